@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import ast
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from boa3 import constants
 from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.astinliner import AstInliner
 from boa3.analyser.astoptimizer import AstOptimizer
 from boa3.analyser.constructanalyser import ConstructAnalyser
+from boa3.analyser.model.modulescache import ModulesCache
+from boa3.analyser.model.virtualmodules import VirtualModules
 from boa3.analyser.moduleanalyser import ModuleAnalyser
 from boa3.analyser.supportedstandard.standardanalyser import StandardAnalyser
 from boa3.analyser.typeanalyser import TypeAnalyser
@@ -24,7 +27,10 @@ class Analyser:
     :ivar symbol_table: a dictionary used to store the identifiers
     """
 
-    def __init__(self, ast_tree: ast.AST, path: str = None, log: bool = False):
+    def __init__(self, ast_tree: ast.AST, path: str = None, log: bool = False,
+                 virtual_modules: Optional[VirtualModules] = None,
+                 modules_cache: Optional[ModulesCache] = None,
+                 optimize: bool = True):
         self.symbol_table: Dict[str, ISymbol] = {}
 
         self.ast_tree: ast.AST = ast_tree
@@ -39,9 +45,15 @@ class Analyser:
         import os
         self.path: str = path
         self.filename: str = path if path is None else os.path.realpath(path)
+        self.virtual_modules: Optional[VirtualModules] = virtual_modules
+        self.modules_cache: Optional[ModulesCache] = modules_cache
+        self.optimize: bool = optimize
 
     @staticmethod
-    def analyse(path: str, log: bool = False, analysed_files: Optional[List[str]] = None) -> Analyser:
+    def analyse(path: str, log: bool = False, analysed_files: Optional[List[str]] = None,
+                source: Union[str, bytes] = None, virtual_modules: Optional[VirtualModules] = None,
+                modules_cache: Optional[ModulesCache] = None, optimize: bool = True,
+                inline_threshold: Optional[int] = None) -> Analyser:
         """
         Analyses the syntax of the Python code
 
@@ -49,13 +61,27 @@ class Analyser:
         :param log: if compiler errors should be logged.
         :param analysed_files: a list with the paths of the files that were analysed if it's from an import.
                                if it's not triggered by an import, must be None.
+        :param source: the source code of the file. If it's None, it's read from the path
+        :param virtual_modules: the user modules that can be imported without being read from the file system
+        :param modules_cache: the analysis of the user modules imported by previously analysed files
+        :param optimize: whether the ast is optimized after the validations. If it's False, the file is only checked
+        :param inline_threshold: the maximum size of the methods whose calls are replaced by their code. If it's None,
+                                 the default size is used
         :return: a boolean value that represents if the analysis was successful
         :rtype: Analyser
         """
-        with open(path, 'rb') as source:
-            ast_tree = ast.parse(source.read())
-
-        analyser = Analyser(ast_tree, path, log)
+        if source is None and virtual_modules is not None:
+            source = virtual_modules.get_source(path)
+
+        if source is None:
+            with open(path, 'rb') as source_file:
+                ast_tree = ast.parse(source_file.read())
+            analyser = Analyser(ast_tree, path, log, virtual_modules, modules_cache, optimize)
+        else:
+            ast_tree = ast.parse(source)
+            analyser = Analyser(ast_tree, path, log, virtual_modules, modules_cache, optimize)
+            # the file doesn't exist, so its path isn't resolved in the file system
+            analyser.filename = path
         analyser.__pre_execute()
 
         # fill symbol table
@@ -68,7 +94,11 @@ class Analyser:
         if not analyser.__check_types():
             return analyser
 
-        analyser.__pos_execute()
+        if optimize:
+            analyser.__pos_execute()
+            if analysed_files is None:
+                # only the methods of the entry file are inlined
+                analyser.__inline_methods(inline_threshold)
         analyser.is_analysed = True
 
         return analyser
@@ -138,6 +168,12 @@ class Analyser:
         """
         AstOptimizer(self, log=self._log)
 
+    def __inline_methods(self, threshold: Optional[int] = None):
+        """
+        Replaces the calls to small methods by their code
+        """
+        AstInliner(self, threshold, log=self._log)
+
     def update_symbol_table(self, symbol_table: Dict[str, ISymbol]):
         for symbol_id, symbol in symbol_table.items():
             if (hasattr(symbol, 'origin')
@@ -0,0 +1,211 @@
+import ast
+import copy
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.model.inlinedcall import InlinedCall
+from boa3.model.builtin.builtin import Builtin
+from boa3.model.builtin.builtincallable import IBuiltinCallable
+from boa3.model.builtin.decorator import InlineDecorator, PublicDecorator
+from boa3.model.method import Method
+from boa3.model.type.type import Type
+
+
+class AstInliner(IAstAnalyser):
+    """
+    This class replaces the calls to small methods of the entry module by the code of the called methods.
+
+    A method is inlined if it's decorated with `inline`, or if it's not public and its size is at most the threshold.
+    Methods that are called only once are inlined regardless of their size, since their code isn't duplicated.
+    Methods decorated with `noinline` are never inlined. The inlined methods are not generated if all their calls are
+    replaced.
+
+    :ivar threshold: the maximum number of ast nodes of the methods that are inlined. If it's zero, only the methods
+     decorated with `inline` are inlined
+    :ivar inlined_calls: the number of calls that were replaced by the methods' code
+    :ivar removed_methods: the number of methods that are not generated anymore
+    """
+
+    DEFAULT_THRESHOLD = 32
+    MAX_LOCALS = 255
+
+    _UNSUPPORTED_NODES = (ast.Return, ast.Try, ast.With, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+                          ast.Lambda, ast.Global, ast.Nonlocal, ast.Yield, ast.YieldFrom, ast.Await,
+                          ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp, ast.Import, ast.ImportFrom)
+
+    def __init__(self, analyser, threshold: Optional[int] = None, log: bool = False):
+        super().__init__(analyser.ast_tree, log=log)
+        self.symbols = analyser.symbol_table
+        self.threshold: int = threshold if threshold is not None else self.DEFAULT_THRESHOLD
+
+        self.inlined_calls: int = 0
+        self.removed_methods: int = 0
+
+        self._sites_count: Dict[str, int] = {}
+        self._inline()
+
+    def _inline(self):
+        functions: Dict[str, Tuple[ast.FunctionDef, Method]] = {}
+        for node in self._tree.body:
+            if isinstance(node, ast.FunctionDef):
+                method = self.symbols.get(node.name)
+                if (isinstance(method, Method) and not isinstance(method, IBuiltinCallable)
+                        and method.defined_by_entry and method.origin is node):
+                    functions[node.name] = (node, method)
+
+        references = self._count_references(set(functions))
+        callees: Dict[str, Tuple[ast.FunctionDef, Method, List[ast.AST], Optional[ast.AST]]] = {}
+        for name, (node, method) in functions.items():
+            callee = self._get_inlinable_code(node, method, functions, references.get(name, 0))
+            if callee is not None:
+                callees[name] = (node, method) + callee
+
+        if len(callees) == 0:
+            return
+
+        inlined: Dict[str, int] = {}
+        for name, (caller_node, caller) in functions.items():
+            if caller.has_cls_or_self:
+                continue
+            for call in self._get_calls(caller_node, callees):
+                callee_node, callee, body, value = callees[call.func.id]
+                if callee_node is caller_node or not self._can_inline_at(call, callee_node, callee, caller):
+                    continue
+                call.inlined_call = self._build_inlined_call(call.func.id, callee, body, value, caller)
+                inlined[call.func.id] = inlined.get(call.func.id, 0) + 1
+
+        for name, count in inlined.items():
+            method = callees[name][1]
+            self.inlined_calls += count
+            if count == references.get(name, 0) and not method.is_public:
+                # every call was replaced, so the method isn't needed anymore
+                method.is_inlined = True
+                self.removed_methods += 1
+
+        if self.inlined_calls > 0:
+            logging.info('Inlined {0} calls of small methods, {1} methods are not generated'
+                         .format(self.inlined_calls, self.removed_methods))
+
+    def _count_references(self, names: Set[str]) -> Dict[str, int]:
+        """
+        Counts how many times each method is referenced in the module
+
+        :param names: the names of the methods
+        """
+        references: Dict[str, int] = {}
+        for node in ast.walk(self._tree):
+            if isinstance(node, ast.Name) and node.id in names:
+                references[node.id] = references.get(node.id, 0) + 1
+        return references
+
+    def _get_inlinable_code(self, node: ast.FunctionDef, method: Method,
+                            functions: Dict[str, Tuple[ast.FunctionDef, Method]],
+                            references: int) -> Optional[Tuple[List[ast.AST], Optional[ast.AST]]]:
+        """
+        Verifies if the method can be inlined
+
+        :return: the statements and the returned expression of the method if it can be inlined. None otherwise.
+        """
+        if (method.is_init or method.has_cls_or_self or method.has_starred_argument
+                or node.name in Builtin.internal_methods or node.name == '_deploy'):
+            return None
+
+        has_inline_decorator = any(isinstance(decorator, InlineDecorator) for decorator in method.decorators)
+        if not all(isinstance(decorator, (InlineDecorator, PublicDecorator)) for decorator in method.decorators):
+            # `noinline` and the decorators that change how the method is called
+            return None
+        if method.is_public and not has_inline_decorator:
+            return None
+
+        if not has_inline_decorator:
+            size = self._get_size(node)
+            if self.threshold <= 0 or (size > self.threshold and references > 1):
+                return None
+
+        body = node.body
+        value = None
+        if len(body) > 0 and isinstance(body[-1], ast.Return):
+            value = body[-1].value
+            body = body[:-1]
+            if isinstance(value, ast.Constant) and value.value is None:
+                value = None
+
+        if method.return_type is Type.none:
+            if value is not None:
+                return None
+        elif value is None:
+            # the method doesn't end with the returned value
+            return None
+
+        for stmt in body + ([value] if value is not None else []):
+            for inner in ast.walk(stmt):
+                if isinstance(inner, self._UNSUPPORTED_NODES):
+                    return None
+                if (isinstance(inner, ast.Call) and isinstance(inner.func, ast.Name)
+                        and inner.func.id in functions):
+                    # only the methods that don't call other methods are inlined, so they are never recursive
+                    return None
+
+        return body, value
+
+    def _get_size(self, node: ast.FunctionDef) -> int:
+        return sum(1 for stmt in node.body for inner in ast.walk(stmt)
+                   if not isinstance(inner, ast.expr_context))
+
+    def _get_calls(self, node: ast.FunctionDef, callees: Dict) -> List[ast.Call]:
+        return [inner for stmt in node.body for inner in ast.walk(stmt)
+                if isinstance(inner, ast.Call) and isinstance(inner.func, ast.Name) and inner.func.id in callees]
+
+    def _can_inline_at(self, call: ast.Call, callee_node: ast.FunctionDef, callee: Method, caller: Method) -> bool:
+        caller_symbols = set(caller.args) | set(caller.locals)
+        if call.func.id in caller_symbols:
+            return False
+        if len(call.keywords) > 0 or any(isinstance(arg, ast.Starred) for arg in call.args):
+            return False
+        if len(call.args) != len(callee.args):
+            return False
+
+        callee_symbols = set(callee.args) | set(callee.locals)
+        for stmt in callee_node.body:
+            for inner in ast.walk(stmt):
+                if isinstance(inner, ast.Name) and inner.id not in callee_symbols and inner.id in caller_symbols:
+                    # the name would refer to a variable of the calling method
+                    return False
+
+        return len(caller.locals) + len(callee_symbols) <= self.MAX_LOCALS
+
+    def _build_inlined_call(self, callee_id: str, callee: Method,
+                            body: List[ast.AST], value: Optional[ast.AST], caller: Method) -> InlinedCall:
+        site = self._sites_count.get(callee_id, 0)
+        self._sites_count[callee_id] = site + 1
+
+        renamed: Dict[str, str] = {}
+        for var_id, var in list(callee.args.items()) + list(callee.locals.items()):
+            new_id = '{0}-{1}-{2}'.format(callee_id, site, var_id)
+            renamed[var_id] = new_id
+            caller.include_variable(new_id, var.copy())
+
+        new_body = [self._copy_node(stmt, renamed) for stmt in body]
+        new_value = self._copy_node(value, renamed) if value is not None else None
+        return InlinedCall(callee, [renamed[arg_id] for arg_id in callee.args], new_body, new_value)
+
+    def _copy_node(self, node: ast.AST, renamed: Dict[str, str]) -> ast.AST:
+        """
+        Copies the node and its children, renaming the variables of the inlined method
+
+        The attributes included in the node by the analysers are kept in the copy
+        """
+        new_node = copy.copy(node)
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                setattr(new_node, field, [self._copy_node(item, renamed)
+                                          if isinstance(item, ast.AST) and not isinstance(item, ast.expr_context)
+                                          else item
+                                          for item in value])
+            elif isinstance(value, ast.AST) and not isinstance(value, ast.expr_context):
+                setattr(new_node, field, self._copy_node(value, renamed))
+
+        if isinstance(new_node, ast.Name) and new_node.id in renamed:
+            new_node.id = renamed[new_node.id]
+        return new_node
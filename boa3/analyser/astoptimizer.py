@@ -39,7 +39,8 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
 
         self.visit(self._tree)
 
-    def literal_eval(self, node: ast.AST) -> Any:
+    @staticmethod
+    def literal_eval(node: ast.AST) -> Any:
         """
         Evaluates an expression node containing a Python expression.
 
@@ -158,7 +159,7 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
                     and self.is_symmetric_operation(bin_op.op, bin_op.right.op)):
                 left_value, right_value = self.reorder_operations(bin_op, bin_op.right)
 
-            value = self._evaluate_binary_operation(left_value, right_value, bin_op.op)
+            value = self.evaluate_binary_operation(left_value, right_value, bin_op.op)
             if value is not None:
                 self.has_changes = True
                 return self.parse_to_node(str(value), bin_op, isinstance(value, str))
@@ -225,8 +226,9 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
 
         return self.literal_eval(outer_bin_op), self.literal_eval(outer_bin_op)
 
-    def _evaluate_binary_operation(self, left: Any, right: Any,
-                                   op: Union[ast.operator, BinaryOperation]) -> Optional[Any]:
+    @staticmethod
+    def evaluate_binary_operation(left: Any, right: Any,
+                                  op: Union[ast.operator, BinaryOperation]) -> Optional[Any]:
         operator = Operation.get_operation(op)
         try:
             if operator is Operation.Add:
@@ -254,7 +256,7 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
 
             operand_value = ast.literal_eval(un_op.operand)
 
-            value = self._evaluate_unary_operation(operand_value, un_op.op)
+            value = self.evaluate_unary_operation(operand_value, un_op.op)
             if value is not None:
                 self.has_changes = True
                 if hasattr(un_op.operand, 'n'):
@@ -266,7 +268,8 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
         except ValueError:
             return un_op
 
-    def _evaluate_unary_operation(self, operand: Any, op: Union[ast.operator, UnaryOperation]) -> Optional[Any]:
+    @staticmethod
+    def evaluate_unary_operation(operand: Any, op: Union[ast.operator, UnaryOperation]) -> Optional[Any]:
         operator = Operation.get_operation(op)
         try:
             if operator is Operation.Add:
@@ -5,6 +5,8 @@ from typing import Dict, List, Optional
 
 from boa3 import constants
 from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.model.modulescache import ModulesCache
+from boa3.analyser.model.virtualmodules import VirtualModules
 from boa3.model import imports
 from boa3.model.symbol import ISymbol
 from boa3.model.type.type import Type
@@ -13,15 +15,28 @@ from boa3.model.type.type import Type
 class ImportAnalyser(IAstAnalyser):
 
     def __init__(self, import_target: str, importer_file: Optional[str] = None,
-                 already_imported_modules: List[str] = None, log: bool = False):
+                 already_imported_modules: List[str] = None, log: bool = False,
+                 virtual_modules: Optional[VirtualModules] = None,
+                 modules_cache: Optional[ModulesCache] = None,
+                 optimize: bool = True):
         self.can_be_imported: bool = False
         self.is_builtin_import: bool = False
         self.recursive_import: bool = False
         self._import_identifier: str = import_target
         self._imported_files: List[str] = already_imported_modules if already_imported_modules is not None else []
+        self._virtual_modules: Optional[VirtualModules] = virtual_modules
+        self._modules_cache: Optional[ModulesCache] = modules_cache
+        self._optimize: bool = optimize
 
         super().__init__(ast.Module(body=[]), log=log)
 
+        virtual_path = virtual_modules.get_path(import_target) if virtual_modules is not None else None
+        if virtual_path is not None:
+            self.filename = virtual_path.split('/')[-1]
+            self.path: str = virtual_path
+            self._analyse_user_module(virtual_path, importer_file)
+            return
+
         try:
             module_origin: str = importlib.util.find_spec(import_target).origin
         except BaseException:
@@ -49,38 +64,56 @@ class ImportAnalyser(IAstAnalyser):
             import re
 
             inside_python_folder = any(re.search(r'python(\d\.?)*', folder.lower()) for folder in path)
-            updated_tree = None
 
             if not (inside_python_folder and 'lib' in path):
-                # check circular imports to avoid recursions inside the compiler
-                if self.path in self._imported_files:
-                    self.recursive_import = True
+                if self._virtual_modules is not None and not self._virtual_modules.read_files:
+                    # only the virtual modules can be imported
                     return
 
-                # TODO: only user modules and typing lib imports are implemented
-                try:
-                    from boa3.analyser.analyser import Analyser
-                    files = self._imported_files
-                    files.append(origin_file)
-                    analyser = Analyser.analyse(module_origin, analysed_files=files, log=self._log)
-
-                    # include only imported symbols
-                    if analyser.is_analysed:
-                        for symbol_id, symbol in analyser.symbol_table.items():
-                            if symbol_id not in Type.all_types():
-                                symbol.defined_by_entry = False
-                                self.symbols[symbol_id] = symbol
-
-                    self.errors.extend(analyser.errors)
-                    self.warnings.extend(analyser.warnings)
-
-                    updated_tree = analyser.ast_tree
-                    self.can_be_imported = analyser.is_analysed
-                except FileNotFoundError:
-                    self.can_be_imported = False
-
-                if updated_tree is not None:
-                    self._tree = updated_tree
+                self._analyse_user_module(module_origin, origin_file)
+
+    def _analyse_user_module(self, module_origin: str, origin_file: Optional[str] = None):
+        # check circular imports to avoid recursions inside the compiler
+        if self.path in self._imported_files:
+            self.recursive_import = True
+            return
+
+        updated_tree = None
+
+        # TODO: only user modules and typing lib imports are implemented
+        try:
+            from boa3.analyser.analyser import Analyser
+            files = self._imported_files
+            files.append(origin_file)
+
+            analyser = (self._modules_cache.get(module_origin, self._optimize)
+                        if self._modules_cache is not None else None)
+            if analyser is None:
+                # the modules are analysed with the same options of the file that imports them
+                analyser = Analyser.analyse(module_origin, analysed_files=files, log=self._log,
+                                            virtual_modules=self._virtual_modules,
+                                            modules_cache=self._modules_cache,
+                                            optimize=self._optimize)
+                if self._modules_cache is not None:
+                    self._modules_cache.put(module_origin, analyser, self._optimize)
+
+            # include only imported symbols
+            if analyser.is_analysed:
+                for symbol_id, symbol in analyser.symbol_table.items():
+                    if symbol_id not in Type.all_types():
+                        symbol.defined_by_entry = False
+                        self.symbols[symbol_id] = symbol
+
+            self.errors.extend(analyser.errors)
+            self.warnings.extend(analyser.warnings)
+
+            updated_tree = analyser.ast_tree
+            self.can_be_imported = analyser.is_analysed
+        except FileNotFoundError:
+            self.can_be_imported = False
+
+        if updated_tree is not None:
+            self._tree = updated_tree
 
     @property
     def tree(self) -> ast.AST:
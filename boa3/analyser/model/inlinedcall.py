@@ -0,0 +1,22 @@
+import ast
+from typing import List, Optional
+
+from boa3.model.method import Method
+
+
+class InlinedCall:
+    """
+    The code of a method that is generated in place of a call to it
+
+    :ivar method: the called method
+    :ivar args: the ids of the local variables of the calling method that store the arguments, in the order of the
+     method's args
+    :ivar body: the statements of the method, using the local variables of the calling method
+    :ivar value: the returned expression. None if the method doesn't return a value
+    """
+
+    def __init__(self, method: Method, args: List[str], body: List[ast.AST], value: Optional[ast.AST]):
+        self.method: Method = method
+        self.args: List[str] = args
+        self.body: List[ast.AST] = body
+        self.value: Optional[ast.AST] = value
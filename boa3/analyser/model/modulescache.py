@@ -0,0 +1,92 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+_FileStat = Tuple[int, int]
+
+
+class ModulesCache:
+    """
+    The analysis of the imported user modules, reused when other files import the same modules.
+
+    An analysis is reused while the module and the modules it imports aren't modified, and only by analyses with the
+    same options. It's meant to be used when the files are only checked, because the generated code would share the
+    symbols between the compiled files.
+    """
+
+    def __init__(self):
+        self._modules: Dict[Tuple[str, bool], Tuple[Dict[str, _FileStat], object]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def _stat(path: str) -> Optional[_FileStat]:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def get(self, path: str, optimize: bool = True):
+        """
+        Gets the analysis of a module if it's still valid
+
+        :param path: the path of the module
+        :param optimize: whether the module ast was optimized after the validations
+        :return: the analyser of the module if it's cached and none of its files changed. None otherwise
+        """
+        key = (path, optimize)
+        cached = self._modules.get(key)
+        if cached is not None:
+            files, analyser = cached
+            if all(self._stat(file_path) == file_stat for file_path, file_stat in files.items()):
+                self.hits += 1
+                return analyser
+            del self._modules[key]
+
+        self.misses += 1
+        return None
+
+    def put(self, path: str, analyser, optimize: bool = True):
+        """
+        Includes the analysis of a module in the cache. Modules that aren't files or had errors aren't included
+
+        :param path: the path of the module
+        :param analyser: the analyser of the module
+        :param optimize: whether the module ast was optimized after the validations
+        """
+        if not analyser.is_analysed or len(analyser.errors) > 0:
+            return
+
+        files: Dict[str, _FileStat] = {}
+        for file_path in [path] + self._get_imported_files(analyser):
+            file_stat = self._stat(file_path)
+            if file_stat is None:
+                return
+            files[file_path] = file_stat
+
+        self._modules[(path, optimize)] = (files, analyser)
+
+    @staticmethod
+    def _get_imported_files(analyser) -> List[str]:
+        from boa3.model.imports.importsymbol import Import
+
+        imported_files = []
+        visited = set()
+        to_visit = [symbol for symbol in analyser.symbol_table.values() if isinstance(symbol, Import)]
+        while len(to_visit) > 0:
+            imported = to_visit.pop()
+            if id(imported) in visited:
+                continue
+            visited.add(id(imported))
+
+            if isinstance(imported.origin, str) and imported.origin.endswith('.py'):
+                imported_files.append(imported.origin)
+            to_visit.extend(symbol for symbol in imported.all_symbols.values() if isinstance(symbol, Import))
+
+        return imported_files
+
+    def clear(self):
+        self._modules.clear()
+
+    def __len__(self) -> int:
+        return len(self._modules)
@@ -0,0 +1,45 @@
+import posixpath
+from typing import Dict, Optional, Union
+
+
+class VirtualModules:
+    """
+    User modules given as source code, so they can be imported without being read from the file system
+
+    :ivar root: the folder where the virtual modules are placed. Each module path is its name relative to this folder
+    :ivar read_files: whether user modules that aren't virtual can be read from the file system
+    """
+
+    def __init__(self, sources: Dict[str, Union[str, bytes]], root: str = '', read_files: bool = True):
+        """
+        :param sources: a dictionary that maps each module name, like `package.module`, with its source code
+        :param root: the folder where the virtual modules are placed
+        :param read_files: whether user modules that aren't virtual can be read from the file system
+        """
+        self.root: str = root.replace('\\', '/')
+        self.read_files: bool = read_files
+
+        self._paths: Dict[str, str] = {}
+        self._sources: Dict[str, Union[str, bytes]] = {}
+        for module_name, source in sources.items():
+            module_path = posixpath.join(self.root, '{0}.py'.format(module_name.replace('.', '/')))
+            self._paths[module_name] = module_path
+            self._sources[module_path] = source
+
+    def get_path(self, module_name: str) -> Optional[str]:
+        """
+        Gets the path of a virtual module
+
+        :param module_name: the full name of the imported module
+        :return: the virtual path of the module if it exists. None otherwise.
+        """
+        return self._paths.get(module_name)
+
+    def get_source(self, path: str) -> Optional[Union[str, bytes]]:
+        """
+        Gets the source code of a virtual module
+
+        :param path: the virtual path of the module
+        :return: the source code of the module if it exists. None otherwise.
+        """
+        return self._sources.get(path.replace('\\', '/'))
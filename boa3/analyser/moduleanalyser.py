@@ -7,8 +7,10 @@ from boa3 import constants
 from boa3.analyser.astanalyser import IAstAnalyser
 from boa3.analyser.importanalyser import ImportAnalyser
 from boa3.analyser.model.functionarguments import FunctionArguments
+from boa3.analyser.model.modulescache import ModulesCache
 from boa3.analyser.model.optimizer import UndefinedType
 from boa3.analyser.model.symbolscope import SymbolScope
+from boa3.analyser.model.virtualmodules import VirtualModules
 from boa3.builtin import NeoMetadata
 from boa3.exception import CompilerError, CompilerWarning
 from boa3.model.builtin.builtin import Builtin
@@ -54,6 +56,9 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
             analysed_files = [file_path.replace(os.sep, '/') if isinstance(file_path, str) else file_path
                               for file_path in analysed_files]
         self._analysed_files: Optional[List[str]] = analysed_files
+        self._virtual_modules: Optional[VirtualModules] = analyser.virtual_modules
+        self._modules_cache: Optional[ModulesCache] = analyser.modules_cache
+        self._optimize: bool = analyser.optimize
 
         self._builtin_functions_to_visit: Dict[str, IBuiltinMethod] = {}
         self._current_module: Module = None
@@ -167,6 +172,9 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
                         if isinstance(var_type, SequenceType):
                             var_type = var_type.build_collection(var_enumerate_type)
                         var = Variable(var_type, origin_node=source_node)
+                        if self._current_method is None and self._current_class is None:
+                            var.origin_module = self.filename
+                            var.name = var_id
 
                     self._current_symbol_scope.include_symbol(var_id, var)
                     if isinstance(source_node, ast.AnnAssign):
@@ -395,7 +403,10 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
         analyser = ImportAnalyser(import_target=target,
                                   importer_file=self.filename,
                                   already_imported_modules=list(already_imported),
-                                  log=self._log)
+                                  log=self._log,
+                                  virtual_modules=self._virtual_modules,
+                                  modules_cache=self._modules_cache,
+                                  optimize=self._optimize)
 
         if analyser.recursive_import:
             self._log_error(
@@ -1,3 +1,8 @@
+from typing import Dict, List, Optional, Union
+
+from boa3.analyser.model.modulescache import ModulesCache
+from boa3.compiler.artifacts import CompilationArtifacts
+from boa3.compiler.checkresult import CheckResult
 from boa3.compiler.compiler import Compiler
 from boa3.exception.InvalidPathException import InvalidPathException
 
@@ -9,20 +14,91 @@ class Boa3:
     """
 
     @staticmethod
-    def compile(path: str) -> bytes:
+    def compile(path: str, cache_globals: bool = False, inline_threshold: Optional[int] = None) -> bytes:
         """
         Load a Python file to be compiled but don't write the result into a file
 
         :param path: the path of the Python file to compile
+        :param cache_globals: if the global variables saved in the storage should be read at most once and written at
+                              most once in each contract invocation. Disabled by default.
+        :param inline_threshold: the maximum size, in ast nodes, of the private methods whose calls are replaced by
+                                 their code. Zero inlines only the methods decorated with `inline`. 32 by default.
         :return: the bytecode of the compiled .nef file
         """
         if not path.endswith('.py'):
             raise InvalidPathException(path)
 
-        return Compiler().compile(path)
+        return Compiler().compile(path, cache_globals=cache_globals, inline_threshold=inline_threshold)
+
+    @staticmethod
+    def compile_artifacts(path_or_source: Union[str, bytes],
+                          modules: Optional[Dict[str, Union[str, bytes]]] = None,
+                          show_errors: bool = True,
+                          source_path: str = 'contract.py',
+                          cache_globals: bool = False,
+                          inline_threshold: Optional[int] = None) -> CompilationArtifacts:
+        """
+        Compile a Python file or source code and return the .nef file, the manifest and the debug info without
+        writing them into files
+
+        :param path_or_source: the path of the Python file to compile or its source code. It's used as a path if it's
+                               a single line string ending with '.py'
+        :param modules: Optional dictionary that maps the name of user modules, like `package.module`, with their
+                        source code. They are imported instead of the files with the same name.
+        :param show_errors: if compiler errors should be logged.
+        :param source_path: the virtual path of the compiled source code, used in the debug info. Virtual modules are
+                            placed in the same folder. It's ignored if a file path is compiled.
+        :param cache_globals: if the global variables saved in the storage should be read at most once and written at
+                              most once in each contract invocation. Disabled by default.
+        :param inline_threshold: the maximum size, in ast nodes, of the private methods whose calls are replaced by
+                                 their code. Zero inlines only the methods decorated with `inline`. 32 by default.
+        :return: the compiled contract artifacts
+        """
+        if (isinstance(path_or_source, str)
+                and '\n' not in path_or_source
+                and path_or_source.endswith('.py')):
+            return Compiler().compile_artifacts(path_or_source, show_errors, modules=modules,
+                                                cache_globals=cache_globals, inline_threshold=inline_threshold)
+
+        if not source_path.endswith('.py'):
+            raise InvalidPathException(source_path)
+        return Compiler().compile_artifacts(source_path, show_errors, source=path_or_source, modules=modules,
+                                            cache_globals=cache_globals, inline_threshold=inline_threshold)
+
+    @staticmethod
+    def check(path: str, show_errors: bool = True) -> CheckResult:
+        """
+        Check a Python file for compiler errors and warnings, without generating the bytecode
+
+        :param path: the path of the Python file to check
+        :param show_errors: if compiler errors should be logged.
+        :return: the errors and warnings found in the file, with their positions
+        """
+        if not path.endswith('.py'):
+            raise InvalidPathException(path)
+
+        return Compiler().check(path, show_errors)
+
+    @staticmethod
+    def check_files(paths: List[str], show_errors: bool = True) -> List[CheckResult]:
+        """
+        Check many Python files for compiler errors and warnings. The user modules imported by more than one file are
+        analysed only once
+
+        :param paths: the paths of the Python files to check
+        :param show_errors: if compiler errors should be logged.
+        :return: the result of each file, in the same order of the paths
+        """
+        for path in paths:
+            if not path.endswith('.py'):
+                raise InvalidPathException(path)
+
+        modules_cache = ModulesCache()
+        return [Compiler().check(path, show_errors, modules_cache=modules_cache) for path in paths]
 
     @staticmethod
-    def compile_and_save(path: str, output_path: str = None, show_errors: bool = True):
+    def compile_and_save(path: str, output_path: str = None, show_errors: bool = True, pretty: bool = False,
+                         cache_globals: bool = False, inline_threshold: Optional[int] = None):
         """
         Load a Python file to be compiled and save the result into the files.
         By default, the resultant .nef file is saved in the same folder of the
@@ -31,6 +107,11 @@ class Boa3:
         :param path: the path of the Python file to compile
         :param output_path: Optional path to save the generated files
         :param show_errors: if compiler errors should be logged.
+        :param pretty: if the manifest and the debug info should be indented. They are compact by default.
+        :param cache_globals: if the global variables saved in the storage should be read at most once and written at
+                              most once in each contract invocation. Disabled by default.
+        :param inline_threshold: the maximum size, in ast nodes, of the private methods whose calls are replaced by
+                                 their code. Zero inlines only the methods decorated with `inline`. 32 by default.
         """
         if not path.endswith('.py'):
             raise InvalidPathException(path)
@@ -40,4 +121,4 @@ class Boa3:
         elif not output_path.endswith('.nef'):
             raise InvalidPathException(path)
 
-        Compiler().compile_and_save(path, output_path, show_errors)
+        Compiler().compile_and_save(path, output_path, show_errors, pretty, cache_globals, inline_threshold)
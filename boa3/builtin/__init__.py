@@ -20,6 +20,25 @@ def metadata(*args):
     return metadata_wrapper
 
 
+def inline(*args):
+    """
+    This decorator identifies the methods whose calls should always be replaced by the method's code, regardless of
+    its size.
+    """
+    def inline_wrapper():
+        pass
+    return inline_wrapper
+
+
+def noinline(*args):
+    """
+    This decorator identifies the methods whose calls should never be replaced by the method's code.
+    """
+    def noinline_wrapper():
+        pass
+    return noinline_wrapper
+
+
 def to_script_hash(data_bytes: Any) -> bytes:
     """
     Converts a data to a script hash.
@@ -2,14 +2,29 @@ import argparse
 import logging
 import os
 import sys
+from typing import List, Tuple
 
 from boa3.boa3 import Boa3
 from boa3.exception.NotLoadedException import NotLoadedException
 
 
 def main():
-    parser = argparse.ArgumentParser()
+    commands_parser, commands = get_commands_parser()
+    if len(sys.argv) > 1 and sys.argv[1] in commands:
+        # the contracts are compiled without a command, so the other commands are parsed only if they are used
+        args = commands_parser.parse_args()
+        args.command(args)
+        return
+
+    parser = argparse.ArgumentParser(epilog="other commands: {0}. Use 'neo3-boa <command> -h' to see their "
+                                            "arguments".format(", ".join(commands)))
     parser.add_argument("input", help=".py smart contract to compile")
+    parser.add_argument("--pretty", action="store_true", help="indent the generated manifest and debug info")
+    parser.add_argument("--cache-globals", action="store_true",
+                        help="read and write each global variable in the storage once per invocation")
+    parser.add_argument("--inline-threshold", type=int, default=None,
+                        help="maximum size of the private methods whose calls are replaced by their code. "
+                             "0 inlines only the methods decorated with @inline")
     args = parser.parse_args()
 
     if not args.input.endswith(".py") or not os.path.isfile(args.input):
@@ -20,7 +35,8 @@ def main():
     path, filename = os.path.split(fullpath)
 
     try:
-        Boa3.compile_and_save(args.input)
+        Boa3.compile_and_save(args.input, pretty=args.pretty, cache_globals=args.cache_globals,
+                              inline_threshold=args.inline_threshold)
         logging.info(f"Wrote {filename.replace('.py', '.nef')} to {path}")
     except NotLoadedException as e:
         logging.error("Could not compile")
@@ -28,5 +44,101 @@ def main():
         logging.exception(e)
 
 
+def get_commands_parser() -> Tuple[argparse.ArgumentParser, List[str]]:
+    parser = argparse.ArgumentParser(prog="neo3-boa")
+    subparsers = parser.add_subparsers(title="commands", metavar="command")
+    subparsers.required = True
+
+    inspect_parser = subparsers.add_parser("inspect", help="disassembles a compiled smart contract")
+    inspect_parser.add_argument("input", help=".nef file to inspect")
+    inspect_parser.add_argument("-s", "--source", action="store_true",
+                                help="show the source lines from the debug info")
+    inspect_parser.add_argument("--summary", action="store_true",
+                                help="show only the summary, without the instructions")
+    inspect_parser.set_defaults(command=inspect)
+
+    check_parser = subparsers.add_parser("check", help="checks smart contracts for errors without compiling them",
+                                         description="checks smart contracts for errors without compiling them")
+    check_parser.add_argument("inputs", nargs="+", help=".py smart contracts to check")
+    check_parser.add_argument("--json", action="store_true", help="print the results as json")
+    check_parser.set_defaults(command=check)
+
+    serve_parser = subparsers.add_parser("serve", help="runs a compiler that answers JSON-RPC requests",
+                                         description="runs a compiler that answers JSON-RPC requests, one per line")
+    serve_parser.add_argument("--socket", default=None,
+                              help="path of the Unix socket to listen. Uses stdio by default")
+    serve_parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    serve_parser.add_argument("--deadline", type=float, default=60.0,
+                              help="maximum time in seconds of each request")
+    serve_parser.add_argument("--memory-limit", type=int, default=None,
+                              help="peak memory in MiB a worker can use before being replaced")
+    serve_parser.add_argument("--cache-size", type=int, default=128,
+                              help="number of compiled artifacts kept in memory")
+    serve_parser.set_defaults(command=serve)
+
+    return parser, list(subparsers.choices)
+
+
+def inspect(args: argparse.Namespace):
+    if not args.input.endswith(".nef") or not os.path.isfile(args.input):
+        logging.error("Input file is not .nef")
+        sys.exit(1)
+
+    from boa3.neo.contracts.nefinspector import NefInspector
+    try:
+        inspector = NefInspector(args.input)
+        lines = inspector.summary()
+        if not args.summary:
+            from itertools import chain
+            lines = chain(lines, inspector.listing(show_source=args.source))
+
+        for line in lines:
+            sys.stdout.write(line + '\n')
+    except Exception as e:
+        logging.exception(e)
+        sys.exit(1)
+
+
+def check(args: argparse.Namespace):
+    for path in args.inputs:
+        if not path.endswith(".py") or not os.path.isfile(path):
+            logging.error("Input file '{0}' is not .py".format(path))
+            sys.exit(1)
+
+    try:
+        results = Boa3.check_files(args.inputs, show_errors=False)
+    except Exception as e:
+        logging.exception(e)
+        sys.exit(1)
+
+    if args.json:
+        import json
+        sys.stdout.write(json.dumps([result.to_json() for result in results], indent=2) + '\n')
+    else:
+        for path, result in zip(args.inputs, results):
+            for error in result.errors:
+                sys.stdout.write("error: {0}:{1}\n".format(path, error.message))
+            for warning in result.warnings:
+                sys.stdout.write("warning: {0}:{1}\n".format(path, warning.message))
+
+    if not all(result.success for result in results):
+        sys.exit(1)
+
+
+def serve(args: argparse.Namespace):
+    from boa3.compiler.server.compileserver import CompileServer
+    try:
+        with CompileServer(args.workers, args.deadline, args.memory_limit, args.cache_size) as server:
+            if args.socket is not None:
+                server.serve_unix_socket(args.socket)
+            else:
+                server.serve_stdio()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logging.exception(e)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List
+
+from boa3.exception.CompilerWarning import CompilerWarning
+from boa3.neo import to_hex_str
+
+
+class CompilationArtifacts:
+    """
+    The results of a compilation, kept in memory instead of being saved into files
+
+    :ivar nef: the serialized .nef file
+    :ivar script: the compiled bytecode
+    :ivar script_hash: the hash of the compiled bytecode
+    :ivar manifest: the contract manifest
+    :ivar debug_info: the debug information, the content of the .nefdbgnfo file
+    :ivar warnings: the warnings logged during the compilation
+    :ivar timings: a dictionary that maps each compilation phase with its duration in seconds
+    """
+
+    def __init__(self, nef: bytes, script: bytes, script_hash: bytes,
+                 manifest: Dict[str, Any], debug_info: Dict[str, Any],
+                 warnings: List[CompilerWarning], timings: Dict[str, float]):
+        self.nef: bytes = nef
+        self.script: bytes = script
+        self.script_hash: bytes = script_hash
+        self.manifest: Dict[str, Any] = manifest
+        self.debug_info: Dict[str, Any] = debug_info
+        self.warnings: List[CompilerWarning] = warnings
+        self.timings: Dict[str, float] = timings
+
+    @property
+    def script_hash_str(self) -> str:
+        """
+        Gets the string representation of the script hash, the same used in the debug info
+
+        :return: the hex string representation of the hash
+        """
+        return to_hex_str(self.script_hash)
+
+    @property
+    def total_time(self) -> float:
+        """
+        Gets the duration of the whole compilation in seconds
+        """
+        return sum(self.timings.values())
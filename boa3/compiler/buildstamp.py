@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sysconfig
+from typing import Any, Dict, List, Optional
+
+from boa3 import constants
+from boa3.analyser.analyser import Analyser
+
+
+class BuildStamp:
+    """
+    Records the inputs used to generate a contract's artifacts, so they can be reused while none of them changes.
+
+    :ivar source: the path of the compiled entry file
+    :ivar files: a dictionary that maps the entry file and each user module it depends on with its content hash
+    :ivar boa_version: the version of the compiler that generated the artifacts
+    :ivar python_version: the version of the Python interpreter used to compile
+    :ivar compiler_hash: the hash of the compiler sources that generated the artifacts
+    :ivar options: the compiler options that changed the generated code
+    """
+
+    FILE_EXTENSION = '.buildstamp.json'
+
+    _compiler_hash: Optional[str] = None
+
+    def __init__(self, source: str, files: Dict[str, str],
+                 boa_version: str = constants.BOA_VERSION,
+                 python_version: str = constants.SYS_VERSION,
+                 compiler_hash: Optional[str] = None,
+                 options: Optional[Dict[str, Any]] = None):
+        self.source: str = source
+        self.files: Dict[str, str] = files
+        self.boa_version: str = boa_version
+        self.python_version: str = python_version
+        self.compiler_hash: str = compiler_hash if compiler_hash is not None else self.current_compiler_hash()
+        self.options: Dict[str, Any] = options if options is not None else {}
+
+    @classmethod
+    def from_analyser(cls, analyser: Analyser, options: Optional[Dict[str, Any]] = None) -> BuildStamp:
+        """
+        Builds the stamp of an analysed file, including the user modules it imports
+
+        :param analyser: the analyser of the compiled file
+        :param options: the compiler options that changed the generated code
+        """
+        source = analyser.path.replace(os.sep, '/')
+        dependencies = [source] + cls._get_dependencies(analyser.symbol_table.values())
+        return cls(source, {path: cls.file_hash(path) for path in dependencies}, options=options)
+
+    @classmethod
+    def _get_dependencies(cls, symbols) -> List[str]:
+        from boa3.model.imports.importsymbol import Import
+
+        # compiler files are covered by the compiler hash and Python libs by the Python version
+        ignored_folders = tuple('{0}/'.format(os.path.realpath(folder).replace(os.sep, '/'))
+                                for folder in (os.path.dirname(constants.__file__),
+                                               sysconfig.get_path('stdlib'),
+                                               sysconfig.get_path('purelib')))
+        dependencies: List[str] = []
+        visited = set()
+        to_visit = [symbol for symbol in symbols if isinstance(symbol, Import)]
+
+        while len(to_visit) > 0:
+            imported = to_visit.pop()
+            if id(imported) in visited:
+                continue
+            visited.add(id(imported))
+
+            origin = imported.origin.replace(os.sep, '/') if isinstance(imported.origin, str) else None
+            if (origin is not None
+                    and origin.endswith('.py')
+                    and not origin.startswith(ignored_folders)
+                    and origin not in dependencies
+                    and os.path.isfile(origin)):
+                dependencies.append(origin)
+
+            to_visit.extend(symbol for symbol in imported.all_symbols.values() if isinstance(symbol, Import))
+
+        return sorted(dependencies)
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """
+        Gets the hash of a file content
+
+        :param path: the path of the file
+        :return: the hex representation of the content's sha256. Empty if the file doesn't exist
+        """
+        if not os.path.isfile(path):
+            return ''
+        with open(path, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    @classmethod
+    def current_compiler_hash(cls) -> str:
+        """
+        Gets the hash of the running compiler's source files.
+        Is calculated once per process, so changes in the compiler without a version bump invalidate the stamps too.
+        """
+        if cls._compiler_hash is None:
+            boa_package = os.path.dirname(os.path.realpath(constants.__file__))
+            compiler_hash = hashlib.sha256()
+            for root, dirs, files in os.walk(boa_package):
+                dirs.sort()
+                for file_name in sorted(files):
+                    if file_name.endswith('.py'):
+                        file_path = os.path.join(root, file_name)
+                        compiler_hash.update(os.path.relpath(file_path, boa_package).encode(constants.ENCODING))
+                        with open(file_path, 'rb') as file:
+                            compiler_hash.update(file.read())
+            cls._compiler_hash = compiler_hash.hexdigest()
+
+        return cls._compiler_hash
+
+    @property
+    def digest(self) -> str:
+        """
+        Gets a single hash that identifies all the inputs of the build
+        """
+        return hashlib.sha256(self.serialize()).hexdigest()
+
+    def is_up_to_date(self, options: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Checks if the artifacts generated with this stamp still match the current files and compiler
+
+        :param options: the compiler options of the current build
+        :return: whether the artifacts can be reused
+        """
+        if (self.options != (options if options is not None else {})
+                or self.boa_version != constants.BOA_VERSION
+                or self.python_version != constants.SYS_VERSION
+                or self.compiler_hash != self.current_compiler_hash()):
+            return False
+        return all(self.file_hash(path) == file_hash for path, file_hash in self.files.items())
+
+    @classmethod
+    def get_path(cls, output_path: str) -> str:
+        """
+        Gets the path of the stamp of an artifact
+
+        :param output_path: the path of the .nef or the .py file
+        """
+        return os.path.splitext(output_path)[0] + cls.FILE_EXTENSION
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'source': self.source,
+            'boa-version': self.boa_version,
+            'python-version': self.python_version,
+            'compiler-hash': self.compiler_hash,
+            'files': self.files,
+            'options': self.options
+        }
+
+    @classmethod
+    def from_json(cls, json_data: Dict[str, Any]) -> BuildStamp:
+        return cls(json_data['source'], dict(json_data['files']),
+                   boa_version=json_data['boa-version'],
+                   python_version=json_data['python-version'],
+                   compiler_hash=json_data['compiler-hash'],
+                   options=dict(json_data.get('options', {})))
+
+    def serialize(self) -> bytes:
+        return bytes(json.dumps(self.to_json(), indent=4, sort_keys=True), constants.ENCODING)
+
+    def save(self, output_path: str):
+        """
+        Saves the stamp next to the generated artifacts
+
+        :param output_path: the path of the generated .nef file
+        """
+        with open(self.get_path(output_path), 'wb+') as stamp_file:
+            stamp_file.write(self.serialize())
+
+    @classmethod
+    def load(cls, output_path: str) -> Optional[BuildStamp]:
+        """
+        Loads the stamp of the generated artifacts
+
+        :param output_path: the path of the .nef or the .py file
+        :return: the stamp if it exists and is valid. None otherwise
+        """
+        stamp_path = cls.get_path(output_path)
+        if not os.path.isfile(stamp_path):
+            return None
+
+        try:
+            with open(stamp_path, 'rb') as stamp_file:
+                return cls.from_json(json.loads(stamp_file.read()))
+        except (OSError, ValueError, KeyError):
+            return None
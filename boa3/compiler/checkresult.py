@@ -0,0 +1,46 @@
+from typing import Any, Dict, List, Union
+
+from boa3.exception.CompilerError import CompilerError
+from boa3.exception.CompilerWarning import CompilerWarning
+
+
+class CheckResult:
+    """
+    The result of checking a file, without compiling it
+
+    :ivar path: the path of the checked file
+    :ivar errors: the errors found in the file and in its imported modules
+    :ivar warnings: the warnings found in the file and in its imported modules
+    :ivar time: the duration of the check in seconds
+    """
+
+    def __init__(self, path: str, errors: List[CompilerError], warnings: List[CompilerWarning], time: float):
+        self.path: str = path
+        self.errors: List[CompilerError] = errors
+        self.warnings: List[CompilerWarning] = warnings
+        self.time: float = time
+
+    @property
+    def success(self) -> bool:
+        return len(self.errors) == 0
+
+    @staticmethod
+    def _log_to_json(log: Union[CompilerError, CompilerWarning], message: str) -> Dict[str, Any]:
+        return {
+            'type': type(log).__name__,
+            'line': log.line,
+            'col': log.col,
+            'message': message
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Gets the json representation of the result, with the position of each error and warning
+        """
+        return {
+            'path': self.path,
+            'success': self.success,
+            'errors': [self._log_to_json(error, error._error_message) for error in self.errors],
+            'warnings': [self._log_to_json(warning, warning._warning_message) for warning in self.warnings],
+            'time': self.time
+        }
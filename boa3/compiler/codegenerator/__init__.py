@@ -1,21 +1,37 @@
-from typing import List, Tuple
+import os
+from typing import List, Optional, Tuple
 
-from boa3.model.expression import IExpression
+from boa3.constants import ENCODING
 from boa3.model.symbol import ISymbol
+from boa3.neo.cryptography import sha256
 from boa3.neo.vm.opcode.Opcode import Opcode
-from boa3.neo.vm.type.Integer import Integer
+
+# the storage keys of the global variables have the same size as the keys derived from the Python hashes
+STORAGE_KEY_SIZE = 8
 
 
 def get_bytes_count(instructions: List[Tuple[Opcode, bytes]]) -> int:
     return sum([len(opcode) + len(arg) for opcode, arg in instructions])
 
 
-def get_storage_key_for_variable(symbol: ISymbol) -> bytes:
-    if isinstance(symbol, IExpression):
-        symbol_obj = symbol.origin
-    else:
-        symbol_obj = symbol
+def get_storage_key_for_variable(symbol: ISymbol, root_folder: Optional[str] = None) -> bytes:
+    """
+    Gets the storage key of a global variable. The key is derived from the path of the module where the variable is
+    declared and its name, so the same source code is always compiled with the same keys
+
+    :param symbol: the global variable
+    :param root_folder: the folder the module paths are relative to. If it's None, the paths are used as they are
+    :return: the storage key of the variable
+    """
+    module_path = getattr(symbol, 'origin_module', None)
+    if not isinstance(module_path, str):
+        module_path = ''
+    elif root_folder is not None:
+        try:
+            module_path = os.path.relpath(module_path, root_folder)
+        except ValueError:
+            # the module is in another drive
+            pass
 
-    origin_hash = Integer(hash(symbol_obj)).to_byte_array()
-    symbol_hash = Integer(hash(symbol)).to_byte_array()
-    return Integer(hash(origin_hash + symbol_hash)).to_byte_array()
+    qualified_name = '{0}:{1}'.format(module_path.replace(os.sep, '/'), getattr(symbol, 'name', None) or '')
+    return sha256(qualified_name.encode(ENCODING))[:STORAGE_KEY_SIZE]
@@ -1,15 +1,21 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+import logging
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from boa3 import constants
 from boa3.analyser.analyser import Analyser
 from boa3.analyser.model.symbolscope import SymbolScope
 from boa3.compiler import codegenerator
+from boa3.compiler.codegenerator.commonexpression import CommonExpression
+from boa3.compiler.codegenerator.modulevariables import ModuleVariables
 from boa3.compiler.codegenerator.stackmemento import NeoStack, StackMemento
+from boa3.compiler.codegenerator.versionedsymboltable import VersionedSymbolTable
 from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
 from boa3.model.builtin.builtin import Builtin
 from boa3.model.builtin.internal.innerdeploymethod import InnerDeployMethod
 from boa3.model.builtin.interop.interop import Interop
 from boa3.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.event import Event
 from boa3.model.imports.importsymbol import Import
 from boa3.model.method import Method
@@ -23,6 +29,7 @@ from boa3.model.type.classes.userclass import UserClass
 from boa3.model.type.collection.icollection import ICollectionType
 from boa3.model.type.collection.sequence.buffertype import Buffer as BufferType
 from boa3.model.type.collection.sequence.mutable.listtype import ListType
+from boa3.model.type.collection.sequence.mutable.mutablesequencetype import MutableSequenceType
 from boa3.model.type.collection.sequence.sequencetype import SequenceType
 from boa3.model.type.primitive.bytestype import BytesType
 from boa3.model.type.primitive.primitivetype import PrimitiveType
@@ -45,18 +52,26 @@ class CodeGenerator:
     """
 
     @staticmethod
-    def generate_code(analyser: Analyser) -> bytes:
+    def generate_code(analyser: Analyser, cache_globals: bool = False) -> bytes:
         """
         Generates the Neo VM bytecode using of the analysed Python code
 
         :param analyser: semantic analyser it tge Python code
+        :param cache_globals: whether the global variables saved in the storage are cached in static fields
         :return: the Neo VM bytecode
         """
         VMCodeMapping.reset()
         import ast
         from boa3.compiler.codegenerator.codegeneratorvisitor import VisitorCodeGenerator
 
+        from boa3.compiler.codegenerator.staticinitializerevaluator import StaticInitializerEvaluator
+        static_evaluator = StaticInitializerEvaluator.evaluate_module(analyser.symbol_table, analyser.ast_tree)
+
         generator = CodeGenerator(analyser.symbol_table)
+        if isinstance(analyser.filename, str):
+            generator.root_folder = os.path.dirname(analyser.filename)
+        if cache_globals:
+            generator.enable_storage_globals_cache(analyser.symbol_table)
         deploy_method = (analyser.symbol_table[constants.DEPLOY_METHOD_ID]
                          if constants.DEPLOY_METHOD_ID in analyser.symbol_table
                          else None)
@@ -100,6 +115,9 @@ class CodeGenerator:
 
             visitor.global_stmts = static_stmts
 
+        had_static_fields = len(visitor.global_stmts) > 0
+        visitor.global_stmts = static_evaluator.remove_inlined_initializers(visitor.global_stmts)
+
         if hasattr(deploy_method, 'origin'):
             deploy_ast = ast.parse("")
             deploy_ast.body = [deploy_method.origin]
@@ -112,18 +130,44 @@ class CodeGenerator:
             generator.symbol_table.clear()
             generator.symbol_table.update(analyser.symbol_table.copy())
 
+        if generator.has_cached_globals:
+            generator.convert_flush_cached_globals_method()
+
         generator.can_init_static_fields = True
-        if len(visitor.global_stmts) > 0:
+        if len(visitor.global_stmts) > 0 or generator.has_cached_globals:
+            # the cached globals need the static fields, even if there aren't static statements
             global_ast = ast.parse("")
             global_ast.body = visitor.global_stmts
             visitor.visit(global_ast)
             generator.initialized_static_fields = True
 
+        if static_evaluator.evaluated_initializers > 0:
+            price_saved = static_evaluator.price_saved
+            if had_static_fields and constants.INITIALIZE_METHOD_ID not in generator.symbol_table:
+                price_saved += OpcodeInfo.INITSSLOT.opcode.price
+            logging.info("Evaluated {0} static initializers while compiling, saving {1:.8f} GAS per invocation".format(
+                static_evaluator.evaluated_initializers,
+                price_saved * constants.DEFAULT_EXEC_FEE_FACTOR / 10 ** constants.GAS_DECIMALS
+            ))
+
+        if generator.removed_index_checks > 0:
+            logging.info("Removed {0} negative index checks of indexes that are never negative".format(
+                generator.removed_index_checks
+            ))
+
+        if generator.reused_expressions > 0:
+            logging.info("Reused the results of {0} repeated builtin calls".format(generator.reused_expressions))
+
+        if generator.hoisted_expressions > 0:
+            logging.info("Moved {0} loop invariant builtin calls out of their loops".format(
+                generator.hoisted_expressions
+            ))
+
         analyser.update_symbol_table(generator.symbol_table)
         return generator.bytecode
 
     def __init__(self, symbol_table: Dict[str, ISymbol]):
-        self.symbol_table: Dict[str, ISymbol] = symbol_table.copy()
+        self.symbol_table: Dict[str, ISymbol] = VersionedSymbolTable(symbol_table)
 
         self._current_method: Method = None
         self._current_class: Method = None
@@ -147,6 +191,36 @@ class CodeGenerator:
 
         self.can_init_static_fields: bool = False
         self.initialized_static_fields: bool = False
+        # the slots of the variables, computed again only when the variables change
+        self._module_variables: Optional[ModuleVariables] = None
+        self._method_slots: Optional[Tuple[Method, Dict[str, int], Dict[str, int]]] = None
+        # the storage keys of the global variables are derived from the modules paths relative to this folder
+        self.root_folder: Optional[str] = None
+        # the number of negative index fixes and bounds checks that weren't generated because the index is non-negative
+        self.removed_index_checks: int = 0
+
+        # maps the storage key of each cached global with its static field. Its state is in the next static field
+        self._cached_globals: Dict[bytes, int] = {}
+        self._cached_globals_first_slot: int = 0
+        self._flush_cached_globals_method: Optional[Method] = None
+
+        # maps the repeated expressions of the current method with the local variables that store their results
+        self._common_expressions: Dict[str, CommonExpression] = {}
+        self._common_expression_locals: Dict[str, str] = {}
+        # the repeated expressions that are evaluated before the loops that are being generated
+        self._loop_invariants: Dict[str, CommonExpression] = {}
+        # the local variables included to store the lengths of the sequences of the for loops
+        self._for_length_locals: List[str] = []
+        # maps the for loops that are being generated with the local variable that stores their sequence's length
+        self._for_lengths: Dict[int, str] = {}
+        # the number of builtin calls generated, used to verify if an expression can be reused
+        self._unannotated_calls: int = 0
+        self._reusable_calls: int = 0
+        self._storage_reads: int = 0
+        # the number of builtin calls that weren't generated because their results were reused
+        self.reused_expressions: int = 0
+        # the number of expressions that were moved out of loops
+        self.hoisted_expressions: int = 0
 
     @property
     def bytecode(self) -> bytes:
@@ -217,57 +291,93 @@ class CodeGenerator:
         return VMCodeMapping.instance().bytecode_size
 
     @property
-    def _args(self) -> List[str]:
+    def _args(self) -> Dict[str, int]:
         """
-        Gets a list with the arguments names of the current method
+        Gets the arguments names of the current method
 
-        :return: A list with the arguments names
+        :return: A dictionary that maps the arguments names with their slots
         """
-        return [] if self._current_method is None else list(self._current_method.args.keys())
+        return self._get_method_slots()[0]
 
     @property
-    def _locals(self) -> List[str]:
+    def _locals(self) -> Dict[str, int]:
         """
-        Gets a list with the variables names in the scope of the current method
+        Gets the variables names in the scope of the current method
 
-        :return: A list with the variables names
+        :return: A dictionary that maps the variables names with their slots
         """
-        return [] if self._current_method is None else list(self._current_method.locals.keys())
+        return self._get_method_slots()[1]
+
+    def _get_method_slots(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        method = self._current_method
+        if method is None:
+            return {}, {}
+
+        # the variables of a method are only included while it's generated, so the slots are the same while the
+        # number of variables doesn't change
+        if (self._method_slots is None or self._method_slots[0] is not method
+                or len(self._method_slots[1]) != len(method.args)
+                or len(self._method_slots[2]) != len(method.locals)):
+            self._method_slots = (method,
+                                  {arg_id: index for index, arg_id in enumerate(method.args)},
+                                  {var_id: index for index, var_id in enumerate(method.locals)})
+        return self._method_slots[1], self._method_slots[2]
 
     @property
-    def _globals(self) -> List[str]:
-        return self._module_variables(True)
+    def _globals(self) -> Dict[str, int]:
+        """
+        Gets the module variables that are saved in the storage
+
+        :return: A dictionary with the variables names, in the order they are declared
+        """
+        return self._get_module_variables().globals
 
     @property
-    def _statics(self) -> List[str]:
-        return self._module_variables(False)
+    def _statics(self) -> Dict[str, int]:
+        """
+        Gets the module variables and the classes with class variables that are kept in static fields
 
-    def _module_variables(self, modified_variable: bool) -> List[str]:
+        :return: A dictionary that maps the names with their static fields slots
         """
-        Gets a list with the variables name in the global scope
+        return self._get_module_variables().statics
 
-        :return: A list with the variables names
+    def _get_module_variables(self) -> ModuleVariables:
         """
-        module_global_variables = [var_id for var_id, var in self.symbol_table.items()
-                                   if isinstance(var, Variable) and var.is_reassigned == modified_variable]
-        class_with_class_variables = [class_id for class_id, class_symbol in self.symbol_table.items()
-                                      if isinstance(class_symbol, UserClass) and len(class_symbol.class_variables) > 0]
+        Classifies the variables in the global scope
 
-        if not self.can_init_static_fields:
-            for imported in self.symbol_table.values():
-                if isinstance(imported, Import):
-                    # tried to use set and just update, but we need the variables to be ordered
-                    for var_id, var in imported.variables.items():
-                        if (isinstance(var, Variable)
-                                and var.is_reassigned == modified_variable
-                                and var_id not in module_global_variables):
-                            module_global_variables.append(var_id)
+        The classification is cached until the symbol table is changed
+        """
+        version = self.symbol_table.version if isinstance(self.symbol_table, VersionedSymbolTable) else None
+        cached = self._module_variables
+        if (cached is not None and version is not None and cached.version == version
+                and cached.can_init_static_fields == self.can_init_static_fields):
+            return cached
+
+        module_variables = ModuleVariables(version, self.can_init_static_fields)
+        for modified_variable, variables in ((True, module_variables.globals), (False, module_variables.statics)):
+            for var_id, var in self.symbol_table.items():
+                if (isinstance(var, Variable)
+                        and var.is_reassigned == modified_variable
+                        and not var.has_literal_value):
+                    variables[var_id] = len(variables)
+
+            if not self.can_init_static_fields:
+                for imported in self.symbol_table.values():
+                    if isinstance(imported, Import):
+                        for var_id, var in imported.variables.items():
+                            if (isinstance(var, Variable)
+                                    and var.is_reassigned == modified_variable
+                                    and var_id not in variables):
+                                variables[var_id] = len(variables)
+
+                        # TODO: include user class from imported symbols as well
 
-                    # TODO: include user class from imported symbols as well
+        for class_id, class_symbol in self.symbol_table.items():
+            if isinstance(class_symbol, UserClass) and len(class_symbol.class_variables) > 0:
+                module_variables.statics[class_id] = len(module_variables.statics)
 
-        return (module_global_variables
-                if modified_variable
-                else module_global_variables + class_with_class_variables)
+        self._module_variables = module_variables
+        return module_variables
 
     @property
     def _current_scope(self) -> SymbolScope:
@@ -336,6 +446,8 @@ class CodeGenerator:
             return False
 
         num_static_fields = len(self._statics)
+        if self.has_cached_globals:
+            num_static_fields = max(num_static_fields, self._cached_globals_first_slot) + 2 * len(self._cached_globals)
         if num_static_fields > 0:
             init_data = bytearray([num_static_fields])
             self.__insert1(OpcodeInfo.INITSSLOT, init_data)
@@ -382,6 +494,12 @@ class CodeGenerator:
             method.init_bytecode = self.last_code
         self._current_method = method
 
+        self.clear_common_expressions()
+        self._loop_invariants.clear()
+        self._common_expression_locals.clear()
+        self._for_length_locals.clear()
+        self._for_lengths.clear()
+
     def convert_end_method(self, method_id: Optional[str] = None):
         """
         Converts the end of the method
@@ -398,6 +516,17 @@ class CodeGenerator:
 
             self.insert_return()
 
+        if len(self._common_expression_locals) > 0 or len(self._for_length_locals) > 0:
+            # the local variables that store the common expressions and the lengths of the for loops were included
+            # after the slots were initialized
+            init_data = bytes([len(self._current_method.locals), len(self._current_method.args)])
+            VMCodeMapping.instance().update_vm_code(self._current_method.init_bytecode, OpcodeInfo.INITSLOT, init_data)
+            self._common_expression_locals.clear()
+            self._for_length_locals.clear()
+        self.clear_common_expressions()
+        self._loop_invariants.clear()
+        self._for_lengths.clear()
+
         self._current_method.end_bytecode = self.last_code
         self._current_method = None
         self._stack.clear()
@@ -408,6 +537,8 @@ class CodeGenerator:
         """
         Insert the return statement
         """
+        if self.has_cached_globals and self._current_method is not None and self._current_method.is_public:
+            self.convert_flush_cached_globals()
         self.__insert1(OpcodeInfo.RET)
 
     def convert_begin_while(self, is_for: bool = False) -> int:
@@ -436,18 +567,28 @@ class CodeGenerator:
         """
         self.convert_end_loop(start_address, test_address, False)
 
-    def convert_begin_for(self) -> int:
+    def convert_begin_for(self, constant_length: bool = False) -> int:
         """
         Converts the beginning of the for statement
 
+        :param constant_length: whether the length of the sequence can't change during the loop
         :return: the address of the for first opcode
         """
+        length_id = self._get_for_length_local() if constant_length else None
+        if length_id is not None:
+            # the length is stored once instead of being computed in every loop condition
+            self.duplicate_stack_top_item()
+            self.convert_builtin_method_call(Builtin.Len)
+            self.convert_store_variable(length_id)
+
         self.convert_literal(0)
         address = self.convert_begin_while(True)
+        if length_id is not None:
+            self._for_lengths[address] = length_id
 
         self.duplicate_stack_item(2)  # duplicate for sequence
         self.duplicate_stack_item(2)  # duplicate for index
-        self.convert_get_item()
+        self.convert_get_item(non_negative_index=True)  # the index starts at zero
         return address
 
     def convert_end_for(self, start_address: int) -> int:
@@ -465,14 +606,36 @@ class CodeGenerator:
         self._update_continue_jumps(start_address, for_increment)
 
         self.duplicate_stack_top_item()     # dup index and sequence
-        self.duplicate_stack_item(3)
-        self.convert_builtin_method_call(Builtin.Len)
+        if start_address in self._for_lengths:
+            length_id = self._for_lengths.pop(start_address)
+            self.convert_load_variable(length_id, self._current_method.locals[length_id])
+        else:
+            self.duplicate_stack_item(3)
+            self.convert_builtin_method_call(Builtin.Len)
         self.convert_operation(BinaryOp.Lt)  # continue loop condition: index < len(sequence)
 
         self.convert_end_loop(start_address, test_address, True)
 
         return test_address
 
+    def _get_for_length_local(self) -> Optional[str]:
+        """
+        Gets the local variable that stores the length of the sequence of the for loop that is beginning
+
+        :return: the identifier of the variable. None if the method has no local variables slots or no slot is left
+        """
+        if self._current_method is None or self._current_method.init_bytecode is None:
+            return None
+
+        # the nested loops use different variables, but the loops in the same depth share them
+        length_id = '-for_length_{0}'.format(len(self._current_for))
+        if length_id not in self._current_method.locals:
+            if len(self._current_method.locals) >= constants.ONE_BYTE_MAX_VALUE:
+                return None
+            self._current_method.include_variable(length_id, Variable(Type.int))
+            self._for_length_locals.append(length_id)
+        return length_id
+
     def convert_end_loop(self, start_address: int, test_address: int, is_for: bool):
         """
         Converts the end of a loop statement
@@ -798,6 +961,21 @@ class CodeGenerator:
                 # cast the value to integer
                 self.convert_cast(Type.int)
 
+    def convert_static_literal(self, value: Any, value_type: IType):
+        """
+        Converts the value of a module variable evaluated while compiling
+
+        :param value: the value of the variable
+        :param value_type: the type of the variable
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            opcode, data = Opcode.get_push_and_data(value)
+            self.__insert1(OpcodeInfo.get_info(opcode), data)
+        else:
+            self.convert_literal(value)
+            self._stack_pop()
+        self._stack_append(value_type)
+
     def convert_string_literal(self, value: str):
         """
         Converts an string literal value
@@ -912,39 +1090,53 @@ class CodeGenerator:
                 self._stack_pop()
             self._stack_append(array_type)
 
-    def _set_array_item(self, value_start_address: int):
+    def _set_array_item(self, value_start_address: int, non_negative_index: bool = False):
         """
         Converts the end of setting af a value in an array
         """
         index_type: IType = self._stack[-2]  # top: index
         if index_type is Type.int:
-            self.fix_negative_index(value_start_address)
+            if non_negative_index:
+                self.removed_index_checks += 1
+            else:
+                self.fix_negative_index(value_start_address)
 
-    def convert_set_item(self, value_start_address: int):
+    def convert_set_item(self, value_start_address: int, non_negative_index: bool = False):
         """
         Converts the end of setting af a value in an array
+
+        :param value_start_address: the address of the first opcode of the value
+        :param non_negative_index: whether the index is known to be non-negative
         """
         item_type: IType = self._stack[-3]  # top: index, 2nd-to-top: value, 3nd-to-top: array or map
         if item_type.stack_item is not StackItemType.Map:
-            self._set_array_item(value_start_address)
+            self._set_array_item(value_start_address, non_negative_index)
 
         self.__insert1(OpcodeInfo.SETITEM)
         self._stack_pop()  # value
         self._stack_pop()  # index
         self._stack_pop()  # array or map
 
-    def _get_array_item(self):
+    def _get_array_item(self, non_negative_index: bool = False):
         """
         Converts the end of get a value in an array
         """
         index_type: IType = self._stack[-1]  # top: index
         if index_type is Type.int:
-            self.fix_negative_index()
+            if non_negative_index:
+                self.removed_index_checks += 1
+            else:
+                self.fix_negative_index()
+
+    def convert_get_item(self, non_negative_index: bool = False):
+        """
+        Converts the end of get a value in an array or a map
 
-    def convert_get_item(self):
+        :param non_negative_index: whether the index is known to be non-negative
+        """
         array_or_map_type: IType = self._stack[-2]  # second-to-top: array or map
         if array_or_map_type.stack_item is not StackItemType.Map:
-            self._get_array_item()
+            self._get_array_item(non_negative_index)
 
         if array_or_map_type is Type.str:
             self.convert_literal(1)  # length of substring
@@ -976,23 +1168,28 @@ class CodeGenerator:
         self._stack_append(BufferType)  # substr returns a buffer instead of a bytestring
         self.convert_cast(original)
 
-    def convert_get_array_slice(self, array: SequenceType):
+    def convert_get_array_slice(self, array: SequenceType, non_negative_lower: bool = False):
         """
         Converts the end of get a substring
+
+        :param non_negative_lower: whether the start of the slice is known to be non-negative
         """
-        # if lower is still negative, then it should be 0
-        self.duplicate_stack_item(2)
-        self.__insert1(OpcodeInfo.SIGN)
-        self.convert_literal(-1)
-        jmp_address = VMCodeMapping.instance().bytecode_size
-        self._insert_jump(OpcodeInfo.JMPNE)         # if lower < 0, then lower = 0
+        if non_negative_lower:
+            self.removed_index_checks += 1
+        else:
+            # if lower is still negative, then it should be 0
+            self.duplicate_stack_item(2)
+            self.__insert1(OpcodeInfo.SIGN)
+            self.convert_literal(-1)
+            jmp_address = VMCodeMapping.instance().bytecode_size
+            self._insert_jump(OpcodeInfo.JMPNE)         # if lower < 0, then lower = 0
 
-        self.swap_reverse_stack_items(2)
-        self.remove_stack_top_item()
-        self.convert_literal(0)
-        self.swap_reverse_stack_items(2)
-        jmp_target = VMCodeMapping.instance().bytecode_size
-        self._update_jump(jmp_address, jmp_target)
+            self.swap_reverse_stack_items(2)
+            self.remove_stack_top_item()
+            self.convert_literal(0)
+            self.swap_reverse_stack_items(2)
+            jmp_target = VMCodeMapping.instance().bytecode_size
+            self._update_jump(jmp_address, jmp_target)
 
         self.convert_new_empty_array(0, array)      # slice = []
         self.duplicate_stack_item(3)                # index = slice_start
@@ -1006,7 +1203,7 @@ class CodeGenerator:
         self.duplicate_stack_item(2)                    # slice.append(array[index])
         self.duplicate_stack_item(6)
         self.duplicate_stack_item(3)
-        self.convert_get_item()
+        self.convert_get_item(non_negative_index=True)  # index starts at the non-negative slice start
         self.convert_builtin_method_call(Builtin.SequenceAppend)
         self.convert_end_if(is_valid_index)
 
@@ -1025,21 +1222,35 @@ class CodeGenerator:
         self.remove_stack_top_item()
         self.remove_stack_top_item()
 
-    def convert_get_sub_array(self, value_addresses: List[int] = None, negative_stride: bool = False):
+    def convert_get_sub_array(self, value_addresses: List[int] = None, negative_stride: bool = False,
+                              non_negative_indexes: List[bool] = None):
         """
         Converts the end of get a slice in the beginning of an array
 
         :param value_addresses: the start and end values addresses
         :param negative_stride: whether stride is negative or not
+        :param non_negative_indexes: whether each of the start and end values is known to be non-negative
         """
         # top: length, index, array
+        lower_non_negative = False
         if len(self._stack) > 2 and isinstance(self._stack[-3], SequenceType):
             if value_addresses is not None:
+                if non_negative_indexes is None or negative_stride:
+                    non_negative_indexes = [False] * len(value_addresses)
+                lower_non_negative = non_negative_indexes[0]
+
                 # use the next value address to found where the opcodes to fix the value sign should be
                 end_value_opcodes = value_addresses[1:]
-                for code in reversed(end_value_opcodes):
-                    self.fix_negative_index(code)
-                self.fix_negative_index()  # fix the last value sign
+                for code, non_negative in reversed(list(zip(end_value_opcodes, non_negative_indexes))):
+                    if non_negative:
+                        self.removed_index_checks += 1
+                    else:
+                        self.fix_negative_index(code)
+
+                if non_negative_indexes[-1]:
+                    self.removed_index_checks += 1
+                else:
+                    self.fix_negative_index()  # fix the last value sign
 
                 if negative_stride:
                     """
@@ -1066,19 +1277,22 @@ class CodeGenerator:
             if self._stack[-3].stack_item in (StackItemType.ByteString,
                                               StackItemType.Buffer):
 
-                # if lower is still negative, then it should be 0
-                self.duplicate_stack_item(2)
-                self.__insert1(OpcodeInfo.SIGN)
-                self.convert_literal(-1)
-                jmp_address = VMCodeMapping.instance().bytecode_size
-                self._insert_jump(OpcodeInfo.JMPNE)     # if lower < 0, then lower = 0
+                if lower_non_negative:
+                    self.removed_index_checks += 1
+                else:
+                    # if lower is still negative, then it should be 0
+                    self.duplicate_stack_item(2)
+                    self.__insert1(OpcodeInfo.SIGN)
+                    self.convert_literal(-1)
+                    jmp_address = VMCodeMapping.instance().bytecode_size
+                    self._insert_jump(OpcodeInfo.JMPNE)     # if lower < 0, then lower = 0
 
-                self.swap_reverse_stack_items(2)
-                self.remove_stack_top_item()
-                self.convert_literal(0)
-                self.swap_reverse_stack_items(2)
-                jmp_target = VMCodeMapping.instance().bytecode_size
-                self._update_jump(jmp_address, jmp_target)
+                    self.swap_reverse_stack_items(2)
+                    self.remove_stack_top_item()
+                    self.convert_literal(0)
+                    self.swap_reverse_stack_items(2)
+                    jmp_target = VMCodeMapping.instance().bytecode_size
+                    self._update_jump(jmp_address, jmp_target)
 
                 # lower can not be greater than len(string)
                 self.swap_reverse_stack_items(2)
@@ -1109,16 +1323,21 @@ class CodeGenerator:
                 # TODO: change to convert_builtin_method_call(Builtin.Min) when min(a, b) is implemented
                 self.__insert1(OpcodeInfo.MIN)
                 self._stack_pop()
-                self.convert_get_array_slice(array)
+                self.convert_get_array_slice(array, lower_non_negative)
 
-    def convert_get_array_beginning(self, negative_stride: bool = False):
+    def convert_get_array_beginning(self, negative_stride: bool = False, non_negative_index: bool = False):
         """
         Converts the end of get a slice in the beginning of an array
 
         :param negative_stride: whether stride is negative or not
+        :param non_negative_index: whether the end of the slice is known to be non-negative
         """
         if len(self._stack) > 1 and isinstance(self._stack[-2], SequenceType):
-            self.fix_negative_index()
+            non_negative_index = non_negative_index and not negative_stride
+            if non_negative_index:
+                self.removed_index_checks += 1
+            else:
+                self.fix_negative_index()
 
             if negative_stride:
                 # calculates corresponding upper
@@ -1128,17 +1347,20 @@ class CodeGenerator:
 
             if self._stack[-2].stack_item in (StackItemType.ByteString,
                                               StackItemType.Buffer):
-                # if upper is still negative, then it should be 0
-                self.duplicate_stack_top_item()
-                self.__insert1(OpcodeInfo.SIGN)
-                self.convert_literal(-1)
-                jmp_address = VMCodeMapping.instance().bytecode_size
-                self._insert_jump(OpcodeInfo.JMPNE)     # if upper < 0, then upper = 0
-
-                self.remove_stack_top_item()
-                self.convert_literal(0)
-                jmp_target = VMCodeMapping.instance().bytecode_size
-                self._update_jump(jmp_address, jmp_target)
+                if non_negative_index:
+                    self.removed_index_checks += 1
+                else:
+                    # if upper is still negative, then it should be 0
+                    self.duplicate_stack_top_item()
+                    self.__insert1(OpcodeInfo.SIGN)
+                    self.convert_literal(-1)
+                    jmp_address = VMCodeMapping.instance().bytecode_size
+                    self._insert_jump(OpcodeInfo.JMPNE)     # if upper < 0, then upper = 0
+
+                    self.remove_stack_top_item()
+                    self.convert_literal(0)
+                    jmp_target = VMCodeMapping.instance().bytecode_size
+                    self._update_jump(jmp_address, jmp_target)
 
                 # upper can not be greater than len(string)
                 self.duplicate_stack_item(2)
@@ -1165,17 +1387,22 @@ class CodeGenerator:
 
                 self.convert_literal(0)
                 self.swap_reverse_stack_items(2)
-                self.convert_get_array_slice(array)
+                self.convert_get_array_slice(array, non_negative_lower=True)
 
-    def convert_get_array_ending(self, negative_stride: bool = False):
+    def convert_get_array_ending(self, negative_stride: bool = False, non_negative_index: bool = False):
         """
         Converts the end of get a slice in the ending of an array
 
         :param negative_stride: whether stride is negative or not
+        :param non_negative_index: whether the start of the slice is known to be non-negative
         """
         # top: start_slice, array_length, array
         if len(self._stack) > 2 and isinstance(self._stack[-3], SequenceType):
-            self.fix_negative_index()
+            non_negative_index = non_negative_index and not negative_stride
+            if non_negative_index:
+                self.removed_index_checks += 1
+            else:
+                self.fix_negative_index()
 
             if negative_stride:
                 # calculates corresponding lower
@@ -1185,17 +1412,20 @@ class CodeGenerator:
 
             if self._stack[-3].stack_item in (StackItemType.ByteString,
                                               StackItemType.Buffer):
-                # if lower is still negative, then it should be 0
-                self.duplicate_stack_top_item()
-                self.__insert1(OpcodeInfo.SIGN)
-                self.convert_literal(-1)
-                jmp_address = VMCodeMapping.instance().bytecode_size
-                self._insert_jump(OpcodeInfo.JMPNE)     # if lower < 0, then lower = 0
-
-                self.remove_stack_top_item()
-                self.convert_literal(0)
-                jmp_target = VMCodeMapping.instance().bytecode_size
-                self._update_jump(jmp_address, jmp_target)
+                if non_negative_index:
+                    self.removed_index_checks += 1
+                else:
+                    # if lower is still negative, then it should be 0
+                    self.duplicate_stack_top_item()
+                    self.__insert1(OpcodeInfo.SIGN)
+                    self.convert_literal(-1)
+                    jmp_address = VMCodeMapping.instance().bytecode_size
+                    self._insert_jump(OpcodeInfo.JMPNE)     # if lower < 0, then lower = 0
+
+                    self.remove_stack_top_item()
+                    self.convert_literal(0)
+                    jmp_target = VMCodeMapping.instance().bytecode_size
+                    self._update_jump(jmp_address, jmp_target)
 
                 # lower can not be greater than len(string)
                 self.duplicate_stack_item(3)
@@ -1213,7 +1443,121 @@ class CodeGenerator:
             else:
                 array = self._stack[-3]
                 self.swap_reverse_stack_items(2)
-                self.convert_get_array_slice(array)
+                self.convert_get_array_slice(array, non_negative_index)
+
+    def convert_get_substring_constant_bounds(self, lower: Optional[int], upper: Optional[int]):
+        """
+        Converts a slice without step of a string or bytes value whose bounds are constants
+
+        If the length of the value type is fixed, the substring position is computed while compiling. Otherwise, the
+        bounds are fixed without jumps.
+
+        :param lower: the start of the slice. None if it is omitted
+        :param upper: the end of the slice. None if it is omitted
+        """
+        # top: string
+        if len(self._stack) < 1 or not isinstance(self._stack[-1], SequenceType):
+            return
+
+        if lower == 0:
+            lower = None    # string[0:upper] == string[:upper]
+
+        fixed_length = self._stack[-1].fixed_length
+        if lower is None and upper is None:
+            if not (isinstance(self._stack[-1], MutableSequenceType)
+                    or self._stack[-1].stack_item is StackItemType.Buffer):
+                return  # bytestrings are immutable, so the slice doesn't need to be a copy
+
+            # bytearrays are mutable, so the slice must be a copy
+            self.duplicate_stack_top_item()
+            self.convert_builtin_method_call(Builtin.Len)
+            opcode = OpcodeInfo.LEFT
+
+        elif fixed_length is not None:
+            start, stop, _ = slice(lower, upper).indices(fixed_length)
+            count = max(stop - start, 0)
+            if start == 0:
+                self.convert_literal(count)
+                opcode = OpcodeInfo.LEFT
+            elif start + count == fixed_length:
+                self.convert_literal(count)
+                opcode = OpcodeInfo.RIGHT
+            else:
+                self.convert_literal(start)
+                self.convert_literal(count)
+                opcode = OpcodeInfo.SUBSTR
+
+        else:
+            if upper is not None:
+                # stop = min(upper, len(string)) if upper >= 0 else max(len(string) + upper, 0)
+                self.duplicate_stack_top_item()
+                self.convert_builtin_method_call(Builtin.Len)
+                self._convert_fix_constant_bound(upper)
+
+            if lower is None:
+                opcode = OpcodeInfo.LEFT
+            elif upper is None:
+                self.duplicate_stack_top_item()
+                self.convert_builtin_method_call(Builtin.Len)
+                if lower < 0:
+                    # count = min(-lower, len(string))
+                    self.convert_literal(-lower)
+                    self.__insert1(OpcodeInfo.MIN)
+                    self._stack_pop()
+                else:
+                    # count = max(len(string) - lower, 0)
+                    self.convert_literal(lower)
+                    self.convert_operation(BinaryOp.Sub)
+                    self.convert_literal(0)
+                    self.__insert1(OpcodeInfo.MAX)
+                    self._stack_pop()
+                opcode = OpcodeInfo.RIGHT
+            else:
+                # start = min(lower, stop), with lower fixed like the stop
+                if lower < 0:
+                    self.duplicate_stack_item(2)
+                    self.convert_builtin_method_call(Builtin.Len)
+                    self._convert_fix_constant_bound(lower)
+                else:
+                    self.convert_literal(lower)
+                self.duplicate_stack_item(2)
+                self.__insert1(OpcodeInfo.MIN)
+                self._stack_pop()
+
+                # count = stop - start
+                self.__insert1(OpcodeInfo.TUCK)
+                self._stack_append(self._stack[-1])
+                self.convert_operation(BinaryOp.Sub)
+                opcode = OpcodeInfo.SUBSTR
+
+        self.__insert1(opcode)
+        self._stack_pop()  # count
+        if opcode is OpcodeInfo.SUBSTR:
+            self._stack_pop()  # start
+        original_type = self._stack_pop()  # original string
+        if isinstance(original_type, MutableSequenceType):
+            # the slice of a bytearray is a new bytearray, so it's kept as a buffer
+            self._stack_append(original_type)
+        else:
+            self._stack_append(BufferType)  # the substring opcodes return a buffer instead of a bytestring
+            self.convert_cast(original_type)
+
+    def _convert_fix_constant_bound(self, bound: int):
+        """
+        Converts the fix of a constant slice bound to a valid index of the string whose length is at the stack top
+
+        :param bound: the constant bound of the slice
+        """
+        # top: len(string)
+        if bound < 0:
+            self.convert_literal(-bound)
+            self.convert_operation(BinaryOp.Sub)
+            self.convert_literal(0)
+            self.__insert1(OpcodeInfo.MAX)
+        else:
+            self.convert_literal(bound)
+            self.__insert1(OpcodeInfo.MIN)
+        self._stack_pop()
 
     def convert_copy(self):
         if self._stack[-1].stack_item is StackItemType.Array:
@@ -1422,6 +1766,10 @@ class CodeGenerator:
                 self.__insert1(op_info)
             self._stack_append(var.type)
 
+        elif isinstance(var, Variable) and var.has_literal_value:
+            # the value was evaluated while compiling and isn't stored in a static field
+            self.convert_static_literal(var.literal_value, var.type)
+
         elif hasattr(var.type, 'get_value'):
             # the variable is a type constant
             # TODO: change this when implement class conversion
@@ -1431,14 +1779,17 @@ class CodeGenerator:
 
         elif var_id in self._globals:
             var = self.get_symbol(var_id)
-            storage_key = codegenerator.get_storage_key_for_variable(var)
-            self._convert_builtin_storage_get_or_put(True, storage_key)
+            storage_key = codegenerator.get_storage_key_for_variable(var, self.root_folder)
+            if storage_key in self._cached_globals:
+                self._convert_load_cached_global(storage_key)
+            else:
+                self._convert_builtin_storage_get_or_put(True, storage_key)
 
         elif class_type:
             if var_id in class_type.variables:
                 index = list(class_type.variables).index(var_id)
                 self.convert_literal(index)
-                self.convert_get_item()
+                self.convert_get_item(non_negative_index=True)
                 self._stack_pop()             # pop class type
                 self._stack_append(var.type)  # push variable type
 
@@ -1448,6 +1799,8 @@ class CodeGenerator:
 
         :param var_id: the value to be converted
         """
+        self._invalidate_common_expressions(var_id)
+
         inner_index = None
         index, local, is_arg = self._get_variable_info(var_id)
 
@@ -1471,7 +1824,7 @@ class CodeGenerator:
                 no_stack_items_to_swap = 2
 
             self.swap_reverse_stack_items(no_stack_items_to_swap)
-            self.convert_set_item(index_address)
+            self.convert_set_item(index_address, non_negative_index=True)
             return
 
         if index >= 0:
@@ -1496,10 +1849,13 @@ class CodeGenerator:
 
         elif var_id in self._globals:
             var = self.get_symbol(var_id)
-            storage_key = codegenerator.get_storage_key_for_variable(var)
-            if value_start_address is None:
-                value_start_address = self.bytecode_size
-            self._convert_builtin_storage_get_or_put(False, storage_key, value_start_address)
+            storage_key = codegenerator.get_storage_key_for_variable(var, self.root_folder)
+            if storage_key in self._cached_globals:
+                self._convert_store_cached_global(storage_key)
+            else:
+                if value_start_address is None:
+                    value_start_address = self.bytecode_size
+                self._convert_builtin_storage_get_or_put(False, storage_key, value_start_address)
 
     def _convert_builtin_storage_get_or_put(self, is_get: bool, storage_key: bytes, arg_address: int = None):
         addresses = [arg_address] if arg_address is not None else [self.bytecode_size]
@@ -1517,6 +1873,284 @@ class CodeGenerator:
             # once the value is retrieved, it must be deserialized
             self.convert_builtin_method_call(Interop.Deserialize, addresses)
 
+    # region Cached storage globals
+
+    @property
+    def has_cached_globals(self) -> bool:
+        return len(self._cached_globals) > 0
+
+    def enable_storage_globals_cache(self, symbols: Dict[str, ISymbol]):
+        """
+        Caches the global variables that are saved in the storage in static fields, so each one is read from the
+        storage only once in each invocation. The modified values are saved back in the storage before the public
+        methods return and before calling other contracts
+
+        :param symbols: the symbol table of the compiled module
+        """
+        static_ids = set()
+        storage_keys: List[bytes] = []
+
+        symbol_tables = [symbols]
+        visited_imports = set()
+        while len(symbol_tables) > 0:
+            for symbol_id, symbol in symbol_tables.pop().items():
+                if isinstance(symbol, Variable):
+                    if not symbol.is_reassigned:
+                        static_ids.add(symbol_id)
+                    else:
+                        storage_key = codegenerator.get_storage_key_for_variable(symbol, self.root_folder)
+                        if storage_key not in storage_keys:
+                            storage_keys.append(storage_key)
+                elif isinstance(symbol, UserClass):
+                    static_ids.add(symbol_id)
+                elif isinstance(symbol, Import) and id(symbol) not in visited_imports:
+                    visited_imports.add(id(symbol))
+                    symbol_tables.append(symbol.all_symbols)
+
+        # the cache is placed after every static field that the module variables could use
+        self._cached_globals_first_slot = len(static_ids)
+        self._cached_globals = {storage_key: self._cached_globals_first_slot + 2 * index
+                                for index, storage_key in enumerate(storage_keys)}
+        if self.has_cached_globals:
+            self._flush_cached_globals_method = Method()
+
+    def _insert_static_field_opcode(self, is_load: bool, index: int):
+        opcode = Opcode.get_load(index, local=False) if is_load else Opcode.get_store(index, local=False)
+        op_info = OpcodeInfo.get_info(opcode)
+        if op_info.data_len > 0:
+            self.__insert1(op_info, Integer(index).to_byte_array())
+        else:
+            self.__insert1(op_info)
+
+    def _convert_load_cached_global(self, storage_key: bytes):
+        """
+        Loads a global variable from its static field, reading it from the storage if it isn't loaded yet
+        """
+        value_slot = self._cached_globals[storage_key]
+        state_slot = value_slot + 1
+
+        # the value is loaded first, so the methods that update their arguments store them in the cache
+        self._insert_static_field_opcode(True, value_slot)
+        self._insert_static_field_opcode(True, state_slot)
+        self.__insert1(OpcodeInfo.ISNULL)
+        self._stack_append(Type.bool)
+        self._insert_jump(OpcodeInfo.JMPIFNOT)
+        is_loaded_jump = self.last_code_start_address
+
+        self.__insert1(OpcodeInfo.DROP)
+        self._convert_builtin_storage_get_or_put(True, storage_key)
+        self._stack_pop()
+        self.__insert1(OpcodeInfo.DUP)
+        self._insert_static_field_opcode(False, value_slot)
+        # loaded and not modified
+        self.__insert1(OpcodeInfo.PUSH0)
+        self._insert_static_field_opcode(False, state_slot)
+
+        self._update_jump(is_loaded_jump, self.bytecode_size)
+        self._stack_append(Interop.Deserialize.return_type)
+
+    def _convert_store_cached_global(self, storage_key: bytes):
+        """
+        Stores the value in the top of the stack in the static field of a global variable and marks it as modified
+        """
+        value_slot = self._cached_globals[storage_key]
+        self._insert_static_field_opcode(False, value_slot)
+        self._stack_pop()
+        self.__insert1(OpcodeInfo.PUSH1)
+        self._insert_static_field_opcode(False, value_slot + 1)
+
+    def _cached_global_of_load(self, vm_code: VMCode) -> Optional[int]:
+        if self.has_cached_globals and vm_code.opcode.is_load_slot:
+            for value_slot in self._cached_globals.values():
+                load_opcode = Opcode.get_load(value_slot, local=False)
+                if (vm_code.opcode is load_opcode
+                        and (load_opcode is not Opcode.LDSFLD or Integer.from_bytes(vm_code.data) == value_slot)):
+                    return value_slot
+        return None
+
+    def convert_flush_cached_globals(self):
+        """
+        Saves the modified cached globals in the storage and clears the cache
+        """
+        self._invalidate_common_expressions(storage_changed=True)
+        from boa3.neo.vm.CallCode import CallCode
+        self.__insert_code(CallCode(self._flush_cached_globals_method))
+
+    def convert_flush_cached_globals_method(self):
+        """
+        Converts the method called to save the modified cached globals in the storage
+        """
+        method = self._flush_cached_globals_method
+        method.init_address = self.bytecode_size
+
+        for storage_key, value_slot in self._cached_globals.items():
+            state_slot = value_slot + 1
+
+            self._insert_static_field_opcode(True, state_slot)
+            self._stack_append(Type.bool)
+            self._insert_jump(OpcodeInfo.JMPIFNOT)
+            not_modified_jump = self.last_code_start_address
+
+            value_address = self.bytecode_size
+            self._insert_static_field_opcode(True, value_slot)
+            self._stack_append(Type.any)
+            self._convert_builtin_storage_get_or_put(False, storage_key, value_address)
+
+            self._update_jump(not_modified_jump, self.bytecode_size)
+            # the values are read again after calling other contracts, because they may have changed the storage
+            self.__insert1(OpcodeInfo.PUSHNULL)
+            self._insert_static_field_opcode(False, state_slot)
+
+        self.__insert1(OpcodeInfo.RET)
+        method.init_bytecode = VMCodeMapping.instance().code_map[method.init_address]
+        method.end_bytecode = self.last_code
+
+    @staticmethod
+    def _calls_other_contracts(function: IBuiltinMethod) -> bool:
+        from boa3.model.builtin.interop.contract.callmethod import CallMethod
+        from boa3.model.builtin.interop.nativecontract import (CryptoLibMethod, LedgerMethod, PolicyContractMethod,
+                                                               RoleManagementMethod, StdLibMethod)
+        from boa3.model.builtin.interop.nativecontract.nativecontractmethod import NativeContractMethod
+
+        if isinstance(function, CallMethod):
+            return True
+        # these native contracts never call other contracts
+        return (isinstance(function, NativeContractMethod)
+                and not isinstance(function, (CryptoLibMethod, LedgerMethod, PolicyContractMethod,
+                                              RoleManagementMethod, StdLibMethod)))
+
+    # endregion
+
+    # region Common expressions
+
+    @property
+    def builtin_calls_count(self) -> Tuple[int, int, int]:
+        """
+        Gets the number of builtin calls generated so far, to verify the calls included in an expression
+
+        :return: the number of calls to methods without annotated effects, to methods that can be reused and to
+         methods that read the storage
+        """
+        return self._unannotated_calls, self._reusable_calls, self._storage_reads
+
+    def load_common_expression(self, key: str) -> bool:
+        """
+        Loads the stored result of a repeated expression, if it's still valid
+
+        :param key: the key that identifies the expression
+        :return: whether the result was loaded
+        """
+        expression = self._loop_invariants.get(key, self._common_expressions.get(key))
+        if expression is None:
+            return False
+
+        local_id = expression.local_id
+        self.convert_load_variable(local_id, self._current_method.locals[local_id])
+        self.reused_expressions += 1
+        return True
+
+    def store_common_expression(self, key: str, dependencies: Set[str], calls_count: Tuple[int, int, int],
+                                loop_invariant: bool = False) -> bool:
+        """
+        Stores the result of a repeated expression that is in the top of the stack, if it can be reused
+
+        :param key: the key that identifies the expression
+        :param dependencies: the variables used in the expression
+        :param calls_count: the `builtin_calls_count` before the expression was generated
+        :param loop_invariant: whether the expression was moved out of a loop. If it's True, the result is removed from
+         the stack and is valid until the loop is generated
+        :return: whether the result was stored
+        """
+        unannotated_calls, reusable_calls, storage_reads = calls_count
+        if (self._unannotated_calls > unannotated_calls or self._reusable_calls == reusable_calls
+                or self._current_method is None or self._current_method.init_bytecode is None
+                or len(self._stack) == 0):
+            # only the results of builtin calls without side effects are reused
+            return False
+
+        local_id = self._common_expression_locals.get(key)
+        if local_id is None:
+            if len(self._current_method.locals) >= constants.ONE_BYTE_MAX_VALUE:
+                return False
+            local_id = '-common_expression_{0}'.format(len(self._common_expression_locals))
+            self._current_method.include_variable(local_id, Variable(self._stack[-1]))
+            self._common_expression_locals[key] = local_id
+
+        address = self.bytecode_size
+        expression = CommonExpression(local_id, address, dependencies, self._storage_reads > storage_reads)
+        if loop_invariant:
+            self.convert_store_variable(local_id)
+            self._loop_invariants[key] = expression
+            self.hoisted_expressions += 1
+        else:
+            self.duplicate_stack_top_item()
+            self.convert_store_variable(local_id)
+            self._common_expressions[key] = expression
+        return True
+
+    def is_loop_invariant(self, key: str) -> bool:
+        """
+        Verifies if the expression was moved out of a loop that is being generated
+
+        :param key: the key that identifies the expression
+        """
+        return key in self._loop_invariants
+
+    def hoist_common_expression(self, key: str) -> bool:
+        """
+        Keeps the stored result of a repeated expression valid during the loop that is beginning
+
+        :param key: the key that identifies the expression
+        :return: whether the result was stored before the loop
+        """
+        if key not in self._common_expressions:
+            return False
+
+        self._loop_invariants[key] = self._common_expressions[key]
+        self.hoisted_expressions += 1
+        return True
+
+    def discard_loop_invariants(self, keys: List[str]):
+        """
+        Discards the results of the expressions that were moved out of a loop, after the loop is generated
+
+        :param keys: the keys of the moved expressions
+        """
+        for key in keys:
+            self._loop_invariants.pop(key, None)
+
+    def clear_common_expressions(self, first_address: Optional[int] = None):
+        """
+        Discards the stored results of the repeated expressions
+
+        Must be called where the code branches or joins, since the results may not have been stored in every path. The
+        results of the expressions that were moved out of the loops are kept
+
+        :param first_address: if it's given, discards only the results stored from this address on, because their code
+         was removed
+        """
+        if first_address is None:
+            self._common_expressions.clear()
+        else:
+            for expressions in (self._common_expressions, self._loop_invariants):
+                for key, expression in list(expressions.items()):
+                    if expression.address >= first_address:
+                        expressions.pop(key)
+
+    def _invalidate_common_expressions(self, var_id: Optional[str] = None, storage_changed: bool = False):
+        for expressions in (self._common_expressions, self._loop_invariants):
+            for key, expression in list(expressions.items()):
+                if var_id in expression.dependencies or (storage_changed and expression.reads_storage):
+                    expressions.pop(key)
+
+    @staticmethod
+    def _may_change_storage(function: IBuiltinMethod) -> bool:
+        # the storage is changed only by syscalls and by calls to other contracts or methods
+        return any(opcode in (Opcode.SYSCALL, Opcode.CALLT, Opcode.CALL, Opcode.CALL_L, Opcode.CALLA)
+                   for opcode, data in function.opcode)
+
+    # endregion
+
     def _get_variable_info(self, var_id: str) -> Tuple[int, bool, bool]:
         """
         Gets the necessary information about the variable to get the correct opcode
@@ -1528,27 +2162,16 @@ class CodeGenerator:
             `is_arg` is True only if the variable is a parameter of the function.
         If the variable is not found, returns (-1, False, False)
         """
-        is_arg: bool = False
-        local: bool = False
-        scope = None
-
-        if var_id in self._args:
-            is_arg: bool = True
-            local: bool = True
-            scope = self._args
-        elif var_id in self._locals:
-            is_arg = False
-            local: bool = True
-            scope = self._locals
-        elif var_id in self._statics:
-            scope = self._statics
-
-        if scope is not None:
-            index: int = scope.index(var_id) if var_id in scope else -1
-        else:
-            index = -1
+        args, local_vars = self._get_method_slots()
+        if var_id in args:
+            return args[var_id], True, True
+        if var_id in local_vars:
+            return local_vars[var_id], True, False
 
-        return index, local, is_arg
+        statics = self._statics
+        if var_id in statics:
+            return statics[var_id], False, False
+        return -1, False, False
 
     def convert_builtin_method_call(self, function: IBuiltinMethod, args_address: List[int] = None):
         """
@@ -1565,6 +2188,7 @@ class CodeGenerator:
         if function.pack_arguments:
             self.convert_new_array(len(args_address))
 
+        updated_cached_global: Optional[int] = None
         if function.stores_on_slot and 0 < len(function.args) <= len(args_address):
             address = args_address[-len(function.args)]
             load_instr = VMCodeMapping.instance().code_map[address]
@@ -1572,6 +2196,7 @@ class CodeGenerator:
                 store: Opcode = Opcode.get_store_from_load(load_instr.opcode)
                 store_opcode = OpcodeInfo.get_info(store)
                 store_data = load_instr.data
+                updated_cached_global = self._cached_global_of_load(load_instr)
 
         fix_negatives = function.validate_negative_arguments()
         if len(fix_negatives) > 0:
@@ -1587,16 +2212,35 @@ class CodeGenerator:
                 if len(addresses) > arg:
                     self.fix_negative_index(addresses[arg])
 
+        if self.has_cached_globals and self._calls_other_contracts(function):
+            self.convert_flush_cached_globals()
+
         for opcode, data in function.opcode:
             op_info = OpcodeInfo.get_info(opcode)
             self.__insert1(op_info, data)
 
+        if function.effects is MethodEffects.ANY:
+            self._unannotated_calls += 1
+            if self._may_change_storage(function):
+                self._invalidate_common_expressions(storage_changed=True)
+        else:
+            self._reusable_calls += 1
+            if function.effects is MethodEffects.READS_STORAGE:
+                self._storage_reads += 1
+
         if store_opcode is not None:
+            # the variable is updated in place
+            self.clear_common_expressions()
             self._insert_jump(OpcodeInfo.JMP)
             jump = self.last_code_start_address
             self.__insert1(store_opcode, store_data)
             self._update_jump(jump, VMCodeMapping.instance().bytecode_size)
 
+        if updated_cached_global is not None:
+            # the global was updated in place, so it must be saved in the storage
+            self.__insert1(OpcodeInfo.PUSH1)
+            self._insert_static_field_opcode(False, updated_cached_global + 1)
+
         for _ in range(function.args_on_stack):
             self._stack_pop()
         if function.return_type not in (None, Type.none):
@@ -1622,6 +2266,8 @@ class CodeGenerator:
 
         from boa3.neo.vm.CallCode import CallCode
         self.__insert_code(CallCode(function))
+        self._unannotated_calls += 1
+        self._invalidate_common_expressions(storage_changed=True)
 
         for arg in range(num_args):
             self._stack_pop()
@@ -1648,6 +2294,7 @@ class CodeGenerator:
             self.__insert1(info, data)
             self._stack_pop()
             self._stack_pop()
+        self._unannotated_calls += 1
 
     def convert_class_symbol(self, class_type: ClassType, symbol_id: str, load: bool = True) -> Optional[int]:
         """
@@ -1707,7 +2354,7 @@ class CodeGenerator:
 
             if load:
                 self.convert_literal(index)
-                self.convert_get_item()
+                self.convert_get_item(non_negative_index=True)
 
             return index
 
@@ -1725,6 +2372,29 @@ class CodeGenerator:
             self._stack_pop()
         self._stack_append(operation.result)
 
+    def convert_buffer_concat(self, result_type: IType = None):
+        """
+        Converts a concatenation of strings or bytes without converting the resulting buffer to a bytestring
+
+        :param result_type: the type of the concatenation result, if it's used as a string or bytes value. Buffer by
+         default
+        """
+        self.__insert1(OpcodeInfo.CAT)
+        self._stack_pop()
+        self._stack_pop()
+        self._stack_append(result_type if result_type is not None else BufferType)
+
+    def convert_buffers_to_bytestrings(self, var_ids: List[str]):
+        """
+        Converts the buffers stored in string or bytes variables to bytestrings
+
+        :param var_ids: the identifiers of the variables
+        """
+        for var_id in var_ids:
+            self.convert_load_symbol(var_id)
+            self.__insert1(OpcodeInfo.CONVERT, StackItemType.ByteString)
+            self.convert_store_variable(var_id)
+
     def convert_assert(self):
         asserted_type = self._stack[-1] if len(self._stack) > 0 else Type.any
 
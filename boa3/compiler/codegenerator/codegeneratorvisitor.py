@@ -1,16 +1,24 @@
 import ast
 from inspect import isclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from boa3 import constants
 from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.model.inlinedcall import InlinedCall
 from boa3.compiler.codegenerator.codegenerator import CodeGenerator
+from boa3.compiler.codegenerator.commonexpressionfinder import CommonExpressionFinder
+from boa3.compiler.codegenerator.concataccumulatorfinder import ConcatAccumulatorFinder
 from boa3.compiler.codegenerator.generatordata import GeneratorData
+from boa3.compiler.codegenerator.loopinvariantfinder import LoopInvariantFinder
+from boa3.compiler.codegenerator.valuerangeanalyser import ValueRangeAnalyser
 from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
 from boa3.model.builtin.builtin import Builtin
 from boa3.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
+from boa3.model.builtin.method.rangemethod import RangeMethod
 from boa3.model.expression import IExpression
 from boa3.model.method import Method
+from boa3.model.operation.binary.arithmetic.concat import Concat
 from boa3.model.operation.binary.binaryoperation import BinaryOperation
 from boa3.model.operation.binaryop import BinaryOp
 from boa3.model.operation.operation import IOperation
@@ -22,6 +30,7 @@ from boa3.model.type.classes.userclass import UserClass
 from boa3.model.type.collection.sequence.sequencetype import SequenceType
 from boa3.model.type.type import IType, Type
 from boa3.model.variable import Variable
+from boa3.neo.vm.type.StackItem import StackItemType
 
 
 class VisitorCodeGenerator(IAstAnalyser):
@@ -43,6 +52,13 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         self.global_stmts: List[ast.AST] = []
         self._is_generating_initialize = False
+        self._non_negative_indexes: Set[ast.AST] = set()
+        self._repeated_expressions: Dict[ast.AST, str] = {}
+        self._common_expression_results: Dict[str, GeneratorData] = {}
+        self._loop_invariants: Dict[ast.AST, str] = {}
+        self._concat_accumulators: Dict[ast.AST, List[str]] = {}
+        self._buffer_concats: Set[ast.AST] = set()
+        self._is_generating_function: bool = False
 
     @property
     def _symbols(self) -> Dict[str, ISymbol]:
@@ -112,6 +128,16 @@ class VisitorCodeGenerator(IAstAnalyser):
         :param node: an ast node
         """
         if isinstance(node, ast.AST):
+            loop_invariant = self._loop_invariants.get(node)
+            if loop_invariant is not None and self.generator.load_common_expression(loop_invariant):
+                return self._common_expression_results[loop_invariant].copy(node)
+
+            common_expression = self._repeated_expressions.get(node)
+            if common_expression is not None:
+                if self.generator.load_common_expression(common_expression):
+                    return self._common_expression_results[common_expression].copy(node)
+                calls_count = self.generator.builtin_calls_count
+
             result = self.visit(node)
 
             if not result.already_generated and result.symbol_id is not None:
@@ -133,11 +159,95 @@ class VisitorCodeGenerator(IAstAnalyser):
 
                 result.already_generated = True
 
+            if common_expression is not None and self._can_reuse_result(node, result):
+                dependencies = self._get_dependencies(node)
+                if self.generator.store_common_expression(common_expression, dependencies, calls_count):
+                    self._common_expression_results[common_expression] = result
+
             return result
         else:
             index = self.generator.convert_literal(node)
             return self.build_data(node, index=index)
 
+    def _can_reuse_result(self, node: ast.AST, result: GeneratorData) -> bool:
+        if self._is_generating_function:
+            # the code of the called function may be removed or moved after the arguments
+            return False
+        if isinstance(node, ast.Call):
+            return isinstance(result.symbol, IBuiltinMethod) and result.symbol.effects is not MethodEffects.ANY
+        return True
+
+    def _get_dependencies(self, node: ast.AST) -> Set[str]:
+        return {inner.id for inner in ast.walk(node)
+                if isinstance(inner, ast.Name)
+                and (inner.id in self.current_method.args or inner.id in self.current_method.locals)}
+
+    def _hoist_loop_invariants(self, loop: ast.AST) -> List[str]:
+        """
+        Generates the invariant expressions of a loop before it begins, storing their results in local variables
+
+        :param loop: the python ast while or for node
+        :return: the keys of the expressions whose results were stored
+        """
+        if self.current_method is None or self.current_method.init_bytecode is None:
+            return []
+
+        invariants = LoopInvariantFinder.find_loop_invariants(loop, self.current_method, self._symbols)
+        self._loop_invariants.update(invariants)
+
+        hoisted: List[str] = []
+        first_nodes: Dict[str, ast.AST] = {}
+        for node, key in invariants.items():
+            first_nodes.setdefault(key, node)
+
+        for key, node in first_nodes.items():
+            if self.generator.is_loop_invariant(key):
+                # it was moved out of an outer loop
+                continue
+            if self.generator.hoist_common_expression(key):
+                # it was already stored before the loop
+                hoisted.append(key)
+                continue
+
+            address = self.generator.bytecode_size
+            stack_size = self.generator.stack_size
+            calls_count = self.generator.builtin_calls_count
+
+            # the result is stored only once, without duplicating it
+            common_expression = self._repeated_expressions.pop(node, None)
+            result = self.visit_to_generate(node)
+            if common_expression is not None:
+                self._repeated_expressions[node] = common_expression
+
+            if (self._can_reuse_result(node, result)
+                    and self.generator.store_common_expression(key, self._get_dependencies(node), calls_count,
+                                                               loop_invariant=True)):
+                self._common_expression_results[key] = result
+                hoisted.append(key)
+            else:
+                self._remove_inserted_opcodes_since(address, stack_size)
+
+        return hoisted
+
+    def _has_constant_length(self, iter_node: ast.AST, iter_data: GeneratorData) -> bool:
+        """
+        Verifies if the length of the sequence of a for loop can't change during the loop
+
+        :param iter_node: the python ast node of the sequence
+        :param iter_data: the data of the generated sequence
+        """
+        if isinstance(iter_node, (ast.List, ast.Tuple)):
+            # the new sequence isn't referenced by anything else
+            return True
+        if (isinstance(iter_node, ast.Call) and isinstance(iter_node.func, ast.Name)
+                and iter_node.func.id not in self.current_method.locals
+                and isinstance(self.get_symbol(iter_node.func.id), RangeMethod)):
+            return True
+
+        iter_type = iter_data.type
+        return (isinstance(iter_type, IType) and not Type.bytearray.is_type_of(iter_type)
+                and any(immutable_type.is_type_of(iter_type) for immutable_type in (Type.str, Type.bytes, Type.tuple)))
+
     def is_exception_name(self, exc_id: str) -> bool:
         global_symbols = globals()
         if exc_id in global_symbols or exc_id in global_symbols['__builtins__']:
@@ -152,6 +262,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         if VMCodeMapping.instance().bytecode_size > last_address:
             # remove opcodes inserted during the evaluation of the symbol
             VMCodeMapping.instance().remove_opcodes(last_address, VMCodeMapping.instance().bytecode_size)
+            self.generator.clear_common_expressions(last_address)
 
         if isinstance(last_stack_size, int) and last_stack_size < self.generator.stack_size:
             # remove any additional values pushed to the stack during the evalution of the symbol
@@ -251,14 +362,26 @@ class VisitorCodeGenerator(IAstAnalyser):
         if isinstance(method, Property):
             method = method.getter
 
-        if isinstance(method, Method):
+        if isinstance(method, Method) and not method.is_inlined:
             self.current_method = method
+            self._non_negative_indexes = ValueRangeAnalyser.analyse_method(function, self._symbols)
+            self._repeated_expressions = CommonExpressionFinder.find_repeated_expressions(function, method,
+                                                                                          self._symbols)
+            accumulator_finder = ConcatAccumulatorFinder.find_accumulators(function, method)
+            self._concat_accumulators = accumulator_finder.accumulators
+            self._buffer_concats = accumulator_finder.buffer_concats
             self.generator.convert_begin_method(method)
 
             for stmt in function.body:
                 self.visit_to_map(stmt)
 
             self.generator.convert_end_method(function.name)
+            self._non_negative_indexes = set()
+            self._repeated_expressions = {}
+            self._common_expression_results = {}
+            self._loop_invariants = {}
+            self._concat_accumulators = {}
+            self._buffer_concats = set()
             self.current_method = None
 
         return self.build_data(function, symbol=method, symbol_id=function.name)
@@ -301,7 +424,8 @@ class VisitorCodeGenerator(IAstAnalyser):
                     value_data = self.visit_to_generate(value)
                     value_address = value_data.index if value_data.index is not None else aux_index
 
-                    self.generator.convert_set_item(value_address)
+                    self.generator.convert_set_item(value_address,
+                                                    non_negative_index=index in self._non_negative_indexes)
 
             elif len(var_ids) > 0:
                 # it's a chained assignment
@@ -324,7 +448,8 @@ class VisitorCodeGenerator(IAstAnalyser):
                             fix_index = VMCodeMapping.instance().bytecode_size
                             self.generator.convert_load_symbol(var_id)
                             self.generator.swap_reverse_stack_items(3)
-                        self.generator.convert_set_item(fix_index)
+                        self.generator.convert_set_item(fix_index,
+                                                        non_negative_index=index in self._non_negative_indexes)
 
     def visit_AnnAssign(self, ann_assign: ast.AnnAssign) -> GeneratorData:
         """
@@ -377,8 +502,13 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         self.generator.convert_load_symbol(var_id)
         value_address = self.generator.bytecode_size
-        self.visit_to_generate(aug_assign.value)
-        self.generator.convert_operation(aug_assign.op)
+        if aug_assign in self._buffer_concats:
+            # the variable is converted to a bytestring after the loop ends
+            self._convert_concat_operand(aug_assign.value)
+            self.generator.convert_buffer_concat(aug_assign.op.result)
+        else:
+            self.visit_to_generate(aug_assign.value)
+            self.generator.convert_operation(aug_assign.op)
         self.generator.convert_store_variable(var_id, value_address)
         return self.build_data(aug_assign)
 
@@ -406,7 +536,7 @@ class VisitorCodeGenerator(IAstAnalyser):
             value_data = self.visit_to_generate(subscript.value)
             slice = subscript.slice.value if isinstance(subscript.slice, ast.Index) else subscript.slice
             self.visit_to_generate(slice)
-            self.generator.convert_get_item()
+            self.generator.convert_get_item(non_negative_index=slice in self._non_negative_indexes)
 
             value_type = value_data.type
         else:
@@ -431,7 +561,19 @@ class VisitorCodeGenerator(IAstAnalyser):
         upper_omitted = subscript.slice.upper is None
         step_omitted = subscript.slice.step is None
 
-        self.visit_to_generate(subscript.value)
+        value_data = self.visit_to_generate(subscript.value)
+
+        if (step_omitted and not (lower_omitted and upper_omitted)
+                and isinstance(value_data.type, SequenceType)
+                and value_data.type.stack_item in (StackItemType.ByteString, StackItemType.Buffer)
+                and all(bound is None or self._is_constant_int(bound)
+                        for bound in (subscript.slice.lower, subscript.slice.upper))):
+            # substrings with constant bounds don't need to fix the bounds with jumps
+            self.generator.convert_get_substring_constant_bounds(
+                subscript.slice.lower.n if not lower_omitted else None,
+                subscript.slice.upper.n if not upper_omitted else None
+            )
+            return self.build_data(subscript)
 
         step_negative = True if not step_omitted and subscript.slice.step.n < 0 else False
         # if step is negative, then consider the value reversed
@@ -447,20 +589,24 @@ class VisitorCodeGenerator(IAstAnalyser):
             addresses.append(VMCodeMapping.instance().bytecode_size)
             self.visit_to_generate(subscript.slice.upper)
 
-            self.generator.convert_get_sub_array(addresses, step_negative)
+            self.generator.convert_get_sub_array(addresses, step_negative,
+                                                 [subscript.slice.lower in self._non_negative_indexes,
+                                                  subscript.slice.upper in self._non_negative_indexes])
         # only one of them is omitted
         elif lower_omitted != upper_omitted:
             # start position is omitted
             if lower_omitted:
                 self.visit_to_generate(subscript.slice.upper)
-                self.generator.convert_get_array_beginning(step_negative)
+                self.generator.convert_get_array_beginning(step_negative,
+                                                           subscript.slice.upper in self._non_negative_indexes)
             # end position is omitted
             else:
                 self.generator.duplicate_stack_top_item()
                 # length of slice
                 self.generator.convert_builtin_method_call(Builtin.Len)
                 self.visit_to_generate(subscript.slice.lower)
-                self.generator.convert_get_array_ending(step_negative)
+                self.generator.convert_get_array_ending(step_negative,
+                                                        subscript.slice.lower in self._non_negative_indexes)
         else:
             self.generator.convert_copy()
 
@@ -470,6 +616,11 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         return self.build_data(subscript)
 
+    @staticmethod
+    def _is_constant_int(node: ast.AST) -> bool:
+        return (isinstance(node, ast.Num) and isinstance(node.n, int)
+                and not isinstance(node.n, bool))
+
     def _convert_unary_operation(self, operand, op):
         self.visit_to_generate(operand)
         self.generator.convert_operation(op)
@@ -485,11 +636,28 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         :param bin_op: the python ast binary operation node
         """
-        if isinstance(bin_op.op, BinaryOperation):
+        if isinstance(bin_op.op, Concat):
+            self._convert_concat_operand(bin_op.left)
+            self._convert_concat_operand(bin_op.right)
+            if bin_op in self._buffer_concats:
+                # the variable is converted to a bytestring after the loop ends
+                self.generator.convert_buffer_concat(bin_op.op.result)
+            else:
+                self.generator.convert_operation(bin_op.op)
+        elif isinstance(bin_op.op, BinaryOperation):
             self._convert_binary_operation(bin_op.left, bin_op.right, bin_op.op)
 
         return self.build_data(bin_op)
 
+    def _convert_concat_operand(self, operand: ast.AST):
+        if isinstance(operand, ast.BinOp) and isinstance(operand.op, Concat):
+            # the partial results of a chain of concatenations are kept as buffers
+            self._convert_concat_operand(operand.left)
+            self._convert_concat_operand(operand.right)
+            self.generator.convert_buffer_concat()
+        else:
+            self.visit_to_generate(operand)
+
     def visit_UnaryOp(self, un_op: ast.UnaryOp) -> GeneratorData:
         """
         Visitor of a binary operation node
@@ -552,19 +720,26 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         :param while_node: the python ast while statement node
         """
+        hoisted_expressions = self._hoist_loop_invariants(while_node)
         start_addr: int = self.generator.convert_begin_while()
+        self.generator.clear_common_expressions()
         for stmt in while_node.body:
             self.visit_to_map(stmt, generate=True)
 
+        self.generator.clear_common_expressions()
         test_address: int = VMCodeMapping.instance().bytecode_size
         test_data = self.visit_to_map(while_node.test, generate=True)
         self.generator.convert_end_while(start_addr, test_address)
 
+        self.generator.discard_loop_invariants(hoisted_expressions)
+        self.generator.clear_common_expressions()
         else_begin_address: int = self.generator.last_code_start_address
         for stmt in while_node.orelse:
             self.visit_to_map(stmt, generate=True)
 
         self.generator.convert_end_loop_else(start_addr, else_begin_address, len(while_node.orelse) > 0)
+        self.generator.convert_buffers_to_bytestrings(self._concat_accumulators.get(while_node, []))
+        self.generator.clear_common_expressions()
         return self.build_data(while_node, index=start_addr)
 
     def visit_For(self, for_node: ast.For) -> GeneratorData:
@@ -573,8 +748,10 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         :param for_node: the python ast for node
         """
-        self.visit_to_generate(for_node.iter)
-        start_address = self.generator.convert_begin_for()
+        iter_data = self.visit_to_generate(for_node.iter)
+        hoisted_expressions = self._hoist_loop_invariants(for_node)
+        start_address = self.generator.convert_begin_for(self._has_constant_length(for_node.iter, iter_data))
+        self.generator.clear_common_expressions()
 
         if isinstance(for_node.target, tuple):
             for target in for_node.target:
@@ -593,6 +770,8 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         condition_address = self.generator.convert_end_for(start_address)
         self.include_instruction(for_node, condition_address)
+        self.generator.discard_loop_invariants(hoisted_expressions)
+        self.generator.clear_common_expressions()
         else_begin = self.generator.last_code_start_address
 
         for stmt in for_node.orelse:
@@ -602,6 +781,8 @@ class VisitorCodeGenerator(IAstAnalyser):
                                              else_begin,
                                              has_else=len(for_node.orelse) > 0,
                                              is_for=True)
+        self.generator.convert_buffers_to_bytestrings(self._concat_accumulators.get(for_node, []))
+        self.generator.clear_common_expressions()
         return self.build_data(for_node)
 
     def visit_If(self, if_node: ast.If) -> GeneratorData:
@@ -613,17 +794,20 @@ class VisitorCodeGenerator(IAstAnalyser):
         self.visit_to_map(if_node.test, generate=True)
 
         start_addr: int = self.generator.convert_begin_if()
+        self.generator.clear_common_expressions()
         for stmt in if_node.body:
             self.visit_to_map(stmt, generate=True)
 
         ends_with_if = len(if_node.body) > 0 and isinstance(if_node.body[-1], ast.If)
 
+        self.generator.clear_common_expressions()
         if len(if_node.orelse) > 0:
             start_addr = self.generator.convert_begin_else(start_addr, ends_with_if)
             for stmt in if_node.orelse:
                 self.visit_to_map(stmt, generate=True)
 
         self.generator.convert_end_if(start_addr)
+        self.generator.clear_common_expressions()
         return self.build_data(if_node)
 
     def visit_Expr(self, expr: ast.Expr, generate: bool = False) -> GeneratorData:
@@ -654,12 +838,15 @@ class VisitorCodeGenerator(IAstAnalyser):
         self.visit_to_map(if_node.test, generate=True)
 
         start_addr: int = self.generator.convert_begin_if()
+        self.generator.clear_common_expressions()
         body_data = self.visit_to_map(if_node.body, generate=True)
 
+        self.generator.clear_common_expressions()
         start_addr = self.generator.convert_begin_else(start_addr)
         else_data = self.visit_to_map(if_node.orelse, generate=True)
 
         self.generator.convert_end_if(start_addr)
+        self.generator.clear_common_expressions()
         return self.build_data(if_node, result_type=Type.union.build([body_data.type, else_data.type]))
 
     def visit_Assert(self, assert_node: ast.Assert) -> GeneratorData:
@@ -679,11 +866,17 @@ class VisitorCodeGenerator(IAstAnalyser):
         :param call: the python ast function call node
         :returns: The called function return type
         """
+        if hasattr(call, 'inlined_call'):
+            return self._visit_inlined_call(call, call.inlined_call)
+
         # the parameters are included into the stack in the reversed order
         last_address = VMCodeMapping.instance().bytecode_size
         last_stack = self.generator.stack_size
 
+        is_generating_function = self._is_generating_function
+        self._is_generating_function = True
         func_data = self.visit(call.func)
+        self._is_generating_function = is_generating_function
         function_id = func_data.symbol_id
         # if the symbol is not a method, check if it is a class method
         if (isinstance(func_data.type, ClassType) and func_data.symbol_id in func_data.type.symbols
@@ -744,6 +937,29 @@ class VisitorCodeGenerator(IAstAnalyser):
                                result_type=symbol.type if isinstance(symbol, IExpression) else symbol,
                                already_generated=True)
 
+    def _visit_inlined_call(self, call: ast.Call, inlined_call: InlinedCall) -> GeneratorData:
+        """
+        Generates the code of the called method in place of the call
+
+        :param call: the python ast function call node
+        :param inlined_call: the code of the called method, using the local variables of the current method
+        """
+        for arg in reversed(call.args):
+            self.visit_to_generate(arg)
+        for arg_id in inlined_call.args:
+            self.generator.convert_store_variable(arg_id)
+
+        for stmt in inlined_call.body:
+            self.visit_to_map(stmt, generate=True)
+        if inlined_call.value is not None:
+            # the sequence points of the inlined code refer to the lines of the called method
+            address = VMCodeMapping.instance().bytecode_size
+            self.visit_to_generate(inlined_call.value)
+            self.include_instruction(inlined_call.value, address)
+
+        method = inlined_call.method
+        return self.build_data(call, symbol=method, result_type=method.return_type, already_generated=True)
+
     def visit_Raise(self, raise_node: ast.Raise) -> GeneratorData:
         """
         Visitor of the raise node
@@ -762,9 +978,11 @@ class VisitorCodeGenerator(IAstAnalyser):
         """
         try_address: int = self.generator.convert_begin_try()
         try_end: Optional[int] = None
+        self.generator.clear_common_expressions()
         for stmt in try_node.body:
             self.visit_to_map(stmt, generate=True)
 
+        self.generator.clear_common_expressions()
         if len(try_node.handlers) == 1:
             handler = try_node.handlers[0]
             try_end = self.generator.convert_try_except(handler.name)
@@ -773,16 +991,19 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         else_address = None
         if len(try_node.orelse) > 0:
+            self.generator.clear_common_expressions()
             else_start_address = self.generator.convert_begin_else(try_end)
             else_address = self.generator.bytecode_size
             for stmt in try_node.orelse:
                 self.visit_to_map(stmt, generate=True)
             self.generator.convert_end_if(else_start_address)
 
+        self.generator.clear_common_expressions()
         except_end = self.generator.convert_end_try(try_address, try_end, else_address)
         for stmt in try_node.finalbody:
             self.visit_to_map(stmt, generate=True)
         self.generator.convert_end_try_finally(except_end, try_address, len(try_node.finalbody) > 0)
+        self.generator.clear_common_expressions()
 
         return self.build_data(try_node)
 
@@ -0,0 +1,18 @@
+from typing import Set
+
+
+class CommonExpression:
+    """
+    The result of a repeated expression that is stored in a local variable of the method being generated
+
+    :ivar local_id: the identifier of the local variable that stores the result
+    :ivar address: the address of the code that stores the result
+    :ivar dependencies: the variables used in the expression. The stored result is invalid after any of them changes
+    :ivar reads_storage: whether the stored result is invalid after the storage changes
+    """
+
+    def __init__(self, local_id: str, address: int, dependencies: Set[str], reads_storage: bool):
+        self.local_id: str = local_id
+        self.address: int = address
+        self.dependencies: Set[str] = dependencies
+        self.reads_storage: bool = reads_storage
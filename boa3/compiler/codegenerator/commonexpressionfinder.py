@@ -0,0 +1,219 @@
+import ast
+from typing import Dict, List, Optional, Set, Tuple
+
+from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
+from boa3.model.imports.package import Package
+from boa3.model.method import Method
+from boa3.model.property import Property
+from boa3.model.symbol import ISymbol
+from boa3.model.type.itype import IType
+from boa3.model.type.type import Type
+from boa3.model.variable import Variable
+
+
+class CommonExpressionFinder(IAstAnalyser):
+    """
+    This class finds the calls to builtin methods and properties that are repeated in a method, so their results can be
+    stored in local variables and reused instead of calling them again.
+
+    The expressions are compared inside the regions of the method that are executed without branches, and their
+    arguments must be literals or variables with immutable values. The expressions that read the storage are compared
+    only until the next call that may change it.
+
+    :ivar repeated_expressions: maps the nodes of the repeated expressions with the key used to compare them
+    """
+
+    _UNSUPPORTED_NODES = (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+                          ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+    def __init__(self, function: ast.FunctionDef, method: Method, symbols: Dict[str, ISymbol]):
+        super().__init__(function)
+        self.symbols = symbols
+
+        self._locals: Set[str] = set(method.args) | set(method.locals)
+        self._local_types: Dict[str, IType] = {var_id: var.type
+                                               for var_id, var in list(method.args.items()) + list(method.locals.items())}
+        self._regions: List[Dict[Tuple[str, int], List[ast.AST]]] = [{}]
+        self._storage_version: int = 0
+
+        self.repeated_expressions: Dict[ast.AST, str] = {}
+
+    @classmethod
+    def find_repeated_expressions(cls, function: ast.FunctionDef, method: Method,
+                                  symbols: Dict[str, ISymbol]) -> Dict[ast.AST, str]:
+        """
+        Finds the expressions that are repeated in the same region of a method
+
+        :param function: the method ast
+        :param method: the method symbol
+        :param symbols: the symbols of the module
+        :return: the nodes of the repeated expressions, mapped to the key that identifies equal expressions
+        """
+        finder = cls(function, method, symbols)
+        finder._find_in_statements(function.body)
+
+        for region in finder._regions:
+            for (key, storage_version), nodes in region.items():
+                if len(nodes) > 1:
+                    for node in nodes:
+                        finder.repeated_expressions[node] = key
+        return finder.repeated_expressions
+
+    def _new_region(self):
+        if len(self._regions[-1]) > 0:
+            self._regions.append({})
+
+    def _find_in_statements(self, statements: List[ast.AST]):
+        for stmt in statements:
+            if isinstance(stmt, ast.If):
+                self._find_in_expression(stmt.test)
+                self._find_in_branches(stmt.body, stmt.orelse)
+
+            elif isinstance(stmt, ast.For):
+                self._find_in_expression(stmt.iter)
+                self._find_in_branches(stmt.body, stmt.orelse)
+
+            elif isinstance(stmt, ast.While):
+                self._new_region()
+                self._find_in_expression(stmt.test)
+                self._find_in_branches(stmt.body, stmt.orelse)
+
+            elif isinstance(stmt, ast.Try):
+                self._find_in_branches(stmt.body, *[handler.body for handler in stmt.handlers],
+                                       stmt.orelse, stmt.finalbody)
+
+            elif isinstance(stmt, ast.Assert):
+                # the message isn't generated
+                self._find_in_expression(stmt.test)
+
+            elif not isinstance(stmt, self._UNSUPPORTED_NODES):
+                for child in ast.iter_child_nodes(stmt):
+                    self._find_in_expression(child)
+
+                targets = (stmt.targets if isinstance(stmt, ast.Assign)
+                           else [stmt.target] if isinstance(stmt, (ast.AnnAssign, ast.AugAssign))
+                           else [])
+                for target in targets:
+                    if (isinstance(target, ast.Name) and target.id not in self._locals
+                            and isinstance(self.symbols.get(target.id), Variable)):
+                        # the global variables are saved in the storage
+                        self._storage_version += 1
+
+    def _find_in_branches(self, *branches: List[ast.AST]):
+        for branch in branches:
+            self._new_region()
+            self._find_in_statements(branch)
+        self._new_region()
+
+    def _find_in_expression(self, node: ast.AST):
+        if isinstance(node, self._UNSUPPORTED_NODES) or isinstance(node, ast.expr_context):
+            return
+
+        if isinstance(node, ast.IfExp):
+            self._find_in_expression(node.test)
+            self._new_region()
+            self._find_in_expression(node.body)
+            self._new_region()
+            self._find_in_expression(node.orelse)
+            self._new_region()
+            return
+
+        if isinstance(node, ast.Call) and hasattr(node, 'inlined_call'):
+            # the code of the inlined method is generated in place of the call
+            for arg in node.args:
+                self._find_in_expression(arg)
+            self._find_in_statements(node.inlined_call.body)
+            if node.inlined_call.value is not None:
+                self._find_in_expression(node.inlined_call.value)
+            return
+
+        key = self._get_key(node)
+        if key is not None:
+            storage_version = self._storage_version if self._reads_storage(node) else 0
+            occurrences = self._regions[-1].setdefault((key, storage_version), [])
+            occurrences.append(node)
+            if len(occurrences) > 1:
+                # the result of the first occurrence is reused, so the inner expressions aren't generated again
+                return
+
+        if isinstance(node, ast.Call):
+            # the called function isn't generated as a value
+            children = node.args + [keyword.value for keyword in node.keywords]
+        else:
+            children = ast.iter_child_nodes(node)
+        for child in children:
+            self._find_in_expression(child)
+
+        if isinstance(node, ast.Call) and key is None:
+            # the called method may change the storage
+            self._storage_version += 1
+
+    def _get_key(self, node: ast.AST) -> Optional[str]:
+        """
+        Gets the key that identifies the expression if it can be reused
+
+        :return: the dump of the node if it's a call to a function or an attribute of a module. None otherwise.
+        """
+        if isinstance(node, ast.Call):
+            is_internal = getattr(node, 'is_internal_call', False)
+            if (len(node.keywords) > 0 or self._get_effects(node.func, is_internal) in (None, MethodEffects.ANY)
+                    or not all(self._is_immutable_argument(arg) for arg in node.args)):
+                return None
+        elif isinstance(node, (ast.Attribute, ast.Name)):
+            if not isinstance(node.ctx, ast.Load) or self._get_effects(node) in (None, MethodEffects.ANY):
+                return None
+        else:
+            return None
+
+        return ast.dump(node)
+
+    def _get_effects(self, node: ast.AST, is_internal: bool = False) -> Optional[MethodEffects]:
+        """
+        Gets the effects of the builtin method or property referenced by the node
+
+        :param is_internal: whether the node is the function of a call included by the compiler
+        :return: the effects of the method. None if the node isn't a builtin method or property of a module
+        """
+        symbol = self._get_module_symbol(node, is_internal)
+        if isinstance(symbol, Property):
+            symbol = symbol.getter
+        return symbol.effects if isinstance(symbol, IBuiltinMethod) else None
+
+    def _get_module_symbol(self, node: ast.AST, is_internal: bool = False) -> Optional[ISymbol]:
+        if isinstance(node, ast.Name):
+            if node.id in self._locals:
+                return None
+            if node.id not in self.symbols and is_internal:
+                from boa3.model import imports
+                return imports.builtin.get_internal_symbol(node.id)
+            return self.symbols.get(node.id)
+        if isinstance(node, ast.Attribute):
+            value = self._get_module_symbol(node.value)
+            if isinstance(value, Package):
+                return value.symbols.get(node.attr)
+        return None
+
+    def _reads_storage(self, node: ast.AST) -> bool:
+        return any(self._get_effects(inner) is MethodEffects.READS_STORAGE
+                   for inner in ast.walk(node) if isinstance(inner, (ast.Name, ast.Attribute)))
+
+    def _is_immutable_argument(self, node: ast.AST) -> bool:
+        if isinstance(node, ast.Constant):
+            return True
+
+        if isinstance(node, ast.Name):
+            if node.id in self._locals:
+                return self._is_immutable_type(self._local_types[node.id])
+            symbol = self.symbols.get(node.id)
+            if isinstance(symbol, Variable):
+                # the module variables that are never reassigned are constants
+                return not symbol.is_reassigned and self._is_immutable_type(symbol.type)
+
+        return self._get_key(node) is not None
+
+    def _is_immutable_type(self, value_type: IType) -> bool:
+        if not isinstance(value_type, IType) or Type.bytearray.is_type_of(value_type):
+            return False
+        return any(immutable_type.is_type_of(value_type) for immutable_type in (Type.int, Type.str, Type.bytes))
@@ -0,0 +1,160 @@
+import ast
+from typing import Dict, List, Set
+
+from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.model.method import Method
+from boa3.model.operation.binary.arithmetic.concat import Concat
+from boa3.model.operation.operation import IOperation
+from boa3.model.type.primitive.bytestype import BytesType
+from boa3.model.type.primitive.strtype import StrType
+
+
+class ConcatAccumulatorFinder(IAstAnalyser):
+    """
+    This class finds the string and bytes local variables that are built by concatenations inside a loop, like
+    `s = s + x` and `s += x`, so their values can be kept as buffers while the loop runs and converted only once after
+    it ends.
+
+    A variable is an accumulator of a loop only if the loop, including its else branch, uses it only in the
+    concatenations that change it. The methods with exception handlers aren't analysed, because the handlers could
+    read the values that weren't converted yet.
+
+    :ivar accumulators: maps the loops with the ids of their accumulator variables
+    :ivar buffer_concats: the concatenations whose results are kept as buffers
+    """
+
+    _UNSUPPORTED_NODES = (ast.Try, ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+                          ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+    def __init__(self, function: ast.FunctionDef, method: Method):
+        super().__init__(function)
+
+        self._candidates: Set[str] = set(method.args) | set(method.locals)
+
+        self.accumulators: Dict[ast.AST, List[str]] = {}
+        self.buffer_concats: Set[ast.AST] = set()
+
+    @classmethod
+    def find_accumulators(cls, function: ast.FunctionDef, method: Method) -> 'ConcatAccumulatorFinder':
+        """
+        Finds the accumulator variables of the loops of a method
+
+        :param function: the method ast
+        :param method: the method symbol
+        :return: the finder with the accumulators of each loop and the concatenations that change them
+        """
+        finder = cls(function, method)
+        if not any(isinstance(node, cls._UNSUPPORTED_NODES)
+                   for stmt in function.body for node in ast.walk(stmt)):
+            finder._find_in_statements(function.body, set())
+        return finder
+
+    def _find_in_statements(self, statements: List[ast.AST], outer_accumulators: Set[str]):
+        for stmt in statements:
+            if isinstance(stmt, (ast.For, ast.While)):
+                targets = {target.id for inner in self._get_statements(stmt.body)
+                           if isinstance(inner, (ast.Assign, ast.AugAssign))
+                           for target in (inner.targets if isinstance(inner, ast.Assign) else [inner.target])
+                           if isinstance(target, ast.Name)}
+                accumulators = [var_id for var_id in sorted(targets & self._candidates - outer_accumulators)
+                                if self._is_accumulator(stmt, var_id)]
+                if len(accumulators) > 0:
+                    self.accumulators[stmt] = accumulators
+                    self.buffer_concats.update(concat for var_id in accumulators
+                                               for concat in self._get_concats(stmt.body, var_id))
+                inner_accumulators = outer_accumulators | set(accumulators)
+            else:
+                inner_accumulators = outer_accumulators
+
+            for field in ('body', 'orelse'):
+                inner_statements = getattr(stmt, field, None)
+                if isinstance(inner_statements, list):
+                    self._find_in_statements(inner_statements, inner_accumulators)
+
+    def _is_accumulator(self, loop: ast.AST, var_id: str) -> bool:
+        concats = self._get_concats(loop.body, var_id)
+        if len(concats) == 0:
+            return False
+
+        allowed_names: Set[ast.AST] = set()
+        for concat in concats:
+            if isinstance(concat, ast.AugAssign):
+                allowed_names.add(concat.target)
+            else:
+                allowed_names.update(name for name in self._get_concat_operands(concat)
+                                     if isinstance(name, ast.Name) and name.id == var_id)
+
+        # the target of the assignments that store the concatenations
+        allowed_names.update(stmt.targets[0] for stmt in self._get_statements(loop.body)
+                             if isinstance(stmt, ast.Assign) and stmt.value in concats)
+
+        loop_nodes = [loop.test] if isinstance(loop, ast.While) else [loop.target]
+        for node in loop_nodes + loop.body + loop.orelse:
+            for inner in self._walk(node):
+                if isinstance(inner, ast.Name) and inner.id == var_id and inner not in allowed_names:
+                    return False
+        return True
+
+    def _get_concats(self, statements: List[ast.AST], var_id: str) -> List[ast.AST]:
+        """
+        Gets the concatenations that change a variable with its own value
+
+        :return: the augmented assignments and the values of the assignments that concatenate the variable
+        """
+        concats = []
+        for stmt in self._get_statements(statements):
+            if isinstance(stmt, ast.AugAssign):
+                if (self._is_bytestring_concat(stmt.op)
+                        and isinstance(stmt.target, ast.Name) and stmt.target.id == var_id
+                        and not self._uses_variable(stmt.value, var_id)):
+                    concats.append(stmt)
+
+            elif (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1
+                  and isinstance(stmt.targets[0], ast.Name) and stmt.targets[0].id == var_id
+                  and self._is_concat(stmt.value) and self._is_bytestring_concat(stmt.value.op)):
+                operands = self._get_concat_operands(stmt.value)
+                uses = [operand for operand in operands if self._uses_variable(operand, var_id)]
+                if len(uses) == 1 and isinstance(uses[0], ast.Name):
+                    concats.append(stmt.value)
+        return concats
+
+    def _get_statements(self, statements: List[ast.AST]) -> List[ast.AST]:
+        result = []
+        for stmt in statements:
+            result.append(stmt)
+            for field in ('body', 'orelse'):
+                inner_statements = getattr(stmt, field, None)
+                if isinstance(inner_statements, list):
+                    result.extend(self._get_statements(inner_statements))
+        return result
+
+    @staticmethod
+    def _is_bytestring_concat(operation: IOperation) -> bool:
+        # the variables with other types, like bytearray, can't be converted to bytestrings
+        return isinstance(operation, Concat) and type(operation.result) in (StrType, BytesType)
+
+    @staticmethod
+    def _is_concat(node: ast.AST) -> bool:
+        return isinstance(node, ast.BinOp) and isinstance(node.op, Concat)
+
+    def _get_concat_operands(self, node: ast.AST) -> List[ast.AST]:
+        if self._is_concat(node):
+            return self._get_concat_operands(node.left) + self._get_concat_operands(node.right)
+        return [node]
+
+    def _uses_variable(self, node: ast.AST, var_id: str) -> bool:
+        return any(isinstance(inner, ast.Name) and inner.id == var_id for inner in self._walk(node))
+
+    def _walk(self, node: ast.AST):
+        """
+        Walks through the node and the code of the methods that are inlined inside it
+        """
+        for inner in ast.walk(node):
+            yield inner
+            if isinstance(inner, ast.Call) and hasattr(inner, 'inlined_call'):
+                inlined_call = inner.inlined_call
+                yield from (ast.Name(id=arg_id, ctx=ast.Store()) for arg_id in inlined_call.args)
+                for stmt in inlined_call.body:
+                    yield from self._walk(stmt)
+                if inlined_call.value is not None:
+                    yield from self._walk(inlined_call.value)
@@ -0,0 +1,162 @@
+import ast
+from typing import Dict, List, Optional, Set
+
+from boa3.compiler.codegenerator.commonexpressionfinder import CommonExpressionFinder
+from boa3.model.builtin.builtin import Builtin
+from boa3.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
+from boa3.model.method import Method
+from boa3.model.symbol import ISymbol
+from boa3.model.type.classes.pythonclass import PythonClass
+from boa3.model.type.classes.userclass import UserClass
+from boa3.model.variable import Variable
+
+
+class LoopInvariantFinder(CommonExpressionFinder):
+    """
+    This class finds the calls to builtin methods and properties inside a loop that have the same result in every
+    iteration, so they can be evaluated once before the loop starts.
+
+    Only the expressions that can't fail and have no side effects are moved, since they are evaluated even if the
+    loop body isn't executed. The arguments of the expressions must not be changed inside the loop, and the
+    expressions that read the storage are moved only if the loop can't change it.
+
+    :ivar loop_invariants: maps the nodes of the invariant expressions with the key used to compare them
+    """
+
+    def __init__(self, loop: ast.AST, method: Method, symbols: Dict[str, ISymbol]):
+        super().__init__(loop, method, symbols)
+
+        user_classes = [symbol for symbol in symbols.values() if isinstance(symbol, UserClass)]
+        self._user_properties: Set[str] = {prop_id for user_class in user_classes for prop_id in user_class.properties}
+        self._user_methods: Set[str] = {method_id for user_class in user_classes
+                                        for methods in (user_class.instance_methods, user_class.class_methods,
+                                                        user_class.static_methods)
+                                        for method_id in methods}
+        self._builtin_methods: Set[str] = {method.identifier for method in vars(Builtin).values()
+                                           if isinstance(method, IBuiltinMethod)}
+        self._stored_variables: Set[str] = set()
+        self._changes_storage: bool = False
+
+        self.loop_invariants: Dict[ast.AST, str] = {}
+
+    @classmethod
+    def find_loop_invariants(cls, loop: ast.AST, method: Method, symbols: Dict[str, ISymbol]) -> Dict[ast.AST, str]:
+        """
+        Finds the expressions of a loop that can be evaluated before it starts
+
+        :param loop: the while or for loop ast
+        :param method: the symbol of the method that has the loop
+        :param symbols: the symbols of the module
+        :return: the nodes of the invariant expressions, mapped to the key that identifies equal expressions
+        """
+        finder = cls(loop, method, symbols)
+        if isinstance(loop, ast.While):
+            nodes = [loop.test] + loop.body
+        elif isinstance(loop, ast.For):
+            nodes = [loop.target] + loop.body
+        else:
+            return {}
+
+        if not finder._find_loop_effects(nodes):
+            return {}
+
+        for node in nodes:
+            finder._find_invariants(node)
+        return finder.loop_invariants
+
+    def _find_loop_effects(self, nodes: List[ast.AST]) -> bool:
+        """
+        Finds the variables that are changed inside the loop and whether it may change the storage
+
+        :return: whether the loop can be analysed
+        """
+        pending = list(nodes)
+        while len(pending) > 0:
+            node = pending.pop()
+            if isinstance(node, self._UNSUPPORTED_NODES):
+                return False
+
+            if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                if node.id in self._locals:
+                    self._stored_variables.add(node.id)
+                elif isinstance(self.symbols.get(node.id), Variable):
+                    # the global variables are saved in the storage
+                    self._changes_storage = True
+
+            elif isinstance(node, ast.Attribute) and node.attr in self._user_properties:
+                # the getter of a user class property may change the storage
+                self._changes_storage = True
+
+            elif isinstance(node, ast.Call):
+                if hasattr(node, 'inlined_call'):
+                    # the code of the inlined method is generated in place of the call
+                    self._stored_variables.update(node.inlined_call.args)
+                    pending.extend(node.inlined_call.body)
+                    if node.inlined_call.value is not None:
+                        pending.append(node.inlined_call.value)
+                    pending.extend(node.args)
+                    continue
+                if self._may_change_storage(node):
+                    self._changes_storage = True
+
+            pending.extend(ast.iter_child_nodes(node))
+
+        return True
+
+    def _may_change_storage(self, call: ast.Call) -> bool:
+        func = call.func
+        effects = self._get_effects(func, getattr(call, 'is_internal_call', False))
+        if effects is not None:
+            return effects is MethodEffects.ANY
+
+        if isinstance(func, ast.Name):
+            # the Python builtin functions don't use the storage
+            return (func.id in self._locals or func.id in self.symbols
+                    or Builtin.get_symbol(func.id) is None)
+
+        if isinstance(func, ast.Attribute):
+            # neither do the methods of the Python builtin types
+            if (isinstance(func.value, ast.Name) and func.value.id in self._locals
+                    and isinstance(self._local_types[func.value.id], PythonClass)):
+                return False
+            return func.attr not in self._builtin_methods or func.attr in self._user_methods
+
+        return True
+
+    def _find_invariants(self, node: ast.AST):
+        if isinstance(node, ast.expr_context):
+            return
+
+        if isinstance(node, ast.Call) and hasattr(node, 'inlined_call'):
+            for arg in node.args:
+                self._find_invariants(arg)
+            for stmt in node.inlined_call.body:
+                self._find_invariants(stmt)
+            if node.inlined_call.value is not None:
+                self._find_invariants(node.inlined_call.value)
+            return
+
+        key = self._get_key(node)
+        if key is not None and not (self._changes_storage and self._reads_storage(node)):
+            self.loop_invariants[node] = key
+            return
+
+        if isinstance(node, ast.Call):
+            children = node.args + [keyword.value for keyword in node.keywords]
+        else:
+            children = ast.iter_child_nodes(node)
+        for child in children:
+            self._find_invariants(child)
+
+    def _get_key(self, node: ast.AST) -> Optional[str]:
+        effects_node = node.func if isinstance(node, ast.Call) else node
+        if self._get_effects(effects_node, getattr(node, 'is_internal_call', False)) is MethodEffects.PURE:
+            # pure methods may fail with some arguments, like the decoding methods
+            return None
+        return super()._get_key(node)
+
+    def _is_immutable_argument(self, node: ast.AST) -> bool:
+        if isinstance(node, ast.Name) and node.id in self._stored_variables:
+            return False
+        return super()._is_immutable_argument(node)
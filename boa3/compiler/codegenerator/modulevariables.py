@@ -0,0 +1,19 @@
+from typing import Dict
+
+
+class ModuleVariables:
+    """
+    The module variables of a symbol table, classified by where their values are kept
+
+    :ivar version: the version of the symbol table when the variables were classified
+    :ivar can_init_static_fields: whether the static fields could be initialized when the variables were classified
+    :ivar globals: the variables that are saved in the storage, in the order they are declared
+    :ivar statics: maps the variables and the classes with class variables that are kept in static fields with their
+     slots
+    """
+
+    def __init__(self, version: int, can_init_static_fields: bool):
+        self.version: int = version
+        self.can_init_static_fields: bool = can_init_static_fields
+        self.globals: Dict[str, int] = {}
+        self.statics: Dict[str, int] = {}
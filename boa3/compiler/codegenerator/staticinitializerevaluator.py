@@ -0,0 +1,355 @@
+import ast
+from typing import Any, Dict, List, Optional, Set
+
+from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.astoptimizer import AstOptimizer
+from boa3.analyser.model.optimizer import Undefined
+from boa3.analyser.model.optimizer.Operation import Operation
+from boa3.model.symbol import ISymbol
+from boa3.model.variable import Variable
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3.neo.vm.type.Integer import Integer
+
+
+class StaticInitializerEvaluator(IAstAnalyser):
+    """
+    This class evaluates the values of the module variables that are initialized in the '_initialize' internal method,
+    which runs in every invocation of the contract.
+
+    The integer, bool and None variables that are assigned only once are pushed directly where they are used and are
+    not initialized. The other initializers that can be evaluated have their values replaced by the resulting literal,
+    and the literals that are assigned again before being read aren't stored, so a chain of assignments to the same
+    variable is folded into its final store.
+
+    The methods with the name starting with 'visit_' are implementations of methods from the :class:`NodeVisitor` class.
+    These methods are used to walk through the Python abstract syntax tree.
+
+    :ivar evaluated_initializers: the number of initializers that were removed or replaced by literals
+    :ivar price_saved: the execution price of the removed initialization instructions, in fractions of GAS
+    """
+
+    _MIN_INLINED_INT = -2 ** 63
+    _MAX_INLINED_INT = 2 ** 63 - 1
+    _MAX_STACK_INT = 2 ** 255 - 1
+
+    def __init__(self, symbols: Dict[str, ISymbol]):
+        super().__init__(ast.parse(""), log=True)
+        self.symbols = symbols.copy()
+
+        self.evaluated_initializers: int = 0
+        self.price_saved: int = 0
+
+        self._module: Optional[ast.Module] = None
+        self._values: Dict[str, Any] = {}
+        self._inlined: Set[str] = set()
+        self._overwritten: Dict[ast.AST, Set[str]] = {}
+
+    @classmethod
+    def evaluate_module(cls, symbol_table: Dict[str, ISymbol], module: ast.Module) -> 'StaticInitializerEvaluator':
+        """
+        Evaluates the initializers of the module variables stored in static fields
+
+        :param symbol_table: the symbols of the module
+        :param module: the module ast. The evaluated initializers are replaced in it
+        :return: the evaluator, with the information about the evaluated initializers
+        """
+        evaluator = cls(symbol_table)
+        evaluator._module = module
+        evaluator._evaluate_statements(module.body)
+        evaluator._find_overwritten_stores(module.body)
+        return evaluator
+
+    def remove_inlined_initializers(self, statements: List[ast.AST]) -> List[ast.AST]:
+        """
+        Removes the initializers of the variables that are pushed where they are used and the stores of the values
+        that are overwritten before being read
+
+        :param statements: the statements of the '_initialize' method
+        :return: the statements that must still be executed
+        """
+        if len(self._inlined) == 0 and len(self._overwritten) == 0:
+            return statements
+
+        result = []
+        for stmt in statements:
+            if getattr(stmt, 'origin', self._module) is self._module:
+                # the statements from the imported modules weren't evaluated
+                stmt = self._remove_evaluated_targets(stmt)
+            if stmt is not None:
+                result.append(stmt)
+        return result
+
+    def _remove_evaluated_targets(self, stmt: ast.AST) -> Optional[ast.AST]:
+        """
+        Removes the targets of an assignment that don't need to be stored
+
+        :return: the assignment with the remaining targets. None if no target remains
+        """
+        removed_targets = self._inlined | self._overwritten.get(stmt, set())
+
+        if isinstance(stmt, ast.Assign):
+            targets = [target for target in stmt.targets
+                       if not (isinstance(target, ast.Name) and target.id in removed_targets)]
+            if len(targets) == 0:
+                return None
+            if len(targets) < len(stmt.targets):
+                new_stmt = ast.Assign(targets=targets, value=stmt.value)
+                ast.copy_location(new_stmt, stmt)
+                if hasattr(stmt, 'origin'):
+                    new_stmt.origin = stmt.origin
+                stmt = new_stmt
+
+        elif (isinstance(stmt, ast.AnnAssign)
+              and isinstance(stmt.target, ast.Name)
+              and stmt.target.id in removed_targets):
+            return None
+
+        return stmt
+
+    def _evaluate_statements(self, statements: List[ast.AST]):
+        static_variables = {var_id for var_id, symbol in self.symbols.items()
+                            if isinstance(symbol, Variable) and not symbol.is_reassigned}
+
+        assignments_count: Dict[str, int] = {}
+        for stmt in statements:
+            if (isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                    or isinstance(stmt, ast.AnnAssign) and stmt.value is None):
+                # declarations without values don't change the variables
+                continue
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                    assignments_count[node.id] = assignments_count.get(node.id, 0) + 1
+            if not isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                # the variables changed by other statements can't be evaluated
+                for node in ast.walk(stmt):
+                    if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                        static_variables.discard(node.id)
+
+        for index, stmt in enumerate(statements):
+            if isinstance(stmt, ast.Assign):
+                targets = stmt.targets
+            elif isinstance(stmt, (ast.AnnAssign, ast.AugAssign)) and stmt.value is not None:
+                targets = [stmt.target]
+            else:
+                continue
+
+            if not all(isinstance(target, ast.Name) for target in targets):
+                for target in targets:
+                    for node in ast.walk(target):
+                        if isinstance(node, ast.Name):
+                            self._values.pop(node.id, None)
+                continue
+
+            static_targets = [target.id for target in targets if target.id in static_variables]
+            if len(static_targets) == 0:
+                for target in targets:
+                    self._values.pop(target.id, None)
+                continue
+
+            if isinstance(stmt, ast.AugAssign):
+                current_value = self._values.get(stmt.target.id, Undefined)
+                right_value = self._evaluate(stmt.value)
+                value = self._evaluate_binary_operation(current_value, right_value, stmt.op)
+                original_price = (Opcode.LDSFLD.price
+                                  + self._get_expression_price(stmt.value)
+                                  + self._get_operation_price(current_value, stmt.op))
+            else:
+                value = self._evaluate(stmt.value)
+                original_price = self._get_expression_price(stmt.value)
+
+            for target in targets:
+                if value is Undefined or target.id not in static_targets:
+                    self._values.pop(target.id, None)
+                else:
+                    self._values[target.id] = value
+            if value is Undefined:
+                continue
+
+            inlined_targets = [var_id for var_id in static_targets
+                               if assignments_count.get(var_id, 0) == 1 and self._is_inlined_value(value)]
+            for var_id in inlined_targets:
+                # stored in no static field, the value is pushed where the variable is used
+                variable: Variable = self.symbols[var_id]
+                variable.has_literal_value = True
+                variable.literal_value = value
+                self._inlined.add(var_id)
+
+            if len(inlined_targets) > 0:
+                self.evaluated_initializers += 1
+                self.price_saved += (Opcode.DUP.price + Opcode.STSFLD.price) * len(inlined_targets)
+                if len(inlined_targets) == len(static_targets):
+                    # the value isn't evaluated nor duplicated anymore
+                    self.price_saved += original_price - Opcode.DUP.price
+
+            if (len(inlined_targets) < len(static_targets)
+                    and (not self._is_literal_node(stmt.value) or isinstance(stmt, ast.AugAssign))
+                    and self._get_literal_price(value) < original_price):
+                literal_node = self._get_literal_node(value, stmt.value)
+                if isinstance(stmt, ast.AugAssign):
+                    new_stmt = ast.Assign(targets=[ast.Name(id=stmt.target.id, ctx=ast.Store())], value=literal_node)
+                    self.update_line_and_col(new_stmt, stmt)
+                    statements[index] = new_stmt
+                else:
+                    stmt.value = literal_node
+
+                self.evaluated_initializers += 1
+                self.price_saved += original_price - self._get_literal_price(value)
+
+    def _find_overwritten_stores(self, statements: List[ast.AST]):
+        """
+        Finds the literals stored in the module variables that are assigned again before being read
+        """
+        static_variables = {var_id for var_id, symbol in self.symbols.items()
+                            if isinstance(symbol, Variable) and not symbol.is_reassigned}
+
+        # the last assignment of each variable whose value wasn't read yet
+        unread_stores: Dict[str, ast.AST] = {}
+
+        for stmt in statements:
+            if (isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                    or isinstance(stmt, ast.AnnAssign) and stmt.value is None):
+                continue
+
+            if any(isinstance(node, ast.Call) for node in ast.walk(stmt)):
+                # the called functions can read any module variable
+                unread_stores.clear()
+
+            read_variables = {node.id for node in ast.walk(stmt)
+                              if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)}
+            if isinstance(stmt, ast.AugAssign) and isinstance(stmt.target, ast.Name):
+                read_variables.add(stmt.target.id)
+            for var_id in read_variables:
+                unread_stores.pop(var_id, None)
+
+            is_literal_store = isinstance(stmt, (ast.Assign, ast.AnnAssign)) and self._is_literal_node(stmt.value)
+            stored_variables = [node.id for node in ast.walk(stmt)
+                                if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del))]
+
+            for var_id in stored_variables:
+                overwritten_stmt = unread_stores.pop(var_id, None)
+                if overwritten_stmt is not None and isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                    self._set_overwritten(overwritten_stmt, var_id)
+
+                if is_literal_store and var_id in static_variables and var_id not in self._inlined:
+                    unread_stores[var_id] = stmt
+
+    def _set_overwritten(self, stmt: ast.AST, var_id: str):
+        overwritten = self._overwritten.setdefault(stmt, set())
+        if len(overwritten) == 0:
+            self.evaluated_initializers += 1
+        overwritten.add(var_id)
+
+        self.price_saved += Opcode.DUP.price + Opcode.STSFLD.price
+        targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+        if all(isinstance(target, ast.Name) and (target.id in self._inlined or target.id in overwritten)
+               for target in targets):
+            # the value isn't pushed anymore
+            self.price_saved += self._get_literal_price(AstOptimizer.literal_eval(stmt.value)) - Opcode.DUP.price
+
+    def _evaluate(self, node: ast.AST) -> Any:
+        """
+        Evaluates an expression with the values of the module variables that were already evaluated
+
+        :return: the value of the expression if it can be evaluated. Otherwise, returns Undefined.
+        """
+        if isinstance(node, ast.Name):
+            return self._values.get(node.id, Undefined)
+
+        if isinstance(node, ast.BinOp):
+            left = self._evaluate(node.left)
+            right = self._evaluate(node.right)
+            return self._evaluate_binary_operation(left, right, node.op)
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._evaluate(node.operand)
+            if type(operand) is not int:
+                return Undefined
+            value = AstOptimizer.evaluate_unary_operation(operand, node.op)
+            return value if self._is_valid_value(value) else Undefined
+
+        value = AstOptimizer.literal_eval(node)
+        return value if self._is_valid_value(value) else Undefined
+
+    def _evaluate_binary_operation(self, left: Any, right: Any, op) -> Any:
+        if left is Undefined or right is Undefined or type(left) is not type(right):
+            return Undefined
+
+        operation = Operation.get_operation(op)
+        if isinstance(left, int) and not isinstance(left, bool):
+            if operation in (Operation.FloorDiv, Operation.Mod) and (left < 0 or right <= 0):
+                # Python and the Neo VM round the negative divisions differently
+                return Undefined
+        elif not (isinstance(left, (str, bytes)) and operation is Operation.Add):
+            return Undefined
+
+        value = AstOptimizer.evaluate_binary_operation(left, right, op)
+        return value if value is not None and self._is_valid_value(value) else Undefined
+
+    def _is_valid_value(self, value: Any) -> bool:
+        if value is None or isinstance(value, (bool, str, bytes)):
+            return True
+        return type(value) is int and -self._MAX_STACK_INT - 1 <= value <= self._MAX_STACK_INT
+
+    def _is_inlined_value(self, value: Any) -> bool:
+        # pushing these values costs less than loading them from a static field
+        if value is None or isinstance(value, bool):
+            return True
+        return type(value) is int and self._MIN_INLINED_INT <= value <= self._MAX_INLINED_INT
+
+    def _is_literal_node(self, node: ast.AST) -> bool:
+        return (isinstance(node, (ast.Constant, ast.Num, ast.Str, ast.Bytes, ast.NameConstant))
+                or (isinstance(node, ast.UnaryOp) and self._is_literal_node(node.operand)))
+
+    def _get_literal_node(self, value: Any, origin: ast.AST) -> ast.AST:
+        node = ast.parse(repr(value)).body[0].value
+        self.update_line_and_col(node, origin)
+        return node
+
+    # region Execution prices
+
+    def _get_expression_price(self, node: ast.AST) -> int:
+        """
+        Gets the price of the instructions that would evaluate the expression in the Neo VM
+        """
+        if isinstance(node, ast.Name):
+            return Opcode.LDSFLD.price
+        if isinstance(node, ast.BinOp):
+            return (self._get_expression_price(node.left)
+                    + self._get_expression_price(node.right)
+                    + self._get_operation_price(self._evaluate(node.left), node.op))
+        if isinstance(node, ast.UnaryOp):
+            return self._get_expression_price(node.operand) + Opcode.NEGATE.price
+
+        value = AstOptimizer.literal_eval(node)
+        return self._get_literal_price(value) if value is not Undefined else 0
+
+    def _get_operation_price(self, left: Any, op) -> int:
+        if isinstance(left, (str, bytes)) and Operation.get_operation(op) is Operation.Add:
+            return Opcode.CAT.price
+        return Opcode.ADD.price
+
+    def _get_literal_price(self, value: Any) -> int:
+        if value is None or isinstance(value, bool):
+            return Opcode.PUSH0.price
+        if isinstance(value, int):
+            if Opcode.get_literal_push(value) is not None:
+                return Opcode.PUSH0.price
+            if Opcode.get_literal_push(-value) is not None:
+                return Opcode.PUSH0.price + Opcode.NEGATE.price
+            # integers are pushed as data and converted
+            return self._get_push_data_price(len(Integer(value).to_byte_array(signed=True))) + Opcode.CONVERT.price
+        if isinstance(value, str):
+            value = value.encode()
+        if isinstance(value, bytes):
+            return self._get_push_data_price(len(value))
+        return 0
+
+    def _get_push_data_price(self, data_len: int) -> int:
+        from boa3 import constants
+        if data_len <= constants.ONE_BYTE_MAX_VALUE:
+            return Opcode.PUSHDATA1.price
+        if data_len <= constants.TWO_BYTES_MAX_VALUE:
+            return Opcode.PUSHDATA2.price
+        return Opcode.PUSHDATA4.price
+
+    # endregion
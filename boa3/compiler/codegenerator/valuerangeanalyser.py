@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import ast
+import math
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.astoptimizer import AstOptimizer
+from boa3.analyser.model.optimizer import Undefined
+from boa3.analyser.model.optimizer.Operation import Operation
+from boa3.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.model.method import Method
+from boa3.model.operation.operation import IOperation
+from boa3.model.operation.operator import Operator
+from boa3.model.symbol import ISymbol
+from boa3.model.variable import Variable
+
+# the lower bound of a variable that wasn't assigned yet and of an unknown value
+_UNASSIGNED = math.inf
+_UNBOUNDED = -math.inf
+
+LowerBound = Union[int, float]
+
+# assignment expressions are supported since Python 3.8
+_NAMED_EXPR = getattr(ast, 'NamedExpr', ())
+
+
+class _Guard:
+    """
+    A comparison that is known to be true in a region of the method: `name >= bound + offset`
+
+    :ivar parent: the guards of the enclosing regions, where the bound is evaluated
+    """
+
+    def __init__(self, parent: Optional[_Guard], name: str, bound: ast.AST, offset: int):
+        self.parent: Optional[_Guard] = parent
+        self.name: str = name
+        self.bound: ast.AST = bound
+        self.offset: int = offset
+
+
+class ValueRangeAnalyser(IAstAnalyser):
+    """
+    This class computes the lower bounds of the integer values of a method, to find the sequence indexes that can't be
+    negative and don't need to be fixed before getting or setting the items.
+
+    The bounds of the local variables are the lowest values of all their assignments, including the loop induction
+    variables of `for` loops over ranges. The comparisons in `if` and `while` tests refine the bounds in their bodies
+    and in the statements after an `if` that always returns.
+
+    The methods with the name starting with 'visit_' are implementations of methods from the :class:`NodeVisitor` class.
+    These methods are used to walk through the Python abstract syntax tree.
+    """
+
+    _MAX_ITERATIONS = 8
+
+    def __init__(self, function: ast.FunctionDef, symbols: Dict[str, ISymbol]):
+        super().__init__(function)
+        self.symbols = symbols
+
+        self._locals: Set[str] = set()
+        self._globals: Set[str] = set()
+        self._unknown: Set[str] = set()
+        self._assignments: List[Tuple[str, ast.AST, Optional[_Guard], bool]] = []
+        self._indexes: List[Tuple[ast.AST, Optional[_Guard]]] = []
+        self._bounds: Dict[str, LowerBound] = {}
+
+        self.non_negative_indexes: Set[ast.AST] = set()
+
+    @classmethod
+    def analyse_method(cls, function: ast.FunctionDef, symbols: Dict[str, ISymbol]) -> Set[ast.AST]:
+        """
+        Finds the sequence indexes of a method that are never negative
+
+        :param function: the method ast
+        :param symbols: the symbols of the module, used to find the values of the module variables
+        :return: the index expressions that are known to be non-negative
+        """
+        analyser = cls(function, symbols)
+        analyser._find_locals(function)
+        analyser._collect_statements(function.body, None)
+        analyser._compute_bounds()
+
+        for index, guard in analyser._indexes:
+            if analyser._lower_bound(index, guard) >= 0:
+                analyser.non_negative_indexes.add(index)
+        return analyser.non_negative_indexes
+
+    # region Statements
+
+    def _find_locals(self, function: ast.FunctionDef):
+        args = function.args
+        for arg in getattr(args, 'posonlyargs', []) + args.args + args.kwonlyargs + [args.vararg, args.kwarg]:
+            if arg is not None:
+                self._locals.add(arg.arg)
+                self._unknown.add(arg.arg)
+
+        for node in self._walk_method(function.body):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                self._locals.add(node.id)
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                # the value can be changed outside the method
+                self._globals.update(node.names)
+                self._unknown.update(node.names)
+            elif isinstance(node, ast.comprehension):
+                self._unknown.update(self._stored_names([node.target]))
+            elif isinstance(node, ast.ExceptHandler) and node.name is not None:
+                self._locals.add(node.name)
+                self._unknown.add(node.name)
+            elif isinstance(node, ast.Lambda):
+                lambda_args = getattr(node.args, 'posonlyargs', []) + node.args.args + node.args.kwonlyargs
+                self._locals.update(arg.arg for arg in lambda_args)
+                self._unknown.update(arg.arg for arg in lambda_args)
+
+    def _collect_statements(self, statements: List[ast.stmt], guard: Optional[_Guard]):
+        for index, stmt in enumerate(statements):
+            self._collect_expressions(stmt, guard)
+
+            if isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    self._include_assignment(target, stmt.value, guard)
+
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                self._include_assignment(stmt.target, stmt.value, guard)
+
+            elif isinstance(stmt, ast.AugAssign) and isinstance(stmt.target, ast.Name):
+                value = ast.BinOp(left=ast.Name(id=stmt.target.id, ctx=ast.Load()), op=stmt.op, right=stmt.value)
+                self._include_assignment(stmt.target, value, guard)
+
+            elif isinstance(stmt, ast.For):
+                if isinstance(stmt.target, ast.Name) and self._is_range(stmt.iter):
+                    self._assignments.append((stmt.target.id, stmt.iter, guard, True))
+                else:
+                    self._unknown.update(self._stored_names([stmt.target]))
+                self._collect_statements(stmt.body, guard)
+                self._collect_statements(stmt.orelse, guard)
+
+            elif isinstance(stmt, ast.While):
+                self._collect_statements(stmt.body, self._refine(guard, stmt.test, True, stmt.body))
+                self._collect_statements(stmt.orelse, guard)
+
+            elif isinstance(stmt, ast.If):
+                self._collect_statements(stmt.body, self._refine(guard, stmt.test, True, stmt.body))
+                self._collect_statements(stmt.orelse, self._refine(guard, stmt.test, False, stmt.orelse))
+
+                # if one of the branches always leaves the block, the other branch test holds after the if
+                remaining = statements[index + 1:]
+                if self._always_exits(stmt.body) and not self._always_exits(stmt.orelse):
+                    guard = self._refine(guard, stmt.test, False, stmt.orelse + remaining)
+                elif self._always_exits(stmt.orelse) and not self._always_exits(stmt.body):
+                    guard = self._refine(guard, stmt.test, True, stmt.body + remaining)
+
+            elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+                for item in stmt.items:
+                    if item.optional_vars is not None:
+                        self._unknown.update(self._stored_names([item.optional_vars]))
+                self._collect_statements(stmt.body, guard)
+
+            elif isinstance(stmt, ast.Try):
+                self._collect_statements(stmt.body, guard)
+                for handler in stmt.handlers:
+                    self._collect_statements(handler.body, guard)
+                self._collect_statements(stmt.orelse, guard)
+                self._collect_statements(stmt.finalbody, guard)
+
+    def _collect_expressions(self, stmt: ast.stmt, guard: Optional[_Guard]):
+        """
+        Finds the indexes used in the expressions of a statement, without the inner statements
+        """
+        for field, value in ast.iter_fields(stmt):
+            nodes = value if isinstance(value, list) else [value]
+            for node in nodes:
+                if not isinstance(node, ast.expr):
+                    continue
+                for inner_node in ast.walk(node):
+                    if isinstance(inner_node, ast.Subscript):
+                        self._include_indexes(inner_node, guard)
+                    elif isinstance(inner_node, _NAMED_EXPR):
+                        self._unknown.update(self._stored_names([inner_node.target]))
+
+    def _include_indexes(self, subscript: ast.Subscript, guard: Optional[_Guard]):
+        index = subscript.slice.value if isinstance(subscript.slice, ast.Index) else subscript.slice
+        if isinstance(index, ast.Slice):
+            for bound in (index.lower, index.upper):
+                if bound is not None:
+                    self._indexes.append((bound, guard))
+        else:
+            self._indexes.append((index, guard))
+
+    def _include_assignment(self, target: ast.AST, value: ast.AST, guard: Optional[_Guard]):
+        if isinstance(target, ast.Name):
+            self._assignments.append((target.id, value, guard, False))
+        else:
+            self._unknown.update(self._stored_names([target]))
+
+    def _refine(self, guard: Optional[_Guard], test: ast.AST, is_true: bool,
+                region: List[ast.stmt]) -> Optional[_Guard]:
+        """
+        Includes the comparisons that hold in a region of the method when the test has the given result
+
+        :return: the guards of the region
+        """
+        assigned = {node.id for node in self._walk_method(region)
+                    if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del))}
+
+        for name, bound, offset in self._get_comparisons(test, is_true):
+            if name not in assigned:
+                guard = _Guard(guard, name, bound, offset)
+        return guard
+
+    def _get_comparisons(self, test: ast.AST, is_true: bool) -> Iterable[Tuple[str, ast.AST, int]]:
+        """
+        Gets the lower bounds that a test implies: each one means `name >= bound + offset`
+        """
+        if isinstance(test, ast.UnaryOp) and self._get_operator(test.op) is Operator.Not:
+            yield from self._get_comparisons(test.operand, not is_true)
+
+        elif isinstance(test, ast.BoolOp):
+            operator = self._get_operator(test.op)
+            # (a and b) is true or (a or b) is false only if both are
+            if (operator is Operator.And and is_true) or (operator is Operator.Or and not is_true):
+                for value in test.values:
+                    yield from self._get_comparisons(value, is_true)
+
+        elif isinstance(test, ast.Compare):
+            if not is_true and len(test.ops) > 1:
+                # a false chained comparison doesn't tell which of the comparisons is false
+                return
+
+            operands = [test.left] + test.comparators
+            for left, op, right in zip(operands, test.ops, operands[1:]):
+                operator = self._get_operator(op)
+                if not is_true:
+                    operator = {Operator.Lt: Operator.GtE,
+                                Operator.LtE: Operator.Gt,
+                                Operator.Gt: Operator.LtE,
+                                Operator.GtE: Operator.Lt}.get(operator)
+
+                if isinstance(left, ast.Name) and operator in (Operator.Gt, Operator.GtE):
+                    yield left.id, right, 1 if operator is Operator.Gt else 0
+                if isinstance(right, ast.Name) and operator in (Operator.Lt, Operator.LtE):
+                    yield right.id, left, 1 if operator is Operator.Lt else 0
+
+    def _always_exits(self, statements: List[ast.stmt]) -> bool:
+        return len(statements) > 0 and isinstance(statements[-1], (ast.Return, ast.Raise, ast.Break, ast.Continue))
+
+    def _walk_method(self, statements: List[ast.stmt]) -> Iterable[ast.AST]:
+        for stmt in statements:
+            for node in ast.walk(stmt):
+                yield node
+
+    def _stored_names(self, targets: List[ast.AST]) -> Set[str]:
+        return {node.id for target in targets for node in ast.walk(target) if isinstance(node, ast.Name)}
+
+    # endregion
+
+    # region Bounds
+
+    def _compute_bounds(self):
+        for name in self._locals:
+            self._bounds[name] = _UNBOUNDED if name in self._unknown else _UNASSIGNED
+
+        # the bounds only decrease while the assignments are evaluated, until all of them are included
+        iteration = 0
+        changed = True
+        while changed:
+            changed = False
+            for name, value, guard, is_range in self._assignments:
+                if name in self._unknown:
+                    continue
+                bound = self._range_lower_bound(value, guard) if is_range else self._lower_bound(value, guard)
+                if bound < self._bounds[name]:
+                    # the values that keep decreasing in a loop don't have a lower bound
+                    self._bounds[name] = bound if iteration < self._MAX_ITERATIONS else _UNBOUNDED
+                    changed = True
+            iteration += 1
+
+    def _lower_bound(self, node: ast.AST, guard: Optional[_Guard]) -> LowerBound:
+        """
+        Gets the lowest value an integer expression can have
+
+        :return: the lower bound of the expression. Negative infinity if it's unknown
+        """
+        if isinstance(node, ast.Name):
+            return self._name_lower_bound(node.id, guard)
+
+        if isinstance(node, ast.BinOp):
+            operation = Operation.get_operation(node.op)
+            left = self._lower_bound(node.left, guard)
+            if operation is Operation.Sub:
+                right = self._constant_value(node.right)
+                return left - right if right is not None else _UNBOUNDED
+
+            right = self._lower_bound(node.right, guard)
+            if _UNASSIGNED in (left, right):
+                return _UNASSIGNED
+            if operation is Operation.Add:
+                return left + right
+            if operation is Operation.Mult:
+                return left * right if left >= 0 and right >= 0 else _UNBOUNDED
+            if operation in (Operation.FloorDiv, Operation.Mod):
+                return 0 if left >= 0 and right > 0 else _UNBOUNDED
+            return _UNBOUNDED
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            function_name = self._get_builtin_name(node.func.id)
+            if function_name in ('len', 'abs'):
+                return 0
+
+        if isinstance(node, ast.IfExp):
+            return min(self._lower_bound(node.body, guard), self._lower_bound(node.orelse, guard))
+
+        value = self._constant_value(node)
+        return value if value is not None else _UNBOUNDED
+
+    def _name_lower_bound(self, name: str, guard: Optional[_Guard]) -> LowerBound:
+        if name not in self._locals:
+            # module variables are only known if they were evaluated while compiling
+            value = self._constant_value(ast.Name(id=name, ctx=ast.Load()))
+            return value if value is not None else _UNBOUNDED
+
+        bound = self._bounds.get(name, _UNBOUNDED)
+        if name in self._globals:
+            # the global can be changed by the methods called after the comparison
+            return bound
+
+        while guard is not None:
+            if guard.name == name:
+                bound = max(bound, self._lower_bound(guard.bound, guard.parent) + guard.offset)
+            guard = guard.parent
+        return bound
+
+    def _range_lower_bound(self, range_call: ast.Call, guard: Optional[_Guard]) -> LowerBound:
+        start, stop, step = self._get_range_args(range_call)
+        step_value = self._constant_value(step) if step is not None else 1
+        if step_value is None:
+            return _UNBOUNDED
+        if step_value > 0:
+            return self._lower_bound(start, guard) if start is not None else 0
+        # with negative steps, the values are greater than stop
+        return self._lower_bound(stop, guard) + 1
+
+    def _constant_value(self, node: ast.AST) -> Optional[int]:
+        if isinstance(node, ast.Name):
+            if node.id in self._locals:
+                return None
+            symbol = self.symbols.get(node.id)
+            if isinstance(symbol, Variable) and symbol.has_literal_value:
+                value = symbol.literal_value
+            else:
+                return None
+        elif isinstance(node, ast.UnaryOp):
+            operand = self._constant_value(node.operand)
+            if operand is None:
+                return None
+            value = AstOptimizer.evaluate_unary_operation(operand, node.op)
+        else:
+            value = AstOptimizer.literal_eval(node)
+
+        return value if isinstance(value, int) and value is not Undefined else None
+
+    # endregion
+
+    def _is_range(self, node: ast.AST) -> bool:
+        return (isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and self._get_builtin_name(node.func.id) == 'range')
+
+    def _get_range_args(self, range_call: ast.Call) -> Tuple[Optional[ast.AST], ast.AST, Optional[ast.AST]]:
+        args = range_call.args
+        if range_call.func.id.startswith('-'):
+            # the type checker reorders the arguments of the builtin range: stop, start and step
+            args = args + [None] * (3 - len(args))
+            return args[1], args[0], args[2]
+
+        if len(args) == 1:
+            return None, args[0], None
+        return args[0], args[1], args[2] if len(args) > 2 else None
+
+    def _get_builtin_name(self, function_id: str) -> Optional[str]:
+        if function_id.startswith('-'):
+            # builtins that have different implementations for each argument type
+            return function_id[1:].split('_from_')[0]
+        if function_id in self._locals:
+            return None
+
+        symbol = self.symbols.get(function_id)
+        if isinstance(symbol, Method) and not isinstance(symbol, IBuiltinMethod):
+            # user methods can have the same names as the builtins
+            return None
+        return function_id
+
+    def _get_operator(self, op) -> Optional[Operator]:
+        if isinstance(op, IOperation):
+            return op.operator
+        return Operator.get_operation(op)
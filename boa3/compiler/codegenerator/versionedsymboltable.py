@@ -0,0 +1,45 @@
+from typing import Dict
+
+from boa3.model.symbol import ISymbol
+
+
+class VersionedSymbolTable(dict):
+    """
+    A symbol table that counts its changes, so the information computed from its symbols can be cached until the
+    table is changed
+
+    :ivar version: the number of changes made to the table
+    """
+
+    def __init__(self, symbols: Dict[str, ISymbol] = None):
+        super().__init__(symbols if symbols is not None else {})
+        self.version: int = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
@@ -127,6 +127,15 @@ class VMCodeMapping:
             return 0
         return next(key for key, value in self._codes.items() if value == vm_code)
 
+    def get_addresses_table(self) -> Dict[VMCode, int]:
+        """
+        Gets the first byte address of every vm code, to look up many addresses without searching the map each time.
+        The table isn't updated if the map changes
+
+        :return: a dictionary that maps each vm code to its address
+        """
+        return {vm_code: address for address, vm_code in self._codes.items()}
+
     def get_end_address(self, vm_code: VMCode) -> int:
         """
         Gets the vm code's last byte address
@@ -1,8 +1,13 @@
 import logging
 import os
+from typing import Any, Dict, Optional, Union
 
 from boa3 import constants
 from boa3.analyser.analyser import Analyser
+from boa3.analyser.model.modulescache import ModulesCache
+from boa3.analyser.model.virtualmodules import VirtualModules
+from boa3.compiler.artifacts import CompilationArtifacts
+from boa3.compiler.checkresult import CheckResult
 from boa3.compiler.codegenerator.codegenerator import CodeGenerator
 from boa3.compiler.filegenerator import FileGenerator
 from boa3.exception.NotLoadedException import NotLoadedException
@@ -20,12 +25,16 @@ class Compiler:
         self._analyser: Analyser = None
         self._entry_smart_contract: str = ''
 
-    def compile(self, path: str, log: bool = True) -> bytes:
+    def compile(self, path: str, log: bool = True, cache_globals: bool = False,
+                inline_threshold: Optional[int] = None) -> bytes:
         """
         Load a Python file and tries to compile it
 
         :param path: the path of the Python file to compile
         :param log: if compiler errors should be logged.
+        :param cache_globals: if the global variables saved in the storage should be cached during each invocation
+        :param inline_threshold: the maximum size of the methods whose calls are replaced by their code. Zero inlines
+                                 only the methods decorated with `inline`
         :return: the bytecode of the compiled .nef file
         """
         fullpath = os.path.realpath(path)
@@ -34,45 +43,177 @@ class Compiler:
         logging.info(f'neo3-boa v{constants.BOA_VERSION}\tPython {constants.SYS_VERSION}')
         logging.info(f'Started compiling\t{filename}')
         self._entry_smart_contract = os.path.splitext(filename)[0]
-        self._analyse(fullpath, log)
-        return self._compile()
+        self._analyse(fullpath, log, inline_threshold=inline_threshold)
+        return self._compile(cache_globals)
 
-    def compile_and_save(self, path: str, output_path: str, log: bool = True):
+    def compile_artifacts(self, path: str, log: bool = True, source: Union[str, bytes] = None,
+                          modules: Optional[Dict[str, Union[str, bytes]]] = None,
+                          cache_globals: bool = False, inline_threshold: Optional[int] = None) -> CompilationArtifacts:
+        """
+        Compiles a Python file and generates the metadata files in memory, without writing them into files
+
+        :param path: the path of the Python file to compile. If the source is given, it's only the file's virtual path
+        :param log: if compiler errors should be logged.
+        :param source: the source code to compile. If it's given, user modules are never read from the file system
+        :param modules: a dictionary that maps the name of the user modules that can be imported with their source code
+        :param cache_globals: if the global variables saved in the storage should be cached during each invocation
+        :param inline_threshold: the maximum size of the methods whose calls are replaced by their code. Zero inlines
+                                 only the methods decorated with `inline`
+        :return: the compiled contract artifacts
+        :raise NotLoadedException: raised if the file couldn't be compiled
+        """
+        import json
+        import time
+
+        if source is None:
+            path = os.path.realpath(path)
+        path = path.replace(os.sep, '/')
+        filename = os.path.basename(path)
+
+        virtual_modules = None
+        if source is not None or modules is not None:
+            virtual_modules = VirtualModules(modules if modules is not None else {},
+                                             root=os.path.dirname(path),
+                                             read_files=source is None)
+
+        logging.info(f'neo3-boa v{constants.BOA_VERSION}\tPython {constants.SYS_VERSION}')
+        logging.info(f'Started compiling\t{filename}')
+        self._entry_smart_contract = os.path.splitext(filename)[0]
+        timings: Dict[str, float] = {}
+
+        start = time.perf_counter()
+        self._analyse(path, log, source, virtual_modules, inline_threshold)
+        timings['analyse'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.bytecode = self._compile(cache_globals)
+        timings['compile'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        generator = FileGenerator(self.bytecode, self._analyser, self._entry_smart_contract)
+        nef = generator.generate_nef_file()
+        # the json documents are parsed back, so they are the same as the ones saved in the files
+        manifest = json.loads(generator.generate_manifest_file())
+        debug_info = json.loads(generator.generate_nefdbgnfo_file())
+        timings['generate'] = time.perf_counter() - start
+
+        return CompilationArtifacts(nef=nef,
+                                    script=bytes(self.bytecode),
+                                    script_hash=generator.script_hash,
+                                    manifest=manifest,
+                                    debug_info=debug_info,
+                                    warnings=self._analyser.warnings,
+                                    timings=timings)
+
+    def check(self, path: str, log: bool = True, source: Union[str, bytes] = None,
+              modules: Optional[Dict[str, Union[str, bytes]]] = None,
+              modules_cache: Optional[ModulesCache] = None) -> CheckResult:
+        """
+        Analyses a Python file without optimizing nor compiling it
+
+        :param path: the path of the Python file to check. If the source is given, it's only the file's virtual path
+        :param log: if compiler errors should be logged.
+        :param source: the source code to check. If it's given, user modules are never read from the file system
+        :param modules: a dictionary that maps the name of the user modules that can be imported with their source code
+        :param modules_cache: the analysis of the imported user modules, shared between the checked files
+        :return: the errors and warnings found in the file
+        """
+        import time
+
+        if source is None:
+            path = os.path.realpath(path)
+        path = path.replace(os.sep, '/')
+
+        virtual_modules = None
+        if source is not None or modules is not None:
+            virtual_modules = VirtualModules(modules if modules is not None else {},
+                                             root=os.path.dirname(path),
+                                             read_files=source is None)
+
+        start = time.perf_counter()
+        try:
+            self._analyser = Analyser.analyse(path, log, source=source, virtual_modules=virtual_modules,
+                                              modules_cache=modules_cache, optimize=False)
+            errors = self._analyser.errors
+            warnings = self._analyser.warnings
+        except SyntaxError as syntax_error:
+            from boa3.exception import CompilerError
+            line = syntax_error.lineno if syntax_error.lineno is not None else 0
+            col = syntax_error.offset - 1 if syntax_error.offset else 0
+            error = CompilerError.InvalidSyntax(line, col, syntax_error.msg)
+            if log:
+                logging.error(error)
+            errors = [error]
+            warnings = []
+
+        return CheckResult(path, errors, warnings, time.perf_counter() - start)
+
+    def compile_and_save(self, path: str, output_path: str, log: bool = True, pretty: bool = False,
+                         cache_globals: bool = False, inline_threshold: Optional[int] = None):
         """
         Save the compiled file and the metadata files
 
         :param path: the path of the Python file to compile
         :param output_path: the path to save the generated files
         :param log: if compiler errors should be logged.
+        :param pretty: if the manifest and the debug info should be indented.
+        :param cache_globals: if the global variables saved in the storage should be cached during each invocation
+        :param inline_threshold: the maximum size of the methods whose calls are replaced by their code. Zero inlines
+                                 only the methods decorated with `inline`
         """
-        self.bytecode = self.compile(path, log)
-        self._save(output_path)
+        self.bytecode = self.compile(path, log, cache_globals, inline_threshold)
+        self._save(output_path, pretty, options=self.get_options(cache_globals, inline_threshold))
 
-    def _analyse(self, path: str, log: bool = True):
+    @staticmethod
+    def get_options(cache_globals: bool = False, inline_threshold: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Gets the compiler options that change the generated code, which are saved in the build stamp
+
+        :param cache_globals: if the global variables saved in the storage are cached during each invocation
+        :param inline_threshold: the maximum size of the methods whose calls are replaced by their code
+        :return: the options that aren't the default ones. None if all of them are the default
+        """
+        options = {}
+        if cache_globals:
+            options['cache-globals'] = True
+        if inline_threshold is not None:
+            options['inline-threshold'] = inline_threshold
+        return options if len(options) > 0 else None
+
+    def _analyse(self, path: str, log: bool = True, source: Union[str, bytes] = None,
+                 virtual_modules: Optional[VirtualModules] = None, inline_threshold: Optional[int] = None):
         """
         Load a Python file and analyses its syntax
 
         :param path: the path of the Python file to compile
         :param log: if compiler errors should be logged.
+        :param source: the source code of the file. If it's None, it's read from the path
+        :param virtual_modules: the user modules that can be imported without being read from the file system
+        :param inline_threshold: the maximum size of the methods whose calls are replaced by their code. Zero inlines
+                                 only the methods decorated with `inline`
         """
-        self._analyser = Analyser.analyse(path, log)
+        self._analyser = Analyser.analyse(path, log, source=source, virtual_modules=virtual_modules,
+                                          inline_threshold=inline_threshold)
 
-    def _compile(self) -> bytes:
+    def _compile(self, cache_globals: bool = False) -> bytes:
         """
         Compile the analysed Python file.
 
+        :param cache_globals: if the global variables saved in the storage should be cached during each invocation
         :return: the compiled file as a bytecode.
         :raise NotLoadedException: raised if none file were analysed
         """
         if not self._analyser.is_analysed:
             raise NotLoadedException
-        return CodeGenerator.generate_code(self._analyser)
+        return CodeGenerator.generate_code(self._analyser, cache_globals)
 
-    def _save(self, output_path: str):
+    def _save(self, output_path: str, pretty: bool = False, options: Optional[Dict[str, Any]] = None):
         """
         Save the compiled file and the metadata files
 
         :param output_path: the path to save the generated files
+        :param pretty: if the manifest and the debug info should be indented
+        :param options: the compiler options that changed the generated code
         :raise NotLoadedException: raised if no file were compiled
         """
         if (self._analyser is None
@@ -80,6 +221,12 @@ class Compiler:
                 or len(self.bytecode) == 0):
             raise NotLoadedException
 
+        from boa3.compiler.buildstamp import BuildStamp
+        stamp_path = BuildStamp.get_path(output_path)
+        if os.path.isfile(stamp_path):
+            # the previous stamp is invalid once the artifacts start being overwritten
+            os.remove(stamp_path)
+
         generator = FileGenerator(self.bytecode, self._analyser, self._entry_smart_contract)
         with open(output_path, 'wb+') as nef_file:
             nef_bytes = generator.generate_nef_file()
@@ -87,11 +234,13 @@ class Compiler:
             nef_file.close()
 
         with open(output_path.replace('.nef', '.manifest.json'), 'wb+') as manifest_file:
-            manifest_bytes = generator.generate_manifest_file()
-            manifest_file.write(manifest_bytes)
-            manifest_file.close()
+            generator.write_manifest_file(manifest_file, pretty)
 
         from zipfile import ZipFile, ZIP_DEFLATED
         with ZipFile(output_path.replace('.nef', '.nefdbgnfo'), 'w', ZIP_DEFLATED) as nef_debug_info:
-            debug_bytes = generator.generate_nefdbgnfo_file()
-            nef_debug_info.writestr(os.path.basename(output_path.replace('.nef', '.debug.json')), debug_bytes)
+            # the debug info is written directly into the compressed entry
+            with nef_debug_info.open(os.path.basename(output_path.replace('.nef', '.debug.json')), 'w') as debug_file:
+                generator.write_nefdbgnfo_file(debug_file, pretty)
+
+        # the stamp is saved last, so an interrupted save doesn't leave outdated artifacts marked as valid
+        BuildStamp.from_analyser(self._analyser, options).save(output_path)
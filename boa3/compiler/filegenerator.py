@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from boa3 import constants
 from boa3.analyser.analyser import Analyser
@@ -12,6 +12,22 @@ from boa3.model.symbol import ISymbol
 from boa3.model.variable import Variable
 from boa3.neo import to_hex_str
 from boa3.neo.contracts.neffile import NefFile
+from boa3.neo.vm.VMCode import VMCode
+
+# size of the chunks written to the output streams, so the json files are never built in a single string
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def get_debug_id(qualified_name: str) -> str:
+    """
+    Gets the id of a method or an event in the debug info. It's derived from the symbol's qualified name, so it's the
+    same in every build
+
+    :param qualified_name: the name of the symbol in the debug info, including its module
+    :return: the id of the symbol
+    """
+    from boa3.neo.cryptography import sha256
+    return str(int.from_bytes(sha256(qualified_name.encode(ENCODING))[:8], 'little'))
 
 
 class FileGenerator:
@@ -28,7 +44,55 @@ class FileGenerator:
         self._entry_file_full_path = analyser.path.replace(os.sep, '/')
 
         self._files: List[str] = [self._entry_file_full_path]
+        self._files_indexes: Dict[str, int] = {self._entry_file_full_path: 0}
         self._nef: NefFile = NefFile(bytecode)
+        self._addresses: Optional[Dict[VMCode, int]] = None
+
+        # indexes of the imported symbols, built only once when they are first used
+        self._symbols_origins: Optional[Dict[int, Import]] = None
+        self._static_variables_info: Optional[Tuple[Dict[str, int],
+                                                    List[str],
+                                                    Optional[Dict[str, List[Tuple[int, Import]]]]]] = None
+
+    @property
+    def _addresses_table(self) -> Dict[VMCode, int]:
+        """
+        Gets the address of each instruction of the generated code. It's computed only once, because the code doesn't
+        change after it is generated
+
+        :return: a dictionary that maps each vm code with its address
+        """
+        if self._addresses is None:
+            from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
+            self._addresses = VMCodeMapping.instance().get_addresses_table()
+        return self._addresses
+
+    @staticmethod
+    def _write_json(data: Any, stream: BinaryIO, pretty: bool):
+        """
+        Encodes the data as json and writes it into the stream in chunks
+
+        :param data: the data to be encoded
+        :param stream: the binary stream where the json is written
+        :param pretty: whether the json is indented. If False, the json is written without whitespaces
+        """
+        if pretty:
+            encoder = json.JSONEncoder(indent=4)
+        else:
+            encoder = json.JSONEncoder(separators=(',', ':'))
+
+        chunks = []
+        chunks_size = 0
+        for chunk in encoder.iterencode(data):
+            chunks.append(chunk)
+            chunks_size += len(chunk)
+            if chunks_size >= _STREAM_CHUNK_SIZE:
+                stream.write(''.join(chunks).encode(ENCODING))
+                chunks.clear()
+                chunks_size = 0
+
+        if len(chunks) > 0:
+            stream.write(''.join(chunks).encode(ENCODING))
 
     @property
     def _public_methods(self) -> Dict[str, Method]:
@@ -70,7 +134,8 @@ class FileGenerator:
         imported_symbols: Dict[str, Import] = {}
 
         for name, symbol in self._symbols.items():
-            if symbol.defined_by_entry and isinstance(symbol, Method) and not isinstance(symbol, IBuiltinCallable):
+            if (symbol.defined_by_entry and isinstance(symbol, Method) and not isinstance(symbol, IBuiltinCallable)
+                    and not symbol.is_inlined):
                 methods[(self._entry_file, name)] = symbol
             elif isinstance(symbol, Import):
                 imported_symbols[symbol.origin] = symbol
@@ -86,15 +151,14 @@ class FileGenerator:
             methods = {(unique_id, method_name): method for (module_id, method_name), method in methods.items()}
 
         # include all user created methods in the list, even the methods that aren't imported in the entry file
-        for index in range(len(imported_to_map)):
-            module_full_path, module_import = list(imported_to_map.items())[index]
-            module_id = imports_unique_ids[index]
-
+        included_methods = {id(method) for method in methods.values()}
+        for module_import, module_id in zip(imported_to_map.values(), imports_unique_ids):
             for name, symbol in module_import.all_symbols.items():
                 if (isinstance(symbol, Method)
                         and not isinstance(symbol, IBuiltinCallable)
-                        and symbol not in [method for method in methods.values()]):
+                        and id(symbol) not in included_methods):
                     methods[(module_id, name)] = symbol
+                    included_methods.add(id(symbol))
 
         return methods
 
@@ -109,6 +173,15 @@ class FileGenerator:
 
     # region NEF
 
+    @property
+    def script_hash(self) -> bytes:
+        """
+        Gets the hash of the compiled script
+
+        :return: the script hash
+        """
+        return self._nef.script_hash
+
     @property
     def _nef_hash(self) -> str:
         """
@@ -116,7 +189,7 @@ class FileGenerator:
 
         :return: the hex string representation of the hash
         """
-        return to_hex_str(self._nef.script_hash)
+        return to_hex_str(self.script_hash)
 
     def generate_nef_file(self) -> bytes:
         """
@@ -130,15 +203,27 @@ class FileGenerator:
 
     # region Manifest
 
-    def generate_manifest_file(self) -> bytes:
+    def generate_manifest_file(self, pretty: bool = False) -> bytes:
         """
         Generates the .manifest metadata file
 
+        :param pretty: whether the json is indented
         :return: the resulting manifest as a byte array
         """
+        from io import BytesIO
+        with BytesIO() as stream:
+            self.write_manifest_file(stream, pretty)
+            return stream.getvalue()
+
+    def write_manifest_file(self, stream: BinaryIO, pretty: bool = False):
+        """
+        Generates the .manifest metadata file and writes it into a stream
+
+        :param stream: the binary stream where the manifest is written
+        :param pretty: whether the json is indented
+        """
         data: Dict[str, Any] = self._get_manifest_info()
-        json_data: str = json.dumps(data, indent=4)
-        return bytes(json_data, ENCODING)
+        self._write_json(data, stream, pretty)
 
     def _get_manifest_info(self) -> Dict[str, Any]:
         """
@@ -187,10 +272,9 @@ class FileGenerator:
         return methods
 
     def _construct_abi_method(self, method_id: str, method: Method) -> Dict[str, Any]:
-        from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
         return {
             "name": method_id,
-            "offset": (VMCodeMapping.instance().get_start_address(method.start_bytecode)
+            "offset": (self._addresses_table.get(method.start_bytecode, 0)
                        if method.start_bytecode is not None else 0),
             "parameters": [
                 {
@@ -224,15 +308,27 @@ class FileGenerator:
 
     # region Debug Info
 
-    def generate_nefdbgnfo_file(self) -> bytes:
+    def generate_nefdbgnfo_file(self, pretty: bool = False) -> bytes:
         """
         Generates a debug map for NEO debugger
 
+        :param pretty: whether the json is indented
         :return: the resulting map as a byte array
         """
+        from io import BytesIO
+        with BytesIO() as stream:
+            self.write_nefdbgnfo_file(stream, pretty)
+            return stream.getvalue()
+
+    def write_nefdbgnfo_file(self, stream: BinaryIO, pretty: bool = False):
+        """
+        Generates a debug map for NEO debugger and writes it into a stream
+
+        :param stream: the binary stream where the debug map is written
+        :param pretty: whether the json is indented
+        """
         data: Dict[str, Any] = self._get_debug_info()
-        json_data: str = json.dumps(data, indent=4)
-        return bytes(json_data, ENCODING)
+        self._write_json(data, stream, pretty)
 
     def _get_debug_info(self) -> Dict[str, Any]:
         """
@@ -260,13 +356,13 @@ class FileGenerator:
         ]
 
     def _get_method_debug_info(self, module_id: str, method_id: str, method: Method) -> Dict[str, Any]:
-        from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
         from boa3.neo.vm.type.AbiType import AbiType
         from boa3.model.type.itype import IType
+        qualified_name = '{0},{1}'.format(module_id, method_id)
         return {
-            "id": str(id(method)),
-            "name": '{0},{1}'.format(module_id, method_id),
-            "range": '{0}-{1}'.format(method.start_address, method.end_address),
+            "id": get_debug_id(qualified_name),
+            "name": qualified_name,
+            "range": '{0}-{1}'.format(*self._get_method_range(method)),
             "params": [
                 '{0},{1}'.format(name, var.type.abi_type) for name, var in method.args.items()
             ],
@@ -275,30 +371,68 @@ class FileGenerator:
                 '{0},{1}'.format(name, var.type.abi_type if isinstance(var.type, IType) else AbiType.Any)
                 for name, var in method.locals.items()
             ],
-            "sequence-points": [
-                '{0}[{1}]{2}:{3}-{4}:{5}'.format(VMCodeMapping.instance().get_start_address(instruction.code),
-                                                 self._get_method_origin_index(method),
-                                                 instruction.start_line, instruction.start_col,
-                                                 instruction.end_line, instruction.end_col)
-                for instruction in method.debug_map()
-            ]
+            "sequence-points": self._get_method_sequence_points(method)
         }
 
-    def _get_method_origin_index(self, method: Method) -> int:
-        imported_files: List[Import] = [imported for imported in self._symbols.values()
-                                        if isinstance(imported, Import) and imported.origin is not None]
-        imported = None
-        for file in imported_files:
-            if method in file.all_symbols.values():
-                imported = file
-                break
+    def _get_method_sequence_points(self, method: Method) -> List[str]:
+        addresses = self._addresses_table
+        debug_map = method.debug_map(addresses)
+        if len(debug_map) == 0:
+            return []
+
+        # the document index is the same for every instruction in the method
+        sequence_point_format = '{0}[' + str(self._get_method_origin_index(method)) + ']{1}:{2}-{3}:{4}'
+        return [
+            sequence_point_format.format(addresses.get(instruction.code, 0),
+                                         instruction.start_line, instruction.start_col,
+                                         instruction.end_line, instruction.end_col)
+            for instruction in debug_map
+        ]
+
+    def _get_method_range(self, method: Method) -> Tuple[int, int]:
+        """
+        Gets the first and the last addresses of a method, using the addresses table instead of searching the code map
+
+        :param method: the method to get the range
+        :return: the same addresses as the method's `start_address` and `end_address`
+        """
+        addresses = self._addresses_table
+
+        if method.init_bytecode is None and method.init_defaults_bytecode is None:
+            start_address = method.init_address
+        else:
+            start_address = addresses.get(method.init_bytecode, 0)
+
+        if method.end_bytecode is None:
+            end_address = start_address
+        elif method.end_bytecode in addresses:
+            end_address = addresses[method.end_bytecode] + method.end_bytecode.size - 1
+        else:
+            end_address = 0
+
+        return start_address, end_address
 
+    def _get_method_origin_index(self, method: Method) -> int:
+        if self._symbols_origins is None:
+            # maps each imported symbol to the first import that includes it
+            symbols_origins: Dict[int, Import] = {}
+            for imported in self._symbols.values():
+                if isinstance(imported, Import) and imported.origin is not None:
+                    for symbol in imported.all_symbols.values():
+                        if id(symbol) not in symbols_origins:
+                            symbols_origins[id(symbol)] = imported
+            self._symbols_origins = symbols_origins
+
+        imported = self._symbols_origins.get(id(method))
         if imported is None:
             return 0
-        else:
-            if imported.origin not in self._files:
-                self._files.append(imported.origin)
-            return self._files.index(imported.origin)
+
+        file_index = self._files_indexes.get(imported.origin)
+        if file_index is None:
+            file_index = len(self._files)
+            self._files.append(imported.origin)
+            self._files_indexes[imported.origin] = file_index
+        return file_index
 
     def _get_debug_events(self) -> List[Dict[str, Any]]:
         """
@@ -308,7 +442,7 @@ class FileGenerator:
         """
         return [
             {
-                "id": str(id(event)),
+                "id": get_debug_id(',{0}'.format(event_id)),
                 "name": ',{0}'.format(event_id),  # TODO: include module name
                 "params": [
                     '{0},{1}'.format(name, var.type.abi_type) for name, var in event.args.items()
@@ -327,7 +461,13 @@ class FileGenerator:
 
         static_variables = []
 
+        # the imports ids and the slot indexes are computed only once for all the variables
+        self._static_variables_info = None
+
         for name, var in self._static_variables.items():
+            if var.has_literal_value:
+                # there's no slot to inspect, the value is pushed where the variable is used
+                continue
             var_unique_name = self._get_static_var_unique_name(name)
             var_type = var.type.abi_type if isinstance(var.type, IType) else AbiType.Any
 
@@ -345,38 +485,64 @@ class FileGenerator:
 
     # endregion
 
-    def _get_static_var_unique_name(self, variable_id) -> str:
-        imported_symbols: Dict[str, Import] = {}
+    def _get_static_variables_info(self) -> Tuple[Dict[str, int], List[str],
+                                                  Optional[Dict[str, List[Tuple[int, Import]]]]]:
+        """
+        Gets the information used to generate the unique names of the static variables
 
-        for name, symbol in self._symbols.items():
-            if isinstance(symbol, Import):
-                imported_symbols[symbol.origin] = symbol
+        :return: the slot index of each static variable, the unique ids of the imported modules and the modules that
+        include each symbol name, with their indexes. The last one is None if there is only one module to map
+        """
+        if self._static_variables_info is None:
+            static_variables = self._static_variables
+            # the variables with values known while compiling aren't stored in static fields
+            slot_indexes = {variable_id: index for index, variable_id in
+                            enumerate(variable_id for variable_id, variable in static_variables.items()
+                                      if not variable.has_literal_value)}
+
+            imported_symbols: Dict[str, Import] = {}
+            for name, symbol in self._symbols.items():
+                if isinstance(symbol, Import):
+                    imported_symbols[symbol.origin] = symbol
+
+            imported_to_map, imports_unique_ids = self._get_imports_unique_ids(imported_symbols,
+                                                                               False,
+                                                                               list(static_variables.values())
+                                                                               )
+
+            if len(imported_to_map) <= 1:
+                symbols_modules = None
+            else:
+                symbols_modules: Dict[str, List[Tuple[int, Import]]] = {}
+                for index, imported in enumerate(imported_symbols.values()):
+                    if isinstance(imported, Import):
+                        for symbol_id in imported.all_symbols:
+                            symbols_modules.setdefault(symbol_id, []).append((index, imported))
+
+            self._static_variables_info = slot_indexes, imports_unique_ids, symbols_modules
+        return self._static_variables_info
+
+    def _get_static_var_unique_name(self, variable_id) -> str:
+        slot_indexes, imports_unique_ids, symbols_modules = self._get_static_variables_info()
 
-        imported_to_map, imports_unique_ids = self._get_imports_unique_ids(imported_symbols,
-                                                                           False,
-                                                                           list(self._static_variables.values())
-                                                                           )
         split_name = variable_id.split(constants.VARIABLE_NAME_SEPARATOR)
         if len(split_name) > 1:
             variable_original_id = split_name[-1]
         else:
             variable_original_id = variable_id
 
-        if len(imported_to_map) <= 1:
+        if symbols_modules is None:
             return variable_original_id
 
-        for index, imported in enumerate(imported_symbols.values()):
-            if isinstance(imported, Import) and variable_original_id in imported.all_symbols:
-                if len(split_name) <= 1 or str(imported.ast.__hash__()) == split_name[0]:
-                    return '{0}.{1}'.format(imports_unique_ids[index], variable_original_id)
+        for index, imported in symbols_modules.get(variable_original_id, []):
+            if len(split_name) <= 1 or str(imported.ast.__hash__()) == split_name[0]:
+                return '{0}.{1}'.format(imports_unique_ids[index], variable_original_id)
 
         return '{0}.{1}'.format(imports_unique_ids[-1], variable_original_id)
 
     def _get_static_var_slot_index(self, variable_id) -> Optional[int]:
-        module_globals = list(self._static_variables.keys())
-        if variable_id in module_globals:
-            return module_globals.index(variable_id)
-        return None
+        slot_indexes, imports_unique_ids, symbols_modules = self._get_static_variables_info()
+        return slot_indexes.get(variable_id)
 
     def _get_imports_unique_ids(self, imported_symbols: Dict[str, Import],
                                 importing_methods: bool,
@@ -389,20 +555,22 @@ class FileGenerator:
         from boa3.model.builtin.builtincallable import IBuiltinCallable
 
         # must map all imports, including inner imports
+        imports_to_visit = list(imported_symbols.values())
         index = 0
-        while index < len(imported_symbols):
-            module_origin, imported = list(imported_symbols.items())[index]
-            for name, imported in imported.all_symbols.items():
+        while index < len(imports_to_visit):
+            for name, imported in imports_to_visit[index].all_symbols.items():
                 if isinstance(imported, Import) and imported.origin not in imported_symbols:
                     imported_symbols[imported.origin] = imported
+                    imports_to_visit.append(imported)
             index += 1
 
         # map the modules that have user modules not imported by the entry file
+        inner_imported_ids = {id(symbol) for symbol in inner_imported_symbols}
         imported_to_map: Dict[str, Import] = {}
         for name in imported_symbols:
             if any(((not importing_methods  # is importing variables or is a method but not builtin
                      or (isinstance(symbol, Method) and not isinstance(symbol, IBuiltinCallable)))
-                    and symbol not in inner_imported_symbols)
+                    and id(symbol) not in inner_imported_ids)
                    for name, symbol in imported_symbols[name].all_symbols.items()):
                 filtered_name = name.replace('.py', '').replace('/__init__', '')
                 imported_to_map[filtered_name] = imported_symbols[name]
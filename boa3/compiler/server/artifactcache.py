@@ -0,0 +1,107 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from boa3 import constants
+from boa3.compiler.buildstamp import BuildStamp
+
+
+class ArtifactCache:
+    """
+    A least recently used cache of the compiled artifacts.
+
+    The artifacts compiled from files are valid while none of the files they depend on change and the artifacts
+    compiled from source code are identified by the sources themselves.
+
+    :ivar max_entries: the maximum number of artifacts kept in the cache
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def get_key(params: Dict[str, Any]) -> str:
+        """
+        Gets the cache key of a request
+
+        :param params: the params of an `artifacts` request
+        :return: a hash that identifies the compiled contract
+        """
+        key_data = {
+            'path': params.get('path'),
+            'source': params.get('source'),
+            'modules': params.get('modules'),
+            'boa-version': constants.BOA_VERSION,
+            # changes in the compiler without a version bump must not reuse the artifacts
+            'compiler-hash': BuildStamp.current_compiler_hash()
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode(constants.ENCODING)).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets the cached artifacts if they are up to date
+
+        :param key: the cache key of the request
+        :return: the artifacts if they are cached. None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        # the files are hashed outside the lock, so other requests aren't blocked
+        is_outdated = (entry is not None and len(entry['files']) > 0
+                       and not all(BuildStamp.file_hash(path) == file_hash
+                                   for path, file_hash in entry['files'].items()))
+
+        with self._lock:
+            if is_outdated:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                entry = None
+            elif entry is not None and key in self._entries:
+                # it may have been evicted or replaced by another request since it was read
+                self._entries.move_to_end(key)
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, key: str, artifacts: Dict[str, Any]):
+        """
+        Includes compiled artifacts in the cache, removing the least recently used if it's full
+
+        :param key: the cache key of the request
+        :param artifacts: the result of the `artifacts` request
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = artifacts
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max-entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,221 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+from boa3 import constants
+from boa3.compiler.server.artifactcache import ArtifactCache
+from boa3.compiler.server.tasks import (INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND,
+                                        PARSE_ERROR, TaskError)
+from boa3.compiler.server.workerpool import WorkerPool
+
+
+class CompileServer:
+    """
+    A long running compiler that answers JSON-RPC 2.0 requests, one json message per line.
+
+    The supported methods are:
+
+    - `compile`: compiles a file and saves its artifacts
+    - `check`: analyses a file or a source code without generating the bytecode
+    - `artifacts`: compiles a file or a source code and returns the artifacts instead of saving them
+    - `cache-stats`: gets the statistics of the artifact cache and of the workers
+
+    The requests are compiled by a pool of worker processes, that keep the compiler loaded between the requests.
+    """
+
+    def __init__(self, workers: Optional[int] = None, deadline: Optional[float] = 60.0,
+                 memory_limit: Optional[int] = None, cache_size: int = 128):
+        """
+        :param workers: the number of worker processes. Uses the number of cpus by default
+        :param deadline: the default maximum time in seconds of each request. It's not limited if it's None
+        :param memory_limit: the peak memory in MiB a worker can use before being replaced
+        :param cache_size: the maximum number of compiled artifacts kept in memory
+        """
+        self._pool = WorkerPool(workers, deadline, memory_limit)
+        self._cache = ArtifactCache(cache_size)
+        self._write_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._pool.close()
+
+    # region JSON-RPC
+
+    def handle(self, request: Union[str, bytes, Dict[str, Any], List[Any]]) -> Optional[Union[Dict[str, Any], list]]:
+        """
+        Handles a JSON-RPC request or a batch of requests
+
+        :param request: the request message or its json
+        :return: the response message. None if the request is a notification
+        """
+        if isinstance(request, (str, bytes)):
+            try:
+                request = json.loads(request)
+            except ValueError:
+                return self._error_response(None, TaskError(PARSE_ERROR, 'Parse error'))
+
+        if isinstance(request, list):
+            if len(request) == 0:
+                return self._error_response(None, TaskError(INVALID_REQUEST, 'Invalid Request'))
+            responses = [self._handle_request(item) for item in request]
+            responses = [response for response in responses if response is not None]
+            return responses if len(responses) > 0 else None
+
+        return self._handle_request(request)
+
+    def _handle_request(self, request: Any) -> Optional[Dict[str, Any]]:
+        if (not isinstance(request, dict)
+                or request.get('jsonrpc') != '2.0'
+                or not isinstance(request.get('method'), str)):
+            request_id = request.get('id') if isinstance(request, dict) else None
+            return self._error_response(request_id, TaskError(INVALID_REQUEST, 'Invalid Request'))
+
+        request_id = request.get('id')
+        is_notification = 'id' not in request
+        params = request.get('params', {})
+
+        try:
+            if not isinstance(params, dict):
+                raise TaskError(INVALID_PARAMS, 'Expected named params')
+            result = self.call(request['method'], params)
+        except TaskError as error:
+            return self._error_response(request_id, error) if not is_notification else None
+        except BaseException as exception:
+            logging.exception(exception)
+            error = TaskError(INTERNAL_ERROR, str(exception) or type(exception).__name__)
+            return self._error_response(request_id, error) if not is_notification else None
+
+        if is_notification:
+            return None
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': result
+        }
+
+    @staticmethod
+    def _error_response(request_id: Any, error: TaskError) -> Dict[str, Any]:
+        return {
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'error': error.to_json()
+        }
+
+    # endregion
+
+    # region Methods
+
+    def call(self, method: str, params: Dict[str, Any]) -> Any:
+        """
+        Runs a server method
+
+        :param method: the name of the method
+        :param params: the params of the method. The `deadline` param limits the time of this request in seconds
+        :return: the result of the method
+        :raise TaskError: raised if the method failed
+        """
+        deadline = params.get('deadline')
+        if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+            raise TaskError(INVALID_PARAMS, "Invalid param 'deadline'")
+
+        if method == 'cache-stats':
+            return self.stats()
+        if method == 'artifacts':
+            return self._artifacts(params, deadline)
+        if method in ('compile', 'check'):
+            return self._pool.run(method, params, deadline)
+
+        raise TaskError(METHOD_NOT_FOUND, 'Method not found')
+
+    def _artifacts(self, params: Dict[str, Any], deadline: Optional[float]) -> Dict[str, Any]:
+        key_params = dict(params)
+        if isinstance(params.get('path'), str) and params.get('source') is None:
+            key_params['path'] = os.path.realpath(params['path'])
+        key = self._cache.get_key(key_params)
+
+        artifacts = self._cache.get(key)
+        cached = artifacts is not None
+        if not cached:
+            artifacts = self._pool.run('artifacts', params, deadline)
+            self._cache.put(key, artifacts)
+
+        result = {name: value for name, value in artifacts.items() if name != 'files'}
+        result['cached'] = cached
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Gets the statistics of the artifact cache and of the worker processes
+        """
+        return {
+            'cache': self._cache.stats(),
+            'pool': self._pool.stats()
+        }
+
+    # endregion
+
+    # region Transports
+
+    def serve_stream(self, input_stream: BinaryIO, output_stream: BinaryIO):
+        """
+        Answers the requests read from a stream until it's closed. Each request and response is a json line
+
+        :param input_stream: the binary stream where the requests are read
+        :param output_stream: the binary stream where the responses are written
+        """
+        for line in input_stream:
+            if len(line.strip()) == 0:
+                continue
+            response = self.handle(line)
+            if response is not None:
+                self._write_response(output_stream, response)
+
+    def _write_response(self, output_stream: BinaryIO, response: Union[Dict[str, Any], list]):
+        data = json.dumps(response, separators=(',', ':')).encode(constants.ENCODING) + b'\n'
+        with self._write_lock:
+            output_stream.write(data)
+            output_stream.flush()
+
+    def serve_stdio(self):
+        """
+        Answers the requests read from the standard input until it's closed
+        """
+        import sys
+        self.serve_stream(sys.stdin.buffer, sys.stdout.buffer)
+
+    def serve_unix_socket(self, socket_path: str):
+        """
+        Answers the requests of the clients connected to a Unix socket. Each connection is handled in its own thread
+
+        :param socket_path: the path of the socket file
+        """
+        import socketserver
+
+        if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+            raise OSError('Unix sockets are not supported in this platform')
+
+        server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server.serve_stream(self.rfile, self.wfile)
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        with socketserver.ThreadingUnixStreamServer(socket_path, RequestHandler) as socket_server:
+            socket_server.daemon_threads = True
+            logging.info('Listening on {0}'.format(socket_path))
+            try:
+                socket_server.serve_forever()
+            finally:
+                os.remove(socket_path)
+
+    # endregion
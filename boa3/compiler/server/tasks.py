@@ -0,0 +1,202 @@
+import base64
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+# JSON-RPC error codes used by the compile server
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+COMPILATION_FAILED = -32000
+DEADLINE_EXCEEDED = -32001
+WORKER_CRASHED = -32002
+
+
+class TaskError(Exception):
+    """
+    An error that is returned as the JSON-RPC error of a request
+
+    :ivar code: the JSON-RPC error code
+    :ivar data: additional information about the error
+    """
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code: int = code
+        self.message: str = message
+        self.data: Any = data
+
+    def to_json(self) -> Dict[str, Any]:
+        error = {
+            'code': self.code,
+            'message': self.message
+        }
+        if self.data is not None:
+            error['data'] = self.data
+        return error
+
+
+def _get_param(params: Dict[str, Any], name: str, param_type: type, default: Any = None) -> Any:
+    value = params.get(name, default)
+    if value is not None and not isinstance(value, param_type):
+        raise TaskError(INVALID_PARAMS, "Invalid param '{0}'".format(name))
+    return value
+
+
+def _get_contract_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validates the params that identify the compiled contract, either a file or a source code
+
+    :return: a dictionary with the path, the source and the virtual modules to compile
+    """
+    path: Optional[str] = _get_param(params, 'path', str)
+    source: Optional[str] = _get_param(params, 'source', str)
+    modules: Optional[Dict[str, str]] = _get_param(params, 'modules', dict)
+
+    if source is None:
+        if path is None or not path.endswith('.py'):
+            raise TaskError(INVALID_PARAMS, "Expected the 'path' of a .py file or a 'source'")
+    elif path is None:
+        path = 'contract.py'
+
+    if modules is not None and not all(isinstance(module, str) for module in modules.values()):
+        raise TaskError(INVALID_PARAMS, "Invalid param 'modules'")
+
+    return {
+        'path': path,
+        'source': source,
+        'modules': modules
+    }
+
+
+def _messages(logs: List[BaseException]) -> List[str]:
+    return [str(log) for log in logs]
+
+
+def _compilation_failed(compiler) -> TaskError:
+    analyser = compiler._analyser
+    return TaskError(COMPILATION_FAILED, 'Could not compile', {
+        'errors': _messages(analyser.errors) if analyser is not None else [],
+        'warnings': _messages(analyser.warnings) if analyser is not None else []
+    })
+
+
+def compile_task(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compiles a file and saves its artifacts, if they aren't up to date
+
+    :param params: the `path` of the file, the `output_path` of the .nef file, whether the files are `pretty`,
+                   whether the storage globals are cached, with `cache_globals`, and the `inline_threshold`
+    :return: the path of the generated .nef file and if it was compiled
+    """
+    from boa3.compiler.buildstamp import BuildStamp
+    from boa3.compiler.compiler import Compiler
+    from boa3.exception.NotLoadedException import NotLoadedException
+
+    path: Optional[str] = _get_param(params, 'path', str)
+    if path is None or not path.endswith('.py'):
+        raise TaskError(INVALID_PARAMS, "Expected the 'path' of a .py file")
+    output_path: str = _get_param(params, 'output_path', str, path.replace('.py', '.nef'))
+    if not output_path.endswith('.nef'):
+        raise TaskError(INVALID_PARAMS, "Invalid param 'output_path'")
+    pretty: bool = _get_param(params, 'pretty', bool, False)
+    cache_globals: bool = _get_param(params, 'cache_globals', bool, False)
+    inline_threshold: Optional[int] = _get_param(params, 'inline_threshold', int)
+
+    stamp = BuildStamp.load(output_path)
+    if (stamp is not None
+            and stamp.is_up_to_date(Compiler.get_options(cache_globals, inline_threshold))
+            and os.path.isfile(output_path)
+            and os.path.isfile(output_path.replace('.nef', '.manifest.json'))):
+        return {
+            'output_path': output_path,
+            'status': 'up-to-date'
+        }
+
+    compiler = Compiler()
+    try:
+        compiler.compile_and_save(path, output_path, log=False, pretty=pretty, cache_globals=cache_globals,
+                                  inline_threshold=inline_threshold)
+    except NotLoadedException:
+        raise _compilation_failed(compiler)
+    except FileNotFoundError:
+        raise TaskError(INVALID_PARAMS, "File '{0}' not found".format(path))
+
+    return {
+        'output_path': output_path,
+        'status': 'compiled',
+        'warnings': _messages(compiler._analyser.warnings)
+    }
+
+
+def check_task(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyses a file or a source code, without generating the bytecode
+
+    :param params: the `path` of the file or the `source` code and the virtual `modules`
+    :return: whether the analysis was successful and its errors and warnings
+    """
+    from boa3.compiler.compiler import Compiler
+
+    contract = _get_contract_params(params)
+    try:
+        result = Compiler().check(contract['path'], log=False,
+                                  source=contract['source'],
+                                  modules=contract['modules'])
+    except FileNotFoundError:
+        raise TaskError(INVALID_PARAMS, "File '{0}' not found".format(contract['path']))
+
+    return {
+        'success': result.success,
+        'errors': _messages(result.errors),
+        'warnings': _messages(result.warnings)
+    }
+
+
+def artifacts_task(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compiles a file or a source code in memory
+
+    :param params: the `path` of the file or the `source` code and the virtual `modules`
+    :return: the compiled artifacts, with the nef file encoded in base64, and the files the compilation depends on
+    """
+    from boa3.compiler.buildstamp import BuildStamp
+    from boa3.compiler.compiler import Compiler
+    from boa3.exception.NotLoadedException import NotLoadedException
+
+    contract = _get_contract_params(params)
+    compiler = Compiler()
+    try:
+        artifacts = compiler.compile_artifacts(contract['path'], log=False,
+                                               source=contract['source'],
+                                               modules=contract['modules'])
+    except NotLoadedException:
+        raise _compilation_failed(compiler)
+    except FileNotFoundError:
+        raise TaskError(INVALID_PARAMS, "File '{0}' not found".format(contract['path']))
+    except SyntaxError as e:
+        raise TaskError(COMPILATION_FAILED, 'Could not compile', {
+            'errors': ['{0}:{1} - {2}'.format(e.lineno, e.offset, e.msg)],
+            'warnings': []
+        })
+
+    # the files are used to check if the cached artifacts are outdated
+    files = BuildStamp.from_analyser(compiler._analyser).files if contract['source'] is None else {}
+
+    return {
+        'nef': base64.b64encode(artifacts.nef).decode('ascii'),
+        'script_hash': artifacts.script_hash_str,
+        'manifest': artifacts.manifest,
+        'debug_info': artifacts.debug_info,
+        'warnings': _messages(artifacts.warnings),
+        'timings': artifacts.timings,
+        'files': files
+    }
+
+
+TASKS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    'compile': compile_task,
+    'check': check_task,
+    'artifacts': artifacts_task
+}
@@ -0,0 +1,237 @@
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+from boa3.compiler.server.tasks import DEADLINE_EXCEEDED, INTERNAL_ERROR, METHOD_NOT_FOUND, WORKER_CRASHED, TaskError
+
+# modules imported by the workers before the first request, so the builtin symbols are already loaded
+_PRELOADED_MODULES = [
+    'boa3.compiler.compiler',
+    'boa3.compiler.server.tasks',
+    'boa3.model.builtin.builtin',
+    'boa3.model.imports.builtin',
+]
+
+
+def _get_context():
+    # workers are forked from a server process that has the compiler already imported
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(_PRELOADED_MODULES)
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _peak_memory() -> Optional[int]:
+    """
+    Gets the peak memory used by the current process in MiB. Returns None if it can't be measured in the platform
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # it's in bytes on macOS and in KiB on Linux
+    return peak // (1024 * 1024) if sys.platform == 'darwin' else peak // 1024
+
+
+def _worker_main(connection, memory_limit: Optional[int]):
+    """
+    Runs the tasks sent by the pool until the connection is closed or the memory limit is exceeded
+    """
+    logging.disable(logging.CRITICAL)
+
+    import importlib
+    for module in _PRELOADED_MODULES:
+        importlib.import_module(module)
+    from boa3.compiler.server.tasks import TASKS
+
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if request is None:
+            break
+
+        task_name, params = request
+        try:
+            task = TASKS.get(task_name)
+            if task is None:
+                raise TaskError(METHOD_NOT_FOUND, 'Method not found')
+            response = (True, task(params))
+        except TaskError as error:
+            response = (False, error.to_json())
+        except BaseException as exception:
+            response = (False, TaskError(INTERNAL_ERROR, str(exception) or type(exception).__name__).to_json())
+
+        peak_memory = _peak_memory()
+        recycle = memory_limit is not None and peak_memory is not None and peak_memory > memory_limit
+        connection.send(response + (recycle,))
+        if recycle:
+            break
+
+    connection.close()
+
+
+class _Worker:
+    """
+    A process that runs the compiler tasks. It's started only when it receives its first task and it's replaced if it
+    exceeds a deadline, crashes or exceeds the memory limit
+    """
+
+    def __init__(self, context, memory_limit: Optional[int]):
+        self._context = context
+        self._memory_limit: Optional[int] = memory_limit
+        self._process = None
+        self._connection = None
+        self.recycled: int = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def _start(self):
+        parent_connection, child_connection = self._context.Pipe()
+        process = self._context.Process(target=_worker_main,
+                                        args=(child_connection, self._memory_limit),
+                                        daemon=True)
+        try:
+            process.start()
+        except BaseException:
+            parent_connection.close()
+            raise
+        finally:
+            child_connection.close()
+
+        self._process = process
+        self._connection = parent_connection
+
+    def _recycle(self, kill: bool = False):
+        if self._process is not None:
+            if kill:
+                self._process.kill()
+            self._process.join()
+            self._connection.close()
+            self.recycled += 1
+        self._process = None
+        self._connection = None
+
+    def run(self, task: str, params: Dict[str, Any], deadline: Optional[float]) -> Any:
+        """
+        Runs a task in the worker process
+
+        :param task: the name of the task
+        :param params: the params of the task
+        :param deadline: the maximum time in seconds the task can run. If it's exceeded, the process is killed
+        :return: the result of the task
+        :raise TaskError: raised if the task failed
+        """
+        if not self.is_alive:
+            self._recycle()
+            self._start()
+
+        try:
+            self._connection.send((task, params))
+            if not self._connection.poll(deadline):
+                self._recycle(kill=True)
+                raise TaskError(DEADLINE_EXCEEDED, 'Deadline of {0}s exceeded'.format(deadline))
+            success, result, recycle = self._connection.recv()
+        except (EOFError, OSError):
+            self._recycle(kill=True)
+            raise TaskError(WORKER_CRASHED, 'The worker process stopped unexpectedly')
+
+        if recycle:
+            self._recycle()
+
+        if not success:
+            raise TaskError(result['code'], result['message'], result.get('data'))
+        return result
+
+    def close(self):
+        if self._process is not None:
+            try:
+                self._connection.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=1)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+            self._connection.close()
+            self._process = None
+            self._connection = None
+
+
+class WorkerPool:
+    """
+    A pool of compiler processes. Each process compiles one request at a time and keeps the compiler modules loaded
+    between the requests.
+
+    :ivar deadline: the default maximum time in seconds of each request
+    :ivar memory_limit: the peak memory in MiB a worker can use before being replaced. It's not limited by default
+    """
+
+    def __init__(self, workers: Optional[int] = None, deadline: Optional[float] = 60.0,
+                 memory_limit: Optional[int] = None):
+        """
+        :param workers: the number of worker processes. Uses the number of cpus by default
+        :param deadline: the default maximum time in seconds of each request. It's not limited if it's None
+        :param memory_limit: the peak memory in MiB a worker can use before being replaced
+        """
+        if workers is None or workers < 1:
+            workers = os.cpu_count() or 1
+
+        self.deadline: Optional[float] = deadline
+        self.memory_limit: Optional[int] = memory_limit
+
+        context = _get_context()
+        self._workers: List[_Worker] = [_Worker(context, memory_limit) for _ in range(workers)]
+        self._idle_workers: queue.Queue = queue.Queue()
+        for worker in self._workers:
+            self._idle_workers.put(worker)
+
+        self._lock = threading.Lock()
+        self._requests: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._workers)
+
+    def run(self, task: str, params: Dict[str, Any], deadline: Optional[float] = None) -> Any:
+        """
+        Runs a task in the first available worker
+
+        :param task: the name of the task
+        :param params: the params of the task
+        :param deadline: the maximum time in seconds of this request. Uses the pool's deadline by default
+        :return: the result of the task
+        :raise TaskError: raised if the task failed
+        """
+        if deadline is None:
+            deadline = self.deadline
+
+        worker: _Worker = self._idle_workers.get()
+        try:
+            with self._lock:
+                self._requests += 1
+            return worker.run(task, params, deadline)
+        finally:
+            self._idle_workers.put(worker)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'workers': self.size,
+            'alive': len([worker for worker in self._workers if worker.is_alive]),
+            'requests': self._requests,
+            'recycled': sum(worker.recycled for worker in self._workers)
+        }
+
+    def close(self):
+        for worker in self._workers:
+            worker.close()
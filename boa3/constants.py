@@ -23,6 +23,9 @@ ATTRIBUTE_NAME_SEPARATOR = '.'
 VARIABLE_NAME_SEPARATOR = ','
 IMPORT_WILDCARD = '*'
 
+GAS_DECIMALS = 8
+DEFAULT_EXEC_FEE_FACTOR = 30
+
 INIT_METHOD_ID = '__init__'
 INITIALIZE_METHOD_ID = '_initialize'
 DEPLOY_METHOD_ID = '_deploy'
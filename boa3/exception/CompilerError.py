@@ -64,6 +64,23 @@ class IncorrectNumberOfOperands(CompilerError):
         return "Incorrect number of operands: expected '%s', got '%s' instead" % (self.expected, self.actual)
 
 
+class InvalidSyntax(CompilerError):
+    """
+    An error raised when the source code isn't a valid Python code
+    """
+
+    def __init__(self, line: int, col: int, syntax_message: str):
+        self.syntax_message: str = syntax_message
+        super().__init__(line, col)
+
+    @property
+    def _error_message(self) -> Optional[str]:
+        message = "Invalid syntax"
+        if self.syntax_message is not None and self.syntax_message.lower() != message.lower():
+            message += ": %s" % self.syntax_message
+        return message
+
+
 class InvalidType(CompilerError):
     """
     An error raised when a type that is not supported by Neo VM is used
@@ -135,7 +135,9 @@ class Builtin:
                 for symbol in Interop.interop_symbols(package)}
 
     # boa builtin decorator
+    Inline = InlineDecorator()
     Metadata = MetadataDecorator()
+    NoInline = NoInlineDecorator()
     Public = PublicDecorator()
 
     # boa builtin type
@@ -155,7 +157,9 @@ class Builtin:
     boa_builtins: List[IdentifiedSymbol] = [Public,
                                             NewEvent,
                                             Event,
+                                            Inline,
                                             Metadata,
+                                            NoInline,
                                             NeoMetadataType,
                                             ScriptHash
                                             ]
@@ -1,14 +1,18 @@
 __all__ = ['ClassMethodDecorator',
+           'InlineDecorator',
            'InstanceMethodDecorator',
            'MetadataDecorator',
+           'NoInlineDecorator',
            'PropertyDecorator',
            'PublicDecorator',
            'StaticMethodDecorator'
            ]
 
 from boa3.model.builtin.decorator.classmethoddecorator import ClassMethodDecorator
+from boa3.model.builtin.decorator.inlinedecorator import InlineDecorator
 from boa3.model.builtin.decorator.instancemethoddecorator import InstanceMethodDecorator
 from boa3.model.builtin.decorator.metadatadecorator import MetadataDecorator
+from boa3.model.builtin.decorator.noinlinedecorator import NoInlineDecorator
 from boa3.model.builtin.decorator.propertydecorator import PropertyDecorator
 from boa3.model.builtin.decorator.publicdecorator import PublicDecorator
 from boa3.model.builtin.decorator.staticmethoddecorator import StaticMethodDecorator
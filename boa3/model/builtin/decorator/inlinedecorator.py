@@ -0,0 +1,7 @@
+from boa3.model.builtin.decorator.builtindecorator import IBuiltinDecorator
+
+
+class InlineDecorator(IBuiltinDecorator):
+    def __init__(self):
+        identifier = 'inline'
+        super().__init__(identifier)
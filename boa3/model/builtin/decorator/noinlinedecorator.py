@@ -0,0 +1,7 @@
+from boa3.model.builtin.decorator.builtindecorator import IBuiltinDecorator
+
+
+class NoInlineDecorator(IBuiltinDecorator):
+    def __init__(self):
+        identifier = 'noinline'
+        super().__init__(identifier)
@@ -2,6 +2,7 @@ from typing import Dict
 
 from boa3.model.builtin.builtinproperty import IBuiltinProperty
 from boa3.model.builtin.interop.nativecontract import LedgerMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -13,6 +14,10 @@ class CurrentHashMethod(LedgerMethod):
         args: Dict[str, Variable] = {}
         super().__init__(identifier, syscall, args, return_type=UInt256Type.build())
 
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.INVOCATION_CONSTANT
+
 
 class CurrentHashProperty(IBuiltinProperty):
     def __init__(self):
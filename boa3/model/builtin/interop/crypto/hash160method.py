@@ -1,6 +1,7 @@
 from typing import Dict, List, Tuple
 
 from boa3.model.builtin.interop.nativecontract import CryptoLibMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 from boa3.neo.vm.opcode.Opcode import Opcode
 
@@ -22,3 +23,7 @@ class Hash160Method(CryptoLibMethod):
                    (Opcode.PACK, b'')
                    ]
                 + Interop.Ripemd160.opcode)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.PURE
@@ -1,6 +1,7 @@
 from typing import Dict
 
 from boa3.model.builtin.interop.nativecontract import CryptoLibMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -11,3 +12,7 @@ class Sha256Method(CryptoLibMethod):
         native_identifier = 'sha256'
         args: Dict[str, Variable] = {'key': Variable(Type.any)}
         super().__init__(identifier, native_identifier, args, return_type=Type.bytes)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.PURE
@@ -2,6 +2,7 @@ from typing import Dict
 
 from boa3.model.builtin.builtinproperty import IBuiltinProperty
 from boa3.model.builtin.interop.interopmethod import InteropMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -13,6 +14,10 @@ class GetBlockTimeMethod(InteropMethod):
         args: Dict[str, Variable] = {}
         super().__init__(identifier, syscall, args, return_type=Type.int)
 
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.INVOCATION_CONSTANT
+
 
 class BlockTimeProperty(IBuiltinProperty):
     def __init__(self):
@@ -1,6 +1,7 @@
 from typing import Dict
 
 from boa3.model.builtin.interop.interopmethod import InteropMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -12,3 +13,7 @@ class GetNetworkMethod(InteropMethod):
         syscall = 'System.Runtime.GetNetwork'
         args: Dict[str, Variable] = {}
         super().__init__(identifier, syscall, args, return_type=Type.int)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.INVOCATION_CONSTANT
@@ -2,6 +2,7 @@ from typing import Dict
 
 from boa3.model.builtin.interop.interopmethod import InteropMethod
 from boa3.model.builtin.interop.runtime.triggertype import TriggerType
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -12,3 +13,7 @@ class GetTriggerMethod(InteropMethod):
         syscall = 'System.Runtime.GetTrigger'
         args: Dict[str, Variable] = {}
         super().__init__(identifier, syscall, args, return_type=trigger_type)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.INVOCATION_CONSTANT
@@ -1,6 +1,7 @@
 from typing import Dict
 
 from boa3.model.builtin.interop.nativecontract import StdLibMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -12,3 +13,7 @@ class Base58CheckDecodeMethod(StdLibMethod):
         native_identifier = 'base58CheckDecode'
         args: Dict[str, Variable] = {'key': Variable(Type.str)}
         super().__init__(identifier, native_identifier, args, return_type=Type.bytes)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.PURE
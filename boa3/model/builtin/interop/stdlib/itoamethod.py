@@ -2,6 +2,7 @@ import ast
 from typing import Dict
 
 from boa3.model.builtin.interop.nativecontract import StdLibMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -18,3 +19,7 @@ class ItoaMethod(StdLibMethod):
         args_default = ast.parse("{0}".format(10)).body[0].value
 
         super().__init__(identifier, syscall, args, defaults=[args_default], return_type=Type.str)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.PURE
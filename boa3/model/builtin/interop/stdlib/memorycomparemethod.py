@@ -1,6 +1,7 @@
 from typing import Dict
 
 from boa3.model.builtin.interop.nativecontract import StdLibMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -16,3 +17,7 @@ class MemoryCompareMethod(StdLibMethod):
         }
 
         super().__init__(identifier, syscall, args, return_type=Type.int)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.PURE
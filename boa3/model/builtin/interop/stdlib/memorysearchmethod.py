@@ -3,6 +3,7 @@ from typing import Dict
 
 from boa3.model import set_internal_call
 from boa3.model.builtin.interop.nativecontract import StdLibMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -25,3 +26,7 @@ class MemorySearchMethod(StdLibMethod):
                                                        ).body[0].value)
 
         super().__init__(identifier, native_identifier, args, defaults=[start_default, backward_default], return_type=Type.int)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.PURE
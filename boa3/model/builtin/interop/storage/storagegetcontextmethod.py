@@ -2,6 +2,7 @@ from typing import Dict
 
 from boa3.model.builtin.interop.interopmethod import InteropMethod
 from boa3.model.builtin.interop.storage.storagecontext.storagecontexttype import StorageContextType
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.variable import Variable
 
 
@@ -12,3 +13,7 @@ class StorageGetContextMethod(InteropMethod):
         native_identifier = 'System.Storage.GetContext'
         args: Dict[str, Variable] = {}
         super().__init__(identifier, native_identifier, args, return_type=storage_context_type)
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.INVOCATION_CONSTANT
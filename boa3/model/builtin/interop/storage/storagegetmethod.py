@@ -4,6 +4,7 @@ from typing import Any, Dict, Iterable, List, Sized, Tuple
 from boa3.model import set_internal_call
 from boa3.model.builtin.interop.interopmethod import InteropMethod
 from boa3.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.expression import IExpression
 from boa3.model.type.itype import IType
 from boa3.model.variable import Variable
@@ -101,3 +102,7 @@ class StorageGetMethod(InteropMethod):
             method = StorageGetMethod()
             method.args['key'] = Variable(key_type)
         return method
+
+    @property
+    def effects(self) -> MethodEffects:
+        return MethodEffects.READS_STORAGE
@@ -9,6 +9,7 @@ __all__ = ['AbsMethod',
            'LenMethod',
            'MaxIntMethod',
            'MaxByteStringMethod',
+           'MethodEffects',
            'MinByteStringMethod',
            'MinIntMethod',
            'PrintMethod',
@@ -30,6 +31,7 @@ from boa3.model.builtin.method.isinstancemethod import IsInstanceMethod
 from boa3.model.builtin.method.lenmethod import LenMethod
 from boa3.model.builtin.method.maxbytestringmethod import MaxByteStringMethod
 from boa3.model.builtin.method.maxintmethod import MaxIntMethod
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.builtin.method.minbytestringmethod import MinByteStringMethod
 from boa3.model.builtin.method.minintmethod import MinIntMethod
 from boa3.model.builtin.method.printmethod import PrintMethod
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
 from boa3.model.builtin.builtincallable import IBuiltinCallable
+from boa3.model.builtin.method.methodeffects import MethodEffects
 from boa3.model.method import Method
 from boa3.model.type.itype import IType
 from boa3.model.variable import Variable
@@ -114,6 +115,16 @@ class IBuiltinMethod(IBuiltinCallable, Method, ABC):
         """
         return False
 
+    @property
+    def effects(self) -> MethodEffects:
+        """
+        Gets the side effects of the method. The results of the methods without effects are reused when the same call
+        is repeated in a method
+
+        :return: the effects of calling the method. The default is `MethodEffects.ANY`
+        """
+        return MethodEffects.ANY
+
     @property
     def requires_reordering(self) -> bool:
         """
@@ -0,0 +1,16 @@
+from enum import Enum, auto
+
+
+class MethodEffects(Enum):
+    """
+    The side effects of a builtin method, used to reuse the results of repeated calls in the same method
+    """
+
+    # the method may change the contract state or return a mutable value. Its calls are never reused
+    ANY = auto()
+    # the result depends only on the arguments
+    PURE = auto()
+    # the result is the same in every call during the invocation of the contract
+    INVOCATION_CONSTANT = auto()
+    # the result is the same until the storage is changed
+    READS_STORAGE = auto()
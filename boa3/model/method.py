@@ -6,6 +6,7 @@ from boa3.model.debuginstruction import DebugInstruction
 from boa3.model.symbol import ISymbol
 from boa3.model.type.type import IType, Type
 from boa3.model.variable import Variable
+from boa3.neo.vm.VMCode import VMCode
 
 
 class Method(Callable):
@@ -17,6 +18,7 @@ class Method(Callable):
     :ivar imported_symbols: a dictionary that maps each imported symbol with its name. Empty by default.
     :ivar is_public: a boolean value that specifies if the method is public. False by default.
     :ivar return_type: the return type of the method. None by default.
+    :ivar is_inlined: whether all the calls to the method were replaced by its code. False by default.
     """
 
     def __init__(self, args: Dict[str, Variable] = None,
@@ -33,6 +35,7 @@ class Method(Callable):
         self.defined_by_entry = True
         self.is_init = is_init
         self.locals: Dict[str, Variable] = {}
+        self.is_inlined: bool = False
 
         if is_init and self.has_cls_or_self:
             self.return_type = list(self.args.values())[0].type
@@ -93,12 +96,16 @@ class Method(Callable):
         """
         return self._origin_node
 
-    def debug_map(self) -> List[DebugInstruction]:
+    def debug_map(self, addresses: Dict[VMCode, int] = None) -> List[DebugInstruction]:
         """
         Returns a list with the debug information of each mapped Python instruction inside this method
+
+        :param addresses: the address of each vm code. If not given, the addresses are searched in the code mapping
         """
-        from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
-        return sorted(self._debug_map, key=lambda instr: VMCodeMapping.instance().get_start_address(instr.code))
+        if addresses is None:
+            from boa3.compiler.codegenerator.vmcodemapping import VMCodeMapping
+            addresses = VMCodeMapping.instance().get_addresses_table()
+        return sorted(self._debug_map, key=lambda instr: addresses.get(instr.code, 0))
 
     def include_instruction(self, instr_info: DebugInstruction):
         """
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any, Set
+from typing import Any, Optional, Set
 
 from boa3.model.type.collection.icollection import ICollectionType
 from boa3.model.type.itype import IType
@@ -20,6 +20,15 @@ class SequenceType(ICollectionType, ABC):
     def default_value(self) -> Any:
         return []
 
+    @property
+    def fixed_length(self) -> Optional[int]:
+        """
+        The length that every value of this type has
+
+        :return: the length of the values if it is fixed. None otherwise
+        """
+        return None
+
     def is_type_of(self, value: Any) -> bool:
         if self._is_type_of(value):
             if isinstance(value, SequenceType):
@@ -29,6 +29,10 @@ class UInt160Type(BytesType):
     def constructor_method(self) -> Optional[Method]:
         return self._constructor
 
+    @property
+    def fixed_length(self) -> Optional[int]:
+        return 20
+
     @property
     def default_value(self) -> Any:
         return bytes(20)
@@ -46,7 +50,7 @@ class UInt160Type(BytesType):
         return super(PythonClass, self).is_instance_opcodes()
 
     def _is_instance_inner_opcodes(self, jmp_to_if_false: int = 0) -> List[Tuple[Opcode, bytes]]:
-        push_int_opcode, size_data = Opcode.get_push_and_data(20)
+        push_int_opcode, size_data = Opcode.get_push_and_data(self.fixed_length)
 
         return [
             (Opcode.SIZE, b''),  # return len(value) == 20
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import ast
-from typing import Optional
+from typing import Any, Optional
 
 from boa3.model.expression import IExpression
 from boa3.model.type.itype import IType
@@ -12,6 +12,9 @@ class Variable(IExpression):
     A class used to represent a variable
 
     :ivar var_type: the type of the variable.
+    :ivar literal_value: the value of the variable evaluated during the compilation, if `has_literal_value` is True
+    :ivar origin_module: the path of the module where the variable was declared, if it's a module variable
+    :ivar name: the name of the variable in the module where it was declared, if it's a module variable
     """
 
     def __init__(self, var_type: Optional[IType], origin_node: Optional[ast.AST] = None):
@@ -20,11 +23,21 @@ class Variable(IExpression):
         self._var_type: Optional[IType] = var_type
 
         self.is_reassigned = False
+        # module variables with values evaluated during the compilation are pushed instead of stored in static fields
+        self.has_literal_value = False
+        self.literal_value: Any = None
+        # module variables are identified by their module and name, so their storage keys are the same in every build
+        self.origin_module: Optional[str] = None
+        self.name: Optional[str] = None
         self._origin_variable: Optional[Variable] = None
 
     def copy(self) -> Variable:
         var = Variable(self._var_type, self._origin_node)
         var.is_reassigned = self.is_reassigned
+        var.has_literal_value = self.has_literal_value
+        var.literal_value = self.literal_value
+        var.origin_module = self.origin_module
+        var.name = self.name
         var._origin_variable = self._origin_variable if self._origin_variable is not None else self
         return var
 
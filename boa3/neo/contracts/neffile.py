@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import boa3
 from boa3.neo.contracts import NEF, Version
 from boa3.neo.core import BinaryReader, BinaryWriter
@@ -19,6 +21,7 @@ class NefFile:
         compiler: str = "neo3-boa by COZ"
         version = Version.from_string(boa3.__version__)
         self._nef = NEF(compiler, version, script_bytes)
+        self._script_hash: Optional[bytes] = None
 
     @property
     def script(self) -> bytes:
@@ -26,8 +29,14 @@ class NefFile:
 
     @property
     def script_hash(self) -> bytes:
-        from boa3.neo.cryptography import hash160
-        return hash160(self.script)
+        if self._script_hash is None:
+            from boa3.neo.cryptography import hash160
+            self._script_hash = hash160(self.script)
+        return self._script_hash
+
+    @property
+    def checksum(self) -> bytes:
+        return self._nef.checksum
 
     def _set_version(self, version: str):
         """
@@ -64,6 +73,8 @@ class NefFile:
             nef = NEF()
             nef.deserialize(reader)
 
-            nef_file = cls(nef.script)
+            # doesn't call the constructor to avoid computing the checksum of the script again
+            nef_file = cls.__new__(cls)
             nef_file._nef = nef
+            nef_file._script_hash = None
         return nef_file
@@ -0,0 +1,193 @@
+import json
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from boa3.neo.contracts.neffile import NefFile
+from boa3.neo.vm.Disassembler import Disassembler
+from boa3.neo.vm.Instruction import Instruction
+from boa3.neo.vm.opcode.Opcode import Opcode
+
+
+class NefInspector:
+    """
+    Inspects the compiled script of a NEF file, using the manifest and the debug info generated with it if they exist.
+    """
+
+    _sequence_point_format = re.compile(r'^(\d+)\[(\d+)\](\d+):(\d+)-(\d+):(\d+)$')
+    _block_terminators = (Opcode.RET, Opcode.THROW, Opcode.ABORT, Opcode.ENDFINALLY)
+    _calls = (Opcode.CALL, Opcode.CALL_L, Opcode.PUSHA)
+
+    def __init__(self, nef_path: str):
+        with open(nef_path, mode='rb') as nef:
+            self._nef: NefFile = NefFile.deserialize(nef.read())
+
+        self._manifest: Optional[Dict[str, Any]] = None
+        manifest_path = nef_path.replace('.nef', '.manifest.json')
+        if os.path.isfile(manifest_path):
+            with open(manifest_path) as manifest_file:
+                self._manifest = json.loads(manifest_file.read())
+
+        self._debug_info: Optional[Dict[str, Any]] = None
+        debug_info_path = nef_path.replace('.nef', '.nefdbgnfo')
+        if os.path.isfile(debug_info_path):
+            from zipfile import ZipFile
+            with ZipFile(debug_info_path, 'r') as debug_info_file:
+                json_file = next((name for name in debug_info_file.namelist() if name.endswith('.json')), None)
+                if json_file is not None:
+                    self._debug_info = json.loads(debug_info_file.read(json_file))
+
+        self._methods: Optional[List[Tuple[int, int, str]]] = None
+        self._histogram: Optional[Dict[Opcode, int]] = None
+        self._instructions_count: int = 0
+        self._basic_blocks_count: int = 0
+
+    @property
+    def script(self) -> bytes:
+        return self._nef.script
+
+    @property
+    def script_hash(self) -> bytes:
+        return self._nef.script_hash
+
+    def instructions(self) -> Iterator[Instruction]:
+        return Disassembler.disassemble(self.script)
+
+    @property
+    def methods(self) -> List[Tuple[int, int, str]]:
+        """
+        Gets the address range of the contract methods. All the methods are included if the debug info exists,
+        otherwise only the public methods from the manifest are included.
+
+        :return: a list with the start address, end address and name of each method, sorted by address
+        """
+        if self._methods is None:
+            methods = []
+            if self._debug_info is not None:
+                for method in self._debug_info['methods']:
+                    start, end = (int(address) for address in method['range'].split('-'))
+                    methods.append((start, end, method['name'].split(',')[-1]))
+
+            elif self._manifest is not None:
+                abi_methods = sorted((method['offset'], method['name']) for method in self._manifest['abi']['methods'])
+                for index, (offset, name) in enumerate(abi_methods):
+                    end = abi_methods[index + 1][0] if index + 1 < len(abi_methods) else len(self.script)
+                    methods.append((offset, end - 1, name))
+
+            self._methods = sorted(methods)
+        return self._methods
+
+    def _analyse(self):
+        if self._histogram is not None:
+            return
+
+        histogram: Dict[Opcode, int] = {}
+        leaders = {0}
+        leaders.update(method[0] for method in self.methods)
+        count = 0
+
+        for instruction in self.instructions():
+            count += 1
+            opcode = instruction.opcode
+            histogram[opcode] = histogram.get(opcode, 0) + 1
+
+            if len(instruction.targets) > 0 and opcode not in self._calls:
+                leaders.update(instruction.targets)
+                leaders.add(instruction.end_address)
+            elif opcode in self._block_terminators:
+                leaders.add(instruction.end_address)
+
+        script_size = len(self.script)
+        self._histogram = dict(sorted(histogram.items(), key=lambda item: (-item[1], item[0])))
+        self._instructions_count = count
+        self._basic_blocks_count = len([address for address in leaders if 0 <= address < script_size])
+
+    @property
+    def instructions_count(self) -> int:
+        self._analyse()
+        return self._instructions_count
+
+    @property
+    def basic_blocks_count(self) -> int:
+        """
+        Gets the number of basic blocks of the script. Blocks start on each jump target and after each jump or exit
+        """
+        self._analyse()
+        return self._basic_blocks_count
+
+    @property
+    def opcode_histogram(self) -> Dict[Opcode, int]:
+        """
+        Gets how many times each opcode is used in the script, from the most used to the least used
+        """
+        self._analyse()
+        return self._histogram.copy()
+
+    def _get_sequence_points(self) -> List[Tuple[int, str, int]]:
+        if self._debug_info is None:
+            return []
+
+        documents = self._debug_info['documents']
+        sequence_points = []
+        for method in self._debug_info['methods']:
+            for sequence_point in method['sequence-points']:
+                match = self._sequence_point_format.match(sequence_point)
+                if match is not None and int(match.group(2)) < len(documents):
+                    sequence_points.append((int(match.group(1)), documents[int(match.group(2))], int(match.group(3))))
+        return sorted(sequence_points)
+
+    def summary(self) -> Iterator[str]:
+        """
+        Gets the summary of the script: its size, methods, basic blocks and opcode histogram
+        """
+        from boa3.neo import to_hex_str
+
+        yield 'Script hash: {0}'.format(to_hex_str(self.script_hash))
+        yield 'Script size: {0} bytes'.format(len(self.script))
+        yield 'Instructions: {0}'.format(self.instructions_count)
+        yield 'Basic blocks: {0}'.format(self.basic_blocks_count)
+
+        yield ''
+        yield 'Methods:'
+        for start, end, name in self.methods:
+            yield '{0:>8}-{1:<8} {2}'.format(start, end, name)
+
+        yield ''
+        yield 'Opcodes:'
+        for opcode, count in self.opcode_histogram.items():
+            yield '{0:>8}  {1}'.format(count, opcode.name)
+
+    def listing(self, show_source: bool = False) -> Iterator[str]:
+        """
+        Gets the disassembled script, with the method names and, optionally, the source lines from the debug info
+
+        :param show_source: whether the source lines should be included
+        """
+        method_starts = {start: name for start, end, name in self.methods}
+        sequence_points = self._get_sequence_points() if show_source else []
+        next_point = 0
+        sources: Dict[str, List[str]] = {}
+
+        for instruction in self.instructions():
+            if instruction.address in method_starts:
+                yield ''
+                yield '{0}:'.format(method_starts[instruction.address])
+
+            while next_point < len(sequence_points) and sequence_points[next_point][0] <= instruction.address:
+                address, document, line = sequence_points[next_point]
+                next_point += 1
+                if address == instruction.address:
+                    if document not in sources:
+                        sources[document] = self._read_source(document)
+                    source = sources[document]
+                    text = source[line - 1].strip() if 0 < line <= len(source) else ''
+                    yield '        # {0}:{1}  {2}'.format(os.path.basename(document), line, text)
+
+            yield Disassembler.format_instruction(instruction)
+
+    @staticmethod
+    def _read_source(document: str) -> List[str]:
+        if not os.path.isfile(document):
+            return []
+        with open(document, 'r') as source_file:
+            return source_file.read().splitlines()
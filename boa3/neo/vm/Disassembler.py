@@ -0,0 +1,141 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from boa3.neo.vm.Instruction import Instruction
+from boa3.neo.vm.opcode.Opcode import Opcode
+
+
+class Disassembler:
+    """
+    Decodes Neo VM scripts into instructions.
+    """
+
+    # the operand info of each opcode byte: (opcode, operand size, size prefix length, targets count)
+    _operand_table: Optional[List[Optional[Tuple[Opcode, int, int, int]]]] = None
+    _sys_calls: Optional[Dict[bytes, str]] = None
+
+    @classmethod
+    def _get_operand_table(cls) -> List[Optional[Tuple[Opcode, int, int, int]]]:
+        if cls._operand_table is None:
+            from boa3.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+            from boa3.neo.vm.opcode.OpcodeInformation import OpcodeInformation
+
+            table: List[Optional[Tuple[Opcode, int, int, int]]] = [None] * 256
+            for info in vars(OpcodeInfo).values():
+                if not isinstance(info, OpcodeInformation):
+                    continue
+
+                opcode = info.opcode
+                if info.max_data_len > info.data_len:
+                    # PUSHDATA: the operand is prefixed with its size
+                    operand_info = (opcode, 0, info.data_len, 0)
+                elif opcode in (Opcode.TRY, Opcode.TRY_L):
+                    operand_info = (opcode, info.data_len, 0, 2)
+                elif opcode.has_target() or opcode is Opcode.PUSHA:
+                    operand_info = (opcode, info.data_len, 0, 1)
+                else:
+                    operand_info = (opcode, info.data_len, 0, 0)
+                table[opcode[0]] = operand_info
+
+            cls._operand_table = table
+        return cls._operand_table
+
+    @classmethod
+    def disassemble(cls, script: bytes, start: int = 0, end: Optional[int] = None) -> Iterator[Instruction]:
+        """
+        Decodes the instructions of a script lazily, so big scripts can be processed without being fully decoded
+
+        :param script: the Neo VM script
+        :param start: the address of the first instruction to decode
+        :param end: the address where the decoding stops. The end of the script by default
+        :return: the decoded instructions in the order they are in the script
+        :raise ValueError: raised if the script has an invalid opcode or a truncated instruction
+        """
+        table = cls._get_operand_table()
+        script_size = len(script)
+        if end is None or end > script_size:
+            end = script_size
+        from_bytes = int.from_bytes
+
+        address = start
+        while address < end:
+            operand_info = table[script[address]]
+            if operand_info is None:
+                raise ValueError('Invalid opcode {0} at address {1}'.format(hex(script[address]), address))
+
+            opcode, operand_size, prefix_size, targets_count = operand_info
+            operand_start = address + 1 + prefix_size
+            if prefix_size > 0:
+                operand_size = from_bytes(script[address + 1:operand_start], 'little')
+
+            next_address = operand_start + operand_size
+            if next_address > script_size:
+                raise ValueError('Truncated {0} instruction at address {1}'.format(opcode.name, address))
+
+            operand = script[operand_start:next_address]
+            if targets_count == 0:
+                targets = ()
+            elif targets_count == 1:
+                targets = (address + from_bytes(operand, 'little', signed=True),)
+            else:
+                offset_size = operand_size // 2
+                # TRY offsets are zero if there's no catch or no finally block
+                targets = tuple(address + offset
+                                for offset in (from_bytes(operand[:offset_size], 'little', signed=True),
+                                               from_bytes(operand[offset_size:], 'little', signed=True))
+                                if offset != 0)
+
+            yield Instruction(address, opcode, operand, next_address - address, targets)
+            address = next_address
+
+    @classmethod
+    def get_sys_call_name(cls, method_hash: bytes) -> Optional[str]:
+        """
+        Gets the name of an interop service
+
+        :param method_hash: the operand of the SYSCALL instruction
+        :return: the name of the service if it's supported by the compiler. None otherwise
+        """
+        if cls._sys_calls is None:
+            from boa3.model.imports.builtin import Interop
+            from boa3.model.builtin.interop.interopmethod import InteropMethod
+
+            sys_calls = {}
+            for symbol in vars(Interop).values():
+                method = symbol.getter if hasattr(symbol, 'getter') else symbol
+                if isinstance(method, InteropMethod):
+                    sys_calls[method.interop_method_hash] = method._sys_call
+            cls._sys_calls = sys_calls
+
+        return cls._sys_calls.get(bytes(method_hash))
+
+    @classmethod
+    def format_instruction(cls, instruction: Instruction) -> str:
+        """
+        Gets a readable representation of an instruction
+
+        :param instruction: the disassembled instruction
+        :return: the address, opcode and the decoded operand of the instruction
+        """
+        opcode = instruction.opcode
+        operand = instruction.operand
+        description = '{0:>6}  {1}'.format(instruction.address, opcode.name)
+
+        if len(instruction.targets) > 0:
+            description += ' ' + ', '.join('-> {0}'.format(target) for target in instruction.targets)
+        elif opcode is Opcode.SYSCALL:
+            sys_call = cls.get_sys_call_name(operand)
+            description += ' {0}'.format(sys_call if sys_call is not None else '0x' + operand.hex())
+        elif Opcode.PUSHINT8 <= opcode <= Opcode.PUSHINT256:
+            description += ' {0}'.format(int.from_bytes(operand, 'little', signed=True))
+        elif Opcode.PUSHDATA1 <= opcode <= Opcode.PUSHDATA4:
+            description += ' 0x{0}'.format(operand.hex())
+            try:
+                text = operand.decode('utf-8')
+                if len(text) > 0 and text.isprintable():
+                    description += ' "{0}"'.format(text)
+            except UnicodeDecodeError:
+                pass
+        elif len(operand) > 0:
+            description += ' {0}'.format(' '.join(str(byte) for byte in operand))
+
+        return description
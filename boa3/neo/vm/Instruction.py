@@ -0,0 +1,46 @@
+from typing import Optional, Tuple
+
+from boa3.neo.vm.opcode.Opcode import Opcode
+
+
+class Instruction:
+    """
+    A disassembled instruction of a Neo VM script
+
+    :ivar address: the address of the instruction in the script
+    :ivar opcode: the opcode of the instruction
+    :ivar operand: the operand bytes, without the size prefix of the PUSHDATA instructions
+    :ivar size: the total size in bytes of the instruction
+    :ivar targets: the absolute addresses the instruction can jump to
+    """
+
+    __slots__ = ('address', 'opcode', 'operand', 'size', 'targets')
+
+    def __init__(self, address: int, opcode: Opcode, operand: bytes = b'', size: int = 1,
+                 targets: Tuple[int, ...] = ()):
+        self.address: int = address
+        self.opcode: Opcode = opcode
+        self.operand: bytes = operand
+        self.size: int = size
+        self.targets: Tuple[int, ...] = targets
+
+    @property
+    def end_address(self) -> int:
+        """
+        Gets the address of the next instruction
+        """
+        return self.address + self.size
+
+    @property
+    def target(self) -> Optional[int]:
+        """
+        Gets the first jump target of the instruction. None if the instruction doesn't jump
+        """
+        return self.targets[0] if len(self.targets) > 0 else None
+
+    def __str__(self) -> str:
+        from boa3.neo.vm.Disassembler import Disassembler
+        return Disassembler.format_instruction(self)
+
+    def __repr__(self) -> str:
+        return str(self)
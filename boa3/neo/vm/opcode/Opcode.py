@@ -776,5 +776,65 @@ class Opcode(bytes, Enum):
 
     # endregion
 
+    @property
+    def price(self) -> int:
+        """
+        Gets the execution price of the opcode. The GAS fee of the execution is the price multiplied by the network's
+        execution fee factor
+
+        :return: the price of the opcode in fractions of GAS
+        """
+        return _OPCODE_PRICES.get(self, 0)
+
     def __repr__(self) -> str:
         return str(self)
+
+
+# the prices of the opcodes, as defined by the Neo N3 ApplicationEngine. The ones that aren't listed cost zero
+_OPCODE_PRICES: Dict[Opcode, int] = {
+    **{opcode: 1 << 0 for opcode in (Opcode.PUSHINT8, Opcode.PUSHINT16, Opcode.PUSHINT32, Opcode.PUSHINT64,
+                                     Opcode.PUSHNULL, Opcode.PUSHM1, Opcode.PUSH0, Opcode.PUSH1, Opcode.PUSH2,
+                                     Opcode.PUSH3, Opcode.PUSH4, Opcode.PUSH5, Opcode.PUSH6, Opcode.PUSH7, Opcode.PUSH8,
+                                     Opcode.PUSH9, Opcode.PUSH10, Opcode.PUSH11, Opcode.PUSH12, Opcode.PUSH13,
+                                     Opcode.PUSH14, Opcode.PUSH15, Opcode.PUSH16, Opcode.NOP, Opcode.ASSERT)},
+    **{opcode: 1 << 1 for opcode in (Opcode.JMP, Opcode.JMP_L, Opcode.JMPIF, Opcode.JMPIF_L, Opcode.JMPIFNOT,
+                                     Opcode.JMPIFNOT_L, Opcode.JMPEQ, Opcode.JMPEQ_L, Opcode.JMPNE, Opcode.JMPNE_L,
+                                     Opcode.JMPGT, Opcode.JMPGT_L, Opcode.JMPGE, Opcode.JMPGE_L, Opcode.JMPLT,
+                                     Opcode.JMPLT_L, Opcode.JMPLE, Opcode.JMPLE_L, Opcode.DEPTH, Opcode.DROP,
+                                     Opcode.NIP, Opcode.DUP, Opcode.OVER, Opcode.PICK, Opcode.TUCK, Opcode.SWAP,
+                                     Opcode.ROT, Opcode.REVERSE3, Opcode.REVERSE4,
+                                     Opcode.LDSFLD0, Opcode.LDSFLD1, Opcode.LDSFLD2, Opcode.LDSFLD3, Opcode.LDSFLD4,
+                                     Opcode.LDSFLD5, Opcode.LDSFLD6, Opcode.LDSFLD,
+                                     Opcode.STSFLD0, Opcode.STSFLD1, Opcode.STSFLD2, Opcode.STSFLD3, Opcode.STSFLD4,
+                                     Opcode.STSFLD5, Opcode.STSFLD6, Opcode.STSFLD,
+                                     Opcode.LDLOC0, Opcode.LDLOC1, Opcode.LDLOC2, Opcode.LDLOC3, Opcode.LDLOC4,
+                                     Opcode.LDLOC5, Opcode.LDLOC6, Opcode.LDLOC,
+                                     Opcode.STLOC0, Opcode.STLOC1, Opcode.STLOC2, Opcode.STLOC3, Opcode.STLOC4,
+                                     Opcode.STLOC5, Opcode.STLOC6, Opcode.STLOC,
+                                     Opcode.LDARG0, Opcode.LDARG1, Opcode.LDARG2, Opcode.LDARG3, Opcode.LDARG4,
+                                     Opcode.LDARG5, Opcode.LDARG6, Opcode.LDARG,
+                                     Opcode.STARG0, Opcode.STARG1, Opcode.STARG2, Opcode.STARG3, Opcode.STARG4,
+                                     Opcode.STARG5, Opcode.STARG6, Opcode.STARG, Opcode.ISNULL, Opcode.ISTYPE)},
+    **{opcode: 1 << 2 for opcode in (Opcode.PUSHINT128, Opcode.PUSHINT256, Opcode.PUSHA, Opcode.TRY, Opcode.TRY_L,
+                                     Opcode.ENDTRY, Opcode.ENDTRY_L, Opcode.ENDFINALLY, Opcode.INVERT, Opcode.SIGN,
+                                     Opcode.ABS, Opcode.NEGATE, Opcode.INC, Opcode.DEC, Opcode.NOT, Opcode.NZ,
+                                     Opcode.SIZE)},
+    **{opcode: 1 << 3 for opcode in (Opcode.PUSHDATA1, Opcode.AND, Opcode.OR, Opcode.XOR, Opcode.ADD, Opcode.SUB,
+                                     Opcode.MUL, Opcode.DIV, Opcode.MOD, Opcode.SHL, Opcode.SHR, Opcode.BOOLAND,
+                                     Opcode.BOOLOR, Opcode.NUMEQUAL, Opcode.NUMNOTEQUAL, Opcode.LT, Opcode.LE,
+                                     Opcode.GT, Opcode.GE, Opcode.MIN, Opcode.MAX, Opcode.WITHIN, Opcode.NEWMAP)},
+    **{opcode: 1 << 4 for opcode in (Opcode.XDROP, Opcode.CLEAR, Opcode.ROLL, Opcode.REVERSEN, Opcode.INITSSLOT,
+                                     Opcode.NEWARRAY0, Opcode.NEWSTRUCT0, Opcode.KEYS, Opcode.REMOVE,
+                                     Opcode.CLEARITEMS, Opcode.POPITEM)},
+    **{opcode: 1 << 5 for opcode in (Opcode.EQUAL, Opcode.NOTEQUAL)},
+    **{opcode: 1 << 6 for opcode in (Opcode.INITSLOT, Opcode.POW, Opcode.HASKEY, Opcode.PICKITEM)},
+    **{opcode: 1 << 8 for opcode in (Opcode.NEWBUFFER,)},
+    **{opcode: 1 << 9 for opcode in (Opcode.PUSHDATA2, Opcode.CALL, Opcode.CALL_L, Opcode.CALLA, Opcode.THROW,
+                                     Opcode.NEWARRAY, Opcode.NEWARRAY_T, Opcode.NEWSTRUCT)},
+    **{opcode: 1 << 11 for opcode in (Opcode.MEMCPY, Opcode.CAT, Opcode.SUBSTR, Opcode.LEFT, Opcode.RIGHT,
+                                      Opcode.SQRT, Opcode.PACK, Opcode.UNPACK)},
+    **{opcode: 1 << 12 for opcode in (Opcode.PUSHDATA4,)},
+    **{opcode: 1 << 13 for opcode in (Opcode.VALUES, Opcode.APPEND, Opcode.SETITEM, Opcode.REVERSEITEMS,
+                                      Opcode.CONVERT)},
+    **{opcode: 1 << 15 for opcode in (Opcode.CALLT,)},
+}
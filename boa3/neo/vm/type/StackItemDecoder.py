@@ -0,0 +1,375 @@
+import os
+from binascii import a2b_base64
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from boa3.neo.core.types.InteropInterface import InteropInterface
+from boa3.neo.vm.type.AbiType import AbiType
+
+_NOT_DECODED = object()
+
+
+class StackItemDecoder:
+    """
+    Decodes the json representation of Neo VM stack items into Python values.
+
+    The decoder can be created from the return type of a method in the manifest ABI, so the results with the expected
+    type are decoded without checking every possible stack item type. Arrays and maps can also be decoded lazily,
+    with their items decoded only when they are accessed.
+    """
+
+    _manifest_cache: Dict[str, Tuple[int, Dict[str, AbiType]]] = {}
+
+    def __init__(self, abi_type: AbiType = AbiType.Any, lazy: bool = False):
+        """
+        :param abi_type: the expected type of the decoded items
+        :param lazy: whether arrays and maps should be decoded only when their items are accessed
+        """
+        self._abi_type: AbiType = abi_type
+        self._lazy: bool = lazy
+
+        expected_types, decoder = _abi_decoders.get(abi_type, ((), None))
+        self._expected_types: Tuple[str, ...] = expected_types
+        self._decoder: Optional[Callable[[Dict[str, Any], bool], Any]] = decoder
+
+    @property
+    def abi_type(self) -> AbiType:
+        return self._abi_type
+
+    @property
+    def is_lazy(self) -> bool:
+        return self._lazy
+
+    @classmethod
+    def from_manifest(cls, manifest: Dict[str, Any], method_name: str, lazy: bool = False):
+        """
+        Creates a decoder for the results of a contract method
+
+        :param manifest: the contract manifest
+        :param method_name: the name of the method in the manifest ABI
+        :param lazy: whether arrays and maps should be decoded only when their items are accessed
+        """
+        return cls(cls._get_return_types(manifest).get(method_name, AbiType.Any), lazy)
+
+    @classmethod
+    def from_manifest_file(cls, manifest_path: str, method_name: str, lazy: bool = False):
+        """
+        Creates a decoder for the results of a contract method. The return types of each manifest file are read only
+        once, until the file is modified
+
+        :param manifest_path: the path of the contract manifest
+        :param method_name: the name of the method in the manifest ABI
+        :param lazy: whether arrays and maps should be decoded only when their items are accessed
+        """
+        try:
+            modified_time = os.stat(manifest_path).st_mtime_ns
+        except OSError:
+            return cls(lazy=lazy)
+
+        cached = cls._manifest_cache.get(manifest_path)
+        if cached is None or cached[0] != modified_time:
+            import json
+            try:
+                with open(manifest_path) as manifest_file:
+                    return_types = cls._get_return_types(json.loads(manifest_file.read()))
+            except ValueError:
+                return_types = {}
+            cached = (modified_time, return_types)
+            cls._manifest_cache[manifest_path] = cached
+
+        return cls(cached[1].get(method_name, AbiType.Any), lazy)
+
+    @staticmethod
+    def _get_return_types(manifest: Dict[str, Any]) -> Dict[str, AbiType]:
+        return_types = {}
+        abi = manifest.get('abi') if isinstance(manifest, dict) else None
+        if isinstance(abi, dict) and isinstance(abi.get('methods'), list):
+            for method in abi['methods']:
+                try:
+                    return_types[method['name']] = AbiType(method['returntype'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+        return return_types
+
+    def decode(self, item: Dict[str, Any]) -> Any:
+        """
+        Decodes a stack item
+
+        :param item: the json representation of the stack item
+        :return: the Python value of the stack item
+        :raise ValueError: raised if the item value doesn't match its type
+        """
+        if self._decoder is not None and item.get('type') in self._expected_types:
+            return self._decoder(item, self._lazy)
+        return decode_stack_item(item, self._lazy)
+
+    def decode_many(self, items: Iterable[Dict[str, Any]]) -> List[Any]:
+        """
+        Decodes a sequence of stack items, like the result stack of an execution
+
+        :param items: the json representation of the stack items
+        :return: a list with the Python values of the stack items
+        :raise ValueError: raised if the value of an item doesn't match its type
+        """
+        decode = self.decode
+        return [decode(item) for item in items]
+
+
+class LazyArray(Sequence):
+    """
+    An array of stack items that are decoded when they are accessed for the first time
+    """
+
+    __slots__ = ('_items', '_values')
+    __hash__ = None
+
+    def __init__(self, items: Sequence):
+        self._items = items
+        self._values: List[Any] = [_NOT_DECODED] * len(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+
+        value = self._values[index]
+        if value is _NOT_DECODED:
+            value = decode_stack_item(self._items[index], True)
+            self._values[index] = value
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyArray):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == other
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class LazyMap(Mapping):
+    """
+    A map of stack items. The keys are decoded when the map is created and the values are decoded when they are
+    accessed for the first time
+    """
+
+    __slots__ = ('_items', '_values')
+    __hash__ = None
+
+    def __init__(self, items: Sequence):
+        self._items: Dict[Any, Dict[str, Any]] = {}
+        for pair in items:
+            if 'key' not in pair or 'value' not in pair:
+                raise ValueError
+            self._items[decode_stack_item(pair['key'])] = pair['value']
+        self._values: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, key: Any) -> Any:
+        values = self._values
+        if key in values:
+            return values[key]
+
+        value = decode_stack_item(self._items[key], True)
+        values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._items
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+def decode_stack_item(item: Dict[str, Any], lazy: bool = False) -> Any:
+    """
+    Decodes the json representation of a stack item
+
+    :param item: the json representation of the stack item
+    :param lazy: whether arrays and maps should be decoded only when their items are accessed
+    :return: the Python value of the stack item
+    :raise ValueError: raised if the item value doesn't match its type
+    """
+    if 'type' not in item:
+        return None
+
+    decoder = _type_decoders.get(item['type'])
+    if decoder is None:
+        # Any, Pointer and unknown types
+        return None
+    return decoder(item, lazy)
+
+
+def _decode_interop_interface(item: Dict[str, Any], lazy: bool) -> Any:
+    if 'iterator' in item:
+        return _decode_list(item['iterator'], lazy)
+    return InteropInterface
+
+
+def _decode_boolean(item: Dict[str, Any], lazy: bool) -> Optional[bool]:
+    if 'value' not in item:
+        return None
+
+    value = item['value']
+    if isinstance(value, str) and value in ('True', 'False'):
+        value = value == 'True'
+    if not isinstance(value, bool):
+        raise ValueError
+    return value
+
+
+def _decode_integer(item: Dict[str, Any], lazy: bool) -> Optional[int]:
+    if 'value' not in item:
+        return None
+
+    value = item['value']
+    if isinstance(value, str):
+        value = int(value)
+    if not isinstance(value, int):
+        raise ValueError
+    return value
+
+
+def _decode_byte_string(item: Dict[str, Any], lazy: bool) -> Union[str, bytes, None]:
+    if 'value' not in item:
+        return None
+
+    value = item['value']
+    if not isinstance(value, str):
+        raise ValueError
+
+    decoded = a2b_base64(value)
+    try:
+        return decoded.decode('utf-8')
+    except UnicodeDecodeError:
+        return decoded
+
+
+def _decode_array(item: Dict[str, Any], lazy: bool) -> Union[list, LazyArray, None]:
+    if 'value' not in item:
+        return None
+
+    value = item['value']
+    if not isinstance(value, Sequence) or isinstance(value, (str, bytes)):
+        raise ValueError
+    return _decode_list(value, lazy)
+
+
+def _decode_map(item: Dict[str, Any], lazy: bool) -> Union[dict, LazyMap, None]:
+    if 'value' not in item:
+        return None
+
+    value = item['value']
+    if not isinstance(value, Sequence):
+        raise ValueError
+    if lazy:
+        return LazyMap(value)
+
+    result = {}
+    for pair in value:
+        if 'key' not in pair or 'value' not in pair:
+            raise ValueError
+        result[decode_stack_item(pair['key'])] = decode_stack_item(pair['value'])
+    return result
+
+
+def _decode_list(items: Sequence, lazy: bool) -> Union[list, LazyArray]:
+    if lazy:
+        return LazyArray(items)
+
+    if len(items) > 0 and isinstance(items[0], dict):
+        fast_decoder = _homogeneous_list_decoders.get(items[0].get('type'))
+        if fast_decoder is not None:
+            result = fast_decoder(items)
+            if result is not None:
+                return result
+
+    return [decode_stack_item(value) for value in items]
+
+
+def _decode_integer_list(items: Sequence) -> Optional[List[int]]:
+    # returns None if the items aren't all integers, so they are decoded one by one
+    result = []
+    append = result.append
+    try:
+        for item in items:
+            if item['type'] != 'Integer':
+                return None
+            value = item['value']
+            if type(value) is str:
+                append(int(value))
+            elif type(value) is int:
+                append(value)
+            else:
+                return None
+    except (KeyError, TypeError):
+        return None
+    return result
+
+
+def _decode_byte_string_list(items: Sequence) -> Optional[List[Union[str, bytes]]]:
+    # returns None if the items aren't all byte strings, so they are decoded one by one
+    result = []
+    append = result.append
+    try:
+        for item in items:
+            if item['type'] not in ('ByteString', 'Buffer'):
+                return None
+            value = item['value']
+            if type(value) is not str:
+                return None
+
+            decoded = a2b_base64(value)
+            try:
+                append(decoded.decode('utf-8'))
+            except UnicodeDecodeError:
+                append(decoded)
+    except (KeyError, TypeError):
+        return None
+    return result
+
+
+_type_decoders: Dict[str, Callable[[Dict[str, Any], bool], Any]] = {
+    'Boolean': _decode_boolean,
+    'Integer': _decode_integer,
+    'ByteString': _decode_byte_string,
+    'Buffer': _decode_byte_string,
+    'Array': _decode_array,
+    'Struct': _decode_array,
+    'Map': _decode_map,
+    'InteropInterface': _decode_interop_interface,
+}
+
+_homogeneous_list_decoders: Dict[str, Callable[[Sequence], Optional[list]]] = {
+    'Integer': _decode_integer_list,
+    'ByteString': _decode_byte_string_list,
+    'Buffer': _decode_byte_string_list,
+}
+
+_byte_string_decoder = (('ByteString', 'Buffer'), _decode_byte_string)
+_abi_decoders: Dict[AbiType, Tuple[Tuple[str, ...], Callable[[Dict[str, Any], bool], Any]]] = {
+    AbiType.Boolean: (('Boolean',), _decode_boolean),
+    AbiType.Integer: (('Integer',), _decode_integer),
+    AbiType.String: _byte_string_decoder,
+    AbiType.ByteArray: _byte_string_decoder,
+    AbiType.Hash160: _byte_string_decoder,
+    AbiType.Hash256: _byte_string_decoder,
+    AbiType.PublicKey: _byte_string_decoder,
+    AbiType.Signature: _byte_string_decoder,
+    AbiType.Array: (('Array', 'Struct'), _decode_array),
+    AbiType.Map: (('Map',), _decode_map),
+    AbiType.InteropInterface: (('InteropInterface',), _decode_interop_interface),
+}
@@ -179,23 +179,27 @@ class NEF(serialization.ISerializable):
         from boa3.neo3.core.serialization import BinaryWriter
         with BinaryWriter() as bw:
             bw.write_var_bytes(self.script)
-            return bw._stream.getvalue()
+            return bw.to_array()
 
     def tokens_to_array(self):
         from boa3.neo3.core.serialization import BinaryWriter
         with BinaryWriter() as bw:
             bw.write_var_bytes(bytes())
-            return bw._stream.getvalue()
+            return bw.to_array()
 
     def compute_checksum(self) -> bytes:
-        data = (self.magic.to_bytes(4, 'little')
-                + self.compiler_with_version
-                + bytes(2)  # reserved bytes
-                + self.tokens_to_array()   # TODO: method tokens
-                + bytes(2)  # reserved bytes
-                + self.script_to_array())
-
-        return hashlib.sha256(hashlib.sha256(data).digest()).digest()[:s.uint32]
+        # hashes the fields incrementally, so the script isn't copied into a temporary buffer
+        data_hash = hashlib.sha256(self.magic.to_bytes(4, 'little'))
+        data_hash.update(self.compiler_with_version)
+        data_hash.update(bytes(2))  # reserved bytes
+        data_hash.update(self.tokens_to_array())   # TODO: method tokens
+        data_hash.update(bytes(2))  # reserved bytes
+        with serialization.BinaryWriter() as bw:
+            bw.write_var_int(len(self.script))
+            data_hash.update(bw.to_array())
+        data_hash.update(self.script)
+
+        return hashlib.sha256(data_hash.digest()).digest()[:s.uint32]
 
     def compute_script_hash(self) -> types.UInt160:
         hash = hashlib.new('ripemd160', hashlib.sha256(self.script).digest()).digest()
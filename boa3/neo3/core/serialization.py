@@ -3,18 +3,39 @@ from __future__ import annotations
 import abc
 import struct
 import sys
-from io import BytesIO, SEEK_END
-from typing import Any, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 ISerializable_T = TypeVar('ISerializable_T', bound='ISerializable')
 
 __all__ = ['ISerializable', 'BinaryReader', 'BinaryWriter']
 
+_structs: Dict[str, struct.Struct] = {}
+
+
+def _get_struct(fmt: str) -> struct.Struct:
+    """
+    Get the compiled `struct.Struct` of a format string, so each format is parsed only once.
+    """
+    packer = _structs.get(fmt)
+    if packer is None:
+        packer = struct.Struct(fmt)
+        _structs[fmt] = packer
+    return packer
+
+
+_BOOL = _get_struct('?')
+_LITTLE_ENDIAN: Dict[str, struct.Struct] = {fmt: _get_struct('<' + fmt) for fmt in 'BHhIiQq'}
+_UINT16 = _LITTLE_ENDIAN['H']
+_UINT32 = _LITTLE_ENDIAN['I']
+_UINT64 = _LITTLE_ENDIAN['Q']
+
 
 class ISerializable(abc.ABC):
     """
     An interface like class supporting NEO's network serialization protocol.
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def serialize(self, writer: BinaryWriter) -> None:
         """
@@ -53,7 +74,7 @@ class ISerializable(abc.ABC):
         """ Serialize the object into a bytearray."""
         with BinaryWriter() as bw:
             self.serialize(bw)
-            return bw._stream.getvalue()
+            return bw.to_array()
 
     @abc.abstractmethod
     def __len__(self):
@@ -64,6 +85,9 @@ class BinaryReader(object):
     """
         A convenience class for reading data from byte streams.
 
+        The data is read through a `memoryview`, so reading doesn't copy the stream and `read_bytes` can return slices
+        that share the memory with the stream.
+
         Context manager support is available to ensure proper cleanup of resources.
 
         Example:
@@ -73,7 +97,7 @@ class BinaryReader(object):
                 my_value = br.read_uint16()
     """
 
-    def __init__(self, stream: Union[bytes, bytearray]) -> None:
+    def __init__(self, stream: Union[bytes, bytearray, memoryview]) -> None:
         """
         Create an instance.
 
@@ -81,7 +105,14 @@ class BinaryReader(object):
             stream: a stream to operate on.
         """
         super(BinaryReader, self).__init__()
-        self._stream = BytesIO(stream)
+        data = memoryview(stream)
+        if data.format != 'B' or data.ndim != 1:
+            data = data.cast('B')
+        self._data: memoryview = data
+        # slicing bytes is faster than copying the slice of a memoryview
+        self._bytes: Optional[bytes] = stream if isinstance(stream, bytes) else None
+        self._position: int = 0
+        self._size: int = len(data)
 
     def __enter__(self):
         return self
@@ -90,16 +121,17 @@ class BinaryReader(object):
         self.close()
 
     def __len__(self):
-        io = self._stream
-        # Remember our current position
-        cur_pos = io.tell()
-        # Seek to the end of the File object
-        io.seek(0, SEEK_END)
-        # Remember position, which is equal to the full length
-        full_size = io.tell()
-        # Seek back to the current position
-        io.seek(cur_pos)
-        return full_size
+        return self._size
+
+    def _read_struct(self, packer: struct.Struct) -> Any:
+        position = self._position
+        end = position + packer.size
+        if end > self._size:
+            raise ValueError(f"unpack requires a buffer of {packer.size} bytes. "
+                             f"Available bytes is: {self._size - position}")
+
+        self._position = end
+        return packer.unpack_from(self._data, position)[0]
 
     def _unpack(self, fmt, length=1) -> Any:
         """
@@ -113,11 +145,10 @@ class BinaryReader(object):
         Returns:
             variable: the result according to the specified format.
         """
-        try:
-            values = struct.unpack(fmt, self._stream.read(length))
-            return values[0]
-        except struct.error as e:
-            raise ValueError(str(e) + f". Available bytes is: {len(self)}")
+        packer = _get_struct(fmt)
+        if packer.size != length:
+            raise ValueError(f"unpack requires a buffer of {packer.size} bytes")
+        return self._read_struct(packer)
 
     def read_byte(self) -> bytes:
         """
@@ -129,17 +160,20 @@ class BinaryReader(object):
         Returns:
             bytes: a hex escaped bytearray with 1 element.
         """
-        value = self._stream.read(1)
-        if len(value) != 1:
+        position = self._position
+        if position >= self._size:
             raise ValueError("Could not read byte from empty stream")
-        return value
+        self._position = position + 1
+        return bytes((self._data[position],))
 
-    def read_bytes(self, length: int, _skip_length_check: bool = False) -> bytes:
+    def read_bytes(self, length: int, _skip_length_check: bool = False,
+                   copy: bool = True) -> Union[bytes, memoryview]:
         """
         Read the specified number of bytes from the stream.
 
         Args:
             length: number of bytes to read.
+            copy: (Optional) if False, returns a `memoryview` that shares the memory with the stream instead of a copy.
 
         Raises:
             ValueError: if `length` bytes of data cannot be read from the stream.
@@ -147,11 +181,19 @@ class BinaryReader(object):
         Returns:
             bytes: `length` number of bytes.
         """
-        value = self._stream.read(length)
-        if not _skip_length_check and len(value) != length:
-            raise ValueError(f"Could not read {length} bytes from stream. Only found {len(value)} bytes of data")
-
-        return value
+        position = self._position
+        end = min(position + length, self._size)
+        if not _skip_length_check and end - position != length:
+            raise ValueError(f"Could not read {length} bytes from stream. "
+                             f"Only found {end - position} bytes of data")
+
+        self._position = end
+        if not copy:
+            return self._data[position:end]
+        elif self._bytes is not None:
+            return self._bytes[position:end]
+        else:
+            return bytes(self._data[position:end])
 
     def read_bool(self) -> bool:
         """
@@ -160,7 +202,7 @@ class BinaryReader(object):
         Returns:
             bool: False for b'\x00'. True for all other values.
         """
-        return self._unpack('?')
+        return self._read_struct(_BOOL)
 
     def read_uint8(self, endian: str = "<") -> int:
         """
@@ -169,7 +211,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%sB' % endian)
+        return self._read_struct(_LITTLE_ENDIAN['B'] if endian == '<' else _get_struct(endian + 'B'))
 
     def read_uint16(self, endian: str = "<") -> int:
         """
@@ -178,7 +220,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%sH' % endian, 2)
+        return self._read_struct(_LITTLE_ENDIAN['H'] if endian == '<' else _get_struct(endian + 'H'))
 
     def read_int16(self, endian: str = "<") -> int:
         """
@@ -187,7 +229,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%sh' % endian, 2)
+        return self._read_struct(_LITTLE_ENDIAN['h'] if endian == '<' else _get_struct(endian + 'h'))
 
     def read_uint32(self, endian: str = "<") -> int:
         """
@@ -196,7 +238,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%sI' % endian, 4)
+        return self._read_struct(_LITTLE_ENDIAN['I'] if endian == '<' else _get_struct(endian + 'I'))
 
     def read_int32(self, endian: str = "<") -> int:
         """
@@ -205,7 +247,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%si' % endian, 4)
+        return self._read_struct(_LITTLE_ENDIAN['i'] if endian == '<' else _get_struct(endian + 'i'))
 
     def read_uint64(self, endian: str = "<") -> int:
         """
@@ -214,7 +256,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%sQ' % endian, 8)
+        return self._read_struct(_LITTLE_ENDIAN['Q'] if endian == '<' else _get_struct(endian + 'Q'))
 
     def read_int64(self, endian: str = "<") -> int:
         """
@@ -223,7 +265,7 @@ class BinaryReader(object):
         Args:
             endian: specify the endianness. (Default) Little endian ('<'). Use '>' for big endian.
         """
-        return self._unpack('%sq' % endian, 8)
+        return self._read_struct(_LITTLE_ENDIAN['q'] if endian == '<' else _get_struct(endian + 'q'))
 
     def read_var_int(self, max: int = sys.maxsize) -> int:
         """
@@ -244,16 +286,20 @@ class BinaryReader(object):
         Raises:
             ValueError: if the return value exceeds the `max` argument.
         """
-        fb = int.from_bytes(self.read_byte(), 'little')
+        position = self._position
+        if position >= self._size:
+            raise ValueError("Could not read byte from empty stream")
+        self._position = position + 1
+        fb = self._data[position]
         if fb == 0:
             return fb
 
         if fb == 0xfd:
-            value = self.read_uint16()
+            value = self._read_struct(_UINT16)
         elif fb == 0xfe:
-            value = self.read_uint32()
+            value = self._read_struct(_UINT32)
         elif fb == 0xff:
-            value = self.read_uint64()
+            value = self._read_struct(_UINT64)
         else:
             value = fb
 
@@ -340,8 +386,8 @@ class BinaryReader(object):
         """
         length = self.read_var_int(max)
         try:
-            data = self._unpack(str(length) + 's', length)
-            return data.decode('utf-8')
+            data = self.read_bytes(length, copy=False)
+            return str(data, 'utf-8')
         except Exception as e:
             raise ValueError(str(e))
 
@@ -374,27 +420,38 @@ class BinaryReader(object):
         if max and count > max:
             count = max
 
+        # fixed size types can decode the whole list at once
+        deserialize_list = getattr(obj_type, '_deserialize_list', None)
+        if deserialize_list is not None:
+            return deserialize_list(self, count)
+
+        append = obj_array.append
         for _ in range(count):
             obj = obj_type()
             obj.deserialize(self)
-            obj_array.append(obj)
+            append(obj)
         return obj_array
 
     def close(self) -> None:
         """
-        Close the internal stream to prevent resource leaking.
+        Release the internal stream to prevent resource leaking.
+        The memoryviews returned by `read_bytes` are still valid after closing the reader.
 
         Note:
             This is done automatically when using the context manager
         """
-        if self._stream:
-            self._stream.close()
+        self._data.release()
+        self._bytes = None
+        self._position = self._size = 0
 
 
 class BinaryWriter(object):
     """
     A convenience class for writing data to byte streams.
 
+    The data is appended to a `bytearray`, which grows geometrically, and the values are packed with precompiled
+    `struct.Struct` objects.
+
     Context manager support is available to ensure proper cleanup of resources.
 
     Example:
@@ -402,7 +459,7 @@ class BinaryWriter(object):
 
         with serialization.BinaryWriter() as bw:
             bw.write_uint8(5)
-            self.assertEqual(b'\\x05', bw._stream.getvalue())
+            self.assertEqual(b'\\x05', bw.to_array())
     """
 
     def __init__(self, stream: Union[bytearray, bytes] = None) -> None:
@@ -413,7 +470,7 @@ class BinaryWriter(object):
             stream: a stream to operate on.
         """
         super(BinaryWriter, self).__init__()
-        self._stream = BytesIO(stream) if stream else BytesIO()
+        self._buffer: bytearray = bytearray(stream) if stream else bytearray()
 
     def __enter__(self):
         return self
@@ -422,16 +479,7 @@ class BinaryWriter(object):
         self.close()
 
     def __len__(self):
-        io = self._stream
-        # Remember our current position
-        cur_pos = io.tell()
-        # Seek to the end of the File object
-        io.seek(0, SEEK_END)
-        # Remember position, which is equal to the full length
-        full_size = io.tell()
-        # Seek back to the current position
-        io.seek(cur_pos)
-        return full_size
+        return len(self._buffer)
 
     def write_bytes(self, value: bytes) -> int:
         """
@@ -443,7 +491,8 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._stream.write(value)
+        self._buffer += value
+        return len(value)
 
     def _pack(self, fmt, data) -> int:
         """
@@ -458,7 +507,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self.write_bytes(struct.pack(fmt, data))
+        packed = _get_struct(fmt).pack(data)
+        self._buffer += packed
+        return len(packed)
 
     def write_bool(self, value: bool) -> int:
         """
@@ -470,7 +521,8 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('?', value)
+        self._buffer += _BOOL.pack(value)
+        return 1
 
     def write_uint8(self, value) -> int:
         """
@@ -481,7 +533,8 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self.write_bytes(bytes([value]))
+        self._buffer.append(value)
+        return 1
 
     def write_uint16(self, value: int, endian: str = "<") -> int:
         """
@@ -494,7 +547,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('%sH' % endian, value)
+        packer = _LITTLE_ENDIAN['H'] if endian == '<' else _get_struct(endian + 'H')
+        self._buffer += packer.pack(value)
+        return 2
 
     def write_uint32(self, value: int, endian: str = "<") -> int:
         """
@@ -507,7 +562,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('%sI' % endian, value)
+        packer = _LITTLE_ENDIAN['I'] if endian == '<' else _get_struct(endian + 'I')
+        self._buffer += packer.pack(value)
+        return 4
 
     def write_uint64(self, value: int, endian: str = "<") -> int:
         """
@@ -520,7 +577,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('%sQ' % endian, value)
+        packer = _LITTLE_ENDIAN['Q'] if endian == '<' else _get_struct(endian + 'Q')
+        self._buffer += packer.pack(value)
+        return 8
 
     def write_int16(self, value: int, endian: str = "<") -> int:
         """
@@ -531,7 +590,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('%sh' % endian, value)
+        packer = _LITTLE_ENDIAN['h'] if endian == '<' else _get_struct(endian + 'h')
+        self._buffer += packer.pack(value)
+        return 2
 
     def write_int32(self, value: int, endian: str = "<") -> int:
         """
@@ -542,7 +603,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('%si' % endian, value)
+        packer = _LITTLE_ENDIAN['i'] if endian == '<' else _get_struct(endian + 'i')
+        self._buffer += packer.pack(value)
+        return 4
 
     def write_int64(self, value: int, endian: str = "<") -> int:
         """
@@ -553,7 +616,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack('%sq' % endian, value)
+        packer = _LITTLE_ENDIAN['q'] if endian == '<' else _get_struct(endian + 'q')
+        self._buffer += packer.pack(value)
+        return 8
 
     def write_var_string(self, value: str, encoding: str = "utf-8") -> int:
         """
@@ -609,18 +674,18 @@ class BinaryWriter(object):
             raise ValueError('%d too small.' % value)
 
         elif value < 0xfd:
-            return self.write_bytes(bytes([value]))
+            return self.write_uint8(value)
 
         elif value <= 0xffff:
-            self.write_bytes(bytes([0xfd]))
+            self.write_uint8(0xfd)
             return self.write_uint16(value, endian)
 
         elif value <= 0xFFFFFFFF:
-            self.write_bytes(bytes([0xfe]))
+            self.write_uint8(0xfe)
             return self.write_uint32(value, endian)
 
         else:
-            self.write_bytes(bytes([0xff]))
+            self.write_uint8(0xff)
             return self.write_uint64(value, endian)
 
     def write_var_bytes(self, value: bytes, endian: str = "<") -> int:
@@ -709,11 +774,9 @@ class BinaryWriter(object):
         Note:
             This is done automatically when using the context manager
         """
-        if self._stream:
-            self._stream.close()
 
     def to_array(self) -> bytes:
         """
         Get the raw bytes from the underlying stream.
         """
-        return self._stream.getvalue()
+        return bytes(self._buffer)
@@ -1,73 +1,160 @@
 from __future__ import annotations
 
 import binascii
-from typing import Type, Union
+from typing import Dict, List, Optional, Type, TypeVar, Union
 
 from boa3.neo import to_hex_str
 from boa3.neo3.core import serialization
 
 __all__ = ['UInt160', 'UInt256']
 
+_UInt_T = TypeVar('_UInt_T', bound='_UIntBase')
+
 
 class _UIntBase(serialization.ISerializable):
-    def __init__(self, num_bytes: int, data: Union[bytes, bytearray] = None) -> None:
+    """
+    Base class of the fixed size unsigned integers. The values are immutable and their data is stored in a `bytes`
+    object, so they can be safely used as keys in dicts and sets.
+    """
+
+    __slots__ = ('_data', '_hash')
+
+    _BYTE_LEN = 0
+    _interned: Dict[bytes, _UIntBase]   # each subclass has its own table
+
+    def __init__(self, num_bytes: int, data: Union[bytes, bytearray, memoryview] = None) -> None:
         """
 
         Args:
-            num_bytes:
-            data:
-        """
-        super(_UIntBase, self).__init__()
+            num_bytes: the size of the value in bytes.
+            data: the value bytes, in little endian order. Use :py:meth:`from_hex` to parse hex strings.
 
+        Raises:
+            TypeError: if `data` is not a bytes-like object.
+            ValueError: if the length of `data` is not `num_bytes`.
+        """
         if data is None:
-            self._data = bytearray(num_bytes)
-
+            data = bytes(num_bytes)
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
         else:
-            if isinstance(data, bytes):
-                # make sure it's mutable for string representation
-                self._data = bytearray(data)
-            elif isinstance(data, bytearray):
-                self._data = data
-            else:
-                raise TypeError(f"Invalid data type {type(data)}. Expecting bytes or bytearray")
-
-            # now make sure the sequence is hex escaped
-            try:
-                self._data = bytearray(binascii.unhexlify(self._data.decode()))
-            except UnicodeDecodeError:
-                # decode() fails most of the time if data is already hex escaped.
-                # In that case there is nothing to be done.
-                pass
-            except binascii.Error:
-                # however in some cases like bytes.fromhex('1122') decoding passes,
-                # but binascii fails because it was actually already escaped. Still nothing to be done.
-                pass
-
-            if len(self._data) != num_bytes:
-                raise ValueError(f"Invalid UInt: data length {len(self._data)} != specified num_bytes {num_bytes}")
+            raise TypeError(f"Invalid data type {type(data)}. Expecting bytes or bytearray")
+
+        if len(data) != num_bytes:
+            raise ValueError(f"Invalid UInt: data length {len(data)} != specified num_bytes {num_bytes}")
+
+        self._data: bytes = data
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _from_trusted_bytes(cls: Type[_UInt_T], data: bytes) -> _UInt_T:
+        """
+        Create an instance without validating the data. `data` must be a `bytes` object with the type's length.
+        """
+        instance = object.__new__(cls)
+        instance._data = data
+        instance._hash = None
+        return instance
+
+    @classmethod
+    def from_hex(cls: Type[_UInt_T], value: Union[str, bytes]) -> _UInt_T:
+        """
+        Parse a hex string in the internal byte order into an instance.
+
+        Note:
+            Unlike :py:meth:`from_string`, the bytes are not reversed.
+
+        Args:
+            value: the hex representation of the value, with or without the `0x` prefix.
+
+        Raises:
+            ValueError: if `value` is not a valid hex string or if its length does not match.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode('ascii', errors='replace')
+        if value.startswith(('0x', '0X')):
+            value = value[2:]
+        if len(value) != cls._BYTE_LEN * 2:
+            raise ValueError(f"Invalid {cls.__name__} Format: {len(value)} chars != {cls._BYTE_LEN * 2} chars")
+
+        try:
+            return cls._from_trusted_bytes(binascii.unhexlify(value))
+        except binascii.Error as e:
+            raise ValueError(f"Invalid {cls.__name__} Format: {e}")
+
+    @classmethod
+    def from_buffer(cls: Type[_UInt_T], buffer: Union[bytes, bytearray, memoryview], count: int = None) -> List[_UInt_T]:
+        """
+        Create instances from consecutive values in a contiguous buffer.
+
+        Args:
+            buffer: the concatenated values, in the internal byte order.
+            count: (Optional) the number of values to read. All the values in the buffer by default.
+
+        Raises:
+            ValueError: if the buffer doesn't have `count` values or if its length isn't a multiple of the type's size
+                when `count` is not specified.
+        """
+        size = cls._BYTE_LEN
+        if count is None:
+            if len(buffer) % size != 0:
+                raise ValueError(f"Invalid buffer length {len(buffer)}, expected a multiple of {size}")
+            count = len(buffer) // size
+        elif len(buffer) < count * size:
+            raise ValueError(f"Insufficient data {len(buffer)} bytes for {count} values of {size} bytes")
+
+        data = bytes(buffer[:count * size])
+        new = object.__new__
+        result = []
+        append = result.append
+        for start in range(0, count * size, size):
+            instance = new(cls)
+            instance._data = data[start:start + size]
+            instance._hash = None
+            append(instance)
+        return result
+
+    @classmethod
+    def _deserialize_list(cls: Type[_UInt_T], reader: serialization.BinaryReader, count: int) -> List[_UInt_T]:
+        """
+        Deserialize `count` consecutive values from a binary stream.
+        """
+        return cls.from_buffer(reader.read_bytes(count * cls._BYTE_LEN, copy=False), count)
+
+    @classmethod
+    def intern(cls: Type[_UInt_T], value: Union[_UInt_T, bytes, bytearray, memoryview]) -> _UInt_T:
+        """
+        Get the canonical instance of a value, so frequently used values are shared instead of duplicated.
+
+        Args:
+            value: an instance or the value bytes.
+        """
+        key = value._data if isinstance(value, _UIntBase) else bytes(value)
+        interned = cls._interned.get(key)
+        if interned is None:
+            interned = value if type(value) is cls else cls(key)
+            cls._interned[key] = interned
+        return interned
 
     def __len__(self) -> int:
         """ Count of data bytes. """
         return len(self._data)
 
     def __eq__(self, other) -> bool:
-        if other is None:
-            return False
-
-        if not isinstance(other, _UIntBase):
-            return False
-
         if other is self:
             return True
 
-        if self._data == other._data:
-            return True
+        if not isinstance(other, _UIntBase):
+            return False
 
-        return False
+        return self._data == other._data
 
     def __hash__(self):
-        slice_length = 4 if len(self._data) >= 4 else len(self._data)
-        return int.from_bytes(self._data[:slice_length], 'little')
+        # bytes objects cache their own hash, but keeping it here avoids the attribute lookups on every dict access
+        result = self._hash
+        if result is None:
+            result = self._hash = hash(self._data)
+        return result
 
     def __str__(self) -> str:
         """ Convert the data to a human readable format (data is in reverse byte order). """
@@ -76,6 +163,9 @@ class _UIntBase(serialization.ISerializable):
     def __repr__(self) -> str:
         return self.__str__()
 
+    def __reduce__(self):
+        return type(self), (self._data,)
+
     def _compare_to(self, other) -> int:
         if not isinstance(other, _UIntBase):
             raise TypeError(f"Cannot compare {type(self).__name__} to type {type(other).__name__}")
@@ -87,14 +177,13 @@ class _UIntBase(serialization.ISerializable):
             raise ValueError(f"Cannot compare {type(self).__name__} with length {len(x)} to {type(other).__name__} with"
                              f" length {len(y)}")
 
-        length = len(x)
-
-        for i in range(length - 1, 0, -1):
-            if x[i] > y[i]:
-                return 1
-            if x[i] < y[i]:
-                return -1
-
+        # the values are little endian, so the comparison starts from the last byte
+        x = x[::-1]
+        y = y[::-1]
+        if x > y:
+            return 1
+        if x < y:
+            return -1
         return 0
 
     def __lt__(self, other):
@@ -115,38 +204,47 @@ class _UIntBase(serialization.ISerializable):
 
         Returns:
         """
-        return bytes(self._data)
+        return self._data
 
+    def serialize(self, writer: serialization.BinaryWriter) -> None:
+        """
+        Serialize the object into a binary stream.
 
-class UInt160(_UIntBase):
-    _BYTE_LEN = 20
+        Args:
+            writer: instance.
+        """
+        writer.write_bytes(self._data)
 
-    def __init__(self, data: bytes = None):
+    def deserialize(self, reader: serialization.BinaryReader) -> None:
         """
-        Initialize an instance.
+        Deserialize the object from a binary stream.
+
+        Note:
+            Only meant to be used on new instances, like in :py:meth:`BinaryReader.read_serializable`.
 
         Args:
-            data: hex escaped bytearray.
+            reader: instance.
         """
-        super(UInt160, self).__init__(num_bytes=self._BYTE_LEN, data=data)
+        self._data = reader.read_bytes(self._BYTE_LEN)
+        self._hash = None
 
     @classmethod
-    def deserialize_from_bytes(cls: Type[UInt160], data: bytes) -> UInt160:
+    def deserialize_from_bytes(cls: Type[_UInt_T], data: Union[bytes, bytearray, memoryview]) -> _UInt_T:
         """
         Parse data into an object instance.
 
         Args:
-            data: hex escaped bytes.
+            data: the value bytes. Any bytes after the type's size are ignored.
 
         Raises:
             ValueError: if the length of the supplied bytearray is insufficient for the type.
         """
         if len(data) < cls._BYTE_LEN:
             raise ValueError(f"Insufficient data {len(data)} bytes is less than the required {cls._BYTE_LEN}")
-        return cls(data[:cls._BYTE_LEN])
+        return cls._from_trusted_bytes(bytes(data[:cls._BYTE_LEN]))
 
     @classmethod
-    def from_string(cls: Type[UInt160], value: str) -> UInt160:
+    def from_string(cls: Type[_UInt_T], value: str) -> _UInt_T:
         """
         Try to parse a string into an instance.
 
@@ -167,103 +265,53 @@ class UInt160(_UIntBase):
         return cls(data=reversed_data)
 
     @classmethod
-    def zero(cls: Type[UInt160]) -> UInt160:
+    def zero(cls: Type[_UInt_T]) -> _UInt_T:
         """
         Returns:
             An instance initialized to zero.
         """
-        return cls(data=bytearray(20))
+        return cls(data=bytes(cls._BYTE_LEN))
 
-    def serialize(self, writer: serialization.BinaryWriter) -> None:
-        """
-        Serialize the object into a binary stream.
 
-        Args:
-            writer: instance.
-        """
-        writer.write_bytes(self._data)
+class UInt160(_UIntBase):
+    __slots__ = ()
 
-    def deserialize(self, reader: serialization.BinaryReader) -> None:
+    _BYTE_LEN = 20
+    _interned: Dict[bytes, UInt160] = {}
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview] = None):
         """
-        Deserialize the object from a binary stream.
+        Initialize an instance.
 
         Args:
-            reader: instance.
+            data: the value bytes, in little endian order.
         """
-        self._data = bytearray(reader.read_bytes(self._BYTE_LEN))
+        super(UInt160, self).__init__(num_bytes=self._BYTE_LEN, data=data)
 
 
 class UInt256(_UIntBase):
+    __slots__ = ()
+
     _BYTE_LEN = 32
+    _interned: Dict[bytes, UInt256] = {}
 
-    def __init__(self, data: bytes = None):
+    def __init__(self, data: Union[bytes, bytearray, memoryview] = None):
         """
         Initialize an instance.
 
         Args:
-            data: hex escaped bytearray.
+            data: the value bytes, in little endian order.
         """
         super(UInt256, self).__init__(num_bytes=self._BYTE_LEN, data=data)
 
-    @classmethod
-    def deserialize_from_bytes(cls: Type[UInt256], data: bytes) -> UInt256:
-        """
-        Parse data into an object instance.
 
-        Args:
-            data: hex escaped bytes.
+def _intern_native_contract_hashes():
+    from boa3 import constants
 
-        Raises:
-            ValueError: if the length of the supplied bytearray is insufficient for the type.
-        """
-        if len(data) < cls._BYTE_LEN:
-            raise ValueError(f"Insufficient data {len(data)} bytes is less than the required {cls._BYTE_LEN}")
-        return cls(data[:cls._BYTE_LEN])
+    for native_hash in (constants.NEO_SCRIPT, constants.GAS_SCRIPT, constants.CRYPTO_SCRIPT, constants.LEDGER_SCRIPT,
+                        constants.MANAGEMENT_SCRIPT, constants.ORACLE_SCRIPT, constants.POLICY_SCRIPT,
+                        constants.ROLE_MANAGEMENT, constants.STD_LIB_SCRIPT):
+        UInt160.intern(native_hash)
 
-    @classmethod
-    def from_string(cls: Type[UInt256], value: str) -> UInt256:
-        """
-        Try to parse a string into an instance.
-
-        Note:
-            NEO's string representation is in reverse byte order from the internal bytearray.
 
-
-        Args:
-            value: accepts the same input as :py:meth:`bytearray.fromhex`.
-
-        Raises:
-            ValueError: if the length of the supplied string does not match.
-        """
-        if len(value) != cls._BYTE_LEN * 2:
-            raise ValueError(f"Invalid {cls.__name__} Format: {len(value)} chars != {cls._BYTE_LEN * 2} chars")
-        reversed_data = bytearray.fromhex(value)
-        reversed_data.reverse()
-        return cls(data=reversed_data)
-
-    @classmethod
-    def zero(cls: Type[UInt256]) -> UInt256:
-        """
-        Returns:
-            An instance initialized to zero.
-        """
-
-        return cls(data=bytearray(cls._BYTE_LEN))
-
-    def serialize(self, writer: serialization.BinaryWriter) -> None:
-        """
-        Serialize the object into a binary stream.
-
-        Args:
-            writer: instance.
-        """
-        writer.write_bytes(self._data)
-
-    def deserialize(self, reader: serialization.BinaryReader) -> None:
-        """
-        Deserialize the object from a binary stream.
-
-        Args:
-            reader: instance.
-        """
-        self._data = bytearray(reader.read_bytes(self._BYTE_LEN))
+_intern_native_contract_hashes()
@@ -0,0 +1,99 @@
+"""
+Benchmarks of the serialization core used to read and write NEF files and stack item blobs.
+
+Usage:
+    python -m boa3_test.benchmarks.serialization [--repeat N]
+"""
+import argparse
+import timeit
+
+from boa3.neo.contracts.neffile import NefFile
+from boa3.neo3.core.serialization import BinaryReader, BinaryWriter
+from boa3.neo3.core.types import UInt160
+
+
+def benchmark_nef(script_size: int, repeat: int):
+    script = bytes(index % 256 for index in range(script_size))
+    nef_bytes = NefFile(script).serialize()
+
+    serialize_time = min(timeit.repeat(lambda: NefFile(script).serialize(), number=10, repeat=repeat)) / 10
+    deserialize_time = min(timeit.repeat(lambda: NefFile.deserialize(nef_bytes), number=10, repeat=repeat)) / 10
+
+    print('NEF {0:>9} bytes   serialize {1:>10.3f} ms   deserialize {2:>10.3f} ms'.format(
+        script_size, serialize_time * 1000, deserialize_time * 1000))
+
+
+def benchmark_serializable_list(count: int, repeat: int):
+    hashes = [UInt160(index.to_bytes(20, 'little')) for index in range(count)]
+
+    def write_list() -> bytes:
+        with BinaryWriter() as writer:
+            writer.write_serializable_list(hashes)
+            return writer.to_array()
+
+    data = write_list()
+
+    def read_list():
+        with BinaryReader(data) as reader:
+            return reader.read_serializable_list(UInt160)
+
+    write_time = min(timeit.repeat(write_list, number=1, repeat=repeat))
+    read_time = min(timeit.repeat(read_list, number=1, repeat=repeat))
+
+    print('UInt160 list {0:>8} items   write {1:>10.3f} ms   read {2:>10.3f} ms'.format(
+        count, write_time * 1000, read_time * 1000))
+
+
+def benchmark_uint160(count: int, repeat: int):
+    buffer = b''.join(index.to_bytes(20, 'little') for index in range(count))
+    hashes = UInt160.from_buffer(buffer)
+    values = dict.fromkeys(hashes)
+
+    construct_time = min(timeit.repeat(lambda: [UInt160(buffer[index:index + 20])
+                                                for index in range(0, len(buffer), 20)],
+                                       number=1, repeat=repeat))
+    bulk_time = min(timeit.repeat(lambda: UInt160.from_buffer(buffer), number=1, repeat=repeat))
+    lookup_time = min(timeit.repeat(lambda: [value in values for value in hashes], number=1, repeat=repeat))
+
+    print('UInt160 {0:>13} items   construct {1:>6.3f} ms   from_buffer {2:>6.3f} ms   dict lookup {3:>6.3f} ms'.format(
+        count, construct_time * 1000, bulk_time * 1000, lookup_time * 1000))
+
+
+def benchmark_var_bytes(count: int, repeat: int):
+    items = [bytes(index % 64) for index in range(count)]
+
+    def write_items() -> bytes:
+        with BinaryWriter() as writer:
+            for item in items:
+                writer.write_var_bytes(item)
+            return writer.to_array()
+
+    data = write_items()
+
+    def read_items(copy: bool):
+        with BinaryReader(data) as reader:
+            return [reader.read_bytes(reader.read_var_int(), copy=copy) for _ in range(count)]
+
+    write_time = min(timeit.repeat(write_items, number=1, repeat=repeat))
+    read_time = min(timeit.repeat(lambda: read_items(True), number=1, repeat=repeat))
+    read_no_copy_time = min(timeit.repeat(lambda: read_items(False), number=1, repeat=repeat))
+
+    print('var bytes {0:>11} items   write {1:>10.3f} ms   read {2:>10.3f} ms   read without copy {3:>10.3f} ms'.format(
+        count, write_time * 1000, read_time * 1000, read_no_copy_time * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the serialization core')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of times each benchmark is repeated')
+    args = parser.parse_args()
+
+    for script_size in (1024, 64 * 1024, 1024 * 1024):
+        benchmark_nef(script_size, args.repeat)
+    for count in (1000, 100000):
+        benchmark_serializable_list(count, args.repeat)
+    benchmark_uint160(100000, args.repeat)
+    benchmark_var_bytes(100000, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmarks of the conversion of the Neo VM stack items returned by the test engine into Python values.
+
+Usage:
+    python -m boa3_test.benchmarks.stackitems [--repeat N]
+"""
+import argparse
+import base64
+import timeit
+
+from boa3.neo.vm.type.StackItemDecoder import StackItemDecoder
+
+
+def _integer(value: int) -> dict:
+    return {'type': 'Integer', 'value': str(value)}
+
+
+def _byte_string(value: bytes) -> dict:
+    return {'type': 'ByteString', 'value': base64.b64encode(value).decode()}
+
+
+def benchmark(name: str, item: dict, repeat: int):
+    eager_decoder = StackItemDecoder()
+    lazy_decoder = StackItemDecoder(lazy=True)
+
+    eager_time = min(timeit.repeat(lambda: eager_decoder.decode(item), number=1, repeat=repeat))
+    lazy_time = min(timeit.repeat(lambda: lazy_decoder.decode(item), number=1, repeat=repeat))
+
+    print('{0:<28} eager {1:>10.3f} ms   lazy {2:>10.3f} ms'.format(name, eager_time * 1000, lazy_time * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the stack item conversion')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of times each benchmark is repeated')
+    args = parser.parse_args()
+
+    count = 10000
+    benchmark('Array of {0} integers'.format(count),
+              {'type': 'Array', 'value': [_integer(index) for index in range(count)]},
+              args.repeat)
+    benchmark('Array of {0} byte strings'.format(count),
+              {'type': 'Array', 'value': [_byte_string(index.to_bytes(20, 'little')) for index in range(count)]},
+              args.repeat)
+    benchmark('Map with {0} entries'.format(count),
+              {'type': 'Map', 'value': [{'key': _byte_string(index.to_bytes(20, 'little')),
+                                         'value': {'type': 'Array', 'value': [_integer(index), _integer(-index)]}}
+                                        for index in range(count)]},
+              args.repeat)
+
+
+if __name__ == '__main__':
+    main()
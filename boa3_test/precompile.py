@@ -0,0 +1,205 @@
+"""
+Compiles the test contracts in parallel before running the test suite.
+
+The generated artifacts are stamped, so the tests only execute the contracts instead of compiling them again.
+Contracts that are up to date are not recompiled and contracts that are expected to fail are reported as failed.
+
+The `--digests` option compiles the contracts in memory and prints the sha256 of their artifacts instead, so builds
+from different processes or machines can be compared.
+
+Usage:
+    python -m boa3_test.precompile [--workers N] [--summary path/to/summary.json] [--digests] [paths...]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from boa3 import env
+
+DEFAULT_FOLDERS = [
+    'boa3_test/test_sc',
+    'boa3_test/examples'
+]
+
+STATUS_COMPILED = 'compiled'
+STATUS_UP_TO_DATE = 'up-to-date'
+STATUS_FAILED = 'failed'
+
+
+def find_contracts(folders: List[str]) -> List[str]:
+    """
+    Gets the paths of every Python file inside the given folders
+
+    :param folders: the folders to be scanned or the paths of the contracts. Relative paths are relative to the
+                    project root
+    :return: a sorted list with the full paths of the contracts
+    """
+    contracts = []
+    for folder in folders:
+        if not os.path.isabs(folder):
+            folder = '{0}/{1}'.format(env.PROJECT_ROOT_DIRECTORY, folder)
+
+        if os.path.isfile(folder):
+            if folder.endswith('.py'):
+                contracts.append(folder.replace(os.sep, '/'))
+            continue
+
+        for root, dirs, files in os.walk(folder):
+            for file_name in files:
+                if file_name.endswith('.py') and file_name != '__init__.py':
+                    contracts.append(os.path.join(root, file_name).replace(os.sep, '/'))
+
+    return sorted(contracts)
+
+
+def compile_contract(path: str) -> Dict[str, Any]:
+    """
+    Compiles a contract and saves its artifacts if they are outdated
+
+    :param path: the full path of the contract
+    :return: a dictionary with the compilation status, time and size of the contract
+    """
+    from boa3.compiler.buildstamp import BuildStamp
+    from boa3.compiler.compiler import Compiler
+    from boa3.exception.NotLoadedException import NotLoadedException
+
+    nef_path = path.replace('.py', '.nef')
+    result = {
+        'path': path,
+        'status': STATUS_UP_TO_DATE,
+        'time': 0.0,
+        'size': 0
+    }
+
+    stamp = BuildStamp.load(nef_path)
+    if stamp is None or not stamp.is_up_to_date() or not os.path.isfile(path.replace('.py', '.manifest.json')):
+        start = time.perf_counter()
+        try:
+            Compiler().compile_and_save(path, nef_path, log=False)
+            result['status'] = STATUS_COMPILED
+        except (NotLoadedException, SyntaxError):
+            # the contract has compiler errors or isn't valid Python code
+            result['status'] = STATUS_FAILED
+        result['time'] = round(time.perf_counter() - start, 6)
+
+    if result['status'] != STATUS_FAILED and os.path.isfile(nef_path):
+        result['size'] = os.path.getsize(nef_path)
+
+    return result
+
+
+def artifacts_digest(path: str) -> Optional[str]:
+    """
+    Compiles a contract in memory and hashes its artifacts
+
+    :param path: the full path of the contract
+    :return: the sha256 of the nef file, the manifest and the debug info. None if the contract doesn't compile
+    """
+    import hashlib
+    from boa3.compiler.compiler import Compiler
+    from boa3.exception.NotLoadedException import NotLoadedException
+
+    try:
+        artifacts = Compiler().compile_artifacts(path, log=False)
+    except (NotLoadedException, SyntaxError):
+        # the contract has compiler errors or isn't valid Python code
+        return None
+
+    digest = hashlib.sha256(artifacts.nef)
+    digest.update(json.dumps(artifacts.manifest, separators=(',', ':')).encode())
+    digest.update(json.dumps(artifacts.debug_info, separators=(',', ':')).encode())
+    return digest.hexdigest()
+
+
+def _init_worker():
+    # the compiler logs are too verbose when compiling hundreds of contracts at once
+    logging.disable(logging.CRITICAL)
+
+
+def precompile(folders: List[str] = None, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compiles all the contracts in the given folders using parallel worker processes
+
+    :param folders: the folders to be scanned. The test contracts and the examples folders by default
+    :param workers: the number of worker processes. Uses the number of cpus by default
+    :return: the summary of the compilation
+    """
+    if folders is None or len(folders) == 0:
+        folders = DEFAULT_FOLDERS
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+
+    contracts = find_contracts(folders)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = list(executor.map(compile_contract, contracts, chunksize=8))
+    total_time = time.perf_counter() - start
+
+    return {
+        'workers': workers,
+        'total-time': round(total_time, 6),
+        'compile-time': round(sum(result['time'] for result in results), 6),
+        'compiled': len([result for result in results if result['status'] == STATUS_COMPILED]),
+        'up-to-date': len([result for result in results if result['status'] == STATUS_UP_TO_DATE]),
+        'failed': len([result for result in results if result['status'] == STATUS_FAILED]),
+        'contracts': results
+    }
+
+
+def digests(folders: List[str] = None, workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """
+    Compiles all the contracts in the given folders in memory and hashes their artifacts
+
+    :param folders: the folders to be scanned. The test contracts and the examples folders by default
+    :param workers: the number of worker processes. Uses the number of cpus by default
+    :return: a dictionary that maps each contract path, relative to the project root, with its artifacts digest
+    """
+    if folders is None or len(folders) == 0:
+        folders = DEFAULT_FOLDERS
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+
+    contracts = find_contracts(folders)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = list(executor.map(artifacts_digest, contracts, chunksize=8))
+
+    root = env.PROJECT_ROOT_DIRECTORY.replace(os.sep, '/')
+    return {os.path.relpath(path, root).replace(os.sep, '/'): digest for path, digest in zip(contracts, results)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compiles the test contracts in parallel')
+    parser.add_argument('folders', nargs='*', help='folders with the contracts to compile or the contracts paths')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('-s', '--summary', default=None, help='path to save the json summary')
+    parser.add_argument('--digests', action='store_true',
+                        help='print the digests of the artifacts compiled in memory, without saving them')
+    args = parser.parse_args()
+
+    if args.digests:
+        sys.stdout.write(json.dumps(digests(args.folders, args.workers), indent=4) + '\n')
+        return
+
+    summary = precompile(args.folders, args.workers)
+    json_summary = json.dumps(summary, indent=4)
+
+    if args.summary is not None:
+        with open(args.summary, 'w') as summary_file:
+            summary_file.write(json_summary)
+    else:
+        sys.stdout.write(json_summary + '\n')
+
+    logging.info('Compiled {0} contracts, {1} up to date and {2} failed in {3:.2f}s'.format(summary['compiled'],
+                                                                                            summary['up-to-date'],
+                                                                                            summary['failed'],
+                                                                                            summary['total-time']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+from typing import List
+
+from boa3.builtin import public
+
+
+@public
+def join_keys(keys: List[bytes], separator: bytes) -> bytes:
+    result = b''
+    for key in keys:
+        result += key + separator
+    return result
+
+
+@public
+def concat_chain(a: str, b: str, c: str) -> str:
+    return a + '.' + b + '.' + c
@@ -0,0 +1,8 @@
+from boa3.builtin import public
+
+
+@public
+def main(value: bytearray) -> bytearray:
+    sliced = value[0:]
+    sliced[0] = 1
+    return value
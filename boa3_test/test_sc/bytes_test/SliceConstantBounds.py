@@ -0,0 +1,17 @@
+from boa3.builtin import public
+from boa3.builtin.type import UInt160
+
+
+@public
+def suffix(key: bytes) -> bytes:
+    return key[-4:]
+
+
+@public
+def middle(key: bytes) -> bytes:
+    return key[1:-1]
+
+
+@public
+def account_part(account: UInt160) -> bytes:
+    return account[2:5]
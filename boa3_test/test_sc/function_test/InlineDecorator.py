@@ -0,0 +1,16 @@
+from boa3.builtin import inline, public
+
+
+@inline
+def clamp(value: int, low: int, high: int) -> int:
+    result = value
+    if value < low:
+        result = low
+    elif value > high:
+        result = high
+    return result
+
+
+@public
+def Main(x: int) -> int:
+    return clamp(x, 0, 10) + clamp(x, 5, 20)
@@ -0,0 +1,15 @@
+from boa3.builtin import noinline, public
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+@noinline
+def sub(a: int, b: int) -> int:
+    return a - b
+
+
+@public
+def Main(x: int, y: int) -> int:
+    return add(x, y) * sub(add(y, 1), x)
@@ -0,0 +1,20 @@
+from boa3.builtin import public
+from boa3.builtin.interop.storage import get, put
+
+
+@public
+def count_lower(key: bytes, limit: int) -> int:
+    index = 0
+    count = 0
+    while index < limit:
+        if index < get(key).to_int():
+            count += 1
+        index += 1
+    return count
+
+
+@public
+def increment(key: bytes, times: int) -> int:
+    for _ in range(times):
+        put(key, get(key).to_int() + 1)
+    return get(key).to_int()
@@ -0,0 +1,17 @@
+from boa3.builtin import public
+from boa3.builtin.interop.runtime import executing_script_hash
+from boa3.builtin.interop.storage import get, put
+
+
+@public
+def put_sender(key: bytes) -> bytes:
+    put(key, executing_script_hash)
+    put(key + b'_copy', executing_script_hash)
+    return get(key) + get(key)
+
+
+@public
+def update_value(key: bytes, value: bytes) -> bool:
+    old_value = get(key)
+    put(key, value)
+    return get(key) != old_value
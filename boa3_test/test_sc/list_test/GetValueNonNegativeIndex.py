@@ -0,0 +1,14 @@
+from typing import List
+
+from boa3.builtin import public
+
+
+@public
+def Main(a: List[int], index: int) -> int:
+    total = 0
+    for i in range(len(a)):
+        total += a[i]
+
+    if index < 0:
+        return total + a[index]  # the negative index is counted from the end of the list
+    return total + a[index] + a[abs(index) // 2]
@@ -0,0 +1,17 @@
+from boa3.builtin import public
+
+
+counter = 0
+
+
+@public
+def increment(times: int) -> int:
+    global counter
+    for _ in range(times):
+        counter = counter + 1
+    return counter
+
+
+@public
+def get_counter() -> int:
+    return counter
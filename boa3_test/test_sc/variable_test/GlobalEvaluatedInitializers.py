@@ -0,0 +1,17 @@
+from boa3.builtin import public
+
+
+one_token = 100_000_000
+total_supply = 21_000_000 * one_token
+prefix = 'token'
+prefix += '_'
+
+
+@public
+def get_total_supply() -> int:
+    return total_supply
+
+
+@public
+def get_prefix() -> str:
+    return prefix
@@ -0,0 +1,19 @@
+from boa3.builtin import public
+
+
+prefix = 'token'
+
+
+def get_prefix() -> str:
+    return prefix
+
+
+symbol = get_prefix()
+prefix = 'other'
+name = 'first'
+name = 'second'
+
+
+@public
+def Main() -> str:
+    return prefix + symbol + name
@@ -4,6 +4,7 @@ from unittest import TestCase
 
 from boa3 import env
 from boa3.analyser.analyser import Analyser
+from boa3.compiler.buildstamp import BuildStamp
 from boa3.compiler.compiler import Compiler
 from boa3.model.method import Method
 from boa3.neo.smart_contract.VoidType import VoidType
@@ -27,6 +28,9 @@ class BoaTest(TestCase):
 
     default_folder: str = ''
 
+    # shared by every test class, so each contract is compiled once per test session
+    _compiled_artifacts: Dict[str, Tuple[BuildStamp, bytes, Dict[str, Any]]] = {}
+
     @classmethod
     def setUpClass(cls):
         folders = os.path.abspath(__file__).split(os.sep)
@@ -115,13 +119,22 @@ class BoaTest(TestCase):
             raise FileNotFoundError(path)
         return path
 
-    def compile_and_save(self, path: str, log: bool = True) -> Tuple[bytes, Dict[str, Any]]:
+    def compile_and_save(self, path: str, log: bool = True,
+                         inline_threshold: Optional[int] = None) -> Tuple[bytes, Dict[str, Any]]:
+        options = Compiler.get_options(inline_threshold=inline_threshold)
+        cached_artifacts = self._get_cached_artifacts(path, options)
+        if cached_artifacts is not None:
+            return cached_artifacts
+
         nef_output = path.replace('.py', '.nef')
         manifest_output = path.replace('.py', '.manifest.json')
 
         from boa3.boa3 import Boa3
         from boa3.neo.contracts.neffile import NefFile
-        Boa3.compile_and_save(path, show_errors=log)
+        stamp = BuildStamp.load(nef_output)
+        if not self._are_artifacts_up_to_date(path, stamp, options):
+            Boa3.compile_and_save(path, show_errors=log, inline_threshold=inline_threshold)
+            stamp = BuildStamp.load(nef_output)
 
         with open(nef_output, mode='rb') as nef:
             file = nef.read()
@@ -131,8 +144,34 @@ class BoaTest(TestCase):
             import json
             manifest = json.loads(manifest_output.read())
 
+        if stamp is not None:
+            BoaTest._compiled_artifacts[path] = (stamp, output, manifest)
+
+        return output, manifest
+
+    def _get_cached_artifacts(self, path: str,
+                              options: Optional[Dict[str, Any]] = None) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        if path not in BoaTest._compiled_artifacts:
+            return None
+
+        stamp, output, manifest = BoaTest._compiled_artifacts[path]
+        if not self._are_artifacts_up_to_date(path, stamp, options):
+            BoaTest._compiled_artifacts.pop(path)
+            return None
+
         return output, manifest
 
+    def _are_artifacts_up_to_date(self, path: str, stamp: Optional[BuildStamp] = None,
+                                  options: Optional[Dict[str, Any]] = None) -> bool:
+        nef_output = path.replace('.py', '.nef')
+        if not (os.path.isfile(nef_output) and os.path.isfile(path.replace('.py', '.manifest.json'))):
+            # both .nef and .manifest.json are required to execute the smart contract
+            return False
+
+        if stamp is None:
+            stamp = BuildStamp.load(nef_output)
+        return stamp is not None and stamp.is_up_to_date(options)
+
     def get_debug_info(self, path: str) -> Optional[Dict[str, Any]]:
         debug_info_output = path.replace('.py', '.nefdbgnfo')
 
@@ -194,9 +233,9 @@ class BoaTest(TestCase):
                            rollback_on_fault: bool = True) -> Any:
 
         if isinstance(smart_contract_path, str) and smart_contract_path.endswith('.py'):
-            if not (os.path.isfile(smart_contract_path.replace('.py', '.nef'))
-                    and os.path.isfile(smart_contract_path.replace('.py', '.manifest.json'))):
-                # both .nef and .manifest.json are required to execute the smart contract
+            if (self._get_cached_artifacts(smart_contract_path) is None
+                    and not self._are_artifacts_up_to_date(smart_contract_path)):
+                # recompiles only if the sources or the compiler changed since the artifacts were generated
                 self.compile_and_save(smart_contract_path, log=False)
             smart_contract_path = smart_contract_path.replace('.py', '.nef')
         elif isinstance(smart_contract_path, bytes):
@@ -138,7 +138,7 @@ class TestAny(BoaTest):
         )
 
         path = self.get_contract_path('FunctionAnyParam.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
     def test_any_sequence_assignments(self):
@@ -287,6 +287,81 @@ class TestArithmetic(BoaTest):
         result = self.run_smart_contract(engine, path, 'concat')
         self.assertEqual('[1,2]', result)
 
+    def test_concat_in_loop(self):
+        separator = b'.'
+        expected_output = (
+            Opcode.INITSLOT     # join_keys
+            + b'\x02'
+            + b'\x02'
+            + Opcode.PUSHDATA1  # result = b''
+            + Integer(0).to_byte_array(min_length=1)
+            + Opcode.STLOC0
+            + Opcode.LDARG0     # for key in keys
+            + Opcode.PUSH0
+            + Opcode.JMP
+            + Integer(13).to_byte_array(min_length=1, signed=True)
+            + Opcode.OVER
+            + Opcode.OVER
+            + Opcode.PICKITEM
+            + Opcode.STLOC1
+            + Opcode.LDLOC0     # result += key + separator
+            + Opcode.LDLOC1
+            + Opcode.LDARG1
+            + Opcode.CAT
+            + Opcode.CAT
+            + Opcode.STLOC0
+            + Opcode.INC
+            + Opcode.DUP
+            + Opcode.PUSH2
+            + Opcode.PICK
+            + Opcode.SIZE
+            + Opcode.LT
+            + Opcode.JMPIF
+            + Integer(-16).to_byte_array(min_length=1, signed=True)
+            + Opcode.DROP
+            + Opcode.DROP
+            + Opcode.LDLOC0     # the result is converted after the loop
+            + Opcode.CONVERT
+            + Type.bytes.stack_item
+            + Opcode.STLOC0
+            + Opcode.LDLOC0     # return result
+            + Opcode.RET
+            + Opcode.INITSLOT   # concat_chain
+            + b'\x00'
+            + b'\x03'
+            + Opcode.LDARG0     # return a + '.' + b + '.' + c
+            + Opcode.PUSHDATA1
+            + Integer(len(separator)).to_byte_array(min_length=1)
+            + separator
+            + Opcode.CAT
+            + Opcode.LDARG1
+            + Opcode.CAT
+            + Opcode.PUSHDATA1
+            + Integer(len(separator)).to_byte_array(min_length=1)
+            + separator
+            + Opcode.CAT
+            + Opcode.LDARG2
+            + Opcode.CAT
+            + Opcode.CONVERT
+            + Type.str.stack_item
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('ConcatInLoop.py')
+        output = Boa3.compile(path)
+        self.assertEqual(expected_output, output)
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'join_keys', [b'unit', b'test'], b'|',
+                                         expected_result_type=bytes)
+        self.assertEqual(b'unit|test|', result)
+        result = self.run_smart_contract(engine, path, 'join_keys', [], b'|',
+                                         expected_result_type=bytes)
+        self.assertEqual(b'', result)
+
+        result = self.run_smart_contract(engine, path, 'concat_chain', 'unit', 'test', 'neo')
+        self.assertEqual('unit.test.neo', result)
+
     def test_power_operation(self):
         expected_output = (
             Opcode.INITSLOT
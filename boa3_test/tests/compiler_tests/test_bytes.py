@@ -4,6 +4,7 @@ from boa3.boa3 import Boa3
 from boa3.exception import CompilerError, CompilerWarning
 from boa3.neo.vm.opcode.Opcode import Opcode
 from boa3.neo.vm.type.Integer import Integer
+from boa3.neo.vm.type.StackItem import StackItemType
 from boa3.neo.vm.type.String import String
 from boa3_test.tests.boa_test import BoaTest
 from boa3_test.tests.test_classes.testengine import TestEngine
@@ -37,14 +38,6 @@ class TestBytes(BoaTest):
             + b'\x01'
             + Opcode.LDARG0     # arg[0]
             + Opcode.PUSH0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.RET        # return
         )
@@ -238,6 +231,96 @@ class TestBytes(BoaTest):
                                          expected_result_type=bytes)
         self.assertEqual(Integer(12345).to_byte_array()[1:2], result)
 
+    def test_slice_constant_bounds(self):
+        expected_output = (
+            Opcode.INITSLOT     # suffix
+            + b'\x00'
+            + b'\x01'
+            + Opcode.LDARG0     # return key[-4:]
+            + Opcode.DUP
+            + Opcode.SIZE
+            + Opcode.PUSH4
+            + Opcode.MIN
+            + Opcode.RIGHT
+            + Opcode.CONVERT
+            + StackItemType.ByteString
+            + Opcode.RET
+            + Opcode.INITSLOT   # middle
+            + b'\x00'
+            + b'\x01'
+            + Opcode.LDARG0     # return key[1:-1]
+            + Opcode.DUP
+            + Opcode.SIZE
+            + Opcode.PUSH1
+            + Opcode.SUB
+            + Opcode.PUSH0
+            + Opcode.MAX
+            + Opcode.PUSH1
+            + Opcode.OVER
+            + Opcode.MIN
+            + Opcode.TUCK
+            + Opcode.SUB
+            + Opcode.SUBSTR
+            + Opcode.CONVERT
+            + StackItemType.ByteString
+            + Opcode.RET
+            + Opcode.INITSLOT   # account_part
+            + b'\x00'
+            + b'\x01'
+            + Opcode.LDARG0     # return account[2:5]
+            + Opcode.PUSH2
+            + Opcode.PUSH3
+            + Opcode.SUBSTR
+            + Opcode.CONVERT
+            + StackItemType.ByteString
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('SliceConstantBounds.py')
+        output = Boa3.compile(path)
+        self.assertEqual(expected_output, output)
+
+        engine = TestEngine()
+        for value in (b'unit_test', b'123', b''):
+            result = self.run_smart_contract(engine, path, 'suffix', value,
+                                             expected_result_type=bytes)
+            self.assertEqual(value[-4:], result)
+            result = self.run_smart_contract(engine, path, 'middle', value,
+                                             expected_result_type=bytes)
+            self.assertEqual(value[1:-1], result)
+
+        account = bytes(range(20))
+        result = self.run_smart_contract(engine, path, 'account_part', account,
+                                         expected_result_type=bytes)
+        self.assertEqual(account[2:5], result)
+
+    def test_bytearray_slice_copy(self):
+        expected_output = (
+            Opcode.INITSLOT     # function signature
+            + b'\x01'
+            + b'\x01'
+            + Opcode.LDARG0     # sliced = value[0:]
+            + Opcode.DUP
+            + Opcode.SIZE
+            + Opcode.LEFT
+            + Opcode.STLOC0
+            + Opcode.LDLOC0     # sliced[0] = 1
+            + Opcode.PUSH0
+            + Opcode.PUSH1
+            + Opcode.SETITEM
+            + Opcode.LDARG0     # return value
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('BytearraySliceCopy.py')
+        output = Boa3.compile(path)
+        self.assertEqual(expected_output, output)
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'main', bytearray(b'unit'),
+                                         expected_result_type=bytearray)
+        self.assertEqual(b'unit', result)
+
     def test_slice_with_stride(self):
         path = self.get_contract_path('SliceWithStride.py')
         engine = TestEngine()
@@ -489,14 +572,6 @@ class TestBytes(BoaTest):
             + b'\x01'
             + Opcode.LDARG0     # arg[0]
             + Opcode.PUSH0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.RET        # return
         )
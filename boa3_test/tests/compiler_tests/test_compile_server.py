@@ -0,0 +1,209 @@
+import base64
+import io
+import json
+
+from boa3.boa3 import Boa3
+from boa3.compiler.buildstamp import BuildStamp
+from boa3.compiler.server import tasks
+from boa3.compiler.server.artifactcache import ArtifactCache
+from boa3.compiler.server.compileserver import CompileServer
+from boa3_test.tests.boa_test import BoaTest
+
+
+class TestCompileServer(BoaTest):
+
+    default_folder: str = 'test_sc/generation_test'
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = CompileServer(workers=1, deadline=60)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+        super().tearDownClass()
+
+    def request(self, method: str, **params):
+        return self.server.handle({
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': method,
+            'params': params
+        })
+
+    def test_artifacts(self):
+        path = self.get_contract_path('GenerationWithUserModuleImports.py')
+        expected = Boa3.compile_artifacts(path)
+
+        response = self.request('artifacts', path=path)
+        self.assertEqual(1, response['id'])
+        self.assertIn('result', response)
+
+        result = response['result']
+        self.assertEqual(expected.nef, base64.b64decode(result['nef']))
+        self.assertEqual(expected.script_hash_str, result['script_hash'])
+        self.assertEqual(expected.manifest, result['manifest'])
+        self.assertEqual(expected.debug_info['documents'], result['debug_info']['documents'])
+        self.assertNotIn('files', result)
+
+        cached_result = self.request('artifacts', path=path)['result']
+        self.assertTrue(cached_result['cached'])
+        self.assertEqual(result['nef'], cached_result['nef'])
+
+        stats = self.request('cache-stats')['result']
+        self.assertGreaterEqual(stats['cache']['hits'], 1)
+        self.assertGreaterEqual(stats['cache']['entries'], 1)
+        self.assertEqual(1, stats['pool']['workers'])
+
+    def test_artifacts_from_source(self):
+        source = (
+            'from boa3.builtin import public\n'
+            'from helpers import add\n'
+            '\n'
+            '\n'
+            '@public\n'
+            'def Main(a: int) -> int:\n'
+            '    return add(a, 1)\n'
+        )
+        modules = {
+            'helpers': 'def add(a: int, b: int) -> int:\n'
+                       '    return a + b\n'
+        }
+
+        result = self.request('artifacts', source=source, modules=modules)['result']
+        self.assertEqual(Boa3.compile_artifacts(source, modules).nef, base64.b64decode(result['nef']))
+        self.assertFalse(result['cached'])
+
+        response = self.request('artifacts', source=source)
+        self.assertIn('error', response)
+        self.assertEqual(tasks.COMPILATION_FAILED, response['error']['code'])
+        self.assertGreater(len(response['error']['data']['errors']), 0)
+
+    def test_compile(self):
+        import os
+        path = self.get_contract_path('GenerationWithDecorator.py')
+        output_path = path.replace('.py', '.nef')
+        if os.path.isfile(output_path):
+            os.remove(output_path)
+
+        result = self.request('compile', path=path)['result']
+        self.assertEqual('compiled', result['status'])
+        self.assertEqual(output_path, result['output_path'])
+        self.assertTrue(os.path.isfile(output_path))
+
+        result = self.request('compile', path=path)['result']
+        self.assertEqual('up-to-date', result['status'])
+
+    def test_check(self):
+        result = self.request('check', path=self.get_contract_path('GenerationWithDecorator.py'))['result']
+        self.assertTrue(result['success'])
+        self.assertEqual([], result['errors'])
+
+        path = self.get_contract_path('test_sc/built_in_methods_test', 'ClearTooManyParameters.py')
+        result = self.request('check', path=path)['result']
+        self.assertFalse(result['success'])
+        self.assertEqual(1, len(result['errors']))
+
+        result = self.request('check', source='def Main(:\n')['result']
+        self.assertFalse(result['success'])
+
+    def test_deadline_exceeded(self):
+        source = 'from boa3.builtin import public\n'
+        for index in range(100):
+            source += ('\n\n@public\n'
+                       'def method_{0}(a: int) -> int:\n'
+                       '    return a + {0}\n'.format(index))
+        recycled = self.request('cache-stats')['result']['pool']['recycled']
+
+        response = self.request('artifacts', source=source, deadline=0.01)
+        self.assertIn('error', response)
+        self.assertEqual(tasks.DEADLINE_EXCEEDED, response['error']['code'])
+        self.assertEqual(recycled + 1, self.request('cache-stats')['result']['pool']['recycled'])
+
+        # the worker is replaced and the next requests are answered
+        self.assertTrue(self.request('check', source=source)['result']['success'])
+        self.assertNotIn('error', self.request('artifacts', source=source, deadline=60))
+
+    def test_memory_limit(self):
+        with CompileServer(workers=1, memory_limit=1) as server:
+            request = {
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'check',
+                'params': {'path': self.get_contract_path('GenerationWithDecorator.py')}
+            }
+            self.assertTrue(server.handle(request)['result']['success'])
+            self.assertTrue(server.handle(request)['result']['success'])
+            self.assertEqual(2, server.stats()['pool']['recycled'])
+
+    def test_invalid_requests(self):
+        response = self.server.handle('{"jsonrpc": "2.0", "method"')
+        self.assertEqual(tasks.PARSE_ERROR, response['error']['code'])
+
+        response = self.server.handle({'id': 2, 'method': 'check'})
+        self.assertEqual(tasks.INVALID_REQUEST, response['error']['code'])
+        self.assertEqual(2, response['id'])
+
+        response = self.request('optimize')
+        self.assertEqual(tasks.METHOD_NOT_FOUND, response['error']['code'])
+
+        response = self.request('compile', path='Contract.nef')
+        self.assertEqual(tasks.INVALID_PARAMS, response['error']['code'])
+
+        # notifications don't have responses
+        self.assertIsNone(self.server.handle({'jsonrpc': '2.0', 'method': 'cache-stats'}))
+
+    def test_serve_stream(self):
+        requests = [
+            {'jsonrpc': '2.0', 'id': 'a', 'method': 'check', 'params': {'source': 'a = 1\n'}},
+            {'jsonrpc': '2.0', 'method': 'check', 'params': {'source': 'a = 1\n'}},
+            [
+                {'jsonrpc': '2.0', 'id': 'b', 'method': 'cache-stats'},
+                {'jsonrpc': '2.0', 'id': 'c', 'method': 'optimize'}
+            ]
+        ]
+        input_stream = io.BytesIO(b'\n'.join(json.dumps(request).encode() for request in requests))
+        output_stream = io.BytesIO()
+
+        self.server.serve_stream(input_stream, output_stream)
+        responses = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+        self.assertEqual(2, len(responses))
+        self.assertEqual('a', responses[0]['id'])
+        self.assertTrue(responses[0]['result']['success'])
+        self.assertEqual(['b', 'c'], [response['id'] for response in responses[1]])
+
+    def test_cache_key_compiler_hash(self):
+        params = {'source': 'a = 1\n'}
+        key = ArtifactCache.get_key(params)
+        self.assertEqual(key, ArtifactCache.get_key(params))
+
+        compiler_hash = BuildStamp._compiler_hash
+        try:
+            BuildStamp._compiler_hash = 'other compiler'
+            self.assertNotEqual(key, ArtifactCache.get_key(params))
+        finally:
+            BuildStamp._compiler_hash = compiler_hash
+
+    def test_cache_entry_evicted_while_validated(self):
+        path = self.get_contract_path('GenerationWithDecorator.py')
+        cache = ArtifactCache(max_entries=1)
+        cache.put('a', {'files': {path: BuildStamp.file_hash(path)}})
+
+        file_hash = BuildStamp.__dict__['file_hash']
+
+        def evicting_file_hash(file_path: str) -> str:
+            # another request replaces the entry while this one checks the files
+            cache.put('b', {'files': {}})
+            return file_hash.__func__(file_path)
+
+        BuildStamp.file_hash = staticmethod(evicting_file_hash)
+        try:
+            self.assertIsNotNone(cache.get('a'))
+        finally:
+            BuildStamp.file_hash = file_hash
+
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+        self.assertEqual(1, cache.stats()['entries'])
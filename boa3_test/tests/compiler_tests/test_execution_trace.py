@@ -0,0 +1,94 @@
+import os
+import tempfile
+
+from boa3.neo import from_hex_str
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.boa_test import BoaTest
+from boa3_test.tests.test_classes.storageaccesstype import StorageAccessType
+from boa3_test.tests.test_classes.tracefile import TraceReader, TraceWriter
+from boa3_test.tests.test_classes.tracereplay import TraceReplay
+from boa3_test.tests.test_classes.tracestep import TraceStep
+
+
+class TestExecutionTrace(BoaTest):
+
+    default_folder: str = 'test_sc/function_test'
+
+    def test_trace_step_storage_json(self):
+        step = TraceStep(bytes(range(20)), 300, Opcode.SYSCALL, 1 << 15, 3, (StorageAccessType.Put, b'balance'))
+        step_from_json = TraceStep.from_json(step.to_json())
+        self.assertEqual(step, step_from_json)
+        self.assertEqual((StorageAccessType.Put, b'balance'), step_from_json.storage_access)
+
+    def test_trace_file(self):
+        script_a = bytes(range(20))
+        script_b = bytes(range(1, 21))
+        first_run = [
+            TraceStep(script_a, 0, Opcode.INITSLOT, 64, 0),
+            TraceStep(script_a, 3, Opcode.SYSCALL, 1 << 15, 2, (StorageAccessType.Get, b'\x01' * 300)),
+            TraceStep(script_b, 70000, Opcode.RET, 0, 1),
+            TraceStep(script_a, 10, None, 1 << 40, 1),
+        ]
+        second_run = [
+            TraceStep(script_b, 1, Opcode.PUSH1, 1, 0),
+            TraceStep(script_b, 2, Opcode.RET, 0, 1, (StorageAccessType.Delete, b'')),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = '{0}/test.trace'.format(temp_dir)
+            with TraceWriter(trace_path) as writer:
+                for step in first_run:
+                    writer.write(step)
+                self.assertEqual(len(first_run), writer.steps_count)
+
+            # each writer appends a new run
+            with TraceWriter(trace_path) as writer:
+                for step in second_run:
+                    writer.write(step)
+
+            reader = TraceReader(trace_path)
+            self.assertEqual(first_run + second_run, list(reader))
+            self.assertEqual([first_run, second_run], list(reader.runs()))
+
+            invalid_path = '{0}/invalid.trace'.format(temp_dir)
+            with open(invalid_path, 'wb') as invalid_file:
+                invalid_file.write(b'invalid trace file')
+            with self.assertRaises(ValueError):
+                list(TraceReader(invalid_path))
+
+    def test_trace_replay(self):
+        path = self.get_contract_path('CallFunctionWrittenBefore.py')
+        # keeps the call to TestAdd, that would be inlined by default
+        self.compile_and_save(path, inline_threshold=0)
+        nef_path = path.replace('.py', '.nef')
+        script_hash = from_hex_str(self.get_debug_info(path)['hash'])
+        other_script = bytes(20)
+
+        trace = [
+            TraceStep(script_hash, 7, Opcode.CALL, 10, 0),
+            TraceStep(script_hash, 0, Opcode.INITSLOT, 20, 0),
+            TraceStep(other_script, 0, Opcode.SYSCALL, 30, 2, (StorageAccessType.Get, b'key')),
+            TraceStep(script_hash, 3, Opcode.ADD, 40, 2),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = '{0}/test.trace'.format(temp_dir)
+            with TraceWriter(trace_path) as writer:
+                for step in trace:
+                    writer.write(step)
+
+            replay = TraceReplay(trace_path, nef_path)
+            self.assertEqual([
+                (trace[0], 'CallFunctionWrittenBefore.Main', (path, 10)),
+                (trace[1], 'CallFunctionWrittenBefore.TestAdd', None),
+                (trace[2], None, None),
+                (trace[3], 'CallFunctionWrittenBefore.TestAdd', (path, 5)),
+            ], list(replay))
+
+            self.assertEqual([(trace[2], None)], list(replay.storage_accesses()))
+
+            listing = replay.format(last=2).splitlines()
+            self.assertEqual(2, len(listing))
+            self.assertIn('storage.Get', listing[0])
+            self.assertTrue(listing[1].startswith('CallFunctionWrittenBefore CallFunctionWrittenBefore.TestAdd'))
+            self.assertIn('{0}:5'.format(os.path.basename(path)), listing[1])
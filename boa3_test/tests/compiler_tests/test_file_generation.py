@@ -4,6 +4,7 @@ from typing import Dict
 from boa3 import constants
 from boa3.boa3 import Boa3
 from boa3.compiler.compiler import Compiler
+from boa3.compiler.filegenerator import get_debug_id
 from boa3.exception.NotLoadedException import NotLoadedException
 from boa3.model.event import Event
 from boa3.model.method import Method
@@ -222,7 +223,7 @@ class TestFileGeneration(BoaTest):
 
             # validate id
             self.assertIn('id', debug_method)
-            self.assertEqual(str(id(actual_method)), debug_method['id'])
+            self.assertEqual(get_debug_id(debug_method['name']), debug_method['id'])
 
             # validate parameters
             self.assertIn('params', debug_method)
@@ -270,7 +271,7 @@ class TestFileGeneration(BoaTest):
 
             # validate id
             self.assertIn('id', debug_event)
-            self.assertEqual(str(id(actual_event)), debug_event['id'])
+            self.assertEqual(get_debug_id(debug_event['name']), debug_event['id'])
 
             # validate parameters
             self.assertIn('params', debug_event)
@@ -345,7 +346,7 @@ class TestFileGeneration(BoaTest):
 
             # validate id
             self.assertIn('id', debug_method)
-            self.assertEqual(str(id(actual_method)), debug_method['id'])
+            self.assertEqual(get_debug_id(debug_method['name']), debug_method['id'])
 
             # validate parameters
             self.assertIn('params', debug_method)
@@ -471,7 +472,7 @@ class TestFileGeneration(BoaTest):
 
             # validate id
             self.assertIn('id', debug_method)
-            self.assertEqual(str(id(actual_method)), debug_method['id'])
+            self.assertEqual(get_debug_id(debug_method['name']), debug_method['id'])
 
             # validate parameters
             self.assertIn('params', debug_method)
@@ -492,7 +493,7 @@ class TestFileGeneration(BoaTest):
                 self.assertEqual(actual_method.locals[var_id].type.abi_type, var_type)
 
     def test_generate_init_method(self):
-        path = self.get_contract_path('test_sc/variable_test', 'GlobalAssignmentWithType.py')
+        path = self.get_contract_path('test_sc/variable_test', 'GlobalMultipleAssignments.py')
 
         compiler = Compiler()
         compiler.compile_and_save(path, path.replace('.py', '.nef'))
@@ -528,11 +529,12 @@ class TestFileGeneration(BoaTest):
         self.assertGreater(len(debug_info['methods']), 0)
 
         debug_method = next((method for method in debug_info['methods']
-                             if 'id' in method and method['id'] == str(id(init_method))), None)
+                             if 'name' in method and method['name'].endswith(constants.INITIALIZE_METHOD_ID)), None)
         self.assertIsNotNone(debug_method)
         parsed_name = debug_method['name'].split(',')
         self.assertEqual(2, len(parsed_name))
         self.assertIn(parsed_name[-1], methods)
+        self.assertEqual(get_debug_id(debug_method['name']), debug_method['id'])
 
         # validate parameters
         self.assertIn('params', debug_method)
@@ -562,6 +564,316 @@ class TestFileGeneration(BoaTest):
         self.assertIn('events', abi)
         self.assertEqual(0, len(abi['events']))
 
+    def test_generate_build_stamp(self):
+        from boa3.compiler.buildstamp import BuildStamp
+        path = self.get_contract_path('GenerationWithUserModuleImports.py')
+        imported_path = self.get_contract_path('test_sc/interop_test/runtime', 'GetNotifications.py')
+        expected_stamp_output = path.replace('.py', BuildStamp.FILE_EXTENSION)
+        Boa3.compile_and_save(path)
+
+        self.assertTrue(os.path.exists(expected_stamp_output))
+        stamp = BuildStamp.load(path)
+        self.assertIsNotNone(stamp)
+        self.assertEqual(constants.BOA_VERSION, stamp.boa_version)
+        self.assertEqual(path, stamp.source)
+        self.assertIn(path, stamp.files)
+        self.assertIn(imported_path, stamp.files)
+        self.assertEqual(BuildStamp.file_hash(imported_path), stamp.files[imported_path])
+        self.assertTrue(stamp.is_up_to_date())
+
+    def test_build_stamp_outdated_dependency(self):
+        import shutil
+        import tempfile
+        from boa3.compiler.buildstamp import BuildStamp
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = '{0}/Contract.py'.format(temp_dir.replace(os.sep, '/'))
+            shutil.copyfile(self.get_contract_path('GenerationWithUserModuleImports.py'), path)
+            Boa3.compile_and_save(path)
+
+            stamp = BuildStamp.load(path)
+            self.assertTrue(stamp.is_up_to_date())
+
+            with open(path, 'a') as source:
+                source.write('\n# changed\n')
+            self.assertFalse(stamp.is_up_to_date())
+
+            outdated_version = BuildStamp(stamp.source, stamp.files, boa_version='0.0.0')
+            self.assertFalse(outdated_version.is_up_to_date())
+
+    def test_build_stamp_compiler_options(self):
+        import shutil
+        import tempfile
+        from boa3.compiler.buildstamp import BuildStamp
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = '{0}/Contract.py'.format(temp_dir.replace(os.sep, '/'))
+            shutil.copyfile(self.get_contract_path('test_sc/variable_test', 'GlobalCounterInLoop.py'), path)
+            Boa3.compile_and_save(path, cache_globals=True)
+
+            # artifacts compiled with other options aren't reused by the default compilation
+            stamp = BuildStamp.load(path)
+            self.assertEqual({'cache-globals': True}, stamp.options)
+            self.assertFalse(stamp.is_up_to_date())
+            self.assertTrue(stamp.is_up_to_date({'cache-globals': True}))
+
+            Boa3.compile_and_save(path)
+            stamp = BuildStamp.load(path)
+            self.assertEqual({}, stamp.options)
+            self.assertTrue(stamp.is_up_to_date())
+
+    def test_reproducible_builds(self):
+        import json
+        import subprocess
+        import sys
+        from boa3 import env
+
+        # contracts with user module imports, events and global variables saved in the storage
+        contracts = [
+            'boa3_test/test_sc/generation_test/GenerationWithUserModuleImports.py',
+            'boa3_test/test_sc/generation_test/GenerationWithUserModuleImportsDupNames.py',
+            'boa3_test/test_sc/generation_test/GenerationWithStaticVariables.py',
+            'boa3_test/test_sc/event_test/EventNep17Transfer.py',
+            'boa3_test/test_sc/variable_test/GlobalCounterInLoop.py',
+        ]
+
+        def compile_contracts(hash_seed: str):
+            process_env = os.environ.copy()
+            process_env['PYTHONHASHSEED'] = hash_seed
+            return subprocess.Popen([sys.executable, '-m', 'boa3_test.precompile', '--digests', '--workers', '1']
+                                    + contracts,
+                                    cwd=env.PROJECT_ROOT_DIRECTORY, env=process_env,
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+        # the contracts are compiled in separated processes, with different hashes for the same objects and strings
+        processes = [compile_contracts('1'), compile_contracts('2')]
+        outputs = [process.communicate()[0] for process in processes]
+        for process in processes:
+            self.assertEqual(0, process.returncode)
+
+        first_build, second_build = [json.loads(output) for output in outputs]
+        self.assertEqual(sorted(contracts), list(first_build))
+        self.assertEqual(first_build.keys(), second_build.keys())
+        for path in contracts:
+            self.assertIsNotNone(first_build[path])
+
+        different_artifacts = [path for path, digest in first_build.items() if second_build[path] != digest]
+        self.assertEqual([], different_artifacts)
+
+    def test_generate_compact_and_pretty_files(self):
+        import json
+        from zipfile import ZipFile
+
+        path = self.get_contract_path('GenerationWithUserModuleImports.py')
+        manifest_output = path.replace('.py', '.manifest.json')
+        debug_info_output = path.replace('.py', '.nefdbgnfo')
+
+        def read_outputs():
+            with open(manifest_output, 'rb') as manifest_file:
+                manifest_bytes = manifest_file.read()
+            with ZipFile(debug_info_output, 'r') as debug_info_file:
+                debug_bytes = debug_info_file.read(os.path.basename(path.replace('.py', '.debug.json')))
+            return manifest_bytes, debug_bytes
+
+        Boa3.compile_and_save(path)
+        manifest_bytes, debug_bytes = read_outputs()
+        manifest, debug_info = json.loads(manifest_bytes), json.loads(debug_bytes)
+        self.assertEqual(json.dumps(manifest, separators=(',', ':')).encode(), manifest_bytes)
+        self.assertEqual(json.dumps(debug_info, separators=(',', ':')).encode(), debug_bytes)
+
+        Boa3.compile_and_save(path, pretty=True)
+        manifest_bytes, debug_bytes = read_outputs()
+        self.assertEqual(json.dumps(manifest, indent=4).encode(), manifest_bytes)
+        # the method ids change in each compilation
+        self.assertEqual(len(debug_info['methods']), len(json.loads(debug_bytes)['methods']))
+        self.assertEqual(json.dumps(json.loads(debug_bytes), indent=4).encode(), debug_bytes)
+
+    def test_generate_debug_info_with_many_imported_methods(self):
+        import sys
+        import tempfile
+        from boa3.compiler.filegenerator import FileGenerator
+        from boa3.model.imports.importsymbol import Import
+
+        def analyse_contract(temp_dir: str, methods_count: int) -> Compiler:
+            for module_name in ('helpers', 'other_helpers'):
+                with open(os.path.join(temp_dir, '{0}.py'.format(module_name)), 'w') as module_file:
+                    for index in range(methods_count):
+                        module_file.write('value_{0} = {0}\n'.format(index))
+                    for index in range(methods_count):
+                        module_file.write('\n\ndef method_{0}(a: int) -> int:\n'
+                                          '    return a + value_{0}\n'.format(index))
+
+            contract_path = os.path.join(temp_dir, 'Contract.py')
+            with open(contract_path, 'w') as contract_file:
+                contract_file.write('from boa3.builtin import public\n\n'
+                                    'import other_helpers\n'
+                                    'from helpers import *\n\n\n'
+                                    '@public\n'
+                                    'def Main(a: int) -> int:\n'
+                                    '    return method_0(a) + other_helpers.method_1(a)\n')
+
+            compiler = Compiler()
+            sys.path.insert(0, temp_dir)
+            try:
+                compiler._analyse(contract_path, log=False)
+            finally:
+                sys.path.remove(temp_dir)
+            return compiler
+
+        def generate_debug_info(compiler: Compiler) -> FileGenerator:
+            generator = FileGenerator(b'', compiler._analyser, compiler._entry_smart_contract)
+            generator._get_debug_methods()
+            generator._get_debug_static_variables()
+            for method in generator._methods_with_imports.values():
+                generator._get_method_origin_index(method)
+            return generator
+
+        all_symbols_property = Import.__dict__['all_symbols']
+        symbols_reads = []
+
+        def count_symbols_reads(imported: Import):
+            symbols_reads[-1] += 1
+            return all_symbols_property.fget(imported)
+
+        for methods_count in (100, 400):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                compiler = analyse_contract(temp_dir, methods_count)
+
+                generator = generate_debug_info(compiler)
+                methods = generator._methods_with_imports
+                self.assertEqual(2 * methods_count + 1, len(methods))
+                self.assertEqual(methods_count, len(generator._get_debug_static_variables()))
+                self.assertEqual(3, len(generator._files))
+
+                helpers_index = generator._files.index(os.path.join(temp_dir, 'other_helpers.py').replace(os.sep, '/'))
+                for (module_id, method_id), method in methods.items():
+                    if module_id == 'other_helpers':
+                        self.assertEqual(helpers_index, generator._get_method_origin_index(method))
+
+                symbols_reads.append(0)
+                Import.all_symbols = property(count_symbols_reads)
+                try:
+                    generate_debug_info(compiler)
+                finally:
+                    Import.all_symbols = all_symbols_property
+
+        # the imported symbols are indexed once, so their lookups don't grow with the number of methods
+        self.assertEqual(symbols_reads[0], symbols_reads[1])
+
+    def test_compile_artifacts_in_memory(self):
+        import json
+
+        path = self.get_contract_path('GenerationWithUserModuleImports.py')
+        output, manifest = self.compile_and_save(path)
+
+        artifacts = Boa3.compile_artifacts(path)
+        self.assertEqual(output, artifacts.script)
+        self.assertEqual(NefFile(output).serialize(), artifacts.nef)
+        self.assertEqual(NefFile(output).script_hash, artifacts.script_hash)
+        self.assertEqual(manifest, artifacts.manifest)
+        self.assertEqual(artifacts.script_hash_str, artifacts.debug_info['hash'])
+        self.assertEqual(2, len(artifacts.debug_info['documents']))
+        self.assertEqual([], artifacts.warnings)
+        self.assertEqual(['analyse', 'compile', 'generate'], list(artifacts.timings))
+        self.assertGreaterEqual(artifacts.total_time, 0)
+
+        path = self.get_contract_path('GenerationWithDecorator.py')
+        artifacts = Boa3.compile_artifacts(path)
+        with open(path) as source_file:
+            source = source_file.read()
+
+        source_artifacts = Boa3.compile_artifacts(source, source_path='GenerationWithDecorator.py')
+        self.assertEqual(artifacts.script, source_artifacts.script)
+        self.assertEqual(json.dumps(artifacts.manifest), json.dumps(source_artifacts.manifest))
+        self.assertEqual(['GenerationWithDecorator.py'], source_artifacts.debug_info['documents'])
+
+    def test_compile_artifacts_with_virtual_modules(self):
+        source = (
+            'from boa3.builtin import public\n'
+            'from helpers import add\n'
+            'import package.values\n'
+            '\n'
+            '\n'
+            '@public\n'
+            'def Main(a: int) -> int:\n'
+            '    return add(a, package.values.VALUE)\n'
+        )
+        modules = {
+            'helpers': 'def add(a: int, b: int) -> int:\n'
+                       '    return a + b\n',
+            'package.values': 'VALUE = 10\n'
+        }
+
+        artifacts = Boa3.compile_artifacts(source, modules, source_path='virtual/Contract.py')
+        self.assertEqual('Contract', artifacts.manifest['name'])
+        self.assertEqual(['virtual/Contract.py', 'virtual/helpers.py'], artifacts.debug_info['documents'])
+        self.assertIn('Contract,add', [method['name'] for method in artifacts.debug_info['methods']])
+
+        self.assertEqual(Boa3.compile_artifacts(source, modules).script, artifacts.script)
+
+        # compiling a source code never reads user modules from the file system
+        modules.pop('helpers')
+        with self.assertRaises(NotLoadedException):
+            Boa3.compile_artifacts(source, modules)
+
+    def test_check(self):
+        from boa3.exception import CompilerError
+
+        path = self.get_contract_path('GenerationWithDecorator.py')
+        compiler = Compiler()
+        result = compiler.check(path)
+        self.assertTrue(result.success)
+        self.assertEqual([], result.errors)
+        self.assertEqual(path.replace(os.sep, '/'), result.path)
+        # the file is only checked, it's not compiled
+        self.assertEqual(bytearray(), compiler.bytecode)
+
+        path = self.get_contract_path('test_sc/built_in_methods_test', 'ClearTooManyParameters.py')
+        result = Boa3.check(path, show_errors=False)
+        self.assertFalse(result.success)
+        self.assertEqual([CompilerError.UnexpectedArgument(6, 12)], result.errors)
+
+        expected_json = {'type': 'UnexpectedArgument', 'line': 6, 'col': 12, 'message': 'Unexpected argument'}
+        self.assertEqual([expected_json], result.to_json()['errors'])
+
+    def test_check_invalid_syntax(self):
+        from boa3.exception import CompilerError
+
+        result = Compiler().check('contract.py', log=False, source='def Main(:\n    pass\n')
+        self.assertFalse(result.success)
+        self.assertEqual(1, len(result.errors))
+        self.assertIsInstance(result.errors[0], CompilerError.InvalidSyntax)
+        self.assertEqual(1, result.errors[0].line)
+
+    def test_check_files_with_shared_imports(self):
+        from boa3.analyser.model.modulescache import ModulesCache
+
+        paths = [
+            self.get_contract_path('test_sc/import_test', 'FromImportUserModule.py'),
+            self.get_contract_path('test_sc/import_test', 'ImportUserModule.py'),
+            self.get_contract_path('test_sc/import_test', 'FromImportVariable.py')
+        ]
+        expected = [Boa3.check(path, show_errors=False) for path in paths]
+
+        modules_cache = ModulesCache()
+        results = [Compiler().check(path, log=False, modules_cache=modules_cache) for path in paths]
+        for expected_result, result in zip(expected, results):
+            self.assertTrue(result.success)
+            self.assertEqual(expected_result.warnings, result.warnings)
+
+        # the imported module is analysed only once
+        self.assertEqual(1, len(modules_cache))
+        self.assertEqual(1, modules_cache.misses)
+        self.assertEqual(2, modules_cache.hits)
+
+        # and with the same options of the checked files, so it isn't reused by optimized analyses
+        module_path = self.get_contract_path('test_sc/import_test', 'FromImportTyping.py')
+        self.assertIsNone(modules_cache.get(module_path, optimize=True))
+        self.assertIsNotNone(modules_cache.get(module_path, optimize=False))
+
+        self.assertEqual([result.success for result in results],
+                         [result.success for result in Boa3.check_files(paths, show_errors=False)])
+
     def test_compiler_error(self):
         path = self.get_contract_path('test_sc/built_in_methods_test', 'ClearTooManyParameters.py')
 
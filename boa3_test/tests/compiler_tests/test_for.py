@@ -11,12 +11,12 @@ class TestFor(BoaTest):
     default_folder: str = 'test_sc/for_test'
 
     def test_for_tuple_condition(self):
-        jmpif_address = Integer(19).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-22).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(11).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-12).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x02'
+            + b'\x03'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -25,19 +25,14 @@ class TestFor(BoaTest):
             + Opcode.PUSH3
             + Opcode.PUSH3
             + Opcode.PACK
+            + Opcode.DUP        # for_length = len(for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC2
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP        # begin for
             + jmpif_address
             + Opcode.OVER           # x = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC1
             + Opcode.LDLOC0         # a = a + x
@@ -45,10 +40,8 @@ class TestFor(BoaTest):
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # for_index = for_index + 1
-            + Opcode.DUP        # if for_index < len(for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if for_index < for_length
+            + Opcode.LDLOC2
             + Opcode.LT
             + Opcode.JMPIF      # end for
             + jmp_address
@@ -85,15 +78,15 @@ class TestFor(BoaTest):
             output = Boa3.compile(path)
 
     def test_nested_for(self):
-        outer_jmpif_address = Integer(47).to_byte_array(min_length=1, signed=True)
-        outer_jmp_address = Integer(-50).to_byte_array(min_length=1, signed=True)
+        outer_jmpif_address = Integer(32).to_byte_array(min_length=1, signed=True)
+        outer_jmp_address = Integer(-33).to_byte_array(min_length=1, signed=True)
 
-        inner_jmpif_address = Integer(21).to_byte_array(min_length=1, signed=True)
-        inner_jmp_address = Integer(-24).to_byte_array(min_length=1, signed=True)
+        inner_jmpif_address = Integer(13).to_byte_array(min_length=1, signed=True)
+        inner_jmp_address = Integer(-14).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x04'
+            + b'\x06'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -104,35 +97,25 @@ class TestFor(BoaTest):
             + Opcode.PACK
             + Opcode.STLOC1
             + Opcode.LDLOC1     # outer_for_sequence = sequence
+            + Opcode.DUP        # outer_for_length = len(outer_for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC4
             + Opcode.PUSH0      # outer_for_index = 0
             + Opcode.JMP
             + outer_jmpif_address
             + Opcode.OVER           # x = outer_for_sequence[outer_for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC2
             + Opcode.LDLOC1     # inner_for_sequence = sequence
+            + Opcode.DUP        # inner_for_length = len(inner_for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC5
             + Opcode.PUSH0      # inner_for_index = 0
             + Opcode.JMP
             + inner_jmpif_address
             + Opcode.OVER         # y = inner_for_sequence[inner_for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC3
             + Opcode.LDLOC0         # a = a + x * y
@@ -142,20 +125,16 @@ class TestFor(BoaTest):
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # inner_for_index = inner_for_index + 1
-            + Opcode.DUP        # if inner_for_index < len(inner_for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if inner_for_index < inner_for_length
+            + Opcode.LDLOC5
             + Opcode.LT
             + Opcode.JMPIF      # end inner_for
             + inner_jmp_address
             + Opcode.DROP
             + Opcode.DROP
             + Opcode.INC     # outer_for_index = outer_for_index + 1
-            + Opcode.DUP        # if outer_for_index < len(outer_for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if outer_for_index < outer_for_length
+            + Opcode.LDLOC4
             + Opcode.LT
             + Opcode.JMPIF      # end outer_for
             + outer_jmp_address
@@ -174,12 +153,12 @@ class TestFor(BoaTest):
         self.assertEqual(529, result)
 
     def test_for_else(self):
-        jmpif_address = Integer(19).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-22).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(11).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-12).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x04'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -190,19 +169,14 @@ class TestFor(BoaTest):
             + Opcode.PACK
             + Opcode.STLOC1
             + Opcode.LDLOC1     # for_sequence = sequence
+            + Opcode.DUP        # for_length = len(for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC3
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP
             + jmpif_address
             + Opcode.OVER           # x = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC2
             + Opcode.LDLOC0         # a = a + x
@@ -210,10 +184,8 @@ class TestFor(BoaTest):
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # for_index = for_index + 1
-            + Opcode.DUP        # if for_index < len(for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if for_index < for_length
+            + Opcode.LDLOC3
             + Opcode.LT
             + Opcode.JMPIF      # end for
             + jmp_address
@@ -236,12 +208,12 @@ class TestFor(BoaTest):
         self.assertEqual(24, result)
 
     def test_for_continue(self):
-        jmpif_address = Integer(28).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-31).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(20).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-21).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x04'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -252,19 +224,14 @@ class TestFor(BoaTest):
             + Opcode.PACK
             + Opcode.STLOC1
             + Opcode.LDLOC1     # for_sequence = sequence
+            + Opcode.DUP        # for_length = len(for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC3
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP
             + jmpif_address
             + Opcode.OVER           # x = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC2
             + Opcode.LDLOC2         # if x % 5 != 0
@@ -281,10 +248,8 @@ class TestFor(BoaTest):
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # for_index = for_index + 1
-            + Opcode.DUP        # if for_index < len(for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if for_index < for_length
+            + Opcode.LDLOC3
             + Opcode.LT
             + Opcode.JMPIF      # end for
             + jmp_address
@@ -303,12 +268,12 @@ class TestFor(BoaTest):
         self.assertEqual(20, result)
 
     def test_for_break(self):
-        jmpif_address = Integer(32).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-35).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(24).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-25).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x04'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -319,19 +284,14 @@ class TestFor(BoaTest):
             + Opcode.PACK
             + Opcode.STLOC1
             + Opcode.LDLOC1     # for_sequence = sequence
+            + Opcode.DUP        # for_length = len(for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC3
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP
             + jmpif_address
             + Opcode.OVER           # x = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC2
             + Opcode.LDLOC2         # if x % 5 != 0
@@ -346,16 +306,14 @@ class TestFor(BoaTest):
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.JMP                # break
-            + Integer(14).to_byte_array(min_length=1, signed=True)
+            + Integer(12).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0         # a += 1
             + Opcode.PUSH1
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # for_index = for_index + 1
-            + Opcode.DUP        # if for_index < len(for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if for_index < for_length
+            + Opcode.LDLOC3
             + Opcode.LT
             + Opcode.JMPIF      # end for
             + jmp_address
@@ -373,12 +331,12 @@ class TestFor(BoaTest):
         self.assertEqual(6, result)
 
     def test_for_break_else(self):
-        jmpif_address = Integer(33).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-36).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(25).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-26).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x04'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -389,19 +347,14 @@ class TestFor(BoaTest):
             + Opcode.PACK
             + Opcode.STLOC1
             + Opcode.LDLOC1     # for_sequence = sequence
+            + Opcode.DUP        # for_length = len(for_sequence)
+            + Opcode.SIZE
+            + Opcode.STLOC3
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP
             + jmpif_address
             + Opcode.OVER           # x = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC2
             + Opcode.LDLOC2         # if x % 5 == 0
@@ -417,16 +370,14 @@ class TestFor(BoaTest):
             + Opcode.STLOC0
             + Opcode.PUSH1
             + Opcode.JMP                # break
-            + Integer(15).to_byte_array(min_length=1, signed=True)
+            + Integer(13).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0         # a += 1
             + Opcode.PUSH1
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # for_index = for_index + 1
-            + Opcode.DUP        # if for_index < len(for_sequence)
-            + Opcode.PUSH2
-            + Opcode.PICK
-            + Opcode.SIZE
+            + Opcode.DUP        # if for_index < for_length
+            + Opcode.LDLOC3
             + Opcode.LT
             + Opcode.JMPIF      # end for
             + jmp_address
@@ -217,7 +217,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallVoidFunctionWithoutArgs.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -241,7 +241,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionWithoutArgs.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -269,7 +269,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallVoidFunctionWithLiteralArgs.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -300,7 +300,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionWithLiteralArgs.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -335,7 +335,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallVoidFunctionWithVariableArgs.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -404,7 +404,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallReturnFunctionOnReturn.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -449,7 +449,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallFunctionWithoutVariables.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -479,7 +479,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('CallFunctionWrittenBefore.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -503,7 +503,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('ReturnVoidFunction.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -619,17 +619,9 @@ class TestFunction(BoaTest):
             + Opcode.LDARG0     # for_sequence = arg0
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP        # begin for
-            + Integer(18).to_byte_array(min_length=1, signed=True)
+            + Integer(10).to_byte_array(min_length=1, signed=True)
             + Opcode.OVER     # value = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC0
             + Opcode.CLEAR
@@ -642,7 +634,7 @@ class TestFunction(BoaTest):
             + Opcode.SIZE
             + Opcode.LT
             + Opcode.JMPIF
-            + Integer(-21).to_byte_array(min_length=1, signed=True)
+            + Integer(-13).to_byte_array(min_length=1, signed=True)
             + Opcode.DROP
             + Opcode.DROP
             + Opcode.PUSH5      # else
@@ -671,17 +663,9 @@ class TestFunction(BoaTest):
             + Opcode.LDARG0     # for_sequence = arg0
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP        # begin for
-            + Integer(19).to_byte_array(min_length=1, signed=True)
+            + Integer(11).to_byte_array(min_length=1, signed=True)
             + Opcode.OVER       # value = for_sequence[for_index]
             + Opcode.OVER
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC1
             + Opcode.LDLOC0     # x += value
@@ -695,7 +679,7 @@ class TestFunction(BoaTest):
             + Opcode.SIZE
             + Opcode.LT
             + Opcode.JMPIF
-            + Integer(-22).to_byte_array(min_length=1, signed=True)
+            + Integer(-14).to_byte_array(min_length=1, signed=True)
             + Opcode.DROP
             + Opcode.DROP
             + Opcode.LDLOC0     # else
@@ -864,7 +848,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('FunctionWithDefaultArgument.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -907,7 +891,7 @@ class TestFunction(BoaTest):
         )
 
         path = self.get_contract_path('FunctionWithOnlyDefaultArguments.py')
-        output = Boa3.compile(path)
+        output = Boa3.compile(path, inline_threshold=0)
         self.assertEqual(expected_output, output)
 
         engine = TestEngine()
@@ -1034,3 +1018,84 @@ class TestFunction(BoaTest):
 
         result = self.run_smart_contract(engine, path, 'result')
         self.assertEqual([10, 20], result)
+
+    def test_inline_small_function(self):
+        called_function_address = Integer(-25).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.INITSLOT     # sub
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG0         # return a - b
+            + Opcode.LDARG1
+            + Opcode.SUB
+            + Opcode.RET
+            + Opcode.INITSLOT   # Main
+            + b'\x04'
+            + b'\x02'
+            + Opcode.LDARG1         # add(x, y) is replaced by its code
+            + Opcode.LDARG0
+            + Opcode.STLOC0
+            + Opcode.STLOC1
+            + Opcode.LDLOC0         # return a + b
+            + Opcode.LDLOC1
+            + Opcode.ADD
+            + Opcode.LDARG0         # sub(add(y, 1), x)
+            + Opcode.PUSH1
+            + Opcode.LDARG1
+            + Opcode.STLOC2
+            + Opcode.STLOC3
+            + Opcode.LDLOC2
+            + Opcode.LDLOC3
+            + Opcode.ADD
+            + Opcode.CALL
+            + called_function_address
+            + Opcode.MUL
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('InlineSmallFunction.py')
+        with self.assertLogs() as log:
+            output = Boa3.compile(path)
+        self.assertEqual(expected_output, output)
+        self.assertTrue(any('Inlined 2 calls' in message for message in log.output))
+
+        self.compile_and_save(path)
+        debug_info = self.get_debug_info(path)
+        main_debug_info = next(method for method in debug_info['methods'] if method['name'].endswith(',Main'))
+        # the inlined code is mapped to the lines of the called method
+        self.assertIn('14[0]5:11-5:16', main_debug_info['sequence-points'])
+        self.assertNotIn('InlineSmallFunction,add', [method['name'] for method in debug_info['methods']])
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'Main', 3, 4)
+        self.assertEqual(14, result)
+
+    def test_inline_threshold(self):
+        from boa3.neo.vm.Disassembler import Disassembler
+
+        path = self.get_contract_path('InlineSmallFunction.py')
+        output = Boa3.compile(path, inline_threshold=0)
+
+        opcodes = [instruction.opcode for instruction in Disassembler.disassemble(output)]
+        self.assertEqual(3, opcodes.count(Opcode.CALL))
+        self.assertEqual(3, opcodes.count(Opcode.INITSLOT))
+
+    def test_inline_decorator(self):
+        from boa3.neo.vm.Disassembler import Disassembler
+
+        path = self.get_contract_path('InlineDecorator.py')
+        # the methods with the decorator are inlined even if the threshold is zero
+        output = Boa3.compile(path, inline_threshold=0)
+
+        opcodes = [instruction.opcode for instruction in Disassembler.disassemble(output)]
+        self.assertNotIn(Opcode.CALL, opcodes)
+        self.assertEqual(1, opcodes.count(Opcode.INITSLOT))
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'Main', -3)
+        self.assertEqual(5, result)
+        result = self.run_smart_contract(engine, path, 'Main', 7)
+        self.assertEqual(14, result)
+        result = self.run_smart_contract(engine, path, 'Main', 30)
+        self.assertEqual(30, result)
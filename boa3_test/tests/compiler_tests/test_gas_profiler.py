@@ -0,0 +1,72 @@
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.boa_test import BoaTest
+from boa3_test.tests.test_classes.gasprofiler import GasProfiler
+from boa3_test.tests.test_classes.testengine import TestEngine
+from boa3_test.tests.test_classes.tracestep import TraceStep
+
+
+class TestGasProfiler(BoaTest):
+
+    default_folder: str = 'test_sc/function_test'
+
+    def test_trace_step_json(self):
+        step = TraceStep(bytes(range(20)), 12, Opcode.CALL, 512)
+        step_from_json = TraceStep.from_json(step.to_json())
+
+        self.assertEqual(step.script_hash, step_from_json.script_hash)
+        self.assertEqual(step.offset, step_from_json.offset)
+        self.assertEqual(step.opcode, step_from_json.opcode)
+        self.assertEqual(step.gas_consumed, step_from_json.gas_consumed)
+
+        step_from_json = TraceStep.from_json({'scripthash': step.to_json()['scripthash'],
+                                              'offset': 12,
+                                              'opcode': int.from_bytes(Opcode.CALL, 'little')})
+        self.assertEqual(Opcode.CALL, step_from_json.opcode)
+        self.assertEqual(0, step_from_json.gas_consumed)
+
+    def test_tracing_disabled_by_default(self):
+        engine = TestEngine()
+        self.assertFalse(engine.tracing)
+        self.assertIsNone(engine.tracing_supported)
+        self.assertNotIn('tracing', engine.to_json('', 'main'))
+
+    def test_profile_source_lines(self):
+        path = self.get_contract_path('CallFunctionWrittenBefore.py')
+        # keeps the call to TestAdd, that would be inlined by default
+        self.compile_and_save(path, inline_threshold=0)
+
+        profiler = GasProfiler(path.replace('.py', '.nef'))
+        script_hash = self.get_debug_info(path)['hash']
+        from boa3.neo import from_hex_str
+        script_hash = from_hex_str(script_hash)
+
+        # Main: 7-11 on line 10 and TestAdd: 0-6 on line 5
+        profiler.add_trace([
+            TraceStep(script_hash, 7, Opcode.CALL, 10),
+            TraceStep(script_hash, 0, Opcode.INITSLOT, 20),
+            TraceStep(bytes(20), 0, Opcode.PUSH1, 1000),  # other contracts are not profiled
+            TraceStep(script_hash, 3, Opcode.ADD, 30),
+            TraceStep(script_hash, 6, Opcode.RET, 40),
+            TraceStep(script_hash, 9, Opcode.RET, 50),
+        ])
+
+        self.assertEqual(150, profiler.total_gas)
+        self.assertEqual((1, 20), profiler.instructions[0])
+        self.assertNotIn(1, profiler.instructions)
+
+        self.assertEqual({(path, 5): (2, 70), (path, 10): (2, 60)}, profiler.lines)
+
+        expected_stacks = ('CallFunctionWrittenBefore.Main;CallFunctionWrittenBefore.TestAdd;'
+                           'CallFunctionWrittenBefore.py:5 70\n'
+                           'CallFunctionWrittenBefore.Main;CallFunctionWrittenBefore.TestAdd;[0] 20\n'
+                           'CallFunctionWrittenBefore.Main;CallFunctionWrittenBefore.py:10 60\n')
+        self.assertEqual(expected_stacks, profiler.collapsed_stacks())
+
+        annotated_source = profiler.annotated_source().splitlines()
+        self.assertEqual('{0} (130 GAS of 150)'.format(path), annotated_source[0])
+        self.assertEqual('{0:>14} {1:>10}  {2:>5}  {3}'.format(70, 2, 5, '    return a + b'), annotated_source[6])
+        self.assertEqual('{0:>14} {1:>10}  {2:>5}  {3}'.format('', '', 6, ''), annotated_source[7])
+
+        # the results of multiple runs are accumulated
+        profiler.add_trace([TraceStep(script_hash, 9, Opcode.RET, 50)])
+        self.assertEqual((3, 110), profiler.lines[(path, 10)])
@@ -290,17 +290,15 @@ class TestImport(BoaTest):
             Opcode.CALL
             + Integer(5).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
-            + Opcode.LDSFLD1    # module function from import
+            + Opcode.LDSFLD0    # module function from import
             + Opcode.RET  # return
-            + Opcode.LDSFLD2    # imported function
+            + Opcode.LDSFLD1    # imported function
             + Opcode.RET  # return
-            + Opcode.INITSSLOT + b'\x03'
-            + Opcode.PUSH15     # module variable a
-            + Opcode.STSFLD0
+            + Opcode.INITSSLOT + b'\x02'   # module variable a is evaluated while compiling
             + Opcode.PUSH10     # module variable a from import
-            + Opcode.STSFLD1
+            + Opcode.STSFLD0
             + Opcode.PUSH5      # module variable b from import
-            + Opcode.STSFLD2
+            + Opcode.STSFLD1
             + Opcode.RET
         )
 
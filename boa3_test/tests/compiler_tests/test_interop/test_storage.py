@@ -734,3 +734,51 @@ class TestStorageInterop(BoaTest):
 
         result = self.run_smart_contract(engine, path, 'get_value_in_storage', key)
         self.assertEqual(value_old, result)
+
+    def test_storage_reuse_repeated_calls(self):
+        script_hash = Opcode.SYSCALL + Interop.ExecutingScriptHash.getter.interop_method_hash
+        get_context = Opcode.SYSCALL + Interop.StorageGetContext.interop_method_hash
+        storage_get = Opcode.SYSCALL + Interop.StorageGet.interop_method_hash
+
+        path = self.get_contract_path('StorageReuseRepeatedCalls.py')
+        output = Boa3.compile(path)
+
+        # the script hash and the storage context are got once in each method
+        self.assertEqual(1, output.count(script_hash))
+        self.assertEqual(2, output.count(get_context))
+        # the value is read again only after the storage is changed
+        self.assertEqual(3, output.count(storage_get))
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'put_sender', b'key',
+                                         expected_result_type=bytes)
+        self.assertEqual(40, len(result))
+        self.assertEqual(result[:20], result[20:])
+
+        result = self.run_smart_contract(engine, path, 'update_value', b'key', b'value')
+        self.assertEqual(True, result)
+        result = self.run_smart_contract(engine, path, 'update_value', b'key', b'value')
+        self.assertEqual(False, result)
+
+    def test_storage_loop_invariants(self):
+        get_context = Opcode.SYSCALL + Interop.StorageGetContext.interop_method_hash
+        storage_get = Opcode.SYSCALL + Interop.StorageGet.interop_method_hash
+
+        path = self.get_contract_path('StorageLoopInvariants.py')
+        output = Boa3.compile(path)
+
+        # the storage context is got before the loops
+        self.assertEqual(3, output.count(get_context))
+        # the value is read before the loop only if the loop doesn't change the storage
+        self.assertEqual(3, output.count(storage_get))
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'count_lower', b'key', 10)
+        self.assertEqual(0, result)
+
+        result = self.run_smart_contract(engine, path, 'increment', b'key', 3)
+        self.assertEqual(3, result)
+        result = self.run_smart_contract(engine, path, 'count_lower', b'key', 10)
+        self.assertEqual(3, result)
+        result = self.run_smart_contract(engine, path, 'count_lower', b'key', 2)
+        self.assertEqual(2, result)
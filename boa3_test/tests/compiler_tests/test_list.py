@@ -115,14 +115,6 @@ class TestList(BoaTest):
             + b'\x01'
             + Opcode.LDARG0     # arg[0]
             + Opcode.PUSH0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.RET        # return
         )
@@ -172,6 +164,29 @@ class TestList(BoaTest):
         with self.assertRaises(TestExecutionException, msg=self.VALUE_IS_OUT_OF_RANGE_MSG):
             self.run_smart_contract(engine, path, 'Main', [])
 
+    def test_list_get_value_with_non_negative_index(self):
+        from boa3.neo.vm.Disassembler import Disassembler
+
+        path = self.get_contract_path('GetValueNonNegativeIndex.py')
+        with self.assertLogs() as log:
+            output = Boa3.compile(path)
+        self.assertTrue(any('Removed 4 negative index checks' in message for message in log.output))
+
+        # only the index that can be negative is fixed before getting the item
+        opcodes = [instruction.opcode for instruction in Disassembler.disassemble(output)]
+        negative_index_checks = [index for index in range(len(opcodes) - 2)
+                                 if opcodes[index:index + 3] == [Opcode.SIGN, Opcode.PUSHM1, Opcode.JMPNE]]
+        self.assertEqual(1, len(negative_index_checks))
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'Main', [1, 2, 3, 4], 3)
+        self.assertEqual(16, result)
+        result = self.run_smart_contract(engine, path, 'Main', [1, 2, 3, 4], -1)
+        self.assertEqual(14, result)
+
+        with self.assertRaises(TestExecutionException, msg=self.VALUE_IS_OUT_OF_RANGE_MSG):
+            self.run_smart_contract(engine, path, 'Main', [1, 2, 3, 4], 4)
+
     def test_list_type_hint(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
@@ -326,14 +341,6 @@ class TestList(BoaTest):
             + b'\x02'
             + Opcode.LDARG1     # args[0]
             + Opcode.PUSH0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.RET        # return
         )
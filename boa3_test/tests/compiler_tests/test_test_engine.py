@@ -1,5 +1,6 @@
 from boa3.neo.utils import contract_parameter_to_json, stack_item_from_json
 from boa3.neo.vm.type.AbiType import AbiType
+from boa3.neo.vm.type.Integer import Integer
 from boa3.neo.vm.type.StackItem import StackItemType
 from boa3.neo.vm.type.String import String
 from boa3_test.tests.boa_test import BoaTest
@@ -364,3 +365,83 @@ class TestTestEngine(BoaTest):
         # however, if the TestEngine is not in the directory it will raise an Exception
         with self.assertRaises(FileNotFoundError):
             engine = TestEngine('{0}/boa3_test'.format(engine_path))
+
+    def test_nef_metadata_cache(self):
+        import os
+        from boa3.neo.contracts.neffile import NefFile
+        from boa3_test.tests.test_classes.nefmetadata import NefMetadataCache
+        from boa3_test.tests.test_classes.testcontract import TestContract
+
+        path = self.get_contract_path('test_sc/generation_test', 'GenerationWithDecorator.py')
+        self.compile_and_save(path)
+        nef_path = path.replace('.py', '.nef')
+        with open(nef_path, mode='rb') as nef:
+            nef_file = NefFile.deserialize(nef.read())
+
+        cache = NefMetadataCache()
+        metadata = cache.get(nef_path)
+        self.assertEqual(nef_file.script_hash, metadata.script_hash)
+        self.assertEqual(nef_file.checksum, metadata.checksum)
+        self.assertIs(metadata, cache.get(nef_path))
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+
+        # modified files are read again
+        file_stat = os.stat(nef_path)
+        os.utime(nef_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+        self.assertIsNot(metadata, cache.get(nef_path))
+        self.assertEqual(2, cache.misses)
+
+        cache.invalidate(nef_path)
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get(nef_path.replace('.nef', 'NotFound.nef')))
+
+        self.assertEqual(nef_file.script_hash, TestContract(nef_path).script_hash)
+
+    def test_storage_fixture_files(self):
+        import os
+        import tempfile
+        from boa3_test.tests.test_classes.storage import Storage, StorageItem
+        from boa3_test.tests.test_classes.storagefixture import read_storage_fixture, write_storage_fixture
+
+        entries = [
+            ('Token.nef', b'balance' + bytes(20), 100),
+            ('Token.nef', 'symbol', 'TKN'),
+            ('Other.nef', b'\x01\x02', b'\x03')
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            binary_path = os.path.join(temp_dir, 'storage.bin')
+            self.assertEqual(3, write_storage_fixture(binary_path, entries))
+
+            result = list(read_storage_fixture(binary_path))
+            self.assertEqual(['Token.nef', 'Token.nef', 'Other.nef'], [contract for contract, _, _ in result])
+            self.assertEqual([b'balance' + bytes(20), b'symbol', b'\x01\x02'], [key for _, key, _ in result])
+            for (_, _, expected_value), (_, _, value) in zip(entries, result):
+                self.assertIsInstance(value, StorageItem)
+                self.assertEqual(Storage.to_storage_value(expected_value), value.value)
+
+            csv_path = os.path.join(temp_dir, 'storage.csv')
+            with open(csv_path, 'w') as csv_file:
+                csv_file.write('contract,key,value\n'
+                               'Token.nef,0x{0},100\n'
+                               'Token.nef,symbol,TKN\n'.format((b'balance' + bytes(20)).hex()))
+
+            self.assertEqual(entries[:2], list(read_storage_fixture(csv_path)))
+
+    def test_load_storage(self):
+        path = self.get_contract_path('test_sc/generation_test', 'GenerationWithDecorator.py')
+        self.compile_and_save(path)
+        nef_path = path.replace('.py', '.nef')
+
+        engine = TestEngine()
+        engine.add_contract(nef_path)
+        count = engine.load_storage((path, 'key{0}'.format(index), index) for index in range(1000))
+        self.assertEqual(1000, count)
+        self.assertEqual(Integer(500).to_byte_array(), engine.storage_get('key500', nef_path))
+
+        # values of contracts that weren't added are ignored
+        self.assertEqual(0, engine.load_storage({('key', 'NotAdded.nef'): 1}))
+
+        engine.set_storage({('key', nef_path): 'value'})
+        self.assertEqual(b'value', engine.storage_get('key', nef_path))
@@ -8,6 +8,7 @@ from boa3.model.symbol import ISymbol
 from boa3.model.variable import Variable
 from boa3.neo.vm.opcode.Opcode import Opcode
 from boa3.neo.vm.type.Integer import Integer
+from boa3.neo.vm.type.StackItem import StackItemType
 from boa3.neo.vm.type.String import String
 from boa3_test.tests.boa_test import BoaTest
 from boa3_test.tests.test_classes.testengine import TestEngine
@@ -133,14 +134,6 @@ class TestVariable(BoaTest):
             + Opcode.STLOC2
             + Opcode.LDLOC0         # a[2] = 2
             + Opcode.PUSH2
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(signed=True, min_length=1)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PUSH2
             + Opcode.PICK
             + Opcode.SETITEM
@@ -169,14 +162,6 @@ class TestVariable(BoaTest):
             + Opcode.DUP            # c = 2
             + Opcode.STLOC1
             + Opcode.PUSH2          # a[2] = 2
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(signed=True, min_length=1)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.LDLOC0
             + Opcode.REVERSE3
             + Opcode.SETITEM
@@ -391,14 +376,6 @@ class TestVariable(BoaTest):
             + b'\x01'
             + Opcode.LDARG0     # b = a[0]
             + Opcode.PUSH0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC0
             + Opcode.RET
@@ -418,12 +395,7 @@ class TestVariable(BoaTest):
 
     def test_global_declaration_with_assignment(self):
         expected_output = (
-            Opcode.LDSFLD0
-            + Opcode.RET
-            + Opcode.INITSSLOT  # global variables
-            + b'\x01'           # number of globals
-            + Opcode.PUSH10
-            + Opcode.STSFLD0    # a = 10
+            Opcode.PUSH10       # a is evaluated while compiling
             + Opcode.RET
         )
         path = self.get_contract_path('GlobalDeclarationWithArgumentWrittenAfter.py')
@@ -440,12 +412,7 @@ class TestVariable(BoaTest):
 
     def test_global_assignment_with_type(self):
         expected_output = (
-            Opcode.LDSFLD0
-            + Opcode.RET
-            + Opcode.INITSSLOT  # global variables
-            + b'\x01'           # number of globals
-            + Opcode.PUSH10
-            + Opcode.STSFLD0    # a = 10
+            Opcode.PUSH10       # a is evaluated while compiling
             + Opcode.RET
         )
         path = self.get_contract_path('GlobalAssignmentWithType.py')
@@ -458,12 +425,7 @@ class TestVariable(BoaTest):
 
     def test_global_assignment_without_type(self):
         expected_output = (
-            Opcode.LDSFLD0
-            + Opcode.RET
-            + Opcode.INITSSLOT  # global variables
-            + b'\x01'           # number of globals
-            + Opcode.PUSH10
-            + Opcode.STSFLD0    # a = 10
+            Opcode.PUSH10       # a is evaluated while compiling
             + Opcode.RET
         )
         path = self.get_contract_path('GlobalAssignmentWithoutType.py')
@@ -496,36 +458,17 @@ class TestVariable(BoaTest):
 
     def test_many_global_assignments(self):
         expected_output = (
-            Opcode.LDSFLD + b'\x07'
-            + Opcode.LDSFLD6    # [a, b, c, d, e, f, g, h]
-            + Opcode.LDSFLD5
-            + Opcode.LDSFLD4
-            + Opcode.LDSFLD3
-            + Opcode.LDSFLD2
-            + Opcode.LDSFLD1
-            + Opcode.LDSFLD0
+            Opcode.PUSH7        # [a, b, c, d, e, f, g, h]
+            + Opcode.PUSH6      # the globals are evaluated while compiling
+            + Opcode.PUSH5
+            + Opcode.PUSH4
+            + Opcode.PUSH3
+            + Opcode.PUSH2
+            + Opcode.PUSH1
+            + Opcode.PUSH0
             + Opcode.PUSH8
             + Opcode.PACK       # return [a, b, c, d, e, f, g, h]
             + Opcode.RET
-            + Opcode.INITSSLOT  # global variables
-            + b'\x08'           # number of globals
-            + Opcode.PUSH0      # a = 0
-            + Opcode.STSFLD0
-            + Opcode.PUSH1      # b = 1
-            + Opcode.STSFLD1
-            + Opcode.PUSH2      # c = 2
-            + Opcode.STSFLD2
-            + Opcode.PUSH3      # d = 3
-            + Opcode.STSFLD3
-            + Opcode.PUSH4      # e = 4
-            + Opcode.STSFLD4
-            + Opcode.PUSH5      # f = 5
-            + Opcode.STSFLD5
-            + Opcode.PUSH6      # g = 6
-            + Opcode.STSFLD6
-            + Opcode.PUSH7      # h = 7
-            + Opcode.STSFLD + b'\x07'   # variable index greater than 6 uses another opcode
-            + Opcode.RET
         )
 
         path = self.get_contract_path('ManyGlobalAssignments.py')
@@ -538,16 +481,9 @@ class TestVariable(BoaTest):
 
     def test_global_assignment_between_functions(self):
         expected_output = (
-            Opcode.LDSFLD0
-            + Opcode.RET
-            + Opcode.LDSFLD1
+            Opcode.PUSH10       # a is evaluated while compiling
             + Opcode.RET
-            + Opcode.INITSSLOT  # global variables
-            + b'\x02'           # number of globals
-            + Opcode.PUSH10     # a = 10
-            + Opcode.STSFLD0
-            + Opcode.PUSH5      # b = 5
-            + Opcode.STSFLD1
+            + Opcode.PUSH5      # b is evaluated while compiling
             + Opcode.RET
         )
         path = self.get_contract_path('GlobalAssignmentBetweenFunctions.py')
@@ -560,37 +496,158 @@ class TestVariable(BoaTest):
         result = self.run_smart_contract(engine, path, 'example')
         self.assertEqual(5, result)
 
-    def test_get_global_variable_value_written_after(self):
+    def test_global_initializers_evaluated_while_compiling(self):
         expected_output = (
-            Opcode.LDSFLD + b'\x07'
-            + Opcode.LDSFLD6    # [a, b, c, d, e, f, g, h]
-            + Opcode.LDSFLD5
-            + Opcode.LDSFLD4
-            + Opcode.LDSFLD3
-            + Opcode.LDSFLD2
-            + Opcode.LDSFLD1
+            Opcode.PUSHINT64 + Integer(2_100_000_000_000_000).to_byte_array(min_length=8)
+            + Opcode.RET        # total_supply is evaluated while compiling
             + Opcode.LDSFLD0
-            + Opcode.PUSH8
-            + Opcode.PACK       # return [a, b, c, d, e, f, g, h]
             + Opcode.RET
             + Opcode.INITSSLOT  # global variables
-            + b'\x08'           # number of globals
-            + Opcode.PUSH0      # a = 0
+            + b'\x01'           # number of globals
+            + Opcode.PUSHDATA1  # prefix = 'token'; prefix += '_' is evaluated and stored once
+            + Integer(len('token_')).to_byte_array()
+            + String('token_').to_bytes()
             + Opcode.STSFLD0
-            + Opcode.PUSH1      # b = 1
+            + Opcode.RET
+        )
+        path = self.get_contract_path('GlobalEvaluatedInitializers.py')
+        with self.assertLogs() as log:
+            output = Boa3.compile(path)
+        self.assertEqual(expected_output, output)
+        self.assertTrue(any('Evaluated 4 static initializers while compiling' in message
+                            for message in log.output))
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'get_total_supply')
+        self.assertEqual(2_100_000_000_000_000, result)
+        result = self.run_smart_contract(engine, path, 'get_prefix')
+        self.assertEqual('token_', result)
+
+    def test_global_overwritten_initializers(self):
+        call_address = Integer(-20).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.LDSFLD0      # get_prefix
+            + Opcode.RET
+            + Opcode.LDSFLD0    # Main
+            + Opcode.LDSFLD1
+            + Opcode.CAT
+            + Opcode.LDSFLD2
+            + Opcode.CAT
+            + Opcode.CONVERT
+            + StackItemType.ByteString
+            + Opcode.RET
+            + Opcode.INITSSLOT  # global variables
+            + b'\x03'           # number of globals
+            + Opcode.PUSHDATA1  # prefix = 'token' is read by get_prefix before being overwritten
+            + Integer(len('token')).to_byte_array()
+            + String('token').to_bytes()
+            + Opcode.STSFLD0
+            + Opcode.CALL       # symbol = get_prefix()
+            + call_address
             + Opcode.STSFLD1
-            + Opcode.PUSH2      # c = 2
+            + Opcode.PUSHDATA1  # prefix = 'other'
+            + Integer(len('other')).to_byte_array()
+            + String('other').to_bytes()
+            + Opcode.STSFLD0
+            + Opcode.PUSHDATA1  # name = 'first' is overwritten before being read
+            + Integer(len('second')).to_byte_array()
+            + String('second').to_bytes()
             + Opcode.STSFLD2
-            + Opcode.PUSH3      # d = 3
-            + Opcode.STSFLD3
-            + Opcode.PUSH4      # e = 4
-            + Opcode.STSFLD4
-            + Opcode.PUSH5      # f = 5
-            + Opcode.STSFLD5
-            + Opcode.PUSH6      # g = 6
-            + Opcode.STSFLD6
-            + Opcode.PUSH7      # h = 7
-            + Opcode.STSFLD + b'\x07'   # variable index greater than 6 uses another opcode
+            + Opcode.RET
+        )
+        path = self.get_contract_path('GlobalOverwrittenInitializers.py')
+        output = Boa3.compile(path)
+        self.assertEqual(expected_output, output)
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, path, 'Main')
+        self.assertEqual('othertokensecond', result)
+
+    def test_global_variables_cached_in_storage(self):
+        from boa3.model.builtin.interop.interop import Interop
+        storage_put = Opcode.SYSCALL + Interop.StoragePut.interop_method_hash
+
+        path = self.get_contract_path('GlobalCounterInLoop.py')
+        output = Boa3.compile(path)
+        cached_output = Boa3.compile(path, cache_globals=True)
+
+        # without the cache, the counter is saved in each iteration of the loop
+        self.assertEqual(2, output.count(storage_put))
+        # with the cache, it's saved only by the method that saves the modified globals
+        self.assertEqual(1, cached_output.count(storage_put))
+        self.assertLess(len(cached_output), len(output))
+
+        nef_path = path.replace('.py', '.nef')
+        Boa3.compile_and_save(path, cache_globals=True)
+
+        engine = TestEngine()
+        result = self.run_smart_contract(engine, nef_path, 'get_counter')
+        self.assertEqual(0, result)
+        result = self.run_smart_contract(engine, nef_path, 'increment', 5)
+        self.assertEqual(5, result)
+        result = self.run_smart_contract(engine, nef_path, 'increment', 3)
+        self.assertEqual(8, result)
+        result = self.run_smart_contract(engine, nef_path, 'get_counter')
+        self.assertEqual(8, result)
+
+    def test_global_variables_storage_keys(self):
+        from boa3.neo.cryptography import sha256
+
+        path = self.get_contract_path('GlobalCounterInLoop.py')
+        output = Boa3.compile(path)
+
+        # the key is derived from the module path, relative to the compiled file, and the variable name
+        storage_key = sha256(b'GlobalCounterInLoop.py:counter')[:8]
+        self.assertIn(Opcode.PUSHDATA1 + Integer(len(storage_key)).to_byte_array() + storage_key, output)
+        self.assertEqual(output, Boa3.compile(path))
+
+    def test_global_variables_cache_saved_before_calling_contracts(self):
+        from boa3.model.builtin.interop.interop import Interop
+        from boa3.neo.vm.Disassembler import Disassembler
+
+        source = (
+            'from typing import Any\n'
+            'from boa3.builtin import public\n'
+            'from boa3.builtin.interop.contract import call_contract\n'
+            'from boa3.builtin.type import UInt160\n'
+            '\n'
+            'counter = 0\n'
+            '\n'
+            '\n'
+            '@public\n'
+            'def Main(contract: UInt160) -> Any:\n'
+            '    global counter\n'
+            '    counter = counter + 1\n'
+            '    return call_contract(contract, "get_counter")\n'
+        )
+        script = Boa3.compile_artifacts(source, cache_globals=True).script
+        instructions = list(Disassembler.disassemble(script))
+
+        return_index = next(index for index, instruction in enumerate(instructions)
+                            if instruction.opcode is Opcode.RET)
+        calls = [index for index in range(return_index) if instructions[index].opcode is Opcode.CALL]
+        self.assertEqual(2, len(calls))
+
+        # the modified globals are saved before calling the contract and before returning
+        flush_call, return_flush_call = calls
+        self.assertIs(Opcode.SYSCALL, instructions[flush_call + 1].opcode)
+        self.assertEqual(Interop.CallContract.interop_method_hash, instructions[flush_call + 1].operand)
+        self.assertEqual(return_index - 1, return_flush_call)
+        self.assertEqual(instructions[flush_call].target, instructions[return_flush_call].target)
+
+    def test_get_global_variable_value_written_after(self):
+        expected_output = (
+            Opcode.PUSH7        # [a, b, c, d, e, f, g, h]
+            + Opcode.PUSH6      # the globals are evaluated while compiling
+            + Opcode.PUSH5
+            + Opcode.PUSH4
+            + Opcode.PUSH3
+            + Opcode.PUSH2
+            + Opcode.PUSH1
+            + Opcode.PUSH0
+            + Opcode.PUSH8
+            + Opcode.PACK       # return [a, b, c, d, e, f, g, h]
             + Opcode.RET
         )
         path = self.get_contract_path('GetGlobalValueWrittenAfter.py')
@@ -610,11 +667,6 @@ class TestVariable(BoaTest):
             + Opcode.STLOC0
             + Opcode.LDLOC0     # variable address
             + Opcode.RET
-            + Opcode.INITSSLOT  # global variables
-            + b'\x01'           # number of globals
-            + Opcode.PUSH0      # b = 0
-            + Opcode.STSFLD0
-            + Opcode.RET
         )
         path = self.get_contract_path('AssignLocalWithArgumentShadowingGlobal.py')
         output = Boa3.compile(path)
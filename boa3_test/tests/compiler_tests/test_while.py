@@ -278,8 +278,8 @@ class TestWhile(BoaTest):
         self.assertEqual(20, result)
 
     def test_while_continue(self):
-        jmpif_address = Integer(31).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-33).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(23).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-25).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
@@ -299,14 +299,6 @@ class TestWhile(BoaTest):
             + jmpif_address
             + Opcode.LDLOC2     # x = sequence[a]
             + Opcode.LDLOC0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC3
             + Opcode.LDLOC0     # a += 1
@@ -345,8 +337,8 @@ class TestWhile(BoaTest):
         self.assertEqual(20, result)
 
     def test_while_break(self):
-        jmpif_address = Integer(35).to_byte_array(min_length=1, signed=True)
-        jmp_address = Integer(-37).to_byte_array(min_length=1, signed=True)
+        jmpif_address = Integer(27).to_byte_array(min_length=1, signed=True)
+        jmp_address = Integer(-29).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
@@ -366,14 +358,6 @@ class TestWhile(BoaTest):
             + jmpif_address
             + Opcode.LDLOC2         # x = sequence[a]
             + Opcode.LDLOC0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PICKITEM
             + Opcode.STLOC3
             + Opcode.LDLOC0         # a += 1
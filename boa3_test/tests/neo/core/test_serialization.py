@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from boa3.neo3.core.serialization import BinaryReader, BinaryWriter
+from boa3.neo3.core.types import UInt160
+
+
+class TestSerialization(TestCase):
+
+    def test_write_and_read_values(self):
+        with BinaryWriter() as writer:
+            writer.write_bool(True)
+            writer.write_uint8(255)
+            writer.write_uint16(0x1234)
+            writer.write_int16(-2)
+            writer.write_uint32(0x12345678, endian='>')
+            writer.write_int32(-3)
+            writer.write_uint64(2 ** 64 - 1)
+            writer.write_int64(-4)
+            writer.write_var_int(0xfc)
+            writer.write_var_int(0xfd)
+            writer.write_var_int(0x10000)
+            writer.write_var_int(2 ** 32)
+            writer.write_var_string('neo3-boa')
+            writer.write_var_bytes(b'\x01\x02\x03')
+            data = writer.to_array()
+            self.assertEqual(len(data), len(writer))
+
+        self.assertEqual(b'\x01\xff\x34\x12\xfe\xff\x12\x34\x56\x78', data[:10])
+
+        with BinaryReader(data) as reader:
+            self.assertEqual(len(data), len(reader))
+            self.assertEqual(True, reader.read_bool())
+            self.assertEqual(255, reader.read_uint8())
+            self.assertEqual(0x1234, reader.read_uint16())
+            self.assertEqual(-2, reader.read_int16())
+            self.assertEqual(0x12345678, reader.read_uint32(endian='>'))
+            self.assertEqual(-3, reader.read_int32())
+            self.assertEqual(2 ** 64 - 1, reader.read_uint64())
+            self.assertEqual(-4, reader.read_int64())
+            self.assertEqual(0xfc, reader.read_var_int())
+            self.assertEqual(0xfd, reader.read_var_int())
+            self.assertEqual(0x10000, reader.read_var_int())
+            self.assertEqual(2 ** 32, reader.read_var_int())
+            self.assertEqual('neo3-boa', reader.read_var_string())
+            self.assertEqual(b'\x01\x02\x03', reader.read_var_bytes())
+
+            with self.assertRaises(ValueError):
+                reader.read_byte()
+            with self.assertRaises(ValueError):
+                reader.read_uint32()
+
+    def test_read_bytes_without_copy(self):
+        data = bytearray(b'\x00\x01\x02\x03\x04')
+        reader = BinaryReader(data)
+
+        self.assertEqual(b'\x00', reader.read_byte())
+        view = reader.read_bytes(3, copy=False)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(b'\x01\x02\x03', view)
+
+        copied = reader.read_bytes(1)
+        self.assertIsInstance(copied, bytes)
+        self.assertEqual(b'\x04', copied)
+
+        with self.assertRaises(ValueError):
+            reader.read_bytes(1)
+        reader.close()
+
+        # the returned views are still valid after closing the reader
+        self.assertEqual(b'\x01\x02\x03', view.tobytes())
+
+    def test_read_bytes_skip_length_check(self):
+        with BinaryReader(b'\x05\x01\x02') as reader:
+            self.assertEqual(b'\x01\x02', reader.read_var_bytes())
+
+        with BinaryReader(b'\x01\x02') as reader:
+            with self.assertRaises(ValueError):
+                reader.read_bytes(3)
+
+    def test_writer_growth(self):
+        with BinaryWriter(b'\xaa') as writer:
+            for value in range(1000):
+                writer.write_uint32(value)
+            self.assertEqual(4001, len(writer))
+            data = writer.to_array()
+            # to_array doesn't keep exports of the buffer, so it can still grow
+            writer.write_bytes(bytes(10000))
+            self.assertEqual(14001, len(writer))
+
+        with BinaryReader(memoryview(data)) as reader:
+            self.assertEqual(b'\xaa', reader.read_byte())
+            self.assertEqual(list(range(1000)), [reader.read_uint32() for _ in range(1000)])
+
+    def test_serializable_list(self):
+        hashes = [UInt160(bytes([0x80 + index % 0x80] * 20)) for index in range(300)]
+
+        with BinaryWriter() as writer:
+            writer.write_serializable_list(hashes)
+            data = writer.to_array()
+
+        with BinaryReader(data) as reader:
+            self.assertEqual(hashes, reader.read_serializable_list(UInt160))
+
+        with BinaryReader(data) as reader:
+            self.assertEqual(hashes[:10], reader.read_serializable_list(UInt160, max=10))
+
+        self.assertEqual(hashes[5], UInt160.deserialize_from_bytes(hashes[5].to_array()))
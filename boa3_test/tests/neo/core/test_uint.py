@@ -0,0 +1,97 @@
+import pickle
+from unittest import TestCase
+
+from boa3 import constants
+from boa3.neo3.core.serialization import BinaryReader, BinaryWriter
+from boa3.neo3.core.types import UInt160, UInt256
+
+
+class TestUInt(TestCase):
+
+    def test_hex_like_bytes_are_not_decoded(self):
+        # 20 bytes that are valid ascii hex used to be silently decoded into 10 bytes
+        data = b'0123456789abcdef0123'
+        value = UInt160(data)
+        self.assertEqual(data, value.to_array())
+
+        with self.assertRaises(ValueError):
+            UInt160(b'0123456789abcdef0123456789abcdef01234567')
+        with self.assertRaises(TypeError):
+            UInt160('0123456789abcdef0123')
+
+    def test_from_hex(self):
+        data = bytes(range(20))
+        self.assertEqual(UInt160(data), UInt160.from_hex(data.hex()))
+        self.assertEqual(UInt160(data), UInt160.from_hex('0x' + data.hex()))
+        self.assertEqual(UInt160(data), UInt160.from_hex(data.hex().encode()))
+        self.assertEqual(UInt256(bytes(32)), UInt256.from_hex('00' * 32))
+
+        # from_string uses the reversed byte order
+        self.assertEqual(UInt160.from_string(data[::-1].hex()), UInt160.from_hex(data.hex()))
+
+        with self.assertRaises(ValueError):
+            UInt160.from_hex('00' * 19)
+        with self.assertRaises(ValueError):
+            UInt160.from_hex('zz' * 20)
+
+    def test_immutable_hashable_values(self):
+        data = bytearray(range(20))
+        value = UInt160(data)
+        data[0] = 0xff
+        self.assertEqual(bytes(range(20)), value.to_array())
+
+        with self.assertRaises(AttributeError):
+            value.other = 1
+
+        values = {UInt160(bytes(range(20))): 'a', UInt160.zero(): 'b'}
+        self.assertEqual('a', values[value])
+        self.assertEqual(hash(value), hash(UInt160(bytes(range(20)))))
+        self.assertNotEqual(UInt160.zero(), UInt256.zero())
+        self.assertNotEqual(UInt160.zero(), bytes(20))
+
+        self.assertEqual(value, pickle.loads(pickle.dumps(value)))
+
+    def test_compare(self):
+        low = UInt160(b'\x02' + bytes(19))
+        high = UInt160(b'\x01' + bytes(18) + b'\x01')
+        self.assertLess(low, high)
+        self.assertGreater(high, low)
+        # the least significant byte is also compared
+        self.assertLess(UInt160(b'\x01' + bytes(19)), UInt160(b'\x02' + bytes(19)))
+        self.assertLessEqual(low, UInt160(low.to_array()))
+
+    def test_intern(self):
+        neo_hash = UInt160.intern(constants.NEO_SCRIPT)
+        self.assertIs(neo_hash, UInt160.intern(UInt160(constants.NEO_SCRIPT)))
+        self.assertEqual(UInt160(constants.NEO_SCRIPT), neo_hash)
+
+        value = UInt256(bytes(range(32)))
+        self.assertIs(value, UInt256.intern(value))
+        self.assertIs(value, UInt256.intern(bytes(range(32))))
+
+    def test_from_buffer(self):
+        values = [UInt160(bytes([index] * 20)) for index in range(10)]
+        buffer = b''.join(value.to_array() for value in values)
+
+        self.assertEqual(values, UInt160.from_buffer(buffer))
+        self.assertEqual(values[:3], UInt160.from_buffer(memoryview(buffer), 3))
+        self.assertEqual(values[:1], UInt160.from_buffer(buffer[:20] + b'\x00', count=1))
+        self.assertEqual(values[1:3], UInt160.from_buffer(bytearray(buffer[20:60])))
+
+        with self.assertRaises(ValueError):
+            UInt160.from_buffer(buffer[:-1])
+        with self.assertRaises(ValueError):
+            UInt160.from_buffer(buffer, count=11)
+
+    def test_serialization(self):
+        value = UInt256(bytes(range(32)))
+        with BinaryWriter() as writer:
+            value.serialize(writer)
+            data = writer.to_array()
+
+        with BinaryReader(data) as reader:
+            self.assertEqual(value, reader.read_serializable(UInt256))
+        self.assertEqual(value, UInt256.deserialize_from_bytes(data + b'\x01'))
+
+        with self.assertRaises(ValueError):
+            UInt256.deserialize_from_bytes(data[:-1])
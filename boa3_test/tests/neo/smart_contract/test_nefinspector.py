@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+
+from boa3.neo.contracts.nefinspector import NefInspector
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.boa_test import BoaTest
+
+
+class TestNefInspector(BoaTest):
+
+    default_folder: str = 'test_sc/function_test'
+
+    def test_inspect_with_debug_info(self):
+        path = self.get_contract_path('CallFunctionWrittenBefore.py')
+        output, manifest = self.compile_and_save(path, inline_threshold=0)
+
+        inspector = NefInspector(path.replace('.py', '.nef'))
+        self.assertEqual(output, inspector.script)
+        self.assertEqual([(0, 6, 'TestAdd'), (7, 11, 'Main')], inspector.methods)
+
+        instructions = list(inspector.instructions())
+        self.assertEqual(len(instructions), inspector.instructions_count)
+        self.assertEqual(inspector.instructions_count, sum(inspector.opcode_histogram.values()))
+        self.assertEqual(2, inspector.opcode_histogram[Opcode.RET])
+        self.assertEqual(2, inspector.basic_blocks_count)
+
+        listing = list(inspector.listing(show_source=True))
+        self.assertIn('Main:', listing)
+        self.assertIn('        # CallFunctionWrittenBefore.py:10  return TestAdd(1, 2)', listing)
+
+        listing_without_source = list(inspector.listing())
+        self.assertEqual(len(listing) - 2, len(listing_without_source))
+
+        summary = list(inspector.summary())
+        self.assertIn('Basic blocks: 2', summary)
+        self.assertIn('{0:>8}-{1:<8} {2}'.format(7, 11, 'Main'), summary)
+
+    def test_inspect_with_manifest_only(self):
+        path = self.get_contract_path('CallFunctionWrittenBefore.py')
+        # keeps the call to TestAdd, that would be inlined by default
+        self.compile_and_save(path, inline_threshold=0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for extension in ('.nef', '.manifest.json'):
+                shutil.copy(path.replace('.py', extension), temp_dir)
+
+            inspector = NefInspector('{0}/{1}'.format(temp_dir, os.path.basename(path.replace('.py', '.nef'))))
+            # only the public methods are in the manifest
+            self.assertEqual([(7, 11, 'Main')], inspector.methods)
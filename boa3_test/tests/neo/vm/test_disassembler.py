@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from boa3.neo.vm.Disassembler import Disassembler
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3.neo.vm.type.Integer import Integer
+
+
+class TestDisassembler(TestCase):
+
+    def test_disassemble_operands(self):
+        script = (
+            Opcode.PUSHINT16 + Integer(-300).to_byte_array(min_length=2)    # 0
+            + Opcode.PUSHDATA1 + b'\x03' + b'abc'                           # 3
+            + Opcode.JMPIFNOT + Integer(5).to_byte_array(min_length=1)      # 8
+            + Opcode.JMP_L + Integer(-10).to_byte_array(min_length=4)       # 10
+            + Opcode.TRY + b'\x04\x00'                                      # 15
+            + Opcode.PUSHDATA2 + b'\x00\x00'                                # 18
+            + Opcode.RET                                                    # 21
+        )
+
+        instructions = list(Disassembler.disassemble(script))
+        self.assertEqual([0, 3, 8, 10, 15, 18, 21], [instruction.address for instruction in instructions])
+        self.assertEqual([Opcode.PUSHINT16, Opcode.PUSHDATA1, Opcode.JMPIFNOT, Opcode.JMP_L,
+                          Opcode.TRY, Opcode.PUSHDATA2, Opcode.RET],
+                         [instruction.opcode for instruction in instructions])
+
+        self.assertEqual(b'abc', instructions[1].operand)
+        self.assertEqual(5, instructions[1].size)
+        self.assertEqual((13,), instructions[2].targets)
+        self.assertEqual(0, instructions[3].target)
+        # TRY without finally block
+        self.assertEqual((19,), instructions[4].targets)
+        self.assertEqual(b'', instructions[5].operand)
+        self.assertIsNone(instructions[6].target)
+
+        self.assertEqual('     0  PUSHINT16 -300', str(instructions[0]))
+        self.assertEqual('     3  PUSHDATA1 0x616263 "abc"', str(instructions[1]))
+        self.assertEqual('    10  JMP_L -> 0', str(instructions[3]))
+
+        self.assertEqual([8, 10], [instruction.address for instruction in Disassembler.disassemble(script, 8, 15)])
+
+    def test_disassemble_sys_call(self):
+        from boa3.model.imports.builtin import Interop
+
+        script = Opcode.SYSCALL + Interop.StorageGet.interop_method_hash + Opcode.SYSCALL + b'\x00\x01\x02\x03'
+        instructions = list(Disassembler.disassemble(script))
+
+        self.assertEqual('     0  SYSCALL System.Storage.Get', str(instructions[0]))
+        self.assertEqual('     5  SYSCALL 0x00010203', str(instructions[1]))
+
+    def test_disassemble_invalid_script(self):
+        with self.assertRaises(ValueError):
+            list(Disassembler.disassemble(Opcode.PUSH1 + b'\xff'))
+
+        with self.assertRaises(ValueError):
+            list(Disassembler.disassemble(Opcode.PUSHDATA1 + b'\x05abc'))
+
+    def test_disassemble_large_script(self):
+        block = (Opcode.PUSHDATA1 + b'\x04abcd' + Opcode.JMPIF + b'\x02' + Opcode.SYSCALL + b'\x00\x01\x02\x03'
+                 + Opcode.DROP)
+        script = block * (2 * 1024 * 1024 // len(block))
+
+        count = 0
+        for instruction in Disassembler.disassemble(script):
+            count += 1
+        self.assertEqual(4 * (len(script) // len(block)), count)
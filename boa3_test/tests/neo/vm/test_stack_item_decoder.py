@@ -0,0 +1,94 @@
+import base64
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from boa3.neo.core.types.InteropInterface import InteropInterface
+from boa3.neo.vm.type.AbiType import AbiType
+from boa3.neo.vm.type.StackItemDecoder import LazyArray, LazyMap, StackItemDecoder, decode_stack_item
+
+
+def _integer(value: int) -> dict:
+    return {'type': 'Integer', 'value': str(value)}
+
+
+def _byte_string(value: bytes) -> dict:
+    return {'type': 'ByteString', 'value': base64.b64encode(value).decode()}
+
+
+class TestStackItemDecoder(TestCase):
+
+    def test_decode_homogeneous_arrays(self):
+        self.assertEqual(list(range(100)),
+                         decode_stack_item({'type': 'Array', 'value': [_integer(x) for x in range(100)]}))
+
+        self.assertEqual(['unit', b'\xff\x01', 'test'],
+                         decode_stack_item({'type': 'Array',
+                                            'value': [_byte_string(b'unit'), _byte_string(b'\xff\x01'),
+                                                      _byte_string(b'test')]}))
+
+        # falls back to decoding each item if the types are mixed
+        self.assertEqual([1, 'abc', True, None],
+                         decode_stack_item({'type': 'Struct',
+                                            'value': [_integer(1), _byte_string(b'abc'),
+                                                      {'type': 'Boolean', 'value': True}, {'type': 'Any'}]}))
+
+        with self.assertRaises(ValueError):
+            decode_stack_item({'type': 'Array', 'value': [_integer(1), _integer(2), {'type': 'Integer', 'value': 'x'}]})
+
+    def test_decode_iterator(self):
+        item = {'type': 'InteropInterface', 'iterator': [_integer(1), _integer(2)]}
+        self.assertEqual([1, 2], decode_stack_item(item))
+        self.assertIs(InteropInterface, decode_stack_item({'type': 'InteropInterface'}))
+
+    def test_decode_lazily(self):
+        items = [_integer(x) for x in range(10)]
+        items[5] = {'type': 'Integer', 'value': 'invalid'}
+        nested_map = {'type': 'Map', 'value': [{'key': _byte_string(b'items'),
+                                                'value': {'type': 'Array', 'value': items}}]}
+
+        decoder = StackItemDecoder(lazy=True)
+        result = decoder.decode(nested_map)
+        self.assertIsInstance(result, LazyMap)
+        self.assertEqual(['items'], list(result.keys()))
+
+        array = result['items']
+        self.assertIsInstance(array, LazyArray)
+        self.assertEqual(10, len(array))
+        # only the accessed values are decoded
+        self.assertEqual(4, array[4])
+        self.assertEqual([7, 8, 9], array[-3:])
+        with self.assertRaises(ValueError):
+            array[5]
+
+        equal_items = [_integer(x) for x in range(3)]
+        self.assertEqual([0, 1, 2], decoder.decode({'type': 'Array', 'value': equal_items}))
+        self.assertEqual({'a': [0, 1, 2]},
+                         decoder.decode({'type': 'Map', 'value': [{'key': _byte_string(b'a'),
+                                                                   'value': {'type': 'Array', 'value': equal_items}}]}))
+
+    def test_decoder_from_manifest(self):
+        manifest = {'abi': {'methods': [{'name': 'count', 'returntype': 'Integer'},
+                                        {'name': 'names', 'returntype': 'Array'},
+                                        {'name': 'invalid', 'returntype': 'Unknown'}]}}
+
+        decoder = StackItemDecoder.from_manifest(manifest, 'count')
+        self.assertEqual(AbiType.Integer, decoder.abi_type)
+        self.assertEqual([10], decoder.decode_many([_integer(10)]))
+        # results that don't match the return type are still decoded
+        self.assertEqual('abc', decoder.decode(_byte_string(b'abc')))
+
+        self.assertEqual(AbiType.Array, StackItemDecoder.from_manifest(manifest, 'names').abi_type)
+        self.assertEqual(AbiType.Any, StackItemDecoder.from_manifest(manifest, 'invalid').abi_type)
+        self.assertEqual(AbiType.Any, StackItemDecoder.from_manifest(manifest, 'missing').abi_type)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest_path = os.path.join(temp_dir, 'contract.manifest.json')
+            with open(manifest_path, 'w') as manifest_file:
+                manifest_file.write(json.dumps(manifest))
+
+            self.assertEqual(AbiType.Integer, StackItemDecoder.from_manifest_file(manifest_path, 'count').abi_type)
+            self.assertTrue(StackItemDecoder.from_manifest_file(manifest_path, 'names', lazy=True).is_lazy)
+
+        self.assertEqual(AbiType.Any, StackItemDecoder.from_manifest_file(manifest_path, 'count').abi_type)
@@ -0,0 +1,137 @@
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.test_classes.sourcemap import SourceMap
+from boa3_test.tests.test_classes.tracestep import TraceStep
+
+
+class GasProfiler:
+    """
+    Folds the instructions executed by the test engine onto the contract's Python source lines.
+
+    :ivar total_gas: the GAS consumed by all the profiled instructions of the contract
+    """
+
+    _call_opcodes = (Opcode.CALL, Opcode.CALL_L, Opcode.CALLA)
+
+    def __init__(self, nef_path: str):
+        self._source_map: SourceMap = SourceMap(nef_path)
+
+        self.total_gas: int = 0
+        self._instructions: Dict[int, List[int]] = {}
+        self._lines: Dict[Tuple[str, int], List[int]] = {}
+        self._stacks: Dict[Tuple[str, ...], int] = {}
+
+    @property
+    def instructions(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Gets the execution count and consumed GAS of each executed instruction, indexed by its address
+        """
+        return {address: (count, gas) for address, (count, gas) in sorted(self._instructions.items())}
+
+    @property
+    def lines(self) -> Dict[Tuple[str, int], Tuple[int, int]]:
+        """
+        Gets the execution count and consumed GAS of each executed source line, indexed by its file and line number
+        """
+        return {line: (count, gas) for line, (count, gas) in sorted(self._lines.items())}
+
+    def add_trace(self, trace: Iterable[TraceStep]):
+        """
+        Includes the instructions of an execution in the profile. Instructions from other contracts are ignored.
+
+        :param trace: the instructions executed by the test engine in a run, in the execution order
+        """
+        frames: List[str] = []
+        previous: Optional[TraceStep] = None
+
+        for step in trace:
+            if step.script_hash != self._source_map.script_hash:
+                continue
+
+            method_name = self._source_map.get_method_name(step.offset)
+            if method_name is None:
+                method_name = '[unknown]'
+
+            if previous is not None and previous.opcode in self._call_opcodes:
+                frames.append(method_name)
+            elif previous is not None and previous.opcode is Opcode.RET and len(frames) > 0:
+                frames.pop()
+
+            if len(frames) == 0:
+                frames.append(method_name)
+            else:
+                frames[-1] = method_name
+            previous = step
+
+            self.total_gas += step.gas_consumed
+            self._add_count(self._instructions, step.offset, step.gas_consumed)
+
+            line = self._source_map.get_line(step.offset)
+            if line is not None:
+                self._add_count(self._lines, line, step.gas_consumed)
+                leaf = '{0}:{1}'.format(os.path.basename(line[0]), line[1])
+            else:
+                leaf = '[{0}]'.format(step.offset)
+
+            stack = tuple(frames) + (leaf,)
+            self._stacks[stack] = self._stacks.get(stack, 0) + step.gas_consumed
+
+    @staticmethod
+    def _add_count(counts: dict, key, gas: int):
+        if key not in counts:
+            counts[key] = [0, 0]
+        counts[key][0] += 1
+        counts[key][1] += gas
+
+    def collapsed_stacks(self) -> str:
+        """
+        Gets the consumed GAS of each call stack in the collapsed format used by flamegraph tools
+
+        :return: a line with the semicolon separated frames and the GAS consumed for each executed stack
+        """
+        return ''.join('{0} {1}\n'.format(';'.join(stack), gas)
+                       for stack, gas in sorted(self._stacks.items()))
+
+    def annotated_source(self) -> str:
+        """
+        Gets the source code of the profiled files with the execution count and consumed GAS of each line
+
+        :return: the annotated source of each file that had an executed line
+        """
+        header = '{0:>14} {1:>10}  {2:>5}  {3}\n'.format('GAS', 'count', 'line', 'source')
+        report = []
+
+        for document in self._source_map.documents:
+            lines = {line: counts for (file, line), counts in self._lines.items() if file == document}
+            if len(lines) == 0:
+                continue
+
+            document_gas = sum(gas for count, gas in lines.values())
+            report.append('{0} ({1} GAS of {2})\n'.format(document, document_gas, self.total_gas))
+            report.append(header)
+
+            if os.path.isfile(document):
+                with open(document, 'r') as source_file:
+                    source = source_file.read().splitlines()
+            else:
+                source = [''] * max(lines)
+
+            for line_number, text in enumerate(source, start=1):
+                if line_number in lines:
+                    count, gas = lines[line_number]
+                    report.append('{0:>14} {1:>10}  {2:>5}  {3}\n'.format(gas, count, line_number, text))
+                else:
+                    report.append('{0:>14} {1:>10}  {2:>5}  {3}\n'.format('', '', line_number, text))
+            report.append('\n')
+
+        return ''.join(report)
+
+    def save_collapsed_stacks(self, output_path: str):
+        with open(output_path, 'w') as output_file:
+            output_file.write(self.collapsed_stacks())
+
+    def save_annotated_source(self, output_path: str):
+        with open(output_path, 'w') as output_file:
+            output_file.write(self.annotated_source())
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class NefMetadata:
+    """
+    The information of a compiled .nef file that the test classes use to identify the contract
+
+    :ivar path: the path of the .nef file
+    :ivar script_hash: the hash of the contract script
+    :ivar checksum: the checksum of the .nef file
+    """
+
+    def __init__(self, path: str, script_hash: bytes, checksum: bytes):
+        self.path: str = path
+        self.script_hash: bytes = script_hash
+        self.checksum: bytes = checksum
+
+
+class NefMetadataCache:
+    """
+    A process-wide cache of the .nef files metadata, so each file is read and hashed only once while it isn't modified
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> NefMetadataCache:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._files: Dict[str, Tuple[Tuple[int, int], NefMetadata]] = {}
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, nef_path: str) -> Optional[NefMetadata]:
+        """
+        Gets the metadata of a .nef file, reading the file only if it's not cached or if it was modified
+
+        :param nef_path: the path of the .nef file
+        :return: the file metadata. None if the file doesn't exist
+        """
+        try:
+            file_stat = os.stat(nef_path)
+        except OSError:
+            self.invalidate(nef_path)
+            return None
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        with self._lock:
+            cached = self._files.get(nef_path)
+            if cached is not None and cached[0] == file_key:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        from boa3.neo.contracts.neffile import NefFile
+        with open(nef_path, mode='rb') as nef:
+            nef_file = NefFile.deserialize(nef.read())
+        metadata = NefMetadata(nef_path, nef_file.script_hash, nef_file.checksum)
+
+        with self._lock:
+            self._files[nef_path] = (file_key, metadata)
+        return metadata
+
+    def invalidate(self, nef_path: str = None):
+        """
+        Removes a file from the cache
+
+        :param nef_path: the path of the .nef file. If it's None, all the files are removed
+        """
+        with self._lock:
+            if nef_path is None:
+                self._files.clear()
+            else:
+                self._files.pop(nef_path, None)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def get_nef_metadata(nef_path: str) -> Optional[NefMetadata]:
+    return NefMetadataCache.instance().get(nef_path)
@@ -0,0 +1,98 @@
+import bisect
+import json
+import re
+from typing import List, Optional, Tuple
+
+
+class SourceMap:
+    """
+    Maps the instruction addresses of a compiled contract to its methods and Python source lines, using the sequence
+    points from the contract's debug info.
+    """
+
+    _sequence_point_format = re.compile(r'^(\d+)\[(\d+)\](\d+):(\d+)-(\d+):(\d+)$')
+
+    def __init__(self, nef_path: str):
+        from boa3_test.tests.test_classes.nefmetadata import get_nef_metadata
+
+        metadata = get_nef_metadata(nef_path)
+        if metadata is None:
+            raise FileNotFoundError(nef_path)
+        self._script_hash: bytes = metadata.script_hash
+
+        debug_info = self._load_debug_info(nef_path.replace('.nef', '.nefdbgnfo'))
+        self._documents: List[str] = debug_info['documents']
+
+        # (start, end, name) of each method, sorted by their start address
+        self._methods: List[Tuple[int, int, str]] = []
+        # (address, document index, line) of each sequence point, sorted by their address
+        self._sequence_points: List[Tuple[int, int, int]] = []
+
+        for method in debug_info['methods']:
+            start, end = (int(address) for address in method['range'].split('-'))
+            module_name, method_name = method['name'].split(',', maxsplit=1)
+            name = '{0}.{1}'.format(module_name, method_name) if len(module_name) > 0 else method_name
+            self._methods.append((start, end, name))
+
+            for sequence_point in method['sequence-points']:
+                match = self._sequence_point_format.match(sequence_point)
+                if match is not None:
+                    self._sequence_points.append((int(match.group(1)), int(match.group(2)), int(match.group(3))))
+
+        self._methods.sort()
+        self._sequence_points.sort()
+        self._method_starts: List[int] = [method[0] for method in self._methods]
+        self._sequence_point_addresses: List[int] = [point[0] for point in self._sequence_points]
+
+    @staticmethod
+    def _load_debug_info(debug_info_path: str) -> dict:
+        from zipfile import ZipFile
+
+        with ZipFile(debug_info_path, 'r') as debug_info_file:
+            json_file = next(name for name in debug_info_file.namelist() if name.endswith('.json'))
+            return json.loads(debug_info_file.read(json_file))
+
+    @property
+    def script_hash(self) -> bytes:
+        return self._script_hash
+
+    @property
+    def documents(self) -> List[str]:
+        return self._documents.copy()
+
+    def get_method(self, address: int) -> Optional[Tuple[int, int, str]]:
+        """
+        Gets the method that includes the given address
+
+        :param address: the address of the instruction
+        :return: the start address, end address and name of the method. None if the address isn't in any method
+        """
+        index = bisect.bisect_right(self._method_starts, address) - 1
+        if index >= 0 and address <= self._methods[index][1]:
+            return self._methods[index]
+        return None
+
+    def get_method_name(self, address: int) -> Optional[str]:
+        method = self.get_method(address)
+        return method[2] if method is not None else None
+
+    def get_line(self, address: int) -> Optional[Tuple[str, int]]:
+        """
+        Gets the source line that generated the instruction at the given address
+
+        :param address: the address of the instruction
+        :return: the source file path and the line number. None if the instruction isn't mapped to any line
+        """
+        method = self.get_method(address)
+        if method is None:
+            return None
+
+        index = bisect.bisect_right(self._sequence_point_addresses, address) - 1
+        if index < 0:
+            return None
+
+        sp_address, document, line = self._sequence_points[index]
+        if sp_address < method[0] or document >= len(self._documents):
+            # the instruction was generated by the compiler, before the method's first line
+            return None
+        return self._documents[document], line
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Union
+import base64
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 from boa3.neo.utils import contract_parameter_to_json, stack_item_from_json
+from boa3.neo.vm.type.AbiType import AbiType
 from boa3.neo.vm.type.Integer import Integer
 from boa3.neo.vm.type.String import String
 from boa3.neo3.core.serialization import BinaryReader
 from boa3_test.tests.test_classes.nativecontractprefix import get_native_contract_data
 
 
+def _bytes_to_json(value: Any) -> Dict[str, Any]:
+    # storage keys and values are almost always bytes, so they skip the type checks of the generic conversion
+    if isinstance(value, bytes):
+        return {'type': AbiType.ByteArray.value,
+                'value': base64.b64encode(value).decode('ascii')
+                }
+    return contract_parameter_to_json(value)
+
+
 class Storage:
     def __init__(self):
         self._dict: Dict[StorageKey, StorageItem] = {}
@@ -105,14 +116,37 @@ class Storage:
         return self._dict[item].value
 
     def __setitem__(self, key: StorageKey, value: Any):
-        from boa3.neo.vm.type import StackItem
+        self._dict[key] = StorageItem(self.to_storage_value(value))
+
+    def put_many(self, contract_id: int, items: Iterable[Tuple[bytes, Any]]) -> int:
+        """
+        Puts many values in the storage of a contract at once
+
+        :param contract_id: the id of the contract
+        :param items: the keys and the values to put. Values that are `StorageItem` are put without being converted
+        :return: the number of values put
+        """
+        storage = self._dict
+        count = 0
+        for key, value in items:
+            if not isinstance(value, StorageItem):
+                value = StorageItem(self.to_storage_value(value))
+            storage[StorageKey(key, contract_id)] = value
+            count += 1
+        return count
+
+    @staticmethod
+    def to_storage_value(value: Any) -> bytes:
+        """
+        Converts a value into the bytes that are saved in the storage
+        """
         if isinstance(value, int):
-            storage_value = Integer(value).to_byte_array()
+            return Integer(value).to_byte_array()
         elif isinstance(value, str):
-            storage_value = String(value).to_bytes()
+            return String(value).to_bytes()
         else:
-            storage_value = StackItem.serialize(value)
-        self._dict[key] = StorageItem(storage_value)
+            from boa3.neo.vm.type import StackItem
+            return StackItem.serialize(value)
 
     @staticmethod
     def build_key(key: bytes, index: int) -> StorageKey:
@@ -126,7 +160,7 @@ class StorageKey:
 
     def to_json(self) -> Dict[str, Any]:
         return {'id': self._ID,
-                'key': contract_parameter_to_json(self._key)
+                'key': _bytes_to_json(self._key)
                 }
 
     @classmethod
@@ -161,7 +195,7 @@ class StorageItem:
 
     def to_json(self) -> Dict[str, Any]:
         return {'isconstant': self._is_constant,
-                'value': contract_parameter_to_json(self._value)
+                'value': _bytes_to_json(self._value)
                 }
 
     @classmethod
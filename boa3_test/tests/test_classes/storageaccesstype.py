@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import enum
+
+
+class StorageAccessType(enum.IntEnum):
+    # Read a value from the storage.
+    Get = 1
+
+    # Write a value into the storage.
+    Put = 2
+
+    # Remove a value from the storage.
+    Delete = 3
+
+    # Search the values with a given prefix in the storage.
+    Find = 4
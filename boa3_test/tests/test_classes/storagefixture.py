@@ -0,0 +1,119 @@
+import csv
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+from boa3.neo3.core.serialization import BinaryReader, BinaryWriter
+from boa3_test.tests.test_classes.storage import Storage, StorageItem
+
+StorageEntry = Tuple[str, Union[str, bytes], Any]
+
+_FIXTURE_MAGIC = b'BSTF'
+_FIXTURE_VERSION = 1
+
+
+def read_storage_fixture(file_path: str) -> Iterator[StorageEntry]:
+    """
+    Reads the storage entries of a fixture file, either a csv or a binary file generated by `write_storage_fixture`
+
+    :param file_path: the path of the fixture file
+    :return: an iterator of the contract paths, keys and values of the entries
+    """
+    if file_path.endswith('.csv'):
+        return _read_csv_fixture(file_path)
+    return _read_binary_fixture(file_path)
+
+
+def write_storage_fixture(file_path: str, entries: Iterable[StorageEntry]) -> int:
+    """
+    Writes storage entries in the compact binary fixture format. The values are saved already converted, so loading
+    them doesn't convert each value again
+
+    :param file_path: the path of the fixture file
+    :param entries: the contract paths, keys and values of the entries
+    :return: the number of written entries
+    """
+    contracts: List[str] = []
+    contract_indexes = {}
+    count = 0
+
+    with BinaryWriter() as entries_writer:
+        for contract_path, key, value in entries:
+            contract_index = contract_indexes.get(contract_path)
+            if contract_index is None:
+                contract_index = len(contracts)
+                contract_indexes[contract_path] = contract_index
+                contracts.append(contract_path)
+
+            entries_writer.write_var_int(contract_index)
+            entries_writer.write_var_bytes(_key_to_bytes(key))
+            entries_writer.write_var_bytes(Storage.to_storage_value(value))
+            count += 1
+        entries_data = entries_writer.to_array()
+
+    with BinaryWriter() as writer:
+        writer.write_bytes(_FIXTURE_MAGIC)
+        writer.write_uint8(_FIXTURE_VERSION)
+        writer.write_var_int(len(contracts))
+        for contract_path in contracts:
+            writer.write_var_string(contract_path)
+        writer.write_var_int(count)
+        header = writer.to_array()
+
+    with open(file_path, mode='wb') as fixture_file:
+        fixture_file.write(header)
+        fixture_file.write(entries_data)
+    return count
+
+
+def _key_to_bytes(key: Union[str, bytes]) -> bytes:
+    if isinstance(key, str):
+        from boa3.neo.vm.type.String import String
+        return String(key).to_bytes()
+    return bytes(key)
+
+
+def _read_binary_fixture(file_path: str) -> Iterator[StorageEntry]:
+    with open(file_path, mode='rb') as fixture_file:
+        data = fixture_file.read()
+
+    with BinaryReader(data) as reader:
+        if reader.read_bytes(len(_FIXTURE_MAGIC)) != _FIXTURE_MAGIC:
+            raise ValueError("'{0}' is not a storage fixture file".format(file_path))
+        version = reader.read_uint8()
+        if version != _FIXTURE_VERSION:
+            raise ValueError("Unsupported storage fixture version: {0}".format(version))
+
+        contracts = [reader.read_var_string() for _ in range(reader.read_var_int())]
+        for _ in range(reader.read_var_int()):
+            contract_path = contracts[reader.read_var_int()]
+            key = reader.read_var_bytes()
+            yield contract_path, key, StorageItem(reader.read_var_bytes())
+
+
+def _read_csv_fixture(file_path: str) -> Iterator[StorageEntry]:
+    """
+    Reads a csv file with the columns contract, key and value. Fields that start with '0x' are read as bytes in hex
+    and values that are integer numbers are read as int
+    """
+    with open(file_path, newline='') as fixture_file:
+        for index, row in enumerate(csv.reader(fixture_file)):
+            if len(row) == 0:
+                continue
+            if len(row) != 3:
+                raise ValueError("Invalid storage fixture row {0}: expected 3 columns".format(index + 1))
+            if index == 0 and [column.strip().lower() for column in row] == ['contract', 'key', 'value']:
+                # header
+                continue
+
+            contract_path, key, value = row
+            yield contract_path, _parse_csv_field(key, False), _parse_csv_field(value, True)
+
+
+def _parse_csv_field(field: str, is_value: bool) -> Union[str, bytes, int]:
+    if field.startswith('0x'):
+        return bytes.fromhex(field[2:])
+    if is_value:
+        try:
+            return int(field)
+        except ValueError:
+            pass
+    return field
@@ -1,4 +1,3 @@
-import os
 from typing import Optional
 
 
@@ -7,11 +6,11 @@ class TestContract:
         self._nef_path: str = file_path
 
         script_hash = None
-        if file_path.endswith('.nef') and os.path.isfile(file_path):
-            with open(file_path, mode='rb') as nef:
-                file = nef.read()
-            from boa3.neo.contracts.neffile import NefFile
-            script_hash = NefFile.deserialize(file).script_hash
+        if file_path.endswith('.nef'):
+            from boa3_test.tests.test_classes.nefmetadata import get_nef_metadata
+            metadata = get_nef_metadata(file_path)
+            if metadata is not None:
+                script_hash = metadata.script_hash
 
         self._script_hash: Optional[bytes] = script_hash
 
@@ -1,10 +1,11 @@
 from os import path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from boa3 import constants
 from boa3.neo.smart_contract.VoidType import VoidType
 from boa3.neo.smart_contract.notification import Notification
-from boa3.neo.utils import contract_parameter_to_json, stack_item_from_json
+from boa3.neo.utils import contract_parameter_to_json
+from boa3.neo.vm.type.StackItemDecoder import StackItemDecoder
 from boa3.neo.vm.type.String import String
 from boa3.neo3.core.types import UInt160
 from boa3.neo3.vm import VMState
@@ -12,6 +13,8 @@ from boa3_test.tests.test_classes.block import Block
 from boa3_test.tests.test_classes.signer import Signer
 from boa3_test.tests.test_classes.storage import Storage
 from boa3_test.tests.test_classes.testcontract import TestContract
+from boa3_test.tests.test_classes.tracefile import TraceWriter
+from boa3_test.tests.test_classes.tracestep import TraceStep
 from boa3_test.tests.test_classes.transaction import Transaction
 from boa3_test.tests.test_classes.transactionattribute import oracleresponse
 from boa3_test.tests.test_classes.witnessscope import WitnessScope
@@ -43,10 +46,18 @@ class TestEngine:
         self._current_tx: Optional[Transaction] = None
         self._accounts: List[Signer] = []
         self._contract_paths: List[TestContract] = []
+        # the ids of the deployed contracts, valid until the storage is replaced
+        self._contract_ids: Dict[bytes, int] = {}
 
         self._error_message: Optional[str] = None
         self._neo_balance_prefix: bytes = b'\x14'
 
+        self._tracing: bool = False
+        # whether the engine returns the executed instructions, unknown until a run is traced
+        self._tracing_supported: Optional[bool] = None
+        self._trace: List[TraceStep] = []
+        self._trace_output: Optional[str] = None
+
     @property
     def error(self) -> Optional[str]:
         return self._error_message
@@ -63,6 +74,45 @@ class TestEngine:
     def result_stack(self) -> List[Any]:
         return self._result_stack.copy()
 
+    @property
+    def tracing(self) -> bool:
+        """
+        If enabled, the test engine returns every instruction executed in the next runs. Disabled by default, because
+        it's only available if the test engine supports tracing
+        """
+        return self._tracing
+
+    @tracing.setter
+    def tracing(self, value: bool):
+        if value and self._tracing_supported is False:
+            raise NotImplementedError('The test engine does not return the executed instructions')
+        self._tracing = value
+
+    @property
+    def tracing_supported(self) -> Optional[bool]:
+        """
+        Whether the test engine returns the executed instructions. None until a run is traced
+        """
+        return self._tracing_supported
+
+    @property
+    def trace_output(self) -> Optional[str]:
+        """
+        If set, the traced instructions are streamed to this binary trace file instead of being kept in memory
+        """
+        return self._trace_output
+
+    @trace_output.setter
+    def trace_output(self, trace_path: Optional[str]):
+        self._trace_output = trace_path
+
+    @property
+    def trace(self) -> List[TraceStep]:
+        """
+        Gets the instructions executed in the last run. Empty if the tracing isn't enabled.
+        """
+        return self._trace.copy()
+
     @property
     def notifications(self) -> List[Notification]:
         return self._notifications.copy()
@@ -109,8 +159,45 @@ class TestEngine:
 
     def set_storage(self, storage: Dict[Tuple[Union[str, bytes], str], Any]):
         self._storage.clear()
-        for (key, contract_path), value in storage.items():
-            self.storage_put(key, value, contract_path)
+        self._contract_ids.clear()
+        self.load_storage(storage)
+
+    def load_storage(self, entries: Union[str,
+                                          Dict[Tuple[Union[str, bytes], str], Any],
+                                          Iterable[Tuple[str, Union[str, bytes], Any]]]) -> int:
+        """
+        Puts many values in the storage at once. The id of each contract is resolved only once
+
+        :param entries: a dictionary that maps (key, contract path) with the values, like in `set_storage`, an iterable
+                        of (contract path, key, value) or the path of a storage fixture file
+        :return: the number of values put. Values of contracts that weren't added to the engine are ignored
+        """
+        if isinstance(entries, str):
+            from boa3_test.tests.test_classes.storagefixture import read_storage_fixture
+            entries = read_storage_fixture(entries)
+        elif isinstance(entries, dict):
+            entries = ((contract_path, key, value) for (key, contract_path), value in entries.items())
+
+        contracts = set(self.contracts)
+        contract_ids: Dict[str, Optional[int]] = {}
+        items: Dict[int, List[Tuple[bytes, Any]]] = {}
+
+        for contract_path, key, value in entries:
+            if contract_path in contract_ids:
+                contract_id = contract_ids[contract_path]
+            else:
+                nef_path = contract_path.replace('.py', '.nef') if contract_path.endswith('.py') else contract_path
+                contract_id = self._get_contract_id(nef_path) if nef_path in contracts else None
+                contract_ids[contract_path] = contract_id
+                if contract_id is not None and contract_id not in items:
+                    items[contract_id] = []
+
+            if contract_id is not None:
+                if isinstance(key, str):
+                    key = String(key).to_bytes()
+                items[contract_id].append((key, value))
+
+        return sum(self._storage.put_many(contract_id, contract_items) for contract_id, contract_items in items.items())
 
     def storage_delete(self, key: Union[str, bytes], contract_path: str):
         if isinstance(key, str):
@@ -160,12 +247,16 @@ class TestEngine:
             return self._contract_paths.pop(index)
 
     def _get_contract_id(self, contract_path: str) -> int:
-        if path.isfile(contract_path):
-            with open(contract_path, mode='rb') as nef:
-                from boa3.neo.contracts.neffile import NefFile
-                script_hash = NefFile.deserialize(nef.read()).script_hash
-
-            return self._storage.get_contract_id(script_hash)
+        from boa3_test.tests.test_classes.nefmetadata import get_nef_metadata
+        metadata = get_nef_metadata(contract_path)
+        if metadata is not None:
+            contract_id = self._contract_ids.get(metadata.script_hash)
+            if contract_id is None:
+                contract_id = self._storage.get_contract_id(metadata.script_hash)
+                if contract_id >= 0:
+                    # contracts that aren't deployed yet aren't cached
+                    self._contract_ids[metadata.script_hash] = contract_id
+            return contract_id
 
         contracts = self.contracts
         if contract_path in contracts:
@@ -231,7 +322,7 @@ class TestEngine:
         self._current_tx = Transaction(b'')
         self._current_tx.add_attribute(oracleresponse.OracleResponse(request_id, oracle_response, result))
 
-        return self.run(UInt160(constants.ORACLE_SCRIPT), 'finish',
+        return self.run(UInt160.intern(constants.ORACLE_SCRIPT), 'finish',
                         reset_engine=reset_engine,
                         rollback_on_fault=rollback_on_fault)
 
@@ -287,10 +378,34 @@ class TestEngine:
                 self._gas_consumed = int(result['gasconsumed'])
 
             if 'resultstack' in result:
+                if isinstance(contract_id, str) and contract_id.endswith('.nef'):
+                    # decodes the results using the method return type from the manifest
+                    decoder = StackItemDecoder.from_manifest_file(contract_id.replace('.nef', '.manifest.json'), method)
+                else:
+                    decoder = StackItemDecoder()
+
                 if isinstance(result['resultstack'], list):
-                    self._result_stack = [stack_item_from_json(value) for value in result['resultstack']]
+                    self._result_stack = decoder.decode_many(result['resultstack'])
                 else:
-                    self._result_stack = [stack_item_from_json(result['resultstack'])]
+                    self._result_stack = [decoder.decode(result['resultstack'])]
+
+            if self._tracing and 'trace' not in result:
+                # the engine ignored the tracing request
+                self._tracing_supported = False
+                self._tracing = False
+
+            elif self._tracing:
+                self._tracing_supported = True
+                json_trace = result['trace']
+                if not isinstance(json_trace, list):
+                    json_trace = [json_trace]
+
+                if self._trace_output is not None:
+                    with TraceWriter(self._trace_output) as trace_writer:
+                        for step in json_trace:
+                            trace_writer.write(TraceStep.from_json(step))
+                else:
+                    self._trace = [TraceStep.from_json(step) for step in json_trace]
 
             if self._vm_state is VMState.HALT or not rollback_on_fault:
                 if 'notifications' in result:
@@ -308,6 +423,7 @@ class TestEngine:
                 if 'storage' in result:
                     json_storage = result['storage']
                     self._storage = Storage.from_json(json_storage)
+                    self._contract_ids.clear()
 
                     for contract in self._contract_paths.copy():
                         if (not isinstance(contract, TestContract)
@@ -334,6 +450,9 @@ class TestEngine:
         except BaseException as e:
             self._error_message = str(e)
 
+        if self._tracing_supported is False and test_engine_args.get('tracing', False):
+            raise NotImplementedError('The test engine does not return the executed instructions')
+
         # TODO: convert the result to the return type of the function in the manifest
         return self._result_stack[-1] if len(self._result_stack) > 0 else VoidType
 
@@ -344,11 +463,13 @@ class TestEngine:
         self._accounts = []
         self._current_tx = None
         self._error_message = None
+        self._trace = []
 
     def reset_engine(self):
         self.reset_state()
         self._notifications.clear()
         self._storage.clear()
+        self._contract_ids.clear()
 
     def to_json(self, contract_id: Union[str, UInt160], method: str, *args: Any) -> Dict[str, Any]:
         json = {
@@ -364,4 +485,6 @@ class TestEngine:
         }
         if isinstance(self._current_tx, Transaction):
             json['currenttx'] = self._current_tx.to_json()
+        if self._tracing:
+            json['tracing'] = True
         return json
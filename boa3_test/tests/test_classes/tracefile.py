@@ -0,0 +1,175 @@
+"""
+Binary format of the trace files:
+
+    header:     magic (4 bytes) + version (uint8)
+    records:    tag (uint8) + payload
+
+    RUN:        starts a new execution and clears the script table. No payload
+    SCRIPT:     script hash (20 bytes). Its index in the script table is the number of scripts in the current run
+    STEP:       script index (var int) + offset (var int) + opcode (uint8) + gas consumed (var int)
+                + stack depth (var int) + storage action (uint8) + storage key if the action isn't 0 (var bytes)
+
+Var ints use the same encoding of Neo's serialization.
+"""
+import os
+import struct
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.test_classes.storageaccesstype import StorageAccessType
+from boa3_test.tests.test_classes.tracestep import TraceStep
+
+TRACE_FILE_MAGIC = b'NTRC'
+TRACE_FILE_VERSION = 1
+
+_RUN_TAG = 1
+_SCRIPT_TAG = 2
+_STEP_TAG = 3
+
+_UNKNOWN_OPCODE = 0xFF
+_SCRIPT_HASH_SIZE = 20
+
+
+def _encode_var_int(value: int) -> bytes:
+    if value < 0xFD:
+        return bytes((value,))
+    elif value <= 0xFFFF:
+        return b'\xfd' + struct.pack('<H', value)
+    elif value <= 0xFFFFFFFF:
+        return b'\xfe' + struct.pack('<I', value)
+    else:
+        return b'\xff' + struct.pack('<Q', value)
+
+
+class TraceWriter:
+    """
+    Streams the instructions executed by the test engine into a binary trace file.
+    Each writer appends a new run to the file, so a file can keep the traces of multiple executions.
+    """
+
+    def __init__(self, trace_path: str):
+        self._file: BinaryIO = open(trace_path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(TRACE_FILE_MAGIC + bytes((TRACE_FILE_VERSION,)))
+        self._file.write(bytes((_RUN_TAG,)))
+
+        self._scripts: Dict[bytes, int] = {}
+        self.steps_count: int = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def write(self, step: TraceStep):
+        script_index = self._scripts.get(step.script_hash)
+        if script_index is None:
+            script_index = len(self._scripts)
+            self._scripts[step.script_hash] = script_index
+            self._file.write(bytes((_SCRIPT_TAG,)) + bytes(step.script_hash).rjust(_SCRIPT_HASH_SIZE, b'\x00'))
+
+        record = bytearray((_STEP_TAG,))
+        record += _encode_var_int(script_index)
+        record += _encode_var_int(step.offset)
+        record.append(step.opcode[0] if isinstance(step.opcode, Opcode) else _UNKNOWN_OPCODE)
+        record += _encode_var_int(step.gas_consumed)
+        record += _encode_var_int(step.stack_depth)
+
+        if step.storage_access is None:
+            record.append(0)
+        else:
+            action, key = step.storage_access
+            record.append(action.value)
+            record += _encode_var_int(len(key))
+            record += key
+
+        self._file.write(record)
+        self.steps_count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class TraceReader:
+    """
+    Reads the instructions from a binary trace file without loading the whole file into memory.
+    """
+
+    def __init__(self, trace_path: str):
+        if not os.path.isfile(trace_path):
+            raise FileNotFoundError(trace_path)
+        self._trace_path: str = trace_path
+
+    def __iter__(self) -> Iterator[TraceStep]:
+        for step in self._read_records():
+            if step is not None:
+                yield step
+
+    def runs(self) -> Iterator[List[TraceStep]]:
+        """
+        Reads the trace file one execution at a time
+
+        :return: the instructions executed in each run, in the execution order
+        """
+        current_run: Optional[List[TraceStep]] = None
+        for step in self._read_records():
+            if step is None:
+                if current_run is not None:
+                    yield current_run
+                current_run = []
+            else:
+                current_run.append(step)
+
+        if current_run is not None:
+            yield current_run
+
+    def _read_records(self) -> Iterator[Optional[TraceStep]]:
+        opcodes = {opcode[0]: opcode for opcode in Opcode}
+
+        with open(self._trace_path, 'rb') as trace_file:
+            header = trace_file.read(len(TRACE_FILE_MAGIC) + 1)
+            if header[:-1] != TRACE_FILE_MAGIC or header[-1] != TRACE_FILE_VERSION:
+                raise ValueError('{0} is not a valid trace file'.format(self._trace_path))
+
+            read = trace_file.read
+            scripts: List[bytes] = []
+
+            def read_var_int() -> int:
+                value = read(1)[0]
+                if value == 0xFD:
+                    return struct.unpack('<H', read(2))[0]
+                elif value == 0xFE:
+                    return struct.unpack('<I', read(4))[0]
+                elif value == 0xFF:
+                    return struct.unpack('<Q', read(8))[0]
+                return value
+
+            tag = read(1)
+            while len(tag) > 0:
+                if tag[0] == _STEP_TAG:
+                    script_hash = scripts[read_var_int()]
+                    offset = read_var_int()
+                    opcode = opcodes.get(read(1)[0])
+                    gas_consumed = read_var_int()
+                    stack_depth = read_var_int()
+
+                    storage_action = read(1)[0]
+                    storage_access = None
+                    if storage_action != 0:
+                        storage_access = StorageAccessType(storage_action), read(read_var_int())
+
+                    yield TraceStep(script_hash, offset, opcode, gas_consumed, stack_depth, storage_access)
+
+                elif tag[0] == _SCRIPT_TAG:
+                    scripts.append(read(_SCRIPT_HASH_SIZE))
+
+                elif tag[0] == _RUN_TAG:
+                    scripts.clear()
+                    yield None
+
+                else:
+                    raise ValueError('{0} is not a valid trace file'.format(self._trace_path))
+
+                tag = read(1)
@@ -0,0 +1,82 @@
+import os
+from collections import deque
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from boa3.neo import to_hex_str
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.test_classes.sourcemap import SourceMap
+from boa3_test.tests.test_classes.tracefile import TraceReader
+from boa3_test.tests.test_classes.tracestep import TraceStep
+
+
+class TraceReplay:
+    """
+    Replays the instructions of a trace, mapping each instruction pointer back to the contract's source code.
+    Instructions of contracts without debug info are replayed without source information.
+    """
+
+    def __init__(self, trace: Union[str, Iterable[TraceStep]], *contract_paths: str):
+        """
+        :param trace: the path of a binary trace file or the traced instructions
+        :param contract_paths: the paths of the .nef files of the traced contracts
+        """
+        self._trace: Iterable[TraceStep] = TraceReader(trace) if isinstance(trace, str) else trace
+
+        self._source_maps: Dict[bytes, SourceMap] = {}
+        self._contract_names: Dict[bytes, str] = {}
+        for contract_path in contract_paths:
+            source_map = SourceMap(contract_path)
+            self._source_maps[source_map.script_hash] = source_map
+            self._contract_names[source_map.script_hash] = os.path.splitext(os.path.basename(contract_path))[0]
+
+    def locate(self, step: TraceStep) -> Tuple[Optional[str], Optional[Tuple[str, int]]]:
+        """
+        Gets the source location of a traced instruction
+
+        :param step: the traced instruction
+        :return: the name of the method and the file and line of the instruction, if they are known
+        """
+        source_map = self._source_maps.get(step.script_hash)
+        if source_map is None:
+            return None, None
+        return source_map.get_method_name(step.offset), source_map.get_line(step.offset)
+
+    def __iter__(self) -> Iterator[Tuple[TraceStep, Optional[str], Optional[Tuple[str, int]]]]:
+        for step in self._trace:
+            method, line = self.locate(step)
+            yield step, method, line
+
+    def storage_accesses(self) -> Iterator[Tuple[TraceStep, Optional[Tuple[str, int]]]]:
+        """
+        Gets the traced instructions that accessed the storage
+
+        :return: the instruction and its source file and line
+        """
+        for step in self._trace:
+            if step.storage_access is not None:
+                yield step, self.locate(step)[1]
+
+    def format_step(self, step: TraceStep) -> str:
+        method, line = self.locate(step)
+
+        contract = self._contract_names.get(step.script_hash, to_hex_str(step.script_hash))
+        location = '{0}:{1}'.format(os.path.basename(line[0]), line[1]) if line is not None else ''
+        opcode = step.opcode.name if isinstance(step.opcode, Opcode) else '?'
+        description = '{0} {1:<24} {2:<20} {3:>6} {4:<14} depth={5} gas={6}'.format(
+            contract, method if method is not None else '', location, step.offset, opcode,
+            step.stack_depth, step.gas_consumed)
+
+        if step.storage_access is not None:
+            action, key = step.storage_access
+            description += ' storage.{0}({1})'.format(action.name, key)
+        return description
+
+    def format(self, last: Optional[int] = None) -> str:
+        """
+        Gets a readable listing of the traced instructions
+
+        :param last: if given, includes only the last instructions. Useful to inspect the cause of a FAULT
+        :return: a line with the source location of each instruction
+        """
+        steps = deque(self._trace, maxlen=last) if last is not None else self._trace
+        return ''.join('{0}\n'.format(self.format_step(step)) for step in steps)
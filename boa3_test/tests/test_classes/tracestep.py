@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import base64
+from typing import Any, Dict, Optional, Tuple
+
+from boa3.neo import from_hex_str, to_hex_str
+from boa3.neo.vm.opcode.Opcode import Opcode
+from boa3_test.tests.test_classes.storageaccesstype import StorageAccessType
+
+
+class TraceStep:
+    _script_hash_key = 'scripthash'
+    _offset_key = 'offset'
+    _opcode_key = 'opcode'
+    _gas_key = 'gasconsumed'
+    _stack_depth_key = 'stackdepth'
+    _storage_key = 'storage'
+    _storage_action_key = 'action'
+    _storage_key_key = 'key'
+
+    def __init__(self, script_hash: bytes, offset: int, opcode: Optional[Opcode], gas_consumed: int = 0,
+                 stack_depth: int = 0, storage_access: Optional[Tuple[StorageAccessType, bytes]] = None):
+        self._script_hash: bytes = script_hash
+        self._offset: int = offset
+        self._opcode: Optional[Opcode] = opcode
+        self._gas_consumed: int = gas_consumed
+        self._stack_depth: int = stack_depth
+        self._storage_access: Optional[Tuple[StorageAccessType, bytes]] = storage_access
+
+    @property
+    def script_hash(self) -> bytes:
+        return self._script_hash
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def opcode(self) -> Optional[Opcode]:
+        return self._opcode
+
+    @property
+    def gas_consumed(self) -> int:
+        """
+        The GAS consumed to execute the instruction, in fractions of GAS
+        """
+        return self._gas_consumed
+
+    @property
+    def stack_depth(self) -> int:
+        """
+        The number of items in the evaluation stack before executing the instruction
+        """
+        return self._stack_depth
+
+    @property
+    def storage_access(self) -> Optional[Tuple[StorageAccessType, bytes]]:
+        """
+        The type of the access and the key if the instruction accessed the storage. None otherwise
+        """
+        return self._storage_access
+
+    def to_json(self) -> Dict[str, Any]:
+        json = {
+            self._script_hash_key: to_hex_str(self._script_hash),
+            self._offset_key: self._offset,
+            self._opcode_key: self._opcode.name if isinstance(self._opcode, Opcode) else None,
+            self._gas_key: self._gas_consumed,
+            self._stack_depth_key: self._stack_depth
+        }
+        if self._storage_access is not None:
+            action, key = self._storage_access
+            json[self._storage_key] = {
+                self._storage_action_key: action.name,
+                self._storage_key_key: base64.b64encode(key).decode()
+            }
+        return json
+
+    @classmethod
+    def from_json(cls, json: Dict[str, Any]) -> TraceStep:
+        """
+        Creates a TraceStep object from a json.
+
+        :param json: json that contains the executed instruction data
+        :return: a TraceStep object
+        :rtype: TraceStep
+        """
+        script = json[cls._script_hash_key] if cls._script_hash_key in json else b''
+        if isinstance(script, str):
+            script = from_hex_str(script)
+
+        opcode = json[cls._opcode_key] if cls._opcode_key in json else None
+        if isinstance(opcode, str):
+            opcode = Opcode[opcode] if opcode in Opcode.__members__ else None
+        elif isinstance(opcode, int):
+            opcode = Opcode(opcode.to_bytes(1, 'little'))
+
+        storage_access = None
+        if cls._storage_key in json and isinstance(json[cls._storage_key], dict):
+            storage_json = json[cls._storage_key]
+            key = base64.b64decode(storage_json[cls._storage_key_key])
+            storage_access = StorageAccessType[storage_json[cls._storage_action_key]], key
+
+        return cls(script,
+                   int(json[cls._offset_key]),
+                   opcode,
+                   int(json[cls._gas_key]) if cls._gas_key in json else 0,
+                   int(json[cls._stack_depth_key]) if cls._stack_depth_key in json else 0,
+                   storage_access)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, TraceStep)
+                and self._script_hash == other._script_hash
+                and self._offset == other._offset
+                and self._opcode == other._opcode
+                and self._gas_consumed == other._gas_consumed
+                and self._stack_depth == other._stack_depth
+                and self._storage_access == other._storage_access)
+
+    def __str__(self) -> str:
+        return '{0}[{1}] {2}'.format(to_hex_str(self._script_hash), self._offset,
+                                     self._opcode.name if isinstance(self._opcode, Opcode) else '')
+
+    def __repr__(self) -> str:
+        return str(self)